@@ -0,0 +1,60 @@
+"""Time the pandas observation converter on a synthetic 100,000-row series.
+
+Run from the repository root with `python scripts/benchmark_observations.py`. The baseline is the
+row-dict converter used before the columnar rewrite, inlined here so both run on the same input.
+"""
+
+import argparse
+import random
+import timeit
+from datetime import date, timedelta
+import pandas as pd
+from fedfred._core._converters import _pandas_dataframe_converter
+
+def baseline_converter(data):
+    """The previous converter: build from row dicts, infer the date format and coerce values."""
+
+    df = pd.DataFrame(data['observations'])
+    df['date'] = pd.to_datetime(df['date'])
+    df.set_index('date', inplace=True)
+    df['value'] = pd.to_numeric(df['value'], errors='coerce')
+    return df
+
+def observations(rows, missing, seed):
+    """Build a daily observations response with a share of FRED's '.' missing marker."""
+
+    rng = random.Random(seed)
+    start = date(1800, 1, 1)
+    return {'observations': [
+        {
+            'realtime_start': '2024-01-01',
+            'realtime_end': '9999-12-31',
+            'date': (start + timedelta(days=i)).isoformat(),
+            'value': '.' if rng.random() < missing else f"{rng.uniform(0, 1000):.3f}",
+        }
+        for i in range(rows)
+    ]}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--missing', type=float, default=0.02)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    data = observations(args.rows, args.missing, args.seed)
+    cases = {
+        'old converter': lambda: baseline_converter(data),
+        'new, default': lambda: _pandas_dataframe_converter(data),
+        "realtime_columns='drop'": lambda: _pandas_dataframe_converter(data, realtime_columns='drop'),
+        "realtime_columns='category'": lambda: _pandas_dataframe_converter(data, realtime_columns='category'),
+    }
+    print(f"pandas {pd.__version__}, {args.rows:,} rows, {args.missing:.0%} missing, best of {args.repeat}")
+    for name, run in cases.items():
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        memory = run().memory_usage(deep=True).sum() / 2**20
+        print(f"  {name:<28} {best * 1000:7.1f} ms  {memory:5.1f} MiB")
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,8 @@ Imports:
     AsyncHelpers: An asynchronous class that provides helper methods for the Fred API.
     set_api_key: Function to set the global FRED API key.
     get_api_key: Function to get the current global FRED API key.
+    set_json_decoder: Function to choose the JSON decoder used for API responses.
+    get_json_decoder: Function to get the configured JSON decoder.
     Category: A class representing a category in the Fred database.
     Series: A class representing a series in the Fred database.
     Tag: A class representing a tag in the Fred database.
@@ -43,6 +45,19 @@ Imports:
     VintageDate: A class representing a vintage date in the Fred database.
     SeriesGroup: A class representing a series group in the Fred database.
     BulkRelease: A class representing a bulk release in the Fred database.
+    ObservationBatch: A class representing the result of a batch observations request.
+    RedisCache: A shared response cache backed by a Redis protocol server.
+    TransferMetrics: Per-endpoint compressed and decompressed response byte counters.
+    EndpointTransfer: Wire-size counters for a single endpoint.
+    Timeout: Connect, read, write and pool timeouts for one endpoint family.
+    TimeoutPolicy: Timeouts per endpoint family.
+    HedgingPolicy: Opt-in hedged requests for AsyncFred.
+    CircuitBreaker: Opt-in circuit breaker failing fast during API outages.
+    deadline: Context manager bounding the total time spent in fedfred calls.
+    CategoryIndex: A compact local index of the FRED category tree.
+    VintageMatrix: An interval-encoded real-time history of an ALFRED series.
+    AsOfEngine: Point-in-time queries over the real-time histories of many series.
+    VintageStore: A local Parquet store of ALFRED histories, partitioned by series and vintage date.
 """
 
 # About
@@ -59,7 +74,7 @@ from .__about__ import (
 )
 
 # Settings
-from .settings import set_api_key, get_api_key, clear_api_key
+from .settings import set_api_key, get_api_key, clear_api_key, set_json_decoder, get_json_decoder
 
 # Models
 from .models import (
@@ -73,6 +88,7 @@ from .models import (
     VintageDate,
     SeriesGroup,
     BulkRelease,
+    ObservationBatch,
 )
 
 # Clients
@@ -85,6 +101,21 @@ from .clients import (
     Alfred
 )
 
+# Cache
+from .cache import RedisCache
+
+# Transport
+from .transport import TransferMetrics, EndpointTransfer, Timeout, TimeoutPolicy, HedgingPolicy, CircuitBreaker, deadline
+
+# Categories
+from .categories import CategoryIndex
+
+# Vintages
+from .vintages import VintageMatrix, AsOfEngine
+
+# Store
+from .store import VintageStore
+
 # Exceptions
 from .exceptions import (
     FedFredError,
@@ -125,6 +156,8 @@ __all__ = [
     "set_api_key",
     "get_api_key",
     "clear_api_key",
+    "set_json_decoder",
+    "get_json_decoder",
     # Clients
     "Fred",
     "AsyncFred",
@@ -133,6 +166,23 @@ __all__ = [
     "AsyncGeoFred",
     "Fraser",
     "Alfred",
+    # Cache
+    "RedisCache",
+    # Transport
+    "TransferMetrics",
+    "EndpointTransfer",
+    "Timeout",
+    "TimeoutPolicy",
+    "HedgingPolicy",
+    "CircuitBreaker",
+    "deadline",
+    # Categories
+    "CategoryIndex",
+    # Vintages
+    "VintageMatrix",
+    "AsOfEngine",
+    # Store
+    "VintageStore",
     # Models
     "Category",
     "Series",
@@ -144,6 +194,7 @@ __all__ = [
     "VintageDate",
     "SeriesGroup",
     "BulkRelease",
+    "ObservationBatch",
     # Exceptions
     "FedFredError",
     "RequestContext",
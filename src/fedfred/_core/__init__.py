@@ -40,6 +40,8 @@ Imports:
     _polars_dataframe_converter_async
     _dask_dataframe_converter
     _dask_dataframe_converter_async
+    _arrow_dataframe_converter
+    _arrow_dataframe_converter_async
     _datetime_hh_mm_converter
     _datetime_hh_mm_converter_async
     _geopandas_geodataframe_converter
@@ -48,6 +50,21 @@ Imports:
     _dask_geopandas_geodataframe_converter_async
     _polars_geodataframe_converter
     _polars_geodataframe_converter_async
+    _arrow_regional_data_converter
+    _arrow_regional_data_converter_async
+    _panel_columns_collector
+    _panel_dataframe_converter
+    _panel_dataframe_converter_async
+    _element_table_flattener
+    _element_dataframe_converter
+    _element_dataframe_converter_async
+    _vintage_dates_chunker
+    _vintage_chunks_merger
+    _vintage_chunks_merger_async
+    _observations_sync_start
+    _observations_sync_merger
+    _EMPTY_OBSERVATIONS
+    _json_response_decoder
 """
 
 from ._converters import (
@@ -59,10 +76,16 @@ from ._converters import (
     _pandas_dataframe_converter, _pandas_dataframe_converter_async,
     _polars_dataframe_converter, _polars_dataframe_converter_async,
     _dask_dataframe_converter, _dask_dataframe_converter_async,
+    _arrow_dataframe_converter, _arrow_dataframe_converter_async,
     _datetime_hh_mm_converter, _datetime_hh_mm_converter_async,
     _geopandas_geodataframe_converter, _geopandas_geodataframe_converter_async,
     _dask_geopandas_geodataframe_converter, _dask_geopandas_geodataframe_converter_async,
-    _polars_geodataframe_converter, _polars_geodataframe_converter_async
+    _polars_geodataframe_converter, _polars_geodataframe_converter_async,
+    _arrow_regional_data_converter, _arrow_regional_data_converter_async,
+    _panel_columns_collector, _panel_dataframe_converter, _panel_dataframe_converter_async,
+    _element_table_flattener, _element_dataframe_converter, _element_dataframe_converter_async,
+    _vintage_dates_chunker, _vintage_chunks_merger, _vintage_chunks_merger_async,
+    _observations_sync_start, _observations_sync_merger, _EMPTY_OBSERVATIONS
 )
 
 from ._validators import (
@@ -74,6 +97,10 @@ from ._extractors import (
     _region_type_extractor, _region_type_extractor_async
 )
 
+from ._decoders import (
+    _json_response_decoder
+)
+
 __all__ = [
     # Converters
     '_dict_type_converter', '_dict_type_converter_async',
@@ -84,13 +111,17 @@ __all__ = [
     '_pandas_dataframe_converter', '_pandas_dataframe_converter_async',
     '_polars_dataframe_converter', '_polars_dataframe_converter_async',
     '_dask_dataframe_converter', '_dask_dataframe_converter_async',
+    '_arrow_dataframe_converter', '_arrow_dataframe_converter_async',
     '_datetime_hh_mm_converter', '_datetime_hh_mm_converter_async',
     '_geopandas_geodataframe_converter', '_geopandas_geodataframe_converter_async',
     '_dask_geopandas_geodataframe_converter', '_dask_geopandas_geodataframe_converter_async',
     '_polars_geodataframe_converter', '_polars_geodataframe_converter_async',
+    '_arrow_regional_data_converter', '_arrow_regional_data_converter_async',
     # Validators
     '_fred_parameter_validator', '_fred_parameter_validator_async',
     '_geofred_parameter_validator', '_geofred_parameter_validator_async',
     # Extractors
-    '_region_type_extractor', '_region_type_extractor_async'
+    '_region_type_extractor', '_region_type_extractor_async',
+    # Decoders
+    '_json_response_decoder'
 ]
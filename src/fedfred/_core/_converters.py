@@ -25,8 +25,9 @@ This module provides converter methods for the FRED API.
 """
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, Optional, Union, Tuple
-from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Tuple
+from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 
@@ -38,19 +39,158 @@ if TYPE_CHECKING:
     import dask_geopandas as dd_gpd # pragma: no cover
     import polars as pl # pragma: no cover
     import polars_st as st # pragma: no cover
+    import pyarrow as pa # pragma: no cover
 
 # DataFrame Converters
-def _pandas_dataframe_converter(data: Dict[str, list]) -> pd.DataFrame:
+_MISSING_VALUE = '.'
+"""The marker FRED uses for a missing observation value."""
+
+_REALTIME_COLUMNS = ('realtime_start', 'realtime_end')
+"""The real-time period columns of an observations response."""
+
+_DATETIME_DTYPE = pd.to_datetime(pd.Series(['2000-01-01'], dtype=object), format='%Y-%m-%d').dtype
+"""The datetime dtype pandas gives parsed date strings, kept so converted frames match `pd.to_datetime`."""
+
+def _observation_columns(observations: Union[List[Dict[str, Any]], Dict[str, list]]) -> Dict[str, list]:
+    """Helper method to turn observation rows into columns.
+
+    Args:
+        observations (List[Dict] | Dict[str, list]): Observation rows, or columns as produced by streamed and merged responses.
+
+    Returns:
+        Dict[str, list]: One list per field, in the field order of the first row.
+
+    Notes:
+        Rows are read once per field with a list comprehension, which is faster than building a frame from
+        the list of dicts. Rows with differing fields fall back to a slower path that fills gaps with None.
+    """
+
+    if isinstance(observations, dict):
+        return observations
+    if not observations:
+        return {}
+    width = len(observations[0])
+    if all(len(row) == width for row in observations):
+        try:
+            return {key: [row[key] for row in observations] for key in observations[0]}
+        except KeyError:
+            pass
+    keys = list(dict.fromkeys(key for row in observations for key in row))
+    return {key: [row.get(key) for row in observations] for key in keys}
+
+def _observation_values(values: list, dtype: str='float64') -> np.ndarray:
+    """Helper method to parse observation value strings, mapping FRED's '.' missing marker to NaN.
+
+    Args:
+        values (list): The value strings.
+        dtype (str, optional): 'float64' or 'float32'. Defaults to 'float64'.
+
+    Returns:
+        numpy.ndarray: The parsed values.
+
+    Notes:
+        Other non-numeric values are coerced to NaN through `pd.to_numeric`, the slower general path.
+    """
+
+    array = np.array(values, dtype=object)
+    array[array == _MISSING_VALUE] = 'nan'
+    try:
+        return array.astype(dtype)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=dtype)
+
+def _observation_dates(values: list) -> np.ndarray:
+    """Helper method to parse ISO 'YYYY-MM-DD' date strings to `datetime64[D]`.
+
+    Args:
+        values (list): The date strings.
+
+    Returns:
+        numpy.ndarray: The parsed dates.
+    """
+
+    try:
+        return np.array(values, dtype='datetime64[D]')
+    except (TypeError, ValueError):
+        return pd.to_datetime(pd.Series(values, dtype=object), format='ISO8601').to_numpy().astype('datetime64[D]')
+
+def _pandas_realtime_column(values: list, realtime_columns: str) -> Any:
+    """Helper method to convert a real-time period column for a Pandas DataFrame.
+
+    Args:
+        values (list): The real-time date strings.
+        realtime_columns (str): 'string', 'category' or 'date'.
+
+    Returns:
+        list | pandas.Categorical | pandas.DatetimeIndex: The converted column.
+
+    Notes:
+        Real-time columns hold few distinct dates, so 'date' parses each distinct date once. The open end
+        '9999-12-31' becomes NaT.
+    """
+
+    if realtime_columns == 'category':
+        return pd.Categorical(values)
+    if realtime_columns == 'date':
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+        days = _observation_dates(list(uniques))
+        days[days == np.datetime64('9999-12-31')] = np.datetime64('NaT')
+        return pd.DatetimeIndex(days[codes].astype(_DATETIME_DTYPE))
+    return values
+
+def _pyarrow() -> Tuple[Any, Any]:
+    """Helper method to import PyArrow and its compute module.
+
+    Returns:
+        Tuple[module, module]: The `pyarrow` and `pyarrow.compute` modules.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+    """
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise OptionalDependencyError(
+            message=f"{e}: PyArrow is not installed. Install it with `pip install pyarrow` to use this method.",
+            package="pyarrow",
+            feature="dataframe_method='arrow'",
+            install_hint="pip install pyarrow",
+        ) from e
+    return pa, pc
+
+def _arrow_values(pa: Any, pc: Any, values: list) -> 'pa.Array':
+    """Helper method to parse a column of observation values into a float64 Arrow array.
+
+    Args:
+        pa (module): The `pyarrow` module.
+        pc (module): The `pyarrow.compute` module.
+        values (list): The raw values, as strings or numbers.
+
+    Returns:
+        pyarrow.Array: The parsed values, with FRED's '.' missing marker as null.
+    """
+
+    raw = pa.array(values)
+    if pa.types.is_string(raw.type):
+        raw = pc.if_else(pc.equal(raw, _MISSING_VALUE), pa.scalar(None, pa.string()), raw)
+    return pc.cast(raw, pa.float64())
+
+def _pandas_dataframe_converter(data: Dict[str, list], value_dtype: str='float64', realtime_columns: str='string') -> pd.DataFrame:
     """Internal converter function to convert a FRED observation dictionary to a Pandas DataFrame.
 
     Args:
         data (Dict[str, list]): FRED observation dictionary.
+        value_dtype (str, optional): The dtype of the value columns, 'float64' or 'float32'. Defaults to 'float64'.
+        realtime_columns (str, optional): How to return 'realtime_start' and 'realtime_end': 'string', 'category', 'date' or 'drop'. Defaults to 'string'.
 
     Returns:
         pandas.DataFrame: Converted Pandas DataFrame.
 
     Raises:
         DataFrameConversionError: If 'observations' key is not in the data or if conversion fails.
+        ValueError: If value_dtype or realtime_columns is invalid.
 
     Examples:
         >>> import fedfred as fd
@@ -70,7 +210,10 @@ def _pandas_dataframe_converter(data: Dict[str, list]) -> pd.DataFrame:
         2020-03-01  300.0
 
     Notes:
-        The 'date' column is converted to a DatetimeIndex and set as the DataFrame index and the 'value' column is converted to numeric, with non-numeric values coerced to NaN.
+        Columns are extracted from the rows in one pass per field. The 'date' column is parsed with a fixed
+        ISO format into the DatetimeIndex, and every other non real-time column is parsed as a value column,
+        with FRED's '.' missing marker mapped straight to NaN. On a 100,000-row series this is several times
+        faster than building the frame from the row dicts and inferring types.
 
     References:
         - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.helpers.Helpers.to_pd_df.html
@@ -87,25 +230,46 @@ def _pandas_dataframe_converter(data: Dict[str, list]) -> pd.DataFrame:
             missing_fields=('observations',),
             details="Data must contain 'observations' key"
         )
-
-    df = pd.DataFrame(data['observations'])
-    df['date'] = pd.to_datetime(df['date'])
-    df.set_index('date', inplace=True)
-    df['value'] = pd.to_numeric(df['value'], errors = 'coerce')
-    return df
-
-def _polars_dataframe_converter(data: Dict[str, list]) -> 'pl.DataFrame':
+    if value_dtype not in ('float64', 'float32'):
+        raise ValueError("value_dtype must be a string, options are: 'float64' or 'float32'")
+    if realtime_columns not in ('string', 'category', 'date', 'drop'):
+        raise ValueError("realtime_columns must be a string, options are: 'string', 'category', 'date', or 'drop'")
+
+    columns = _observation_columns(data['observations'])
+    if not columns:
+        return pd.DataFrame({'value': np.array([], dtype=value_dtype)}, index=pd.DatetimeIndex([], dtype=_DATETIME_DTYPE, name='date'))
+    if 'date' not in columns:
+        raise DataFrameConversionError(
+            message="DataFrame conversion failed: observations have no 'date' field",
+            backend='pandas',
+            missing_fields=('date',),
+            details="Each observation must contain a 'date' field"
+        )
+    frame: Dict[str, Any] = {}
+    for name, values in columns.items():
+        if name == 'date':
+            continue
+        if name in _REALTIME_COLUMNS:
+            if realtime_columns != 'drop':
+                frame[name] = _pandas_realtime_column(values, realtime_columns)
+        else:
+            frame[name] = _observation_values(values, value_dtype)
+    index = pd.DatetimeIndex(_observation_dates(columns['date']).astype(_DATETIME_DTYPE), name='date')
+    return pd.DataFrame(frame, index=index)
+
+def _polars_dataframe_converter(data: Dict[str, list], lazy: bool=False) -> Union['pl.DataFrame', 'pl.LazyFrame']:
     """Helper method to convert a fred observation dictionary to a Polars DataFrame.
 
     Args:
         data (Dict[str, list]): FRED observation dictionary.
+        lazy (bool, optional): Return a LazyFrame whose parsing runs when it is collected. Defaults to False.
 
     Returns:
-        polars.DataFrame: Converted Polars DataFrame.
+        polars.DataFrame | polars.LazyFrame: Converted Polars DataFrame, or LazyFrame if lazy is True.
 
     Raises:
         OptionalDependencyError: If Polars is not installed.
-        DataFrameConversionError: If 'observations' key is not in the data.
+        DataFrameConversionError: If 'observations' key is not in the data, or observations have no 'date' field.
 
     Examples:
         >>> import fedfred as fd
@@ -130,7 +294,10 @@ def _polars_dataframe_converter(data: Dict[str, list]) -> 'pl.DataFrame':
         └────────────┴───────┘
 
     Notes:
-        The 'value' column is converted to Float64, with 'NA' values replaced with None.
+        Columns are built straight from the response, without an intermediate pandas frame. 'date' and the
+        real-time columns become `pl.Date` (the open end stays 9999-12-31), and every other column is cast to
+        Float64 non-strictly, so FRED's '.' missing marker becomes null. Parsing runs column-parallel in
+        the Polars engine.
 
     References:
         - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.helpers.Helpers.to_pl_df.html
@@ -158,14 +325,26 @@ def _polars_dataframe_converter(data: Dict[str, list]) -> 'pl.DataFrame':
             details="Data must contain 'observations' key"
         )
 
-    df = pl.DataFrame(data['observations'])
-    df = df.with_columns(
-        pl.when(pl.col('value') == 'NA')
-        .then(None)
-        .otherwise(pl.col('value').cast(pl.Float64))
-        .alias('value')
-    )
-    return df
+    columns = _observation_columns(data['observations'])
+    if not columns:
+        empty = pl.DataFrame(schema={'date': pl.Date, 'value': pl.Float64})
+        return empty.lazy() if lazy else empty
+    if 'date' not in columns:
+        raise DataFrameConversionError(
+            message="DataFrame conversion failed: observations have no 'date' field",
+            backend='polars',
+            missing_fields=('date',),
+            details="Each observation must contain a 'date' field"
+        )
+    frame = pl.DataFrame({name: pl.Series(name, values, strict=False) for name, values in columns.items()})
+    parsers = []
+    for name, dtype in frame.schema.items():
+        if name == 'date' or name in _REALTIME_COLUMNS:
+            parsers.append(pl.col(name).str.to_date('%Y-%m-%d') if dtype == pl.String else pl.col(name).cast(pl.Date))
+        else:
+            parsers.append(pl.col(name).cast(pl.Float64, strict=False))
+    parsed = frame.lazy().with_columns(parsers)
+    return parsed if lazy else parsed.collect()
 
 def _dask_dataframe_converter(data: Dict[str, list]) -> 'dd.DataFrame':
     """Helper method to convert a FRED observation dictionary to a Dask DataFrame.
@@ -221,6 +400,64 @@ def _dask_dataframe_converter(data: Dict[str, list]) -> 'dd.DataFrame':
     df = _pandas_dataframe_converter(data)
     return dd.from_pandas(df, npartitions=1)
 
+def _arrow_dataframe_converter(data: Dict[str, list]) -> 'pa.Table':
+    """Helper method to convert a FRED observation dictionary to a PyArrow Table.
+
+    Args:
+        data (Dict[str, list]): FRED observation dictionary.
+
+    Returns:
+        pyarrow.Table: Converted PyArrow Table.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+        DataFrameConversionError: If 'observations' key is not in the data, or observations have no 'date' field.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key')
+        >>> table = fred.get_series_observations('GNPCA', dataframe_method='arrow')
+        >>> print(table.schema)
+        realtime_start: date32[day]
+        realtime_end: date32[day]
+        date: date32[day]
+        value: double
+
+    Notes:
+        Columns are built straight from the response, without an intermediate pandas frame. 'date' and the
+        real-time columns become date32 and every other column float64, with FRED's '.' missing marker as null.
+        The Table can be handed to `pl.from_arrow`, `Table.to_pandas(types_mapper=pd.ArrowDtype)` or DuckDB
+        without copying its buffers.
+    """
+
+    pa, pc = _pyarrow()
+
+    if 'observations' not in data:
+        raise DataFrameConversionError(
+            message="DataFrame conversion failed: 'observations' key not found in data",
+            backend='arrow',
+            missing_fields=('observations',),
+            details="Data must contain 'observations' key"
+        )
+
+    columns = _observation_columns(data['observations'])
+    if not columns:
+        return pa.table({'date': pa.array([], type=pa.date32()), 'value': pa.array([], type=pa.float64())})
+    if 'date' not in columns:
+        raise DataFrameConversionError(
+            message="DataFrame conversion failed: observations have no 'date' field",
+            backend='arrow',
+            missing_fields=('date',),
+            details="Each observation must contain a 'date' field"
+        )
+    table = {}
+    for name, values in columns.items():
+        if name == 'date' or name in _REALTIME_COLUMNS:
+            table[name] = pc.cast(pa.array(values), pa.date32())
+        else:
+            table[name] = _arrow_values(pa, pc, values)
+    return pa.table(table)
+
 def _geopandas_geodataframe_converter(shapefile: gpd.GeoDataFrame, meta_data: Dict) -> gpd.GeoDataFrame:
     """Helper method to convert a FRED observation dictionary to a GeoPandas GeoDataFrame.
 
@@ -403,17 +640,75 @@ def _polars_geodataframe_converter(shapefile: gpd.GeoDataFrame, meta_data: Dict)
     gdf = _geopandas_geodataframe_converter(shapefile, meta_data)
     return st.from_geopandas(gdf)
 
-async def _pandas_dataframe_converter_async(data: Dict[str, list]) -> pd.DataFrame:
+def _arrow_regional_data_converter(meta_data: Dict) -> 'pa.Table':
+    """Helper method to convert GeoFRED regional data to a PyArrow Table.
+
+    Args:
+        meta_data (Dict): FRED response metadata dictionary.
+
+    Returns:
+        pyarrow.Table: One row per region and date, with 'date', 'region', 'code', 'value' and 'series_id' columns.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+        GeoDataFrameConversionError: If no data section is found in the metadata.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key').GeoFred
+        >>> table = fred.get_series_data('WIPCPI', geodataframe_method='arrow')
+        >>> print(table.slice(0, 2).to_pydict())
+        {'date': [datetime.date(2013, 1, 1), datetime.date(2013, 1, 1)], 'region': ['Alabama', 'Alaska'], 'code': ['01', '02'], 'value': [36132.0, 51374.0], 'series_id': ['ALPCPI', 'AKPCPI']}
+
+    Notes:
+        No shapefile is joined, so the caller can attach geometry on its own key. Every date in the data
+        section is kept, 'series_id' is dictionary encoded, and the remaining metadata fields (title, units,
+        frequency, ...) are stored in the schema metadata.
+    """
+
+    pa, pc = _pyarrow()
+
+    data_section = meta_data.get('data', {})
+    if not data_section:
+        raise GeoDataFrameConversionError(
+            message="GeoDataFrame conversion failed: No data section found in metadata",
+            backend='arrow',
+            missing_fields=('data',),
+            details="Metadata must contain 'data' section with observations"
+        )
+
+    columns: Dict[str, list] = {'date': [], 'region': [], 'code': [], 'value': [], 'series_id': []}
+    for date, items in data_section.items():
+        for item in items:
+            columns['date'].append(date)
+            columns['region'].append(item.get('region'))
+            columns['code'].append(item.get('code'))
+            columns['value'].append(item.get('value'))
+            columns['series_id'].append(item.get('series_id'))
+    table = pa.table({
+        'date': pc.cast(pa.array(columns['date'], type=pa.string()), pa.date32()),
+        'region': pa.array(columns['region'], type=pa.string()),
+        'code': pa.array(columns['code'], type=pa.string()),
+        'value': _arrow_values(pa, pc, columns['value']),
+        'series_id': pa.array(columns['series_id'], type=pa.string()).dictionary_encode(),
+    })
+    metadata = {key: str(value) for key, value in meta_data.items() if key != 'data' and value is not None}
+    return table.replace_schema_metadata(metadata)
+
+async def _pandas_dataframe_converter_async(data: Dict[str, list], value_dtype: str='float64', realtime_columns: str='string') -> pd.DataFrame:
     """Helper method to convert a FRED observation dictionary to a Pandas DataFrame asynchronously.
 
     Args:
         data (Dict[str, list]): FRED observation dictionary.
+        value_dtype (str, optional): The dtype of the value columns, 'float64' or 'float32'. Defaults to 'float64'.
+        realtime_columns (str, optional): How to return 'realtime_start' and 'realtime_end': 'string', 'category', 'date' or 'drop'. Defaults to 'string'.
 
     Returns:
         pandas.DataFrame: Converted Pandas DataFrame.
 
     Raises:
         DataFrameConversionError: If 'observations' key is not in the data.
+        ValueError: If value_dtype or realtime_columns is invalid.
 
     Examples:
         >>> import asyncio
@@ -437,7 +732,7 @@ async def _pandas_dataframe_converter_async(data: Dict[str, list]) -> pd.DataFra
         2020-03-01  300.0
 
     Notes:
-        The 'date' column is converted to a DatetimeIndex and set as the DataFrame index and the 'value' column is converted to numeric, with non-numeric values coerced to NaN.
+        Runs :func:`_pandas_dataframe_converter` in a worker thread.
 
     References:
         - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.helpers.AsyncHelpers._pandas_dataframe_converter_async.html
@@ -447,16 +742,17 @@ async def _pandas_dataframe_converter_async(data: Dict[str, list]) -> pd.DataFra
         - :meth:`AsyncHelpers._dask_dataframe_converter_async`: Asynchronously convert a FRED observation dictionary to a Dask DataFrame.    
     """
 
-    return await asyncio.to_thread(_pandas_dataframe_converter, data)
+    return await asyncio.to_thread(_pandas_dataframe_converter, data, value_dtype, realtime_columns)
 
-async def _polars_dataframe_converter_async(data: Dict[str, list]) -> 'pl.DataFrame':
+async def _polars_dataframe_converter_async(data: Dict[str, list], lazy: bool=False) -> Union['pl.DataFrame', 'pl.LazyFrame']:
     """Helper method to convert a FRED observation dictionary to a Polars DataFrame asynchronously.
 
     Args:
         data (Dict[str, list]): FRED observation dictionary.
+        lazy (bool, optional): Return a LazyFrame whose parsing runs when it is collected. Defaults to False.
 
     Returns:
-        polars.DataFrame: Converted Polars DataFrame.
+        polars.DataFrame | polars.LazyFrame: Converted Polars DataFrame, or LazyFrame if lazy is True.
 
     Raises:
         ImportError: If Polars is not installed.
@@ -489,7 +785,7 @@ async def _polars_dataframe_converter_async(data: Dict[str, list]) -> 'pl.DataFr
         └────────────┴───────┘
 
     Notes:
-        The 'value' column is converted to Float64, with 'NA' values replaced with None.
+        Runs :func:`_polars_dataframe_converter` in a worker thread.
 
     References:
         - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.helpers.AsyncHelpers.to_pl_df.html
@@ -499,7 +795,7 @@ async def _polars_dataframe_converter_async(data: Dict[str, list]) -> 'pl.DataFr
         - :meth:`AsyncHelpers.to_dd_df`: Asynchronously convert a FRED observation dictionary to a Dask DataFrame.    
     """
 
-    return await asyncio.to_thread(_polars_dataframe_converter, data)
+    return await asyncio.to_thread(_polars_dataframe_converter, data, lazy)
 
 async def _dask_dataframe_converter_async(data: Dict[str, list]) -> 'dd.DataFrame':
     """Helper method to convert a FRED observation dictionary to a Dask DataFrame asynchronously.
@@ -559,6 +855,36 @@ async def _dask_dataframe_converter_async(data: Dict[str, list]) -> 'dd.DataFram
     df = await _pandas_dataframe_converter_async(data)
     return await asyncio.to_thread(dd.from_pandas, df, npartitions=1)
 
+async def _arrow_dataframe_converter_async(data: Dict[str, list]) -> 'pa.Table':
+    """Helper method to convert a FRED observation dictionary to a PyArrow Table asynchronously.
+
+    Args:
+        data (Dict[str, list]): FRED observation dictionary.
+
+    Returns:
+        pyarrow.Table: Converted PyArrow Table.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+        DataFrameConversionError: If 'observations' key is not in the data, or observations have no 'date' field.
+
+    Examples:
+        >>> import asyncio
+        >>> import fedfred as fd
+        >>> async def main():
+        >>>     fred = fd.AsyncFred('your_api_key')
+        >>>     table = await fred.get_series_observations('GNPCA', dataframe_method='arrow')
+        >>>     print(table.num_columns)
+        >>> if __name__ == "__main__":
+        >>>     asyncio.run(main())
+        4
+
+    Notes:
+        The conversion runs in a worker thread; see `_arrow_dataframe_converter`.
+    """
+
+    return await asyncio.to_thread(_arrow_dataframe_converter, data)
+
 async def _geopandas_geodataframe_converter_async(shapefile: gpd.GeoDataFrame, meta_data: Dict) -> gpd.GeoDataFrame:
     """Helper method to convert a FRED observation dictionary to a GeoPandas GeoDataFrame asynchronously.
 
@@ -733,6 +1059,413 @@ async def _polars_geodataframe_converter_async(shapefile: gpd.GeoDataFrame, meta
     gdf = await _geopandas_geodataframe_converter_async(shapefile, meta_data)
     return await asyncio.to_thread(st.from_geopandas, gdf)
 
+async def _arrow_regional_data_converter_async(meta_data: Dict) -> 'pa.Table':
+    """Helper method to convert GeoFRED regional data to a PyArrow Table asynchronously.
+
+    Args:
+        meta_data (Dict): FRED response metadata dictionary.
+
+    Returns:
+        pyarrow.Table: One row per region and date, with 'date', 'region', 'code', 'value' and 'series_id' columns.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+        GeoDataFrameConversionError: If no data section is found in the metadata.
+
+    Notes:
+        The conversion runs in a worker thread; see `_arrow_regional_data_converter`.
+    """
+
+    return await asyncio.to_thread(_arrow_regional_data_converter, meta_data)
+
+# Panel Converters
+def _panel_columns_collector(columns: Dict[str, list], response: Dict) -> None:
+    """Helper method to append the observations of a bulk release page to long-format columns.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns being filled, and optionally 'realtime_start' and 'realtime_end'.
+        response (Dict): One page of a FRED v2 release observations response.
+
+    Raises:
+        ValueError: If the page has no series data.
+
+    Notes:
+        Only the raw strings are kept; no model objects or per-series frames are built. The real-time columns
+        are only filled when `columns` has them.
+    """
+
+    series_list = response.get('series', response.get('seriess'))
+    if series_list is None:
+        raise ValueError("Invalid API response: Missing 'series' field")
+    series_ids, dates, values = columns['series_id'], columns['date'], columns['value']
+    realtime = [name for name in _REALTIME_COLUMNS if name in columns]
+    for series in series_list:
+        observations = series.get('observations') or []
+        series_ids.extend([series.get('series_id', series.get('id'))] * len(observations))
+        dates.extend([observation['date'] for observation in observations])
+        values.extend([observation['value'] for observation in observations])
+        for name in realtime:
+            columns[name].extend([observation.get(name) for observation in observations])
+
+def _pandas_panel_converter(columns: Dict[str, list], layout: str='long') -> pd.DataFrame:
+    """Helper method to convert long-format observation columns to a Pandas DataFrame.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns, and optionally 'realtime_start' and 'realtime_end'.
+        layout (str, optional): 'long' for one row per observation, or 'wide' for one column per series indexed by date. Defaults to 'long'.
+
+    Returns:
+        pandas.DataFrame: The converted DataFrame.
+
+    Notes:
+        'series_id' is categorical, 'date' is parsed with a fixed ISO format and missing values ('.') become NaN.
+        'realtime_start' and 'realtime_end', when collected, stay strings in the long layout.
+    """
+
+    frame: Dict[str, Any] = {'series_id': pd.Categorical(columns['series_id'])}
+    for name in _REALTIME_COLUMNS:
+        if name in columns:
+            frame[name] = _pandas_realtime_column(columns[name], 'string')
+    frame['date'] = pd.to_datetime(pd.Series(columns['date'], dtype=object), format='%Y-%m-%d')
+    frame['value'] = pd.to_numeric(pd.Series(columns['value'], dtype=object), errors='coerce')
+    df = pd.DataFrame(frame)
+    if layout == 'wide':
+        df = df.pivot(index='date', columns='series_id', values='value')
+        df.columns = df.columns.astype(str)
+        df.columns.name = None
+    return df
+
+def _polars_panel_converter(columns: Dict[str, list], layout: str='long') -> 'pl.DataFrame':
+    """Helper method to convert long-format observation columns to a Polars DataFrame.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns, and optionally 'realtime_start' and 'realtime_end'.
+        layout (str, optional): 'long' for one row per observation, or 'wide' for one column per series. Defaults to 'long'.
+
+    Returns:
+        polars.DataFrame: The converted DataFrame.
+
+    Raises:
+        OptionalDependencyError: If Polars is not installed.
+
+    Notes:
+        'date', and 'realtime_start' and 'realtime_end' when collected, are Date columns and missing values ('.') become null.
+    """
+
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise OptionalDependencyError(
+            message=f"{e}: Polars is not installed. Install it with `pip install polars` to use this method.",
+            package="polars",
+            feature="dataframe_method='polars'",
+            install_hint="pip install polars",
+        ) from e
+
+    frame = {'series_id': pl.Series(columns['series_id'], dtype=pl.Utf8)}
+    for name in _REALTIME_COLUMNS:
+        if name in columns:
+            frame[name] = pl.Series(columns[name], dtype=pl.Utf8).str.to_date('%Y-%m-%d')
+    frame['date'] = pl.Series(columns['date'], dtype=pl.Utf8).str.to_date('%Y-%m-%d')
+    frame['value'] = pl.Series(columns['value'], dtype=pl.Utf8).cast(pl.Float64, strict=False)
+    df = pl.DataFrame(frame)
+    if layout == 'wide':
+        df = df.pivot(on='series_id', index='date', values='value').sort('date')
+    return df
+
+def _arrow_panel_converter(columns: Dict[str, list], layout: str='long') -> 'pa.Table':
+    """Helper method to convert long-format observation columns to a PyArrow Table.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns, and optionally 'realtime_start' and 'realtime_end'.
+        layout (str, optional): 'long' for one row per observation, or 'wide' for one column per series. Defaults to 'long'.
+
+    Returns:
+        pyarrow.Table: The converted Table.
+
+    Raises:
+        OptionalDependencyError: If PyArrow is not installed.
+
+    Notes:
+        'series_id' is dictionary encoded, 'date', and 'realtime_start' and 'realtime_end' when collected, are
+        date32 and missing values ('.') become null.
+    """
+
+    pa, pc = _pyarrow()
+
+    values = _arrow_values(pa, pc, columns['value'])
+    dates = pc.cast(pa.array(columns['date'], type=pa.string()), pa.date32())
+    series_ids = pa.array(columns['series_id'], type=pa.string()).dictionary_encode()
+    if layout != 'wide':
+        table = {'series_id': series_ids}
+        for name in _REALTIME_COLUMNS:
+            if name in columns:
+                table[name] = pc.cast(pa.array(columns[name], type=pa.string()), pa.date32())
+        table.update(date=dates, value=values)
+        return pa.table(table)
+    unique_dates = pc.unique(dates)
+    unique_dates = pc.take(unique_dates, pc.sort_indices(unique_dates))
+    rows = pc.index_in(dates, value_set=unique_dates).to_numpy()
+    cols = series_ids.indices.to_numpy()
+    matrix = np.full((len(unique_dates), len(series_ids.dictionary)), np.nan)
+    matrix[rows, cols] = values.to_numpy(zero_copy_only=False)
+    table = {'date': unique_dates}
+    for index, series_id in enumerate(series_ids.dictionary.to_pylist()):
+        table[series_id] = pa.array(matrix[:, index], from_pandas=True)
+    return pa.table(table)
+
+def _panel_duplicate(columns: Dict[str, list]) -> Optional[Tuple[str, str]]:
+    """Helper method to find the first series and date that appear more than once in long-format columns.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id' and 'date' columns.
+
+    Returns:
+        Tuple[str, str], optional: The first repeated (series_id, date) pair, or None if every pair is unique.
+    """
+
+    seen = set()
+    for key in zip(columns['series_id'], columns['date']):
+        if key in seen:
+            return key
+        seen.add(key)
+    return None
+
+_PANEL_CONVERTERS = {
+    'pandas': _pandas_panel_converter,
+    'polars': _polars_panel_converter,
+    'arrow': _arrow_panel_converter,
+}
+"""Mapping of dataframe_method names to long-format column converters."""
+
+def _panel_dataframe_converter(columns: Dict[str, list], dataframe_method: str='pandas', layout: str='long') -> Any:
+    """Helper method to convert long-format observation columns to a DataFrame or Table.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns, and optionally 'realtime_start' and 'realtime_end'.
+        dataframe_method (str, optional): 'pandas', 'polars' or 'arrow'. Defaults to 'pandas'.
+        layout (str, optional): 'long' or 'wide'. Defaults to 'long'.
+
+    Returns:
+        pandas.DataFrame | polars.DataFrame | pyarrow.Table: Depending on the dataframe_method selected.
+
+    Raises:
+        ValueError: If dataframe_method or layout is not supported, or if layout is 'wide' and a series has more than one observation for a date.
+        OptionalDependencyError: If the selected library is not installed.
+
+    Examples:
+        >>> columns = {'series_id': [], 'date': [], 'value': []}
+        >>> _panel_columns_collector(columns, page)
+        >>> df = _panel_dataframe_converter(columns, 'pandas', 'wide')
+    """
+
+    if dataframe_method not in _PANEL_CONVERTERS:
+        raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
+    if layout not in ('long', 'wide'):
+        raise ValueError("layout must be a string, options are: 'long' or 'wide'")
+    if layout == 'wide':
+        duplicate = _panel_duplicate(columns)
+        if duplicate is not None:
+            raise ValueError(f"layout='wide' needs one observation per series and date, but {duplicate[0]} has {duplicate[1]} "
+                             "more than once; use layout='long'")
+    return _PANEL_CONVERTERS[dataframe_method](columns, layout)
+
+async def _panel_dataframe_converter_async(columns: Dict[str, list], dataframe_method: str='pandas', layout: str='long') -> Any:
+    """Helper method to convert long-format observation columns to a DataFrame or Table asynchronously.
+
+    Args:
+        columns (Dict[str, list]): The 'series_id', 'date' and 'value' columns, and optionally 'realtime_start' and 'realtime_end'.
+        dataframe_method (str, optional): 'pandas', 'polars' or 'arrow'. Defaults to 'pandas'.
+        layout (str, optional): 'long' or 'wide'. Defaults to 'long'.
+
+    Returns:
+        pandas.DataFrame | polars.DataFrame | pyarrow.Table: Depending on the dataframe_method selected.
+
+    Raises:
+        ValueError: If dataframe_method or layout is not supported, or if layout is 'wide' and a series has more than one observation for a date.
+        OptionalDependencyError: If the selected library is not installed.
+    """
+
+    return await asyncio.to_thread(_panel_dataframe_converter, columns, dataframe_method, layout)
+
+# Element Table Converters
+_ELEMENT_FIELDS = ('element_id', 'parent_id', 'level', 'series_id', 'release_id', 'line', 'type', 'name')
+"""Element fields collected by the release table flattener."""
+
+def _element_table_flattener(response: Dict) -> Dict[str, list]:
+    """Helper method to flatten a nested release tables response into columns, without recursion.
+
+    Args:
+        response (Dict): A FRED release tables response.
+
+    Returns:
+        Dict[str, list]: One list per element field, plus 'parent_position', the row of each element's parent or -1 for a top-level element.
+
+    Raises:
+        ValueError: If the response has no 'elements' field.
+
+    Notes:
+        Elements are visited with an explicit stack in preorder, so every parent row comes before its
+        children and tables of any depth are flattened without touching the recursion limit.
+    """
+
+    if "elements" not in response:
+        raise ValueError("Invalid API response: Missing 'elements' field")
+    columns: Dict[str, list] = {name: [] for name in _ELEMENT_FIELDS}
+    parent_positions: List[int] = []
+    stack = [(element, -1) for element in reversed(list(response["elements"].values()))]
+    while stack:
+        element, parent_position = stack.pop()
+        position = len(parent_positions)
+        parent_positions.append(parent_position)
+        for name in _ELEMENT_FIELDS:
+            columns[name].append(element.get(name))
+        children = element.get("children") or ()
+        stack.extend((child, position) for child in reversed(children))
+    columns['parent_position'] = parent_positions
+    return columns
+
+def _element_dataframe_converter(columns: Dict[str, list], dataframe_method: str='pandas') -> Any:
+    """Helper method to convert flattened release table columns to a DataFrame or Table.
+
+    Args:
+        columns (Dict[str, list]): The columns built by `_element_table_flattener`.
+        dataframe_method (str, optional): 'pandas', 'polars' or 'arrow'. Defaults to 'pandas'.
+
+    Returns:
+        pandas.DataFrame | polars.DataFrame | pyarrow.Table: One row per element, in preorder, with 'element_id', 'parent_id', 'level', 'series_id', 'type', 'name' and 'line' columns.
+
+    Raises:
+        ValueError: If dataframe_method is not supported.
+        OptionalDependencyError: If the selected library is not installed.
+
+    Notes:
+        'level' is parsed to an integer; the release ID, shared by every row, is dropped.
+    """
+
+    names = ('element_id', 'parent_id', 'level', 'series_id', 'type', 'name', 'line')
+    if dataframe_method == 'pandas':
+        df = pd.DataFrame({name: columns[name] for name in names})
+        df['element_id'] = df['element_id'].astype('int64')
+        df['parent_id'] = df['parent_id'].astype('int64')
+        df['level'] = pd.to_numeric(df['level'], errors='coerce').astype('Int16')
+        return df
+    if dataframe_method == 'polars':
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise OptionalDependencyError(
+                message=f"{e}: Polars is not installed. Install it with `pip install polars` to use this method.",
+                package="polars",
+                feature="dataframe_method='polars'",
+                install_hint="pip install polars",
+            ) from e
+        return pl.DataFrame({
+            'element_id': pl.Series(columns['element_id'], dtype=pl.Int64),
+            'parent_id': pl.Series(columns['parent_id'], dtype=pl.Int64),
+            'level': pl.Series([str(level) for level in columns['level']], dtype=pl.Utf8).cast(pl.Int16, strict=False),
+            **{name: pl.Series(columns[name], dtype=pl.Utf8) for name in names[3:]},
+        })
+    if dataframe_method == 'arrow':
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError as e:
+            raise OptionalDependencyError(
+                message=f"{e}: PyArrow is not installed. Install it with `pip install pyarrow` to use this method.",
+                package="pyarrow",
+                feature="dataframe_method='arrow'",
+                install_hint="pip install pyarrow",
+            ) from e
+        return pa.table({
+            'element_id': pa.array(columns['element_id'], type=pa.int64()),
+            'parent_id': pa.array(columns['parent_id'], type=pa.int64()),
+            'level': pc.cast(pa.array([str(level) for level in columns['level']], type=pa.string()), pa.int16()),
+            **{name: pa.array(columns[name], type=pa.string()) for name in names[3:]},
+        })
+    raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
+
+async def _element_dataframe_converter_async(columns: Dict[str, list], dataframe_method: str='pandas') -> Any:
+    """Helper method to convert flattened release table columns to a DataFrame or Table asynchronously.
+
+    Args:
+        columns (Dict[str, list]): The columns built by `_element_table_flattener`.
+        dataframe_method (str, optional): 'pandas', 'polars' or 'arrow'. Defaults to 'pandas'.
+
+    Returns:
+        pandas.DataFrame | polars.DataFrame | pyarrow.Table: Depending on the dataframe_method selected.
+
+    Raises:
+        ValueError: If dataframe_method is not supported.
+        OptionalDependencyError: If the selected library is not installed.
+    """
+
+    return await asyncio.to_thread(_element_dataframe_converter, columns, dataframe_method)
+
+# Incremental Sync Converters
+_EMPTY_OBSERVATIONS: Dict[str, list] = {'realtime_start': [], 'realtime_end': [], 'date': [], 'value': []}
+"""Observation columns of a response with no observations, so converters build an empty frame with the usual columns."""
+
+def _observations_sync_start(stored: Any, revision_window: timedelta) -> Optional[str]:
+    """Helper method to find where an incremental observations request should start.
+
+    Args:
+        stored (pandas.DataFrame | polars.DataFrame | str | datetime, optional): Previously stored observations, or the last observation date already held.
+        revision_window (timedelta): How far before the last stored date to re-request, to pick up revisions.
+
+    Returns:
+        str, optional: The observation_start in YYYY-MM-DD format, or None if nothing is stored yet.
+
+    Raises:
+        ValueError: If stored is not a pandas or polars DataFrame, a date string or a datetime.
+    """
+
+    if stored is None:
+        return None
+    if isinstance(stored, datetime):
+        last = stored
+    elif isinstance(stored, str):
+        last = datetime.strptime(stored[:10], '%Y-%m-%d')
+    elif isinstance(stored, pd.DataFrame):
+        if stored.empty:
+            return None
+        dates = stored.index if 'date' not in stored.columns else stored['date']
+        last = pd.Timestamp(pd.to_datetime(dates).max()).to_pydatetime()
+    elif hasattr(stored, 'get_column') and hasattr(stored, 'height'):
+        if stored.height == 0:
+            return None
+        last = datetime.strptime(str(stored.get_column('date').max())[:10], '%Y-%m-%d')
+    else:
+        raise ValueError("stored must be a pandas or polars DataFrame, a YYYY-MM-DD string or a datetime")
+    return _datetime_converter(last - revision_window)
+
+def _observations_sync_merger(stored: Any, fresh: Any, start: str) -> Any:
+    """Helper method to merge freshly fetched observations into stored ones.
+
+    Args:
+        stored (pandas.DataFrame | polars.DataFrame): The previously stored observations.
+        fresh (pandas.DataFrame | polars.DataFrame): Observations fetched from `start` onwards, of the same frame type.
+        start (str): The observation_start the fresh observations were fetched from, in YYYY-MM-DD format.
+
+    Returns:
+        pandas.DataFrame | polars.DataFrame: The stored observations before `start`, followed by the fresh ones.
+
+    Notes:
+        Every stored row dated on or after `start` is replaced, so revised values within the revision window
+        overwrite the stored ones and observations dropped by the source disappear.
+    """
+
+    if isinstance(stored, pd.DataFrame):
+        if 'date' in stored.columns:
+            kept = stored[pd.to_datetime(stored['date']) < pd.Timestamp(start)]
+            return pd.concat([kept, fresh.reset_index()], ignore_index=True)
+        kept = stored[pd.to_datetime(stored.index) < pd.Timestamp(start)]
+        return pd.concat([kept, fresh]).sort_index(kind='stable')
+
+    import polars as pl
+    kept = stored.filter(pl.col('date').cast(pl.Utf8) < start)
+    return pl.concat([kept, fresh], how='diagonal_relaxed')
+
 # Single Parameter Converters
 def _liststring_converter(parameter: list[str]) -> str:
     """Helper method to convert a list of strings to a semicolon-separated string.
@@ -838,6 +1571,124 @@ def _vintage_dates_type_converter(param: Union[str, datetime, list[Optional[Unio
             received=type(param).__name__,
         )
 
+_VINTAGE_DATES_PER_REQUEST = 500
+"""Vintage dates sent per observations request, keeping each request inside the API's vintage date cap and URL length limits."""
+
+def _vintage_dates_chunker(vintage_dates: str, size: int=_VINTAGE_DATES_PER_REQUEST) -> List[str]:
+    """Helper method to split a vintage_dates string into chunks small enough for one request each.
+
+    Args:
+        vintage_dates (str): A comma-separated string of vintage dates, as built by `_vintage_dates_type_converter`.
+        size (int, optional): The most vintage dates per chunk. Defaults to 500.
+
+    Returns:
+        List[str]: Comma-separated chunks of the sorted, de-duplicated vintage dates.
+
+    Examples:
+        >>> _vintage_dates_chunker("2020-03-01,2020-01-01,2020-02-01", size=2)
+        ['2020-01-01,2020-02-01', '2020-03-01']
+
+    Notes:
+        ISO dates sort chronologically as strings, so consecutive chunks cover consecutive real-time ranges.
+    """
+
+    dates = sorted({date.strip() for date in vintage_dates.split(',') if date.strip()})
+    return [','.join(dates[start:start + size]) for start in range(0, len(dates), size)]
+
+def _vintage_chunks_merger(responses: List[Dict], chunks: List[str], output_type: Optional[int]=None) -> Dict[str, Any]:
+    """Helper method to merge the observations responses of consecutive vintage_dates chunks.
+
+    Args:
+        responses (List[Dict]): One observations response per chunk, in chunk order. Observations may be row dicts or streamed columns.
+        chunks (List[str]): The vintage_dates chunk each response was requested with.
+        output_type (int, optional): The output_type of the requests. Defaults to None (observations by real-time period).
+
+    Returns:
+        Dict[str, Any]: A single response whose 'observations' are columns.
+
+    Notes:
+        With output_type 2 or 3, each chunk holds one column per vintage, so rows are joined on 'date'.
+        Otherwise rows are concatenated, and a row that ends on the last vintage of one chunk is joined
+        with the row for the same date and value that starts on the first vintage of the next chunk, so
+        splitting the request does not split real-time periods. Either way the merged rows are sorted by date,
+        then by real-time start, as an unchunked response would be.
+    """
+
+    chunk_columns: List[Dict[str, list]] = []
+    for response in responses:
+        observations = response.get('observations') or []
+        if isinstance(observations, dict):
+            chunk_columns.append(observations)
+        else:
+            keys = list(dict.fromkeys(key for row in observations for key in row))
+            chunk_columns.append({key: [row.get(key) for row in observations] for key in keys})
+    names = list(dict.fromkeys(key for columns in chunk_columns for key in columns))
+    merged: Dict[str, list] = {name: [] for name in names}
+    rows = 0
+
+    if output_type in (2, 3):
+        positions: Dict[Any, int] = {}
+        for columns in chunk_columns:
+            dates = columns.get('date', [])
+            for index, date in enumerate(dates):
+                position = positions.get(date)
+                if position is None:
+                    position = positions[date] = rows
+                    rows += 1
+                    for name in names:
+                        merged[name].append(None)
+                for name, values in columns.items():
+                    if values[index] is not None:
+                        merged[name][position] = values[index]
+        order = sorted(range(rows), key=lambda position: merged['date'][position])
+        merged = {name: [values[position] for position in order] for name, values in merged.items()}
+    else:
+        boundary: Dict[Tuple[Any, Any], int] = {}
+        for chunk, columns in enumerate(chunk_columns):
+            count = len(next(iter(columns.values()), []))
+            first_vintage = chunks[chunk].split(',', 1)[0]
+            last_vintage = chunks[chunk].rsplit(',', 1)[-1]
+            starts, ends = columns.get('realtime_start'), columns.get('realtime_end')
+            dates, values = columns.get('date'), columns.get('value')
+            joinable = starts is not None and ends is not None and dates is not None and values is not None
+            next_boundary: Dict[Tuple[Any, Any], int] = {}
+            for index in range(count):
+                if joinable and starts[index] == first_vintage:
+                    position = boundary.get((dates[index], values[index]))
+                    if position is not None:
+                        merged['realtime_end'][position] = ends[index]
+                        if ends[index] == last_vintage:
+                            next_boundary[(dates[index], values[index])] = position
+                        continue
+                for name in names:
+                    column = columns.get(name)
+                    merged[name].append(column[index] if column is not None else None)
+                if joinable and ends[index] == last_vintage:
+                    next_boundary[(dates[index], values[index])] = rows
+                rows += 1
+            boundary = next_boundary
+        if 'date' in merged:
+            starts = merged.get('realtime_start') or [None] * rows
+            order = sorted(range(rows), key=lambda position: (merged['date'][position] or '', starts[position] or ''))
+            merged = {name: [values[position] for position in order] for name, values in merged.items()}
+
+    first = {key: value for key, value in responses[0].items() if key not in ('observations', 'offset', 'limit')} if responses else {}
+    return {**first, 'count': rows, 'observations': merged}
+
+async def _vintage_chunks_merger_async(responses: List[Dict], chunks: List[str], output_type: Optional[int]=None) -> Dict[str, Any]:
+    """Helper method to merge the observations responses of consecutive vintage_dates chunks asynchronously.
+
+    Args:
+        responses (List[Dict]): One observations response per chunk, in chunk order.
+        chunks (List[str]): The vintage_dates chunk each response was requested with.
+        output_type (int, optional): The output_type of the requests. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: A single response whose 'observations' are columns.
+    """
+
+    return await asyncio.to_thread(_vintage_chunks_merger, responses, chunks, output_type)
+
 def _datetime_converter(param: datetime) -> str:
     """Helper method to convert a datetime object to a string in YYYY-MM-DD format.
 
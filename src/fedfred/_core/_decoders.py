@@ -0,0 +1,229 @@
+# filepath: /src/fedfred/_core/_decoders.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred._core._decoders
+
+This module provides the JSON decoders used for FRED, GeoFRED and FRASER API responses, including an
+incremental parser that streams FRED observations straight into columns.
+
+References:
+    - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    - orjson documentation. https://github.com/ijl/orjson
+    - msgspec documentation. https://jcristharif.com/msgspec/
+"""
+
+from __future__ import annotations
+import codecs
+import json
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+from .. import settings
+from ..exceptions import OptionalDependencyError
+
+if TYPE_CHECKING:
+    import httpx # pragma: no cover
+
+_JSON_DECODER_ORDER: Tuple[str, ...] = ("orjson", "msgspec", "json")
+"""Decoders tried, fastest first, when the selection is "auto"."""
+
+def _orjson_loads() -> Callable[[bytes], Any]:
+    """Import orjson and return its decode function."""
+
+    import orjson
+    return orjson.loads
+
+def _msgspec_loads() -> Callable[[bytes], Any]:
+    """Import msgspec and return its decode function, raising ValueError on invalid JSON like the other decoders."""
+
+    import msgspec
+    decode = msgspec.json.decode
+
+    def loads(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid JSON response: {e}") from e
+
+    return loads
+
+def _json_loads() -> Callable[[bytes], Any]:
+    """Return the standard library decode function."""
+
+    return json.loads
+
+_JSON_DECODER_FACTORIES = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": _json_loads,
+}
+"""Mapping of decoder names to factories returning a bytes-to-object decode function."""
+
+@lru_cache(maxsize=None)
+def _json_decoder_resolver(decoder: str) -> Callable[[bytes], Any]:
+    """Helper method to resolve a JSON decoder selection to a decode function.
+
+    Args:
+        decoder (str): The decoder selection, one of "auto", "orjson", "msgspec" or "json".
+
+    Returns:
+        Callable[[bytes], Any]: A function decoding raw response bytes.
+
+    Raises:
+        OptionalDependencyError: If an explicitly requested decoder is not installed.
+
+    Notes:
+        Resolution is cached per selection, so the import cost is paid once per process.
+    """
+
+    if decoder == "auto":
+        for name in _JSON_DECODER_ORDER:
+            try:
+                return _JSON_DECODER_FACTORIES[name]()
+            except ImportError:
+                continue
+    try:
+        return _JSON_DECODER_FACTORIES[decoder]()
+    except ImportError as e:
+        raise OptionalDependencyError(
+            message=f"{e}: {decoder} is not installed. Install it with `pip install {decoder}` or call `fedfred.set_json_decoder('auto')`.",
+            package=decoder,
+            feature="JSON decoding",
+            install_hint=f"pip install {decoder}",
+        ) from e
+
+def _json_response_decoder(response: httpx.Response) -> Any:
+    """Helper method to decode a JSON API response with the configured decoder.
+
+    Args:
+        response (httpx.Response): The HTTP response to decode.
+
+    Returns:
+        Any: The decoded JSON payload.
+
+    Raises:
+        ValueError: If the response body is not valid JSON.
+        OptionalDependencyError: If the configured decoder is not installed.
+
+    Notes:
+        The raw `response.content` bytes are passed straight to the decoder, skipping the text decoding
+        step `response.json()` performs.
+
+    See Also:
+        - :func:`fedfred.set_json_decoder`: Choose the decoder used for API responses.
+    """
+
+    return _json_decoder_resolver(settings.get_json_decoder())(response.content)
+
+class _ObservationStreamParser:
+    """Incremental parser for the `observations` array of a FRED observations response.
+
+    Bytes are fed as they arrive from the response stream. Each observation object is decoded as soon
+    as it is complete and its fields are appended to per-column lists, so neither the full response
+    body nor a list of per-row dicts is ever held in memory.
+
+    Examples:
+        >>> parser = _ObservationStreamParser()
+        >>> for chunk in response.iter_bytes():
+        >>>     parser.feed(chunk)
+        >>> data = parser.close()
+        >>> data['observations']['value'][:2]
+        ['1202.659', '1100.670']
+    """
+
+    __slots__ = ("_decoder", "_text_decoder", "_buffer", "_started", "_finished", "_columns", "_rows")
+
+    _ARRAY_START = re.compile(r'"observations"\s*:\s*\[')
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._started: bool = False
+        self._finished: bool = False
+        self._columns: Dict[str, List[Any]] = {}
+        self._rows: int = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed the next chunk of response bytes to the parser.
+
+        Args:
+            chunk (bytes): The next chunk of the response body.
+        """
+
+        if self._finished:
+            return
+        self._buffer += self._text_decoder.decode(chunk)
+        if not self._started:
+            match = self._ARRAY_START.search(self._buffer)
+            if match is None:
+                self._buffer = self._buffer[-64:]
+                return
+            self._started = True
+            self._buffer = self._buffer[match.end():]
+        self._parse_buffer()
+
+    def close(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Finish parsing and return the observations as columns.
+
+        Returns:
+            Dict[str, Dict[str, List[Any]]]: A response-shaped dict whose 'observations' value maps each field to a column list.
+
+        Raises:
+            ValueError: If the stream ended before the observations array was complete.
+        """
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        if self._started and not self._finished:
+            self._parse_buffer()
+        if not self._finished:
+            raise ValueError("Invalid JSON response: the observations array is missing or truncated")
+        return {'observations': self._columns}
+
+    def _parse_buffer(self) -> None:
+        """Decode every complete observation object in the buffer and keep the incomplete remainder."""
+
+        buffer, pos, end = self._buffer, 0, len(self._buffer)
+        columns = self._columns
+        while pos < end:
+            char = buffer[pos]
+            if char in " \t\r\n,":
+                pos += 1
+                continue
+            if char == "]":
+                self._finished = True
+                pos += 1
+                break
+            try:
+                row, next_pos = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            for key, value in row.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * self._rows
+                column.append(value)
+            self._rows += 1
+            for column in columns.values():
+                if len(column) < self._rows:
+                    column.append(None)
+            pos = next_pos
+        self._buffer = buffer[pos:]
@@ -0,0 +1,327 @@
+# filepath: /src/fedfred/cache.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.cache
+
+This module defines shared cache backends for the fedfred clients.
+
+By default every client keeps an in-process `cachetools.FIFOCache`. The backends in this module
+implement the same mutable mapping interface, so they can be passed to `Fred`, `GeoFred` (through its
+parent `Fred`), `AsyncFred` and `Fraser` as a drop-in replacement that is shared by many processes or hosts.
+
+Classes:
+    RedisCache: A response cache stored in any server that speaks the Redis protocol.
+
+Examples:
+    >>> import fedfred as fd
+    >>> cache = fd.RedisCache(url="redis://cache.internal:6379/0", ttl=3600)
+    >>> fred = fd.Fred(cache_backend=cache)
+
+Notes:
+    Redis support requires the optional `redis` package (`pip install fedfred[redis]`), unless
+    an already-constructed client object is passed in.
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    Redis serialization protocol specification. https://redis.io/docs/latest/develop/reference/protocol-spec/
+"""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+from .exceptions import OptionalDependencyError
+
+class RedisCache(MutableMapping):
+    """Response cache backed by a Redis protocol server.
+
+    The RedisCache class implements the mutable mapping interface used by `cachetools`, so it can
+    replace the per-instance FIFO cache of a client. Every host pointing at the same server and
+    namespace shares one response cache.
+
+    Attributes:
+        client (Any): The synchronous Redis client used for cache reads and writes.
+        async_client (Any, optional): The asynchronous Redis client used by the asynchronous clients.
+        ttl (int, optional): Time-to-live in seconds applied to every cache entry written.
+        namespace (str): Prefix applied to every key stored by this cache.
+        errors (int): Number of server errors treated as a cache miss or a skipped write.
+
+    Args:
+        client (Any, optional): A synchronous client exposing the redis-py `get`, `set`, `delete` and `scan_iter` methods.
+        url (str, optional): A Redis URL used to build the clients when `client` is not supplied.
+        async_client (Any, optional): An asynchronous client exposing awaitable `get`, `set` and `delete` methods.
+        ttl (int, optional): Time-to-live in seconds for every entry. Defaults to None (no expiry).
+        namespace (str, optional): Key prefix for entries written by this cache. Defaults to 'fedfred'.
+
+    Raises:
+        ValueError: If neither `client` nor `url` is provided, or if `ttl` is not a positive integer.
+        OptionalDependencyError: If `url` is provided and the redis package is not installed.
+
+    Notes:
+        Keys are hashed from the cached call's arguments, so the original keys cannot be recovered from
+        the server; `keys()` yields the namespaced string keys. Values are stored as JSON. A server error
+        while reading or writing a response, such as a lost connection, counts as a miss and the write is
+        skipped, so a cache outage never fails a request.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> cache = fd.RedisCache(url="redis://localhost:6379/0", ttl=600, namespace="fedfred:prod")
+        >>> fred = fd.Fred(cache_backend=cache)
+        >>> fred.get_series('GNPCA')  # cached for every host sharing the server
+
+    See Also:
+        - :class:`fedfred.Fred`: The FRED client which accepts a `cache_backend`.
+    """
+
+    def __init__(self, client: Optional[Any]=None, url: Optional[str]=None, async_client: Optional[Any]=None,
+                 ttl: Optional[int]=None, namespace: str='fedfred') -> None:
+        """Initialize the RedisCache with a client or a Redis URL.
+
+        Args:
+            client (Any, optional): A synchronous client exposing the redis-py `get`, `set`, `delete` and `scan_iter` methods.
+            url (str, optional): A Redis URL used to build the clients when `client` is not supplied.
+            async_client (Any, optional): An asynchronous client exposing awaitable `get`, `set` and `delete` methods.
+            ttl (int, optional): Time-to-live in seconds for every entry. Defaults to None (no expiry).
+            namespace (str, optional): Key prefix for entries written by this cache. Defaults to 'fedfred'.
+
+        Raises:
+            ValueError: If neither `client` nor `url` is provided, or if `ttl` is not a positive integer.
+            OptionalDependencyError: If `url` is provided and the redis package is not installed.
+        """
+
+        if ttl is not None and (not isinstance(ttl, int) or isinstance(ttl, bool) or ttl <= 0):
+            raise ValueError("ttl must be a positive integer number of seconds")
+        if client is None and url is None:
+            raise ValueError("Either client or url must be provided")
+        if client is None:
+            try:
+                import redis
+                import redis.asyncio as redis_async
+            except ImportError as e:
+                raise OptionalDependencyError(
+                    message=f"{e}: Redis is not installed. Install it with `pip install redis` to use this cache backend.",
+                    package="redis",
+                    feature="RedisCache",
+                    install_hint="pip install redis",
+                ) from e
+            client = redis.Redis.from_url(url)
+            if async_client is None:
+                async_client = redis_async.Redis.from_url(url)
+        self.client: Any = client
+        self.async_client: Optional[Any] = async_client
+        self.ttl: Optional[int] = ttl
+        self.namespace: str = namespace
+        self.errors: int = 0
+
+    def __repr__(self) -> str:
+        """String representation of the RedisCache class.
+
+        Returns:
+            str: A string representation of the RedisCache instance.
+        """
+
+        return f"RedisCache(namespace='{self.namespace}', ttl={self.ttl})"
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get a cached response.
+
+        Args:
+            key (Any): The cache key.
+
+        Returns:
+            Any: The cached response.
+
+        Raises:
+            KeyError: If the key is not cached, has expired, or the server could not be read.
+        """
+
+        try:
+            raw = self.client.get(self._redis_key(key))
+        except Exception:
+            self.errors += 1
+            raise KeyError(key) from None
+        if raw is None:
+            raise KeyError(key)
+        return self._loads(raw)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Store a response, applying the configured time-to-live.
+
+        Args:
+            key (Any): The cache key.
+            value (Any): The JSON-serializable response to cache.
+
+        Notes:
+            If the server cannot be written the response is not cached.
+        """
+
+        try:
+            self.client.set(self._redis_key(key), self._dumps(value), ex=self.ttl)
+        except Exception:
+            self.errors += 1
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete a cached response.
+
+        Args:
+            key (Any): The cache key.
+
+        Raises:
+            KeyError: If the key is not cached.
+        """
+
+        if not self.client.delete(self._redis_key(key)):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is cached.
+
+        Args:
+            key (object): The cache key.
+
+        Returns:
+            bool: True if the key is cached, False otherwise.
+        """
+
+        return bool(self.client.exists(self._redis_key(key)))
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the namespaced keys stored by this cache.
+
+        Returns:
+            Iterator[str]: The namespaced string keys.
+        """
+
+        for raw_key in self.client.scan_iter(match=f"{self.namespace}:*"):
+            yield raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+
+    def __len__(self) -> int:
+        """Get the number of entries stored under this namespace.
+
+        Returns:
+            int: The number of entries.
+        """
+
+        return sum(1 for _ in self)
+
+    def clear(self) -> None:
+        """Delete every entry stored under this namespace."""
+
+        keys = list(self)
+        if keys:
+            self.client.delete(*keys)
+
+    # Async Methods
+    async def aget(self, key: Any) -> Optional[Any]:
+        """Asynchronously get a cached response.
+
+        Args:
+            key (Any): The cache key.
+
+        Returns:
+            Any, optional: The cached response, or None if the key is not cached or the server could not be read.
+
+        Notes:
+            Without an `async_client` the synchronous client is called in a worker thread so the event loop is never blocked.
+        """
+
+        redis_key = self._redis_key(key)
+        try:
+            if self.async_client is not None:
+                raw = await self.async_client.get(redis_key)
+            else:
+                raw = await asyncio.to_thread(self.client.get, redis_key)
+        except Exception:
+            self.errors += 1
+            return None
+        return None if raw is None else self._loads(raw)
+
+    async def aset(self, key: Any, value: Any) -> None:
+        """Asynchronously store a response, applying the configured time-to-live.
+
+        Args:
+            key (Any): The cache key.
+            value (Any): The JSON-serializable response to cache.
+
+        Notes:
+            If the server cannot be written the response is not cached.
+        """
+
+        redis_key = self._redis_key(key)
+        try:
+            if self.async_client is not None:
+                await self.async_client.set(redis_key, self._dumps(value), ex=self.ttl)
+            else:
+                await asyncio.to_thread(self.client.set, redis_key, self._dumps(value), ex=self.ttl)
+        except Exception:
+            self.errors += 1
+
+    # Private Methods
+    def _redis_key(self, key: Any) -> str:
+        """Build the namespaced Redis key for a cache key.
+
+        Args:
+            key (Any): The cache key, usually a `cachetools.keys.hashkey` tuple.
+
+        Returns:
+            str: The namespaced key. Keys already carrying the namespace are returned unchanged.
+        """
+
+        if isinstance(key, str) and key.startswith(f"{self.namespace}:"):
+            return key
+        digest = hashlib.sha256(repr(tuple(key) if isinstance(key, tuple) else key).encode()).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        """Serialize a response for storage."""
+
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    @staticmethod
+    def _loads(raw: Any) -> Any:
+        """Deserialize a stored response."""
+
+        return json.loads(raw)
+
+_CACHE_BYPASS: ContextVar[bool] = ContextVar('fedfred_cache_bypass', default=False)
+"""Whether requests made in the current context skip the response cache."""
+
+# Private Helpers
+@contextmanager
+def _bypass_cache() -> Iterator[None]:
+    """Skip the response cache, for reads and writes, for requests made inside the block.
+
+    Notes:
+        For requests whose answer changes while their parameters do not, such as a probe for new vintages,
+        and for one-off downloads that would only evict useful entries. The flag is a context variable, so it
+        follows worker threads started with `contextvars.copy_context()` and asyncio tasks created inside the block.
+    """
+
+    token = _CACHE_BYPASS.set(True)
+    try:
+        yield
+    finally:
+        _CACHE_BYPASS.reset(token)
@@ -0,0 +1,366 @@
+# filepath: /src/fedfred/categories.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.categories
+
+This module defines a compact local index of the FRED category tree.
+
+The index is built by `Fred.crawl_categories` and `AsyncFred.crawl_categories`, which walk the tree
+breadth-first with bounded concurrency. Once built, it answers parent, child, subtree and series
+membership queries without further API calls, and can be saved to disk and loaded again.
+
+Classes:
+    CategoryIndex: A compact index of the FRED category tree and the series in each category.
+
+Examples:
+    >>> import fedfred as fd
+    >>> fred = fd.Fred('your_api_key')
+    >>> index = fred.crawl_categories(32991, checkpoint_path='categories.json')
+    >>> index.series(32991, recursive=True)[:3]
+    ['AAA', 'AAA10Y', 'AAAFF']
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    Federal Reserve Bank of St. Louis, FRED API category documentation. https://fred.stlouisfed.org/docs/api/fred/category.html
+"""
+
+from __future__ import annotations
+import json
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+
+class CategoryIndex:
+    """Compact index of the FRED category tree and the series in each category.
+
+    Categories are stored in depth-first preorder in flat arrays, so the descendants of any category
+    form one contiguous slice and the series of a whole subtree form one contiguous slice of the series
+    array. Subtree queries are therefore a slice rather than a tree walk.
+
+    Attributes:
+        category_ids (numpy.ndarray): The category IDs, in preorder.
+        parent_positions (numpy.ndarray): The position of each category's parent, or -1 for a root.
+        subtree_ends (numpy.ndarray): One past the position of each category's last descendant.
+        names (List[str]): The category names, in preorder.
+        series_offsets (numpy.ndarray): Offsets into `series_ids` of each category's series; length is one more than the number of categories.
+        series_ids (numpy.ndarray): The series IDs of every category, concatenated in preorder.
+        pending (Tuple[int, ...]): Categories whose children and series have not been fetched yet. Empty once the crawl is complete.
+
+    Args:
+        categories (Iterable[Tuple[int, int, str]]): `(category_id, parent_id, name)` records. A category whose parent is itself or is not in the records is a root.
+        series (Mapping[int, Sequence[str]], optional): The series IDs of each category. Defaults to None.
+        pending (Iterable[int], optional): Categories still to be crawled. Defaults to ().
+
+    Raises:
+        ValueError: If a category ID appears more than once, or if the records contain a cycle.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> index = fd.CategoryIndex([(0, 0, 'Categories'), (32991, 0, 'Money, Banking, & Finance'), (22, 32991, 'Interest Rates')],
+        >>>                          series={22: ['DGS10', 'FEDFUNDS']})
+        >>> index.children(0)
+        [32991]
+        >>> index.series(32991, recursive=True)
+        ['DGS10', 'FEDFUNDS']
+        >>> index.path(22)
+        [0, 32991, 22]
+
+    See Also:
+        - :meth:`fedfred.Fred.crawl_categories`: Build the index from the FRED API.
+    """
+
+    __slots__ = ('category_ids', 'parent_positions', 'subtree_ends', 'names', 'series_offsets', 'series_ids',
+                 'pending', '_positions')
+
+    def __init__(self, categories: Iterable[Tuple[int, int, str]], series: Optional[Mapping[int, Sequence[str]]]=None,
+                 pending: Iterable[int]=()) -> None:
+        """Initialize the CategoryIndex from category records.
+
+        Args:
+            categories (Iterable[Tuple[int, int, str]]): `(category_id, parent_id, name)` records.
+            series (Mapping[int, Sequence[str]], optional): The series IDs of each category. Defaults to None.
+            pending (Iterable[int], optional): Categories still to be crawled. Defaults to ().
+
+        Raises:
+            ValueError: If a category ID appears more than once, or if the records contain a cycle.
+        """
+
+        records: Dict[int, Tuple[int, str]] = {}
+        for category_id, parent_id, name in categories:
+            if category_id in records:
+                raise ValueError(f"Duplicate category_id {category_id} in category records")
+            records[int(category_id)] = (int(parent_id), name)
+        series = series or {}
+        children: Dict[int, List[int]] = {}
+        roots: List[int] = []
+        for category_id, (parent_id, _) in records.items():
+            if parent_id == category_id or parent_id not in records:
+                roots.append(category_id)
+            else:
+                children.setdefault(parent_id, []).append(category_id)
+
+        order: List[int] = []
+        stack = sorted(roots, reverse=True)
+        while stack:
+            category_id = stack.pop()
+            order.append(category_id)
+            stack.extend(sorted(children.get(category_id, ()), reverse=True))
+        if len(order) != len(records):
+            raise ValueError("Category records contain a cycle that is not reachable from any root")
+
+        self._positions: Dict[int, int] = {category_id: position for position, category_id in enumerate(order)}
+        count = len(order)
+        self.category_ids: np.ndarray = np.asarray(order, dtype=np.int64)
+        self.names: List[str] = [records[category_id][1] for category_id in order]
+        self.parent_positions: np.ndarray = np.fromiter(
+            (self._positions.get(records[category_id][0], -1) if records[category_id][0] != category_id else -1
+             for category_id in order), dtype=np.int64, count=count)
+        sizes = np.ones(count, dtype=np.int64)
+        for position in range(count - 1, -1, -1):
+            parent = self.parent_positions[position]
+            if parent >= 0:
+                sizes[parent] += sizes[position]
+        self.subtree_ends: np.ndarray = np.arange(count, dtype=np.int64) + sizes
+        counts = np.fromiter((len(series.get(category_id, ())) for category_id in order), dtype=np.int64, count=count)
+        self.series_offsets: np.ndarray = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.series_ids: np.ndarray = np.array([series_id for category_id in order for series_id in series.get(category_id, ())],
+                                               dtype=object)
+        self.pending: Tuple[int, ...] = tuple(dict.fromkeys(int(category_id) for category_id in pending))
+
+    def __repr__(self) -> str:
+        """String representation of the CategoryIndex class.
+
+        Returns:
+            str: A string representation of the CategoryIndex instance.
+        """
+
+        return f"CategoryIndex(categories={len(self)}, series={len(self.series_ids)}, pending={len(self.pending)})"
+
+    def __len__(self) -> int:
+        """Get the number of categories in the index.
+
+        Returns:
+            int: The number of categories.
+        """
+
+        return len(self.category_ids)
+
+    def __contains__(self, category_id: object) -> bool:
+        """Check if a category is in the index.
+
+        Args:
+            category_id (object): The category ID.
+
+        Returns:
+            bool: True if the category is indexed, False otherwise.
+        """
+
+        return category_id in self._positions
+
+    @property
+    def complete(self) -> bool:
+        """Whether every category in the index has been crawled."""
+
+        return not self.pending
+
+    # Queries
+    def parent(self, category_id: int) -> Optional[int]:
+        """Get the parent of a category.
+
+        Args:
+            category_id (int): The category ID.
+
+        Returns:
+            int, optional: The parent category ID, or None for a root.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        parent = int(self.parent_positions[self._position(category_id)])
+        return None if parent < 0 else int(self.category_ids[parent])
+
+    def children(self, category_id: int) -> List[int]:
+        """Get the direct children of a category.
+
+        Args:
+            category_id (int): The category ID.
+
+        Returns:
+            List[int]: The child category IDs, in ascending order.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        position = self._position(category_id)
+        end = int(self.subtree_ends[position])
+        child, result = position + 1, []
+        while child < end:
+            result.append(int(self.category_ids[child]))
+            child = int(self.subtree_ends[child])
+        return result
+
+    def path(self, category_id: int) -> List[int]:
+        """Get the path from the root to a category.
+
+        Args:
+            category_id (int): The category ID.
+
+        Returns:
+            List[int]: The category IDs from the root down to and including `category_id`.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        position, result = self._position(category_id), []
+        while position >= 0:
+            result.append(int(self.category_ids[position]))
+            position = int(self.parent_positions[position])
+        return result[::-1]
+
+    def name(self, category_id: int) -> str:
+        """Get the name of a category.
+
+        Args:
+            category_id (int): The category ID.
+
+        Returns:
+            str: The category name.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        return self.names[self._position(category_id)]
+
+    def subtree(self, category_id: int) -> np.ndarray:
+        """Get a category and all of its descendants.
+
+        Args:
+            category_id (int): The category ID.
+
+        Returns:
+            numpy.ndarray: The category IDs of the subtree, in preorder, starting with `category_id`.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        position = self._position(category_id)
+        return self.category_ids[position:self.subtree_ends[position]]
+
+    def series(self, category_id: int, recursive: bool=False) -> List[str]:
+        """Get the series in a category.
+
+        Args:
+            category_id (int): The category ID.
+            recursive (bool, optional): Include the series of every descendant category. Defaults to False.
+
+        Returns:
+            List[str]: The series IDs, without duplicates, in preorder of their first category.
+
+        Raises:
+            KeyError: If the category is not in the index.
+        """
+
+        position = self._position(category_id)
+        end = self.subtree_ends[position] if recursive else position + 1
+        return list(dict.fromkeys(self.series_ids[self.series_offsets[position]:self.series_offsets[end]].tolist()))
+
+    def categories_of(self, series_id: str) -> List[int]:
+        """Get the categories a series belongs to.
+
+        Args:
+            series_id (str): The series ID.
+
+        Returns:
+            List[int]: The category IDs that list the series directly.
+        """
+
+        matches = np.flatnonzero(self.series_ids == series_id)
+        positions = np.searchsorted(self.series_offsets, matches, side='right') - 1
+        return self.category_ids[positions].tolist()
+
+    # Serialization
+    def records(self) -> Tuple[List[Tuple[int, int, str]], Dict[int, List[str]]]:
+        """Get the category records and series membership the index was built from.
+
+        Returns:
+            Tuple[List[Tuple[int, int, str]], Dict[int, List[str]]]: The `(category_id, parent_id, name)` records, and the series of each category that has any.
+        """
+
+        categories = [
+            (int(category_id), int(self.category_ids[parent]) if parent >= 0 else int(category_id), name)
+            for category_id, parent, name in zip(self.category_ids, self.parent_positions, self.names)
+        ]
+        series = {
+            int(self.category_ids[position]): self.series_ids[self.series_offsets[position]:self.series_offsets[position + 1]].tolist()
+            for position in range(len(self)) if self.series_offsets[position + 1] > self.series_offsets[position]
+        }
+        return categories, series
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Save the index to a JSON file.
+
+        Args:
+            path (str | os.PathLike): The file to write. It is replaced atomically.
+        """
+
+        categories, series = self.records()
+        payload = {
+            'categories': categories,
+            'series': {str(category_id): series_ids for category_id, series_ids in series.items()},
+            'pending': list(self.pending),
+        }
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(payload, file, separators=(',', ':'))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> CategoryIndex:
+        """Load an index saved with `save`.
+
+        Args:
+            path (str | os.PathLike): The file to read.
+
+        Returns:
+            CategoryIndex: The loaded index.
+        """
+
+        with open(path, 'r', encoding='utf-8') as file:
+            payload: Dict[str, Any] = json.load(file)
+        return cls(
+            (tuple(record) for record in payload['categories']),
+            {int(category_id): series_ids for category_id, series_ids in payload.get('series', {}).items()},
+            payload.get('pending', ()),
+        )
+
+    # Private Methods
+    def _position(self, category_id: int) -> int:
+        """Get the preorder position of a category, raising KeyError if it is not indexed."""
+
+        try:
+            return self._positions[category_id]
+        except KeyError:
+            raise KeyError(f"Category {category_id} is not in the index") from None
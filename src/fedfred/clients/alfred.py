@@ -19,74 +19,591 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""
+"""fedfred.clients.alfred
+
+This module defines the Alfred client for point-in-time queries against ALFRED®, the archival FRED database.
+
+Each series' full real-time history is fetched once, in as few requests as the API allows, and kept in a
+typed frame. First-release, latest-release and as-of views are then computed locally from that history,
+so asking for several views of the same series costs a single download.
+
+Classes:
+    Alfred: Client for first-release, latest-release and as-of views of ALFRED series.
+
+Examples:
+    >>> import fedfred as fd
+    >>> alfred = fd.Alfred('your_api_key')
+    >>> first = alfred.get_series_observations_first_release('GDP')
+    >>> as_of = alfred.get_series_observations_as_of_date('GDP', '2020-06-30')  # no further request
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    Federal Reserve Bank of St. Louis, ALFRED real-time periods. https://alfred.stlouisfed.org/help#real_time_periods
 """
 
-from typing import Optional
+from __future__ import annotations
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, MutableMapping, Optional, Union
+import pandas as pd
+from cachetools import LRUCache
 from .fred import Fred
-from ..config import resolve_api_key
+from ..settings import _resolve_api_key
+from ..cache import _bypass_cache
+from ..transport import CircuitBreaker, TimeoutPolicy
+from ..exceptions import OptionalDependencyError
+from ..vintages import AsOfEngine, VintageMatrix
+from ..store import VintageStore
+
+if TYPE_CHECKING:
+    import polars as pl # pragma: no cover
+
+_REALTIME_START = '1776-07-04'
+"""The earliest real-time date ALFRED accepts, requesting every vintage."""
+
+_REALTIME_END = '9999-12-31'
+"""The real-time end ALFRED uses for values that are still current."""
+
+_OBSERVATIONS_PER_REQUEST = 100000
+"""The most observations the API returns per request."""
 
 class Alfred:
+    """Client for point-in-time views of ALFRED series.
+
+    The Alfred class downloads the full real-time history of a series once and answers first-release,
+    latest-release and as-of queries from it locally.
+
+    Attributes:
+        api_key (str): Your FRED API key.
+        cache_mode (bool): Whether caching is enabled for API responses.
+        cache_size (int): The maximum number of responses, and of real-time histories, kept in memory.
+        keys (List[str]): List of keys in the response cache.
+
+    Args:
+        api_key (str, optional): Your FRED API key. If None, it is resolved from the global setting or the `FRED_API_KEY` environment variable.
+        cache_mode (bool, optional): Whether to enable caching for API responses. Defaults to True.
+        cache_size (int, optional): The maximum number of responses, and of real-time histories, kept in memory. Defaults to 256.
+        cache_backend (MutableMapping, optional): A shared response cache, such as :class:`fedfred.RedisCache`. Defaults to None.
+        timeouts (TimeoutPolicy, optional): Connect/read/write/pool timeouts per endpoint family. Defaults to `TimeoutPolicy()`.
+        circuit_breaker (CircuitBreaker, optional): Fails fast while FRED endpoints are down. Defaults to None (disabled).
+
+    Raises:
+        RuntimeError: If no API key can be resolved.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> alfred = fd.Alfred('your_api_key')
+        >>> history = alfred.get_series_history('GNPCA')
+        >>> history.head(3)
+                    realtime_start realtime_end     value
+        date
+        1929-01-01      1958-01-01   1965-08-18     104.4
+        1929-01-01      1965-08-19   1976-01-15     203.6
+        1929-01-01      1976-01-16   1980-12-22     314.7
+
+    Notes:
+        The API key is the FRED API key; ALFRED is served by the same API. Histories are keyed by series and
+        request options, and the least recently used ones are dropped once `cache_size` is reached. Use
+        `clear_history` to force a fresh download.
+
+    See Also:
+        - :class:`fedfred.Fred`: The FRED client used for the underlying requests.
+        - :meth:`fedfred.Fred.get_series_vintagedates`: The vintage dates of a series.
+        - :class:`fedfred.VintageMatrix`: The interval-encoded revision triangle returned by `get_vintage_matrix`.
+        - :class:`fedfred.AsOfEngine`: The point-in-time engine returned by `get_as_of_engine`.
+        - :class:`fedfred.VintageStore`: The local vintage store kept current by `sync_vintage_store`.
+    """
+
+    # Dunder Methods
+    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256,
+                 cache_backend: Optional[MutableMapping[Any, Any]]=None, timeouts: Optional[TimeoutPolicy]=None,
+                 circuit_breaker: Optional[CircuitBreaker]=None) -> None:
+        """Initialize the Alfred client.
+
+        Args:
+            api_key (str, optional): Your FRED API key.
+            cache_mode (bool, optional): Whether to enable caching for API responses. Defaults to True.
+            cache_size (int, optional): The maximum number of responses, and of real-time histories, kept in memory. Defaults to 256.
+            cache_backend (MutableMapping, optional): A shared response cache. Defaults to None.
+            timeouts (TimeoutPolicy, optional): Connect/read/write/pool timeouts per endpoint family. Defaults to `TimeoutPolicy()`.
+            circuit_breaker (CircuitBreaker, optional): Fails fast while FRED endpoints are down. Defaults to None (disabled).
+
+        Raises:
+            RuntimeError: If no API key can be resolved.
+        """
 
-    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256) -> None:
         self.__client: Optional[Fred] = None
-        self.api_key = resolve_api_key(api_key, service="fred")
-        self.cache_mode = cache_mode
-        self.cache_size = cache_size
+        self.api_key: str = _resolve_api_key(api_key, service="fred")
+        self.cache_mode: bool = cache_mode
+        self.cache_size: int = cache_size
+        self.__cache_backend: Optional[MutableMapping[Any, Any]] = cache_backend
+        self.__timeouts: Optional[TimeoutPolicy] = timeouts
+        self.__circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
+        self.__histories: LRUCache = LRUCache(maxsize=cache_size)
+
+    def __repr__(self) -> str:
+        """String representation of the Alfred class.
 
+        Returns:
+            str: A string representation of the Alfred instance.
+        """
+
+        return f"Alfred(api_key='{self.api_key}', cache_mode={self.cache_mode}, cache_size={self.cache_size})"
+
+    # Properties
     @property
     def __fred(self) -> Fred:
+        """The Fred client used for requests, created on first use."""
+
         if self.__client is None:
-            self.__client = Fred(api_key=self.api_key, cache_mode=self.cache_mode, cache_size=self.cache_size)
+            self.__client = Fred(api_key=self.api_key, cache_mode=self.cache_mode, cache_size=self.cache_size,
+                                 cache_backend=self.__cache_backend, timeouts=self.__timeouts,
+                                 circuit_breaker=self.__circuit_breaker)
         return self.__client
 
     @property
     def keys(self):
+        """List of keys in the response cache."""
+
         return self.__fred.keys
 
+    # Public Methods
+    def get_series_history(self, series_id: str, units: Optional[str]=None,
+                           observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                           frequency: Optional[str]=None, aggregation_method: Optional[str]=None) -> pd.DataFrame:
+        """Get the full real-time history of an ALFRED series
+
+        Fetches every vintage of every observation of a series, as real-time periods, once per series and options.
+
+        Args:
+            series_id (str): The ID for a series.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            pandas.DataFrame: Indexed by 'date', with datetime 'realtime_start' and 'realtime_end' and float 'value' columns, sorted by date then real-time start. A 'realtime_end' of NaT marks a value that is still current.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> history = alfred.get_series_history('UNRATE', observation_start='2020-01-01')
+            >>> history.loc['2020-04-01']
+                        realtime_start realtime_end  value
+            date
+            2020-04-01      2020-05-08   2021-01-07   14.7
+            2020-04-01      2021-01-08          NaT   14.8
+
+        Notes:
+            The history is requested with output_type 1 (observations by real-time period) over the widest
+            real-time range, paging through offsets only when it exceeds 100,000 rows. It is then kept in
+            memory, so the first-release, latest-release and as-of views of the same series and options
+            issue no further requests.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_observations.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_series_history.html
+        """
+
+        key = (series_id, units, observation_start, observation_end, frequency, aggregation_method)
+        history = self.__histories.get(key)
+        if history is None:
+            history = self.__fetch_history(series_id, units=units, observation_start=observation_start,
+                                           observation_end=observation_end, frequency=frequency,
+                                           aggregation_method=aggregation_method)
+            self.__histories[key] = history
+        return history
+
     def get_series_observations_first_release(self, series_id: str, units: Optional[str]=None,
-                                              observation_start: Optional[str]=None, observation_end: Optional[str]=None,
-                                              frequency: Optional[str]=None, aggregation_method: Optional[str]=None):
-        realtime_start_ext = '1776-07-04'
-        realtime_end_ext = '9999-12-31'
-
-        result = self.__fred.get_series_observations(
-            series_id=series_id,
-            units=units,
-            observation_start=observation_start,
-            observation_end=observation_end,
-            frequency=frequency,
-            aggregation_method=aggregation_method,
-            realtime_start=realtime_start_ext,
-            realtime_end=realtime_end_ext
-        )
-
-    def get_series_observations_latest_release(self, series_id: str, units: Optional[str]=None, observation_start: Optional[str]=None, observation_end: Optional[str]=None,
-                                              frequency: Optional[str]=None, aggregation_method: Optional[str]=None):
-        
-        realtime_end_ext = '9999-12-31'
-
-        result = self.__fred.get_series_observations(
-            series_id=series_id,
-            units=units,
-            observation_start=observation_start,
-            observation_end=observation_end,
-            frequency=frequency,
-            aggregation_method=aggregation_method,
-            realtime_end=realtime_end_ext
-        )
-
-    def get_series_observations_as_of_date(self, series_id: str, units: Optional[str]=None, observation_start: Optional[str]=None, observation_end: Optional[str]=None,
-                                              frequency: Optional[str]=None, aggregation_method: Optional[str]=None):
-        realtime_start_ext = observation_start
-
-        result = self.__fred.get_series_observations(
-            series_id=series_id,
-            units=units,
-            observation_start=observation_start,
-            observation_end=observation_end,
-            frequency=frequency,
-            aggregation_method=aggregation_method,
-            realtime_start=realtime_start_ext,
-        )
-        
\ No newline at end of file
+                                              observation_start: Optional[Union[str, datetime]]=None,
+                                              observation_end: Optional[Union[str, datetime]]=None,
+                                              frequency: Optional[str]=None, aggregation_method: Optional[str]=None,
+                                              dataframe_method: str='pandas') -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Get the first release of each observation of an ALFRED series
+
+        Returns, for every observation date, the value as it was first published.
+
+        Args:
+            series_id (str): The ID for a series.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+            dataframe_method (str, optional): The frame type to return. Options: 'pandas' or 'polars'. Default is 'pandas'.
+
+        Returns:
+            pandas.DataFrame | polars.DataFrame: One row per observation date with the real-time period and value of its first release.
+
+        Raises:
+            ValueError: If the API request fails or dataframe_method is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> alfred.get_series_observations_first_release('GDP', observation_start='2020-01-01').head(2)
+                        realtime_start realtime_end      value
+            date
+            2020-01-01      2020-04-29   2020-05-27  21729.124
+            2020-04-01      2020-07-30   2020-08-26  19408.759
+
+        Notes:
+            Computed locally from :meth:`get_series_history`.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_series_observations_first_release.html
+        """
+
+        self.__validate_dataframe_method(dataframe_method)
+        history = self.get_series_history(series_id, units, observation_start, observation_end, frequency, aggregation_method)
+        view = history[~history.index.duplicated(keep='first')]
+        return self.__convert(view, dataframe_method)
+
+    def get_series_observations_latest_release(self, series_id: str, units: Optional[str]=None,
+                                               observation_start: Optional[Union[str, datetime]]=None,
+                                               observation_end: Optional[Union[str, datetime]]=None,
+                                               frequency: Optional[str]=None, aggregation_method: Optional[str]=None,
+                                               dataframe_method: str='pandas') -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Get the latest release of each observation of an ALFRED series
+
+        Returns, for every observation date, its most recently published value.
+
+        Args:
+            series_id (str): The ID for a series.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+            dataframe_method (str, optional): The frame type to return. Options: 'pandas' or 'polars'. Default is 'pandas'.
+
+        Returns:
+            pandas.DataFrame | polars.DataFrame: One row per observation date with the real-time period and value of its latest release.
+
+        Raises:
+            ValueError: If the API request fails or dataframe_method is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> alfred.get_series_observations_latest_release('UNRATE').tail(1)
+
+        Notes:
+            Computed locally from :meth:`get_series_history`. An observation withdrawn in a later vintage keeps
+            its last published value.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_series_observations_latest_release.html
+        """
+
+        self.__validate_dataframe_method(dataframe_method)
+        history = self.get_series_history(series_id, units, observation_start, observation_end, frequency, aggregation_method)
+        view = history[~history.index.duplicated(keep='last')]
+        return self.__convert(view, dataframe_method)
+
+    def get_series_observations_as_of_date(self, series_id: str, as_of_date: Union[str, datetime], units: Optional[str]=None,
+                                           observation_start: Optional[Union[str, datetime]]=None,
+                                           observation_end: Optional[Union[str, datetime]]=None,
+                                           frequency: Optional[str]=None, aggregation_method: Optional[str]=None,
+                                           dataframe_method: str='pandas') -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Get an ALFRED series as it was known on a date
+
+        Returns the observations, and their values, that were published as of `as_of_date`.
+
+        Args:
+            series_id (str): The ID for a series.
+            as_of_date (str | datetime): The real-time date to view the series as of. String format: YYYY-MM-DD.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+            dataframe_method (str, optional): The frame type to return. Options: 'pandas' or 'polars'. Default is 'pandas'.
+
+        Returns:
+            pandas.DataFrame | polars.DataFrame: One row per observation date published by `as_of_date`, with the real-time period and value in effect on that date.
+
+        Raises:
+            ValueError: If the API request fails, or as_of_date or dataframe_method is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> before = alfred.get_series_observations_as_of_date('GDP', '2020-06-30')
+            >>> after = alfred.get_series_observations_as_of_date('GDP', '2021-06-30')  # served from the same history
+
+        Notes:
+            Computed locally from :meth:`get_series_history`: a row is in effect when its real-time period
+            contains `as_of_date`, both ends inclusive.
+
+        References:
+            - Federal Reserve Bank of St. Louis, ALFRED real-time periods. https://alfred.stlouisfed.org/help#real_time_periods
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_series_observations_as_of_date.html
+        """
+
+        self.__validate_dataframe_method(dataframe_method)
+        try:
+            as_of = pd.Timestamp(as_of_date)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"as_of_date must be a YYYY-MM-DD string or datetime, got {as_of_date!r}") from e
+        history = self.get_series_history(series_id, units, observation_start, observation_end, frequency, aggregation_method)
+        in_effect = (history['realtime_start'] <= as_of) & (history['realtime_end'].isna() | (history['realtime_end'] >= as_of))
+        view = history[in_effect.to_numpy()]
+        return self.__convert(view[~view.index.duplicated(keep='last')], dataframe_method)
+
+    def get_vintage_matrix(self, series_id: str, units: Optional[str]=None,
+                           observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                           frequency: Optional[str]=None, aggregation_method: Optional[str]=None) -> VintageMatrix:
+        """Get the revision triangle of an ALFRED series
+
+        Builds an interval-encoded vintage matrix from the series' real-time history.
+
+        Args:
+            series_id (str): The ID for a series.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            VintageMatrix: The real-time periods of every observation, with binary-search as-of lookups and slicing by observation or vintage window.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> matrix = alfred.get_vintage_matrix('GDP')
+            >>> matrix.value('2020-01-01', as_of='2020-05-01')
+            21729.124
+            >>> recent = matrix.slice(observation_start='2019-01-01', vintage_start='2020-01-01')
+
+        Notes:
+            Built from :meth:`get_series_history`, so it shares that method's single download.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_vintage_matrix.html
+        """
+
+        history = self.get_series_history(series_id, units, observation_start, observation_end, frequency, aggregation_method)
+        return VintageMatrix.from_frame(history)
+
+    def get_series_revisions(self, series_id: str, units: Optional[str]=None,
+                             observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                             frequency: Optional[str]=None, aggregation_method: Optional[str]=None) -> pd.DataFrame:
+        """Get revision statistics of an ALFRED series
+
+        Computes, for every observation, its first and latest release, first-to-latest revision, revision count and mean absolute revision.
+
+        Args:
+            series_id (str): The ID for a series.
+            units (str, optional): A key that indicates a data transformation. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): An optional parameter to change the frequency of the observations.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            pandas.DataFrame: One row per observation date, as described in :meth:`fedfred.VintageMatrix.revisions`.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> stats = alfred.get_series_revisions('GDP', observation_start='2015-01-01')
+            >>> stats[['revision', 'revision_count']].tail(2)
+
+        Notes:
+            Built from :meth:`get_vintage_matrix`, so it shares that method's single download. Use
+            :meth:`fedfred.VintageMatrix.revision_at` for revisions at a fixed horizon.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_series_revisions.html
+        """
+
+        return self.get_vintage_matrix(series_id, units, observation_start, observation_end, frequency, aggregation_method).revisions()
+
+    def get_as_of_engine(self, series_ids: List[str], units: Optional[str]=None,
+                         observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                         frequency: Optional[str]=None, aggregation_method: Optional[str]=None) -> AsOfEngine:
+        """Get a point-in-time engine over many ALFRED series
+
+        Loads the real-time history of every series, downloading the missing ones concurrently, into an in-memory as-of engine.
+
+        Args:
+            series_ids (List[str]): The IDs of the series to load. Duplicates are loaded once.
+            units (str, optional): A key that indicates a data transformation, applied to every series. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            frequency (str, optional): Aggregate every series to this frequency.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            AsOfEngine: The engine, answering latest-known and point-in-time panel queries for many dates and series from memory.
+
+        Raises:
+            ValueError: If an API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import pandas as pd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> engine = alfred.get_as_of_engine(['GDP', 'UNRATE'])
+            >>> known = engine.latest(pd.date_range('2010-01-01', '2020-12-31', freq='B'))
+            >>> snapshot = engine.panel('2020-06-30')
+
+        Notes:
+            Histories already downloaded by this client are reused. The missing ones are fetched on worker
+            threads with the caller's context variables, so active deadlines still apply. The workers share
+            the client's lock-guarded rate limiter and response cache, so they queue for rate-limit capacity.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.get_as_of_engine.html
+        """
+
+        options = {'units': units, 'observation_start': observation_start, 'observation_end': observation_end,
+                   'frequency': frequency, 'aggregation_method': aggregation_method}
+        key = (units, observation_start, observation_end, frequency, aggregation_method)
+        histories = {series_id: self.__histories.get((series_id, *key)) for series_id in dict.fromkeys(series_ids)}
+        missing = [series_id for series_id, history in histories.items() if history is None]
+        if missing:
+            workers = min(len(missing), max(1, self.__fred.max_requests_per_minute // 10))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, self.__fetch_history, series_id, **options)
+                           for series_id in missing]
+                for series_id, future in zip(missing, futures):
+                    histories[series_id] = self.__histories[(series_id, *key)] = future.result()
+        return AsOfEngine(histories)
+
+    def sync_vintage_store(self, store: VintageStore, series_ids: Union[str, List[str]]) -> Dict[str, int]:
+        """Bring a local vintage store up to date
+
+        Appends the vintages of each series published since the latest stored one, downloading full histories only for series not yet stored.
+
+        Args:
+            store (VintageStore): The local store to update.
+            series_ids (str | List[str]): The ID, or IDs, of the series to update.
+
+        Returns:
+            Dict[str, int]: The number of vintage partitions written for each series.
+
+        Raises:
+            ValueError: If an API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> store = fd.VintageStore('vintages')
+            >>> alfred.sync_vintage_store(store, ['GDP', 'UNRATE'])
+            {'GDP': 312, 'UNRATE': 871}
+            >>> alfred.sync_vintage_store(store, ['GDP', 'UNRATE'])  # nothing new: one small request per series
+            {'GDP': 0, 'UNRATE': 0}
+
+        Notes:
+            For a stored series, the vintage dates after the latest stored vintage are requested first; the
+            observations are only requested, from the first new vintage on, if there are any. Stored values
+            are untransformed, as published. The probe and the downloads bypass the response cache, so a
+            long-lived client or a shared cache never answers with a stale "nothing new".
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_vintagedates.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Alfred.sync_vintage_store.html
+        """
+
+        written: Dict[str, int] = {}
+        for series_id in dict.fromkeys([series_ids] if isinstance(series_ids, str) else series_ids):
+            stored = store.vintages(series_id)
+            if not len(stored):
+                written[series_id] = store.append(series_id, self.__fetch_history(series_id))
+                continue
+            start = str(stored[-1] + 1)
+            with _bypass_cache():
+                new_vintage = next(self.__fred.iter_series_vintagedates(series_id, realtime_start=start, limit=1), None)
+            if new_vintage is None:
+                written[series_id] = 0
+                continue
+            written[series_id] = store.append(series_id, self.__fetch_history(series_id, realtime_start=start))
+        return written
+
+    def clear_history(self, series_id: Optional[str]=None) -> None:
+        """Drop stored real-time histories so the next view downloads them again.
+
+        Args:
+            series_id (str, optional): Only drop the histories of this series. Defaults to None (all series).
+        """
+
+        for key in [key for key in self.__histories if series_id is None or key[0] == series_id]:
+            del self.__histories[key]
+
+    # Private Methods
+    def __fetch_history(self, series_id: str, realtime_start: str=_REALTIME_START, **options: Any) -> pd.DataFrame:
+        """Download the real-time history of a series and type its columns.
+
+        Args:
+            series_id (str): The ID for a series.
+            realtime_start (str, optional): The first real-time date to download. Defaults to every vintage.
+            **options: The units, observation range, frequency and aggregation options of the request.
+
+        Returns:
+            pandas.DataFrame: The typed history, sorted by date then real-time start.
+
+        Notes:
+            The pages bypass the response cache: the history is kept by this client, and a cached page would
+            hide vintages published since it was stored.
+        """
+
+        pages = []
+        offset = 0
+        with _bypass_cache():
+            while True:
+                page = self.__fred.get_series_observations(
+                    series_id, realtime_start=realtime_start, realtime_end=_REALTIME_END, output_type=1,
+                    limit=_OBSERVATIONS_PER_REQUEST, offset=offset, sort_order='asc', **options)
+                pages.append(page)
+                if len(page) < _OBSERVATIONS_PER_REQUEST:
+                    break
+                offset += len(page)
+        history = pd.concat(pages) if len(pages) > 1 else pages[0]
+        history = history.reindex(columns=['realtime_start', 'realtime_end', 'value'])
+        history['realtime_start'] = pd.to_datetime(history['realtime_start'], format='%Y-%m-%d')
+        history['realtime_end'] = pd.to_datetime(history['realtime_end'].where(history['realtime_end'] != _REALTIME_END),
+                                                 format='%Y-%m-%d')
+        history['value'] = pd.to_numeric(history['value'], errors='coerce').astype('float64')
+        history.index = pd.DatetimeIndex(history.index, name='date')
+        order = pd.MultiIndex.from_arrays([history.index, history['realtime_start']]).argsort(kind='stable')
+        return history.iloc[order]
+
+    @staticmethod
+    def __validate_dataframe_method(dataframe_method: str) -> None:
+        """Raise ValueError for an unsupported dataframe_method."""
+
+        if dataframe_method not in ('pandas', 'polars'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas' or 'polars'")
+
+    @staticmethod
+    def __convert(view: pd.DataFrame, dataframe_method: str) -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Return a view as a pandas DataFrame copy, or as a Polars DataFrame with 'date' as a column."""
+
+        if dataframe_method == 'pandas':
+            return view.copy()
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise OptionalDependencyError(
+                message=f"{e}: Polars is not installed. Install it with `pip install polars` to use this method.",
+                package="polars",
+                feature="dataframe_method='polars'",
+                install_hint="pip install polars",
+            ) from e
+        return pl.from_pandas(view.reset_index()).with_columns(
+            pl.col('date').cast(pl.Date), pl.col('realtime_start').cast(pl.Date), pl.col('realtime_end').cast(pl.Date))
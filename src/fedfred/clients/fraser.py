@@ -24,14 +24,19 @@
 This module defines the Fraser client for interacting with the Federal Reserve Fraser API.
 """
 
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, MutableMapping, Optional, Tuple, Union
 from collections import deque
 import time
 from cachetools import FIFOCache, cached
+from cachetools.keys import hashkey
 import httpx
-from tenacity import retry, wait_fixed, stop_after_attempt, retry_if_exception_type
-from .._core._extractors import Helpers
-from ..config import resolve_api_key
+from tenacity import retry, wait_fixed, stop_after_attempt, stop_any, retry_if_exception_type
+from .._core import _dict_type_converter, _hashable_type_converter, _fred_parameter_validator, _json_response_decoder
+from ..transport import (
+    CircuitBreaker, TimeoutPolicy, TransferMetrics,
+    _breaker_call, _deadline_check, _deadline_http_error, _deadline_retry_stop, _deadline_wait, _record_transfer, _request_headers, _request_timeout
+)
+from ..settings import _resolve_api_key
 
 class Fraser:
     """Client for the Federal Reserve FRASER API.
@@ -45,7 +50,11 @@ class Fraser:
         base_url (str): The base URL for the Fraser API.
         cache_mode (bool): Whether to enable caching for GET requests.
         cache_size (int): The maximum size of the cache for GET requests.
-        cache (FIFOCache): The cache object for storing GET request responses.
+        cache (FIFOCache | MutableMapping): The cache object for storing GET request responses.
+        cache_backend (Optional[MutableMapping]): The shared cache backend, if one was provided.
+        metrics (TransferMetrics): Compressed and decompressed response bytes per endpoint.
+        timeouts (TimeoutPolicy): Timeouts per endpoint family.
+        circuit_breaker (Optional[CircuitBreaker]): The circuit breaker, if enabled.
         max_requests_per_minute (int): The maximum number of requests allowed per minute.
         request_times (deque): A deque to track the timestamps of recent requests for rate limiting.
 
@@ -53,6 +62,9 @@ class Fraser:
         api_key (Optional[str]): The API key for accessing the Fraser API. If None, it will be resolved from configuration.
         cache_mode (bool): Whether to enable caching for GET requests. Default is True.
         cache_size (int): The maximum size of the cache for GET requests. Default is 256.
+        cache_backend (Optional[MutableMapping]): A shared cache, such as :class:`fedfred.RedisCache`, used instead of the in-process FIFO cache. Default is None.
+        timeouts (Optional[TimeoutPolicy]): Connect/read/write/pool timeouts per endpoint family. Default is `TimeoutPolicy()`.
+        circuit_breaker (Optional[CircuitBreaker]): Fails fast while FRASER endpoints are down. Default is None (disabled).
 
     Raises:
         RuntimeError: If the API key is not provided for GET requests.
@@ -72,13 +84,18 @@ class Fraser:
     """
 
     # Dunder Methods
-    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256) -> None:
+    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256,
+                 cache_backend: Optional[MutableMapping[Any, Any]]=None, timeouts: Optional[TimeoutPolicy]=None,
+                 circuit_breaker: Optional[CircuitBreaker]=None) -> None:
         """Initialize the Fraser class that provides functions which query FRASER data.
 
         Args:
             api_key (Optional[str]): The API key for accessing the Fraser API. If None, it will be resolved from configuration.
             cache_mode (bool): Whether to enable caching for GET requests. Default is True.
             cache_size (int): The maximum size of the cache for GET requests. Default is 256.
+            cache_backend (Optional[MutableMapping]): A shared cache, such as :class:`fedfred.RedisCache`, used instead of the in-process FIFO cache. Default is None.
+            timeouts (Optional[TimeoutPolicy]): Connect/read/write/pool timeouts per endpoint family. Default is `TimeoutPolicy()`.
+            circuit_breaker (Optional[CircuitBreaker]): Fails fast while FRASER endpoints are down. Default is None (disabled).
 
         Raises:
             RuntimeError: If the API key is not provided for GET requests.
@@ -96,11 +113,15 @@ class Fraser:
             - :func:`fedfred.get_api_key`
         """
         
-        self.api_key: Optional[str] = resolve_api_key(api_key, service="fraser")
+        self.api_key: Optional[str] = _resolve_api_key(api_key, service="fraser")
         self.base_url: str = "https://fraser.stlouisfed.org/api"
         self.cache_mode: bool = cache_mode
         self.cache_size: int = cache_size
-        self.cache: FIFOCache = FIFOCache(maxsize=self.cache_size)
+        self.cache_backend: Optional[MutableMapping[Any, Any]] = cache_backend
+        self.cache: MutableMapping[Any, Any] = cache_backend if cache_backend is not None else FIFOCache(maxsize=self.cache_size)
+        self.metrics: TransferMetrics = TransferMetrics()
+        self.timeouts: TimeoutPolicy = timeouts if timeouts is not None else TimeoutPolicy()
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
         self.max_requests_per_minute: int = 30
         self.request_times: deque = deque()
 
@@ -210,7 +231,7 @@ class Fraser:
             # Cache is cleared when fraser is deleted
         """
 
-        if hasattr(self, "cache"):
+        if hasattr(self, "cache") and getattr(self, "cache_backend", None) is None:
             self.cache.clear()
 
     def __len__(self) -> int:
@@ -332,30 +353,40 @@ class Fraser:
         while self.request_times and self.request_times[0] < now - 60:
             self.request_times.popleft()
         if len(self.request_times) >= self.max_requests_per_minute:
-            time.sleep(60 - (now - self.request_times[0]))
+            time.sleep(_deadline_wait(60 - (now - self.request_times[0])))
 
     def __fraser_post_request(self, url_endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
 
-        self.__rate_limited()
-        payload = {
-            **(data or {}),
-        }
-        with httpx.Client() as client:
-            try:
-                response = client.post(self.base_url + url_endpoint, json=payload, timeout=10)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                raise ValueError(f"HTTP Error occurred: {e}") from e
+        def __post_request() -> Dict[str, Any]:
+            _deadline_check(url_endpoint)
+            self.__rate_limited()
+            payload = {
+                **(data or {}),
+            }
+            with httpx.Client() as client:
+                try:
+                    response = client.post(self.base_url + url_endpoint, json=payload, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint))
+                    _record_transfer(self.metrics, response)
+                    response.raise_for_status()
+                    return _json_response_decoder(response)
+                except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
+                    raise ValueError(f"HTTP Error occurred: {e}") from e
+
+        # POSTs are never answered from stale responses, so no stale key is kept.
+        return _breaker_call(self.circuit_breaker, self.base_url + url_endpoint, None, __post_request)
 
     def __fraser_get_request(self, url_endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         
         @retry(wait=wait_fixed(1),
-               stop=stop_after_attempt(3),
+               stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
                retry=retry_if_exception_type(httpx.HTTPError),
                reraise=True)
         def __get_request(url_endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
             
+            _deadline_check(url_endpoint)
             self.__rate_limited()
             params = {
                 **(data or {}),
@@ -367,23 +398,44 @@ class Fraser:
             }
             with httpx.Client() as client:
                 try:
-                    response = client.get(self.base_url + url_endpoint, params=params, headers=headers, timeout=10)
+                    response = client.get(self.base_url + url_endpoint, params=params, headers=_request_headers(headers), timeout=_request_timeout(self.timeouts, url_endpoint))
+                    _record_transfer(self.metrics, response)
                     response.raise_for_status()
-                    return response.json()
+                    return _json_response_decoder(response)
                 except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
                     raise ValueError(f"HTTP Error occurred: {e}") from e
                 
+        def __guarded_get_request(url_endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            """Perform a GET request through the circuit breaker, if one is configured.
+
+            Args:
+                url_endpoint (str): The API endpoint to query.
+                data (Dict[str, Any], optional): The query parameters for the request. Defaults to None.
+
+            Returns:
+                Dict[str, Any]: The JSON response, or the last good response while the circuit is open and `serve_stale` is set.
+
+            Raises:
+                CircuitOpenError: If the circuit for this endpoint is open.
+            """
+
+            return _breaker_call(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, tuple(sorted((data or {}).items()))),
+                                 lambda: __get_request(url_endpoint, data))
+
         @cached(cache=self.cache)
         def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
 
-            return __get_request(url_endpoint, Helpers.to_dict(hashable_data))
+            return __guarded_get_request(url_endpoint, _dict_type_converter(hashable_data))
 
         if data:
-            Helpers.parameter_validation(data)
+            _fred_parameter_validator(data)
         if self.cache_mode:
-            return __cached_get_request(url_endpoint, Helpers.to_hashable(data))
+            return __cached_get_request(url_endpoint, _hashable_type_converter(data))
         else:
-            return __get_request(url_endpoint, data)
+            return __guarded_get_request(url_endpoint, data)
     
     # Public Methods
     ## API-Key
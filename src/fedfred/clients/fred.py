@@ -59,17 +59,30 @@ References:
 
 from __future__ import annotations
 import asyncio
-from datetime import datetime
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
 import time
 from collections import deque
-from typing import TYPE_CHECKING, Optional, Dict, Union, List, Tuple, Any
+from contextlib import aclosing, closing
+from itertools import islice
+from typing import TYPE_CHECKING, Optional, Dict, Union, List, Tuple, Any, MutableMapping, Callable, Iterable, Iterator, AsyncIterator, Awaitable
 import httpx
 import pandas as pd
-from tenacity import retry, wait_fixed, stop_after_attempt, retry_if_exception_type
+from tenacity import retry, wait_fixed, stop_after_attempt, stop_any, retry_if_exception_type
 from cachetools import FIFOCache, cached
+from cachetools.keys import hashkey
 from asyncache import cached as async_cached
 from ..__about__ import __title__, __version__, __author__, __email__, __license__, __copyright__, __description__, __docs__, __repository__
 from ..settings import _resolve_api_key
+from ..cache import RedisCache, _CACHE_BYPASS, _bypass_cache
+from ..transport import (
+    CircuitBreaker, HedgingPolicy, TimeoutPolicy, TransferMetrics,
+    _AsyncLimiter, _breaker_call, _breaker_call_async, _deadline_check, _deadline_http_error, _deadline_retry_stop, _deadline_wait, _hedged_request,
+    _hold_thread_lock, _record_transfer, _request_headers, _request_timeout
+)
 from .._core import (
     # Converters
     _dict_type_converter, _dict_type_converter_async,
@@ -80,15 +93,25 @@ from .._core import (
     _pandas_dataframe_converter, _pandas_dataframe_converter_async,
     _polars_dataframe_converter, _polars_dataframe_converter_async,
     _dask_dataframe_converter, _dask_dataframe_converter_async,
+    _arrow_dataframe_converter, _arrow_dataframe_converter_async,
     _datetime_hh_mm_converter, _datetime_hh_mm_converter_async,
+    _panel_columns_collector, _panel_dataframe_converter, _panel_dataframe_converter_async,
+    _element_table_flattener, _element_dataframe_converter, _element_dataframe_converter_async,
+    _vintage_dates_chunker, _vintage_chunks_merger, _vintage_chunks_merger_async,
+    _observations_sync_start, _observations_sync_merger, _EMPTY_OBSERVATIONS,
     # Validators
     _fred_parameter_validator, _fred_parameter_validator_async,
+    # Decoders
+    _json_response_decoder,
 )
-from ..models import BulkRelease, Category, Series, Tag, Release, ReleaseDate, Source, Element, VintageDate
+from .._core._decoders import _ObservationStreamParser
+from ..categories import CategoryIndex
+from ..models import BulkRelease, Category, Series, Tag, Release, ReleaseDate, Source, Element, VintageDate, ObservationBatch
 
 if TYPE_CHECKING:
     import polars as pl # pragma: no cover
     import dask.dataframe as dd # pragma: no cover
+    import pyarrow as pa # pragma: no cover
 
 class Fred:
     """Client for the Federal Reserve FRED/ALFRED API.
@@ -102,7 +125,11 @@ class Fred:
         api_key (str): Your FRED API key.
         cache_mode (bool): Whether caching is enabled for API responses.
         cache_size (int): The maximum number of items to store in the cache if caching is enabled.
-        cache (FIFOCache): The cache object for storing API responses.
+        cache (FIFOCache | MutableMapping): The cache object for storing API responses.
+        cache_backend (MutableMapping, optional): The shared cache backend, if one was provided.
+        metrics (TransferMetrics): Compressed and decompressed response bytes per endpoint.
+        timeouts (TimeoutPolicy): Timeouts per endpoint family.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker, if enabled.
         max_requests_per_minute (int): The maximum number of requests allowed per minute.
         request_times (deque): A deque to track the timestamps of recent requests for rate limiting.
         lock (asyncio.Lock): An asyncio lock for synchronizing access to shared resources.
@@ -115,6 +142,9 @@ class Fred:
         api_key (str, optional): Your FRED API key.
         cache_mode (bool, optional): Whether to enable caching for API responses. Defaults to False.
         cache_size (int, optional): The maximum number of items to store in the cache if caching is enabled. Defaults to 256.
+        cache_backend (MutableMapping, optional): A shared cache, such as :class:`fedfred.RedisCache`, used instead of the in-process FIFO cache.
+        timeouts (TimeoutPolicy, optional): Connect/read/write/pool timeouts per endpoint family.
+        circuit_breaker (CircuitBreaker, optional): Fails fast while FRED or GeoFRED endpoints are down.
 
     Raises:
         RuntimeError: If no API key can be resolved from the explicit argument, global setting, or environment variable.
@@ -140,13 +170,18 @@ class Fred:
     """
 
     # Dunder Methods
-    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256) -> None:
+    def __init__(self, api_key: Optional[str]=None, cache_mode: bool=True, cache_size: int=256,
+                 cache_backend: Optional[MutableMapping[Any, Any]]=None, timeouts: Optional[TimeoutPolicy]=None,
+                 circuit_breaker: Optional[CircuitBreaker]=None) -> None:
         """Initialize the Fred class that provides functions which query FRED data.
 
         Args:
             api_key (str, optional): Your FRED API key.
             cache_mode (bool, optional): Whether to enable caching for API responses. Defaults to True.
             cache_size (int, optional): The maximum number of items to store in the cache if caching is enabled. Defaults to 256.   
+            cache_backend (MutableMapping, optional): A shared cache, such as :class:`fedfred.RedisCache`, used instead of the in-process FIFO cache. Defaults to None.
+            timeouts (TimeoutPolicy, optional): Connect/read/write/pool timeouts per endpoint family. Defaults to `TimeoutPolicy()`.
+            circuit_breaker (CircuitBreaker, optional): Fails fast while FRED or GeoFRED endpoints are down. Defaults to None (disabled).
 
         Raises:
             RuntimeError: If no API key can be resolved from the explicit argument, global setting, or environment variable.
@@ -160,6 +195,10 @@ class Fred:
 
             >>> fred = fd.Fred(api_key="your_api_key")
 
+            Sharing one response cache across hosts:
+
+            >>> fred = fd.Fred(cache_backend=fd.RedisCache(url="redis://localhost:6379/0", ttl=3600))
+
         Notes:
             API keys can be set globally using `fedfred.set_api_key(...)`, or can be provided explicitly
             when instantiating the `Fred` class. If neither is provided, the class will attempt to
@@ -168,17 +207,24 @@ class Fred:
         See Also:
             - :func:`fedfred.set_api_key`: Function to set the global FRED API key.
             - :class:`fedfred.Helpers`: Helper functions for parameter validation and conversion.
+            - :class:`fedfred.RedisCache`: Shared cache backend for multi-host deployments.
         """
 
         self.base_url: str = 'https://api.stlouisfed.org/fred'
         self.api_key: Optional[str] = _resolve_api_key(api_key, service="fred")
         self.cache_mode: bool = cache_mode
         self.cache_size: int = cache_size
-        self.cache: FIFOCache = FIFOCache(maxsize=cache_size)
+        self.cache_backend: Optional[MutableMapping[Any, Any]] = cache_backend
+        self.cache: MutableMapping[Any, Any] = cache_backend if cache_backend is not None else FIFOCache(maxsize=cache_size)
+        self.metrics: TransferMetrics = TransferMetrics()
+        self.timeouts: TimeoutPolicy = timeouts if timeouts is not None else TimeoutPolicy()
+        self.circuit_breaker: Optional[CircuitBreaker] = circuit_breaker
         self.max_requests_per_minute: int = 120
         self.request_times: deque = deque()
         self.lock: asyncio.Lock = asyncio.Lock()
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_requests_per_minute // 10)
+        self._rate_lock: threading.Lock = threading.Lock()
+        self._cache_lock: threading.Lock = threading.Lock()
 
     def __repr__(self) -> str:
         """String representation of the Fred class.
@@ -290,9 +336,12 @@ class Fred:
             >>> fred = fd.Fred('your_api_key')
             >>> del fred
             >>> # Cache is cleared when fred is deleted
+
+        Notes:
+            A shared `cache_backend` is never cleared, since other instances and hosts may be using it.
         """
 
-        if hasattr(self, "cache"):
+        if hasattr(self, "cache") and getattr(self, "cache_backend", None) is None:
             self.cache.clear()
 
     def __len__(self) -> int:
@@ -443,18 +492,20 @@ class Fred:
 
         Notes:
             This method tracks the timestamps of requests and enforces rate limiting by sleeping when the maximum 
-            number of requests per minute is reached.
+            number of requests per minute is reached. Threads share the limiter: the check and the sleep run
+            under `_rate_lock`, so concurrent workers queue for capacity instead of overrunning it.
 
         Warnings:
             This method uses time.sleep(), which blocks the current thread. Avoid using it in asynchronous contexts.
         """
 
-        now = time.time()
-        self.request_times.append(now)
-        while self.request_times and self.request_times[0] < now - 60:
-            self.request_times.popleft()
-        if len(self.request_times) >= self.max_requests_per_minute:
-            time.sleep(60 - (now - self.request_times[0]))
+        with self._rate_lock:
+            now = time.time()
+            self.request_times.append(now)
+            while self.request_times and self.request_times[0] < now - 60:
+                self.request_times.popleft()
+            if len(self.request_times) >= self.max_requests_per_minute:
+                time.sleep(_deadline_wait(60 - (now - self.request_times[0])))
 
     def __fred_get_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
         """Helper method to perform a synchronous GET request to the FRED API.
@@ -473,12 +524,12 @@ class Fred:
             This method handles rate limiting and caching for synchronous GET requests to the FRED API.
 
         Warnings:
-            Caching is only applied if `cache_mode` is enabled. Ensure that the `data` parameter is hashable for 
+            Caching is only applied if `cache_mode` is enabled and the request is not made inside `_bypass_cache()`. Ensure that the `data` parameter is hashable for 
             caching to work correctly.
         """
 
         @retry(wait=wait_fixed(1),
-               stop=stop_after_attempt(3),
+               stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
                retry=retry_if_exception_type(httpx.HTTPError),
                reraise=True,)
         def __get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
@@ -498,6 +549,7 @@ class Fred:
                 This method handles rate limiting and caching for synchronous GET requests to the FRED API.
             """
 
+            _deadline_check(url_endpoint)
             self.__rate_limited()
             params = {
                 **(data or {}),
@@ -514,17 +566,39 @@ class Fred:
                             **(data or {}),
                             'format': 'json'
                         }
-                        response = client.get(self.base_url + url_endpoint, headers=headers, params=params, timeout=10)
+                        response = client.get(self.base_url + url_endpoint, headers=_request_headers(headers), params=params, timeout=_request_timeout(self.timeouts, url_endpoint))
+                        _record_transfer(self.metrics, response)
                         response.raise_for_status()
-                        return response.json()
+                        return _json_response_decoder(response)
                     else:
-                        response = client.get(self.base_url + url_endpoint, params=params, timeout=10)
+                        response = client.get(self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint))
+                        _record_transfer(self.metrics, response)
                         response.raise_for_status()
-                    return response.json()
+                    return _json_response_decoder(response)
                 except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
                     raise ValueError(f"HTTP Error occurred: {e}") from e
 
-        @cached(cache=self.cache)
+        def __guarded_get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            """Perform a GET request through the circuit breaker, if one is configured.
+
+            Args:
+                url_endpoint (str): The API endpoint to query.
+                data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+
+            Returns:
+                Dict[str, Any]: The JSON response, or the last good response while the circuit is open and `serve_stale` is set.
+
+            Raises:
+                CircuitOpenError: If the circuit for this endpoint is open.
+            """
+
+            return _breaker_call(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data)),
+                                 lambda: __get_request(url_endpoint, data))
+
+        @cached(cache=self.cache, lock=self._cache_lock)
         def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
             """Perform a GET request with caching.
 
@@ -539,14 +613,195 @@ class Fred:
                 httpx.HTTPError: If the HTTP request fails.
             """
 
-            return __get_request(url_endpoint, _dict_type_converter(hashable_data))
+            return __guarded_get_request(url_endpoint, _dict_type_converter(hashable_data))
 
         if data:
             _fred_parameter_validator(data)
-        if self.cache_mode:
+        if self.cache_mode and not _CACHE_BYPASS.get():
             return __cached_get_request(url_endpoint, _hashable_type_converter(data))
         else:
-            return __get_request(url_endpoint, data)
+            return __guarded_get_request(url_endpoint, data)
+
+    def __fred_stream_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+        """Helper method to perform a synchronous streaming GET request for FRED observations.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: A response-shaped dict whose 'observations' value maps each field to a column list.
+
+        Raises:
+            ValueError: If the HTTP request fails or the response is truncated.
+            CircuitOpenError: If the circuit for this endpoint is open.
+
+        Notes:
+            The response body is parsed incrementally as it is received, so the full payload is never buffered.
+            Streamed responses bypass the cache but go through the circuit breaker like any other request; stale
+            responses are kept apart from unstreamed ones because they hold columns rather than rows.
+        """
+
+        @retry(wait=wait_fixed(1),
+               stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
+               retry=retry_if_exception_type(httpx.HTTPError),
+               reraise=True,)
+        def __stream_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            _deadline_check(url_endpoint)
+            self.__rate_limited()
+            params = {
+                **(data or {}),
+                'api_key': self.api_key,
+                'file_type': 'json'
+            }
+            parser = _ObservationStreamParser()
+            with httpx.Client() as client:
+                try:
+                    with client.stream("GET", self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint)) as response:
+                        response.raise_for_status()
+                        received = 0
+                        for chunk in response.iter_bytes():
+                            received += len(chunk)
+                            parser.feed(chunk)
+                        _record_transfer(self.metrics, response, received)
+                except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
+                    raise ValueError(f"HTTP Error occurred: {e}") from e
+            return parser.close()
+
+        if data:
+            _fred_parameter_validator(data)
+        return _breaker_call(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data), 'stream'),
+                             lambda: __stream_request(url_endpoint, data))
+
+    def __fred_paginate(self, url_endpoint: str, data: Dict[str, Optional[Union[str, int]]], result_key: str,
+                        to_object: Callable[[Dict[str, Any]], List[Any]], page_size: int, limit: Optional[int]=None) -> Iterator[Any]:
+        """Helper method to lazily page through a FRED endpoint that takes `limit` and `offset`.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]]): The query parameters, without `limit`. An `offset` sets the first result.
+            result_key (str): The response key holding the results, such as 'seriess' or 'tags'.
+            to_object (Callable): Parses a response into a list of objects.
+            page_size (int): The number of results requested per page.
+            limit (int, optional): The maximum number of results to yield. Defaults to None (every result).
+
+        Returns:
+            Iterator: The parsed objects, in API order.
+
+        Notes:
+            The next page is only requested once the previous page has been consumed. Paging stops at the
+            response's `count`, at `limit`, or at the first short or empty page. Pages bypass the response
+            cache, so a full walk does not fill it.
+        """
+
+        offset = int(data.get('offset') or 0)
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_limit = page_size if remaining is None else min(page_size, remaining)
+            with _bypass_cache():
+                response = self.__fred_get_request(url_endpoint, {**data, 'limit': page_limit, 'offset': offset})
+            rows = response.get(result_key) or []
+            if not rows:
+                return
+            yield from to_object(response)
+            offset += len(rows)
+            if remaining is not None:
+                remaining -= len(rows)
+            count = response.get('count')
+            if len(rows) < page_limit or (isinstance(count, int) and offset >= count):
+                return
+
+    def __fred_cursor_pages(self, url_endpoint: str, data: Dict[str, Optional[Union[str, int]]]) -> Iterator[Dict[str, Any]]:
+        """Helper method to follow `next_cursor` through a FRED v2 endpoint, prefetching the next page.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]]): The query parameters for the first page.
+
+        Returns:
+            Iterator[Dict[str, Any]]: The raw response of each page.
+
+        Notes:
+            While a page is being consumed, the request for the next cursor runs on a background thread with
+            the caller's context variables, so active deadlines still apply. Closing the iterator discards
+            the prefetched page. Pages bypass the response cache, so at most two are held at a time.
+        """
+
+        def fetch(data: Dict[str, Optional[Union[str, int]]]) -> Dict[str, Any]:
+            with _bypass_cache():
+                return self.__fred_get_request(url_endpoint, data)
+
+        response = fetch(data)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                prefetch: Optional[Future] = None
+                if response.get('has_more'):
+                    data = {**data, 'next_cursor': response['next_cursor']}
+                    prefetch = executor.submit(contextvars.copy_context().run, fetch, data)
+                yield response
+                if prefetch is None:
+                    return
+                response = prefetch.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __fred_vintage_chunks(self, url_endpoint: str, data: Dict[str, Optional[Union[str, int]]], chunks: List[str],
+                              stream: bool=False) -> Dict[str, Any]:
+        """Helper method to fetch observations for each vintage_dates chunk in parallel and merge them.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]]): The query parameters, shared by every chunk.
+            chunks (List[str]): The vintage_dates chunks, one request each.
+            stream (bool, optional): Parse each response incrementally. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The merged observations response.
+
+        Notes:
+            Chunks run on worker threads with the caller's context variables, so active deadlines still apply.
+            Every request goes through the shared, lock-guarded rate limiter and response cache.
+        """
+
+        fetch = self.__fred_stream_request if stream else self.__fred_get_request
+        workers = min(len(chunks), max(1, self.max_requests_per_minute // 10))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, fetch, url_endpoint, {**data, 'vintage_dates': chunk})
+                       for chunk in chunks]
+            responses = [future.result() for future in futures]
+        output_type = data.get('output_type')
+        return _vintage_chunks_merger(responses, chunks, int(output_type) if output_type else None)
+
+    def __run_async(self, method_name: str, call: Callable[[AsyncFred], Awaitable[Any]]) -> Any:
+        """Helper method to run an AsyncFred coroutine to completion on a fresh event loop.
+
+        Args:
+            method_name (str): The name of the calling method, used in the error message.
+            call (Callable): Takes an AsyncFred bound to this client and returns the coroutine to run.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Raises:
+            RuntimeError: If called from a running event loop.
+
+        Notes:
+            asyncio primitives bind to the first event loop that waits on them, so each run gets its own lock
+            and semaphore rather than replacing this client's, which other threads or loops may be using.
+            `request_times` is still shared with every other caller.
+        """
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            async_fred = AsyncFred(self)
+            async_fred._limiter = _AsyncLimiter(asyncio.Lock(), asyncio.Semaphore(max(1, self.max_requests_per_minute // 10)))
+            return asyncio.run(call(async_fred))
+        raise RuntimeError(f"{method_name} cannot be called from a running event loop; use AsyncFred.{method_name} instead")
 
     # Public Methods
     ## Categories
@@ -779,6 +1034,96 @@ class Fred:
         seriess = Series.to_object(response, client=self)
         return seriess
 
+    def iter_category_series(self, category_id: int, realtime_start: Optional[Union[str, datetime]]=None,
+                             realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                             offset: Optional[int]=None, order_by: Optional[str]=None,
+                             sort_order: Optional[str]=None, filter_variable: Optional[str]=None,
+                             filter_value: Optional[str]=None, tag_names: Optional[Union[str, list[str]]]=None,
+                             exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000) -> Iterator[Series]:
+        """Iterate over a FRED Category's FRED Series
+
+        Get the series info for all series in a category from the FRED API, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            category_id (int): The ID for a category.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options are 'series_id', 'title', 'units', 'frequency', 'seasonal_adjustment', 'realtime_start', 'realtime_end', 'last_updated', 'observation_start', 'observation_end', 'popularity', 'group_popularity'.
+            sort_order (str, optional): Sort results in ascending or descending order. Options are 'asc' or 'desc'.
+            filter_variable (str, optional): The attribute to filter results by. Options are 'frequency', 'units', 'seasonal_adjustment'.
+            filter_value (str, optional): The value of the filter_variable to filter results by.
+            tag_names (str | list, optional): A semicolon-separated list of tag names to filter results by.
+            exclude_tag_names (str | list, optional): A semicolon-separated list of tag names to exclude results by.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Series]: The series, requested one page at a time.
+
+        Raises:
+            ValueError: If the request to the FRED API fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for s in fred.iter_category_series(125):
+            >>>     print(s.frequency)
+            'Quarterly'
+            'Annual'
+            'Quarterly'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.Fred.get_category_series`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/category_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_category_series.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(category_id, int) or category_id < 0:
+            raise ValueError("category_id must be a non-negative integer")
+        url_endpoint = '/category/series'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'category_id': category_id,
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = _liststring_converter(tag_names)
+            data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = _liststring_converter(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        return self.__fred_paginate(url_endpoint, data, 'seriess', lambda response: Series.to_object(response, client=self),
+                                    page_size, limit)
+
     def get_category_tags(self, category_id: int, realtime_start: Optional[Union[str, datetime]]=None,
                           realtime_end: Optional[Union[str, datetime]]=None, tag_names: Optional[Union[str, list[str]]]=None,
                           tag_group_id: Optional[int]=None, search_text: Optional[str]=None,
@@ -940,6 +1285,58 @@ class Fred:
         tags = Tag.to_object(response, client=self)
         return tags
 
+    def crawl_categories(self, category_id: int=0, include_series: bool=True, max_concurrency: int=8,
+                         resume: Optional[CategoryIndex]=None, checkpoint_path: Optional[Union[str, os.PathLike]]=None,
+                         checkpoint_every: int=100) -> CategoryIndex:
+        """Crawl the FRED category tree into a local index
+
+        Walk the category tree breadth-first from `category_id`, fetching the children and series of up to
+        `max_concurrency` categories at once, and build a :class:`fedfred.CategoryIndex` that answers subtree
+        queries without further API calls.
+
+        Args:
+            category_id (int, optional): The category to start from. Default is 0, the root of the FRED category tree.
+            include_series (bool, optional): Also record the series in each category. Default is True.
+            max_concurrency (int, optional): The most categories expanded at once. Default is 8.
+            resume (CategoryIndex, optional): A partial index from an earlier crawl; only its pending categories are crawled. Default is None.
+            checkpoint_path (str | os.PathLike, optional): Save the partial index here every `checkpoint_every` categories, on interruption, and at the end. Default is None.
+            checkpoint_every (int, optional): The number of categories crawled between checkpoints. Default is 100.
+
+        Returns:
+            CategoryIndex: The index of the crawled subtree. Categories that failed are left in its `pending`.
+
+        Raises:
+            ValueError: If max_concurrency or checkpoint_every is not a positive integer, or if the start category does not exist.
+            RuntimeError: If called from a running event loop; use `AsyncFred.crawl_categories` there.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> index = fred.crawl_categories(checkpoint_path='categories.json')
+            >>> index
+            CategoryIndex(categories=5183, series=812316, pending=0)
+            >>> # After an interruption, continue where the checkpoint left off
+            >>> index = fred.crawl_categories(resume=fd.CategoryIndex.load('categories.json'), checkpoint_path='categories.json')
+
+        Notes:
+            The requests run on an event loop through :class:`fedfred.AsyncFred`, sharing this client's cache,
+            rate limit and request history. Each category is fetched once per crawl, and with caching enabled
+            a repeated crawl is answered from the cache. A category whose requests fail stays in `pending`, so
+            passing the index back as `resume` retries it.
+
+        See Also:
+            - :meth:`fedfred.Fred.get_category_children`: Get the children of one category.
+            - :meth:`fedfred.Fred.get_category_series`: Get the series in one category.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/category_children.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.crawl_categories.html
+        """
+
+        return self.__run_async('crawl_categories', lambda fred: fred.crawl_categories(
+            category_id, include_series=include_series, max_concurrency=max_concurrency, resume=resume,
+            checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every))
+
     ## Releases
     def get_releases(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
                      limit: Optional[int]=None, offset: Optional[int]=None,
@@ -1002,6 +1399,72 @@ class Fred:
         releases = Release.to_object(response, client=self)
         return releases
 
+    def iter_releases(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                      limit: Optional[int]=None, offset: Optional[int]=None,
+                      order_by: Optional[str]=None, sort_order: Optional[str]=None, page_size: int=1000) -> Iterator[Release]:
+        """Iterate over FRED releases
+
+        Get all economic data releases from the FRED API, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values such as 'release_id', 'name', 'press_release', 'realtime_start', 'realtime_end'. Default is None.
+            sort_order (str, optional): Sort results in 'asc' (ascending) or 'desc' (descending) order. Default is None.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Release]: The releases, requested one page at a time.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for release in fred.iter_releases():
+            >>>     print(release.name)
+            'Advance Monthly Sales for Retail and Food Services'
+            'Consumer Price Index'
+            'Employment Cost Index'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Release`: The Release object representation.
+            - :meth:`fedfred.Fred.get_releases`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/releases.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_releases.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        url_endpoint = '/releases'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        return self.__fred_paginate(url_endpoint, data, 'releases', lambda response: Release.to_object(response, client=self),
+                                    page_size, limit)
+
     def get_releases_dates(self, realtime_start: Optional[Union[str, datetime]]=None,
                            realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
                            offset: Optional[int]=None, order_by: Optional[str]=None,
@@ -1255,41 +1718,122 @@ class Fred:
         seriess = Series.to_object(response, client=self)
         return seriess
 
-    def get_release_sources(self, release_id: int, realtime_start: Optional[Union[str, datetime]]=None,
-                            realtime_end: Optional[Union[str, datetime]]=None) -> List[Source]:
-        """Get FRED release sources
+    def iter_release_series(self, release_id: int, realtime_start: Optional[Union[str, datetime]]=None,
+                            realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                            offset: Optional[int]=None, sort_order: Optional[str]=None,
+                            filter_variable: Optional[str]=None, filter_value: Optional[str]=None,
+                            exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000) -> Iterator[Series]:
+        """Iterate over FRED release series
 
-        Retrieve the sources for a specified release from the FRED API.
+        Get the series in a release, fetching pages lazily as the iterator is consumed.
 
         Args:
-            release_id (int): The ID of the release for which to retrieve sources.
-            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD. Defaults to None.
-            realtime_end (str| datetime, optional): The end of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            release_id (int): The ID for the release.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            sort_order (str, optional): Order results by values. Options are 'asc' or 'desc'.
+            filter_variable (str, optional): The attribute to filter results by.
+            filter_value (str, optional): The value of the filter variable.
+            exclude_tag_names (str | list, optional): A semicolon-separated list of tag names to exclude.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
 
         Returns:
-            List[Series]: If multiple sources are returned.
+            Iterator[Series]: The series, requested one page at a time.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
 
         Examples:
             >>> import fedfred as fd
             >>> fred = fd.Fred('your_api_key')
-            >>> sources = fred.get_release_sources(51)
-            >>> for source in sources:
-            >>>     print(source.name)
-                'U.S. Department of Commerce: Bureau of Economic Analysis'
-                'U.S. Department of Commerce: Census Bureau'
+            >>> for s in fred.iter_release_series(51):
+            >>>     print(s.id)
+            'BOMTVLM133S'
+            'BOMVGMM133S'
+            'BOMVJMM133S'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
 
         See Also:
-            - :class:`fedfred.Source`: The Source object representation.
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.Fred.get_release_series`: Get a single page as a list.
 
         References:
-            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_sources.html
-            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.get_release_sources.html
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_release_series.html
         """
 
-        url_endpoint = '/release/sources'
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(release_id, int) or release_id < 0:
+            raise ValueError("release_id must be a non-negative integer")
+        url_endpoint = '/release/series'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'release_id': release_id,
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = _liststring_converter(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        return self.__fred_paginate(url_endpoint, data, 'seriess', lambda response: Series.to_object(response, client=self),
+                                    page_size, limit)
+
+    def get_release_sources(self, release_id: int, realtime_start: Optional[Union[str, datetime]]=None,
+                            realtime_end: Optional[Union[str, datetime]]=None) -> List[Source]:
+        """Get FRED release sources
+
+        Retrieve the sources for a specified release from the FRED API.
+
+        Args:
+            release_id (int): The ID of the release for which to retrieve sources.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            realtime_end (str| datetime, optional): The end of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+
+        Returns:
+            List[Series]: If multiple sources are returned.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> sources = fred.get_release_sources(51)
+            >>> for source in sources:
+            >>>     print(source.name)
+                'U.S. Department of Commerce: Bureau of Economic Analysis'
+                'U.S. Department of Commerce: Census Bureau'
+
+        See Also:
+            - :class:`fedfred.Source`: The Source object representation.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_sources.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.get_release_sources.html
+        """
+
+        url_endpoint = '/release/sources'
         data: Dict[str, Optional[Union[str, int]]] = {
             'release_id': release_id
         }
@@ -1464,7 +2008,8 @@ class Fred:
 
     def get_release_tables(self, release_id: int, element_id: Optional[int]=None,
                            include_observation_values: Optional[bool]=None,
-                           observation_date: Optional[Union[str, datetime]]=None) -> List[Element]:
+                           observation_date: Optional[Union[str, datetime]]=None,
+                           dataframe_method: Optional[str]=None) -> Union[List[Element], pd.DataFrame, 'pl.DataFrame', 'pa.Table']:
         """Get FRED release tables
 
         Fetches release tables from the FRED API.
@@ -1474,12 +2019,14 @@ class Fred:
             element_id (int, optional): The ID for the element. Defaults to None.
             include_observation_values (bool, optional): Whether to include observation values. Defaults to None.
             observation_date (str | datetime, optional): The observation date in YYYY-MM-DD string format. Defaults to None.
+            dataframe_method (str, optional): Return the table as one flat frame instead of Element trees. Options: 'pandas', 'polars', or 'arrow'. Defaults to None.
 
         Returns:
-            List[Element]: If multiple elements are returned.
+            List[Element]: The top-level elements, with their children nested, if dataframe_method is None.
+            pandas.DataFrame | polars.DataFrame | pyarrow.Table: One row per element with 'element_id', 'parent_id', 'level', 'series_id', 'type', 'name' and 'line' columns, parents before children, if dataframe_method is set.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, or if dataframe_method is invalid.
 
         Examples:
             >>> import fedfred as fd
@@ -1490,6 +2037,10 @@ class Fred:
             'DGDSRL1A225NBEA'
             'DDURRL1A225NBEA'
             'DNDGRL1A225NBEA'...
+            >>> table = fred.get_release_tables(53, dataframe_method='pandas')
+            >>> table[table['level'] == 0].head(1)
+               element_id  parent_id  level        series_id    type                         name  line
+            0       12886          0      0  DGDSRL1A225NBEA  series  Real Gross Domestic Product     1
 
         See Also:
             - :class:`fedfred.Element`: Class representing FRED elements.
@@ -1499,6 +2050,8 @@ class Fred:
             - FRED API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_tables.html
         """
 
+        if dataframe_method not in (None, 'pandas', 'polars', 'arrow'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
         url_endpoint = '/release/tables'
         data: Dict[str, Optional[Union[str, int]]] = {
             'release_id': release_id
@@ -1512,9 +2065,12 @@ class Fred:
                 observation_date = _datetime_converter(observation_date)
             data['observation_date'] = observation_date
         response = self.__fred_get_request(url_endpoint, data)
+        if dataframe_method is not None:
+            return _element_dataframe_converter(_element_table_flattener(response), dataframe_method)
         return Element.to_object(response, client=self)
 
-    def get_release_observations(self, release_id: int, limit: Optional[int]=None) -> List[BulkRelease]:
+    def get_release_observations(self, release_id: int, limit: Optional[int]=None, dataframe_method: Optional[str]=None,
+                                 layout: str='long') -> Union[List[BulkRelease], pd.DataFrame, 'pl.DataFrame', 'pa.Table']:
         """Get FRED release observations in bulk
 
         Fetches release observations in bulk from the FRED API.
@@ -1522,12 +2078,14 @@ class Fred:
         Args:
             release_id (int): The ID for the release.
             limit (int, optional): The maximum number of results to return per request.
+            dataframe_method (str, optional): Return every observation in one frame instead of BulkRelease objects. Options: 'pandas', 'polars', or 'arrow'. Default is None.
+            layout (str, optional): With a dataframe_method, 'long' for series_id/date/value rows or 'wide' for one column per series indexed by date. Default is 'long'.
 
         Returns:
-            List[BulkRelease]: If multiple bulk release observations are returned.
+            List[BulkRelease] | pandas.DataFrame | polars.DataFrame | pyarrow.Table: BulkRelease objects, or a single frame when dataframe_method is set.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, if dataframe_method or layout is invalid, or if layout is 'wide' and a series repeats a date.
             
         Example:
             >>> import fedfred as fd
@@ -1539,6 +2097,7 @@ class Fred:
             '53'
             '58'
             '59'...
+            >>> panel = fred.get_release_observations(18, dataframe_method='pandas', layout='wide')
 
         References:
             - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.get_release_observations.html
@@ -1548,11 +2107,17 @@ class Fred:
             This method handles pagination to retrieve all observations for the specified release ID. 
             It continues to make requests until all data has been fetched, appending each batch of results to 
             a list which is then returned.
+            With a dataframe_method, each cursor page is appended straight to series_id/date/value columns and
+            the frame is built once at the end, without creating any BulkRelease or Series objects.
 
         See Also:
             - :class:`fedfred.BulkRelease`: Class representing bulk release observations.
         """
 
+        if dataframe_method is not None and dataframe_method not in ('pandas', 'polars', 'arrow'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
+        if layout not in ('long', 'wide'):
+            raise ValueError("layout must be a string, options are: 'long' or 'wide'")
         url_endpoint = '/v2/release/observations'
         return_list = []
         has_more = True
@@ -1561,6 +2126,12 @@ class Fred:
         }
         if limit:
             data['limit'] = limit
+        if dataframe_method is not None:
+            columns: Dict[str, list] = {'series_id': [], 'date': [], 'value': []}
+            with closing(self.__fred_cursor_pages(url_endpoint, data)) as pages:
+                for response in pages:
+                    _panel_columns_collector(columns, response)
+            return _panel_dataframe_converter(columns, dataframe_method, layout)
         while has_more:
             response = self.__fred_get_request(url_endpoint, data)
             converted = BulkRelease.to_object(response, client=self)
@@ -1571,6 +2142,55 @@ class Fred:
                 has_more = False
         return return_list
 
+    def iter_release_observations(self, release_id: int, limit: Optional[int]=None) -> Iterator[BulkRelease]:
+        """Iterate over FRED release observations in bulk
+
+        Streams release observations from the FRED API one cursor page at a time.
+
+        Args:
+            release_id (int): The ID for the release.
+            limit (int, optional): The maximum number of results to return per request.
+
+        Returns:
+            Iterator[BulkRelease]: One BulkRelease per page of the release.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for page in fred.iter_release_observations(18):
+            >>>     for series in page.series:
+            >>>         print(series.id)
+            'DFF'
+            'DPRIME'
+            'DTB3'...
+
+        Notes:
+            While a page is being consumed, the request for the next cursor is already running in a
+            background thread, so at most two pages are held in memory. Stopping early discards the
+            prefetched page.
+
+        See Also:
+            - :meth:`fedfred.Fred.get_release_observations`: Collect every page into a list.
+            - :class:`fedfred.BulkRelease`: Class representing bulk release observations.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_release_observations.html
+            - FRED API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_observations.html
+        """
+
+        url_endpoint = '/v2/release/observations'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'release_id': release_id
+        }
+        if limit:
+            data['limit'] = limit
+        with closing(self.__fred_cursor_pages(url_endpoint, data)) as pages:
+            for response in pages:
+                yield BulkRelease.to_object(response, client=self)
+
     ## Series
     def get_series(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
                    realtime_end: Optional[Union[str, datetime]]=None) -> List[Series]:
@@ -1678,14 +2298,16 @@ class Fred:
                                 observation_end: Optional[Union[str, datetime]]=None, units: Optional[str]=None,
                                 frequency: Optional[str]=None,
                                 aggregation_method: Optional[str]=None,
-                                output_type: Optional[int]=None, vintage_dates: Optional[Union[str, datetime, list[Optional[Union[str, datetime]]]]]=None) -> Union[pd.DataFrame, 'pl.DataFrame', 'dd.DataFrame']:
+                                output_type: Optional[int]=None, vintage_dates: Optional[Union[str, datetime, list[Optional[Union[str, datetime]]]]]=None,
+                                stream: bool=False, value_dtype: str='float64',
+                                realtime_columns: str='string') -> Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame', 'pa.Table', 'dd.DataFrame']:
         """Get FRED series observations
 
         Get observations for a FRED series as a pandas or polars DataFrame.
 
         Args:
             series_id (str): The ID for a series.
-            dataframe_method (str, optional): The method to use to convert the response to a DataFrame. Options: 'pandas', 'polars', or 'dask'. Default is 'pandas'.
+            dataframe_method (str, optional): The method to use to convert the response to a DataFrame. Options: 'pandas', 'polars', 'polars_lazy' (a Polars LazyFrame, so filters and joins across series are pushed down and run in parallel on collect), 'arrow' (a PyArrow Table that pandas, Polars and DuckDB can read without copying), or 'dask'. Default is 'pandas'.
             realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
             realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
             limit (int, optional): The maximum number of results to return. Default is 100000.
@@ -1697,10 +2319,13 @@ class Fred:
             frequency (str, optional): An optional parameter to change the frequency of the observations. Options: 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew', 'bwem'.
             aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
             output_type (int, optional): An integer indicating the type of output. Options: 1 (observations by realtime period), 2 (observations by vintage date, all observations), 3 (observations by vintage date, new and revised observations only), 4 (observations by initial release only).
-            vintage_dates (str | list, optional): A comma-separated string of vintage dates. String format: YYYY-MM-DD.
+            vintage_dates (str | list, optional): A comma-separated string of vintage dates. String format: YYYY-MM-DD. Long lists are split into several requests, fetched concurrently, and merged.
+            stream (bool, optional): Parse the response incrementally as it is received, straight into columns. Lowers peak memory for long series and many vintage dates. Streamed responses are not cached. Default is False.
+            value_dtype (str, optional): The dtype of the value columns of a pandas frame. Options: 'float64', 'float32'. Default is 'float64'.
+            realtime_columns (str, optional): How a pandas frame returns 'realtime_start' and 'realtime_end'. Options: 'string', 'category', 'date' (with the open end 9999-12-31 as NaT), 'drop'. Default is 'string'.
 
         Returns:
-            pandas.DataFrame | polars.DataFrame | dask.DataFrame: Depending on the dataframe_method selected. Default is pandas.DataFrame.
+            pandas.DataFrame | polars.DataFrame | polars.LazyFrame | pyarrow.Table | dask.DataFrame: Depending on the dataframe_method selected. Default is pandas.DataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -1759,18 +2384,187 @@ class Fred:
             data['aggregation_method'] = aggregation_method
         if output_type:
             data['output_type'] = output_type
+        chunks: List[str] = []
         if vintage_dates:
             vintage_dates = _vintage_dates_type_converter(vintage_dates)
             data['vintage_dates'] = vintage_dates
-        response = self.__fred_get_request(url_endpoint, data)
+            chunks = _vintage_dates_chunker(vintage_dates)
+        if len(chunks) > 1:
+            response = self.__fred_vintage_chunks(url_endpoint, data, chunks, stream)
+        elif stream:
+            response = self.__fred_stream_request(url_endpoint, data)
+        else:
+            response = self.__fred_get_request(url_endpoint, data)
         if dataframe_method == 'pandas':
-            return _pandas_dataframe_converter(response)
+            return _pandas_dataframe_converter(response, value_dtype, realtime_columns)
         elif dataframe_method == 'polars':
             return _polars_dataframe_converter(response)
+        elif dataframe_method == 'polars_lazy':
+            return _polars_dataframe_converter(response, lazy=True)
+        elif dataframe_method == 'arrow':
+            return _arrow_dataframe_converter(response)
         elif dataframe_method == 'dask':
             return _dask_dataframe_converter(response)
         else:
-            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'dask'")
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', 'polars_lazy', 'arrow', or 'dask'")
+
+    def get_series_observations_many(self, series_ids: List[str], dataframe_method: str='pandas', layout: str='long',
+                                     realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                                     observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                                     units: Optional[str]=None, frequency: Optional[str]=None,
+                                     aggregation_method: Optional[str]=None) -> ObservationBatch:
+        """Get FRED series observations for many series
+
+        Fetch observations for many series concurrently, within the shared rate limit, and merge them into one frame.
+
+        Args:
+            series_ids (List[str]): The IDs of the series to fetch. Duplicates are fetched once.
+            dataframe_method (str, optional): The frame type to return. Options: 'pandas', 'polars', or 'arrow'. Default is 'pandas'.
+            layout (str, optional): 'long' for series_id/date/value rows, or 'wide' for one column per series indexed by date. Default is 'long'.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            units (str, optional): A key that indicates a data transformation, applied to every series. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            frequency (str, optional): Aggregate every series to this frequency. Options: 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew', 'bwem'.
+            aggregation_method (str, optional): The aggregation method used with frequency. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            ObservationBatch: The merged observations in `data`, and the error of each failed series in `errors`.
+
+        Raises:
+            ValueError: If series_ids is empty, if dataframe_method or layout is invalid, or if layout is 'wide' and a series repeats a date.
+            RuntimeError: If called from a running event loop; use `AsyncFred.get_series_observations_many` there.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> batch = fred.get_series_observations_many(['GDP', 'UNRATE', 'CPIAUCSL'], layout='wide')
+            >>> print(batch.data.tail(2))
+                              GDP  UNRATE  CPIAUCSL
+            date
+            2025-04-01  30353.902     4.2   320.580
+            2025-07-01        NaN     4.3   322.132
+            >>> batch.errors
+            {}
+
+        Notes:
+            The requests run on an event loop through :class:`fedfred.AsyncFred`, sharing this client's cache,
+            rate limit and request history. A series that fails is recorded in `errors` and left out of `data`;
+            the rest of the batch still completes. Only the date and value of each observation are kept, plus
+            `realtime_start` and `realtime_end` in the long layout when a real-time window is requested. A window
+            spanning several vintages can repeat a date, which the wide layout rejects.
+
+        See Also:
+            - :meth:`fedfred.Fred.get_series_observations`: Fetch observations for a single series.
+            - :class:`fedfred.ObservationBatch`: The batch result.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_observations.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.get_series_observations_many.html
+        """
+
+        return self.__run_async('get_series_observations_many', lambda fred: fred.get_series_observations_many(
+            series_ids, dataframe_method=dataframe_method, layout=layout,
+            realtime_start=realtime_start, realtime_end=realtime_end,
+            observation_start=observation_start, observation_end=observation_end,
+            units=units, frequency=frequency, aggregation_method=aggregation_method))
+
+    def sync_series_observations(self, series_id: str,
+                                 stored: Optional[Union[pd.DataFrame, 'pl.DataFrame', str, datetime]]=None,
+                                 revision_window: Union[int, timedelta]=0, dataframe_method: str='pandas',
+                                 realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                                 units: Optional[str]=None, frequency: Optional[str]=None,
+                                 aggregation_method: Optional[str]=None) -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Sync stored FRED series observations with only the new data points
+
+        Fetch the observations of a series from its last stored date onwards, less a revision window, and
+        merge them into the stored observations.
+
+        Args:
+            series_id (str): The ID for a series.
+            stored (pandas.DataFrame | polars.DataFrame | str | datetime, optional): The observations stored by an earlier call, or a watermark: the last observation date already held. Default is None (fetch the full history).
+            revision_window (int | timedelta, optional): How far before the last stored date to re-request, in days or as a timedelta, so recent revisions are picked up. Default is 0.
+            dataframe_method (str, optional): The frame type returned when `stored` is not a frame. Options: 'pandas' or 'polars'. Default is 'pandas'.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            units (str, optional): A key that indicates a data transformation. Must match the stored data. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            frequency (str, optional): An optional parameter to change the frequency of the observations. Must match the stored data.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            pandas.DataFrame | polars.DataFrame: The stored observations merged with the new ones if `stored` is a frame; otherwise only the observations from the watermark (less the revision window) onwards.
+
+        Raises:
+            ValueError: If stored, revision_window or dataframe_method is invalid, or if the API request fails.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> stored = fred.sync_series_observations('UNRATE')  # first run: full history
+            >>> stored.to_parquet('unrate.parquet')
+            >>> # Next night: only the last ~3 months are requested and merged
+            >>> stored = fred.sync_series_observations('UNRATE', stored=pd.read_parquet('unrate.parquet'), revision_window=92)
+            >>> # With a watermark, only the new rows are returned
+            >>> new_rows = fred.sync_series_observations('UNRATE', stored='2025-08-01')
+
+        Notes:
+            Only `observation_start >= last stored date - revision_window` is requested, so a nightly sync of a
+            long series transfers and decodes a handful of rows instead of its whole history. Stored rows on or
+            after that start are replaced by the fetched ones. If nothing new is returned, `stored` is returned
+            unchanged. The request bypasses the response cache, so a sync never sees a cached earlier response.
+
+        See Also:
+            - :meth:`fedfred.Fred.get_series_observations`: Fetch observations with full control of the request.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_observations.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.sync_series_observations.html
+        """
+
+        if dataframe_method not in ('pandas', 'polars'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas' or 'polars'")
+        if isinstance(revision_window, int) and not isinstance(revision_window, bool):
+            revision_window = timedelta(days=revision_window)
+        if not isinstance(revision_window, timedelta) or revision_window < timedelta(0):
+            raise ValueError("revision_window must be a non-negative number of days or timedelta")
+        stored_frame = stored is not None and not isinstance(stored, (str, datetime))
+        if stored_frame:
+            dataframe_method = 'pandas' if isinstance(stored, pd.DataFrame) else 'polars'
+        start = _observations_sync_start(stored, revision_window)
+        url_endpoint = '/series/observations'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'series_id': series_id
+        }
+        if start:
+            data['observation_start'] = start
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if units:
+            data['units'] = units
+        if frequency:
+            data['frequency'] = frequency
+        if aggregation_method:
+            data['aggregation_method'] = aggregation_method
+        with _bypass_cache():
+            response = self.__fred_get_request(url_endpoint, data)
+        if not response.get('observations'):
+            if stored_frame:
+                return stored
+            response = {**response, 'observations': _EMPTY_OBSERVATIONS}
+        if dataframe_method == 'pandas':
+            fresh = _pandas_dataframe_converter(response)
+        else:
+            fresh = _polars_dataframe_converter(response)
+        if not stored_frame or start is None:
+            return fresh
+        return _observations_sync_merger(stored, fresh, start)
 
     def get_series_release(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
                            realtime_end: Optional[Union[str, datetime]]=None) -> List[Release]:
@@ -1908,6 +2702,97 @@ class Fred:
         seriess = Series.to_object(response, client=self)
         return seriess
 
+    def iter_series_search(self, search_text: str, search_type: Optional[str]=None,
+                           realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                           limit: Optional[int]=None, offset: Optional[int]=None,
+                           order_by: Optional[str]=None, sort_order: Optional[str]=None,
+                           filter_variable: Optional[str]=None, filter_value: Optional[str]=None,
+                           tag_names: Optional[Union[str, list[str]]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000) -> Iterator[Series]:
+        """Iterate over FRED series search
+
+        Searches for economic data series based on text queries, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            search_text (str): The text to search for in economic data series. if 'search_type'='series_id', it's possible to put an '*' in the middle of a string. 'm*sl' finds any series starting with 'm' and ending with 'sl'.
+            search_type (str, optional): The type of search to perform. Options include 'full_text' or 'series_id'. Defaults to None.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): The attribute to order results by. Options include 'search_rank', 'series_id', 'title', etc. Defaults to None.
+            sort_order (str, optional): The order to sort results. Options include 'asc' or 'desc'. Defaults to None.
+            filter_variable (str, optional): The variable to filter results by. Defaults to None.
+            filter_value (str, optional): The value to filter results by. Defaults to None.
+            tag_names (str | list, optional): A comma-separated list of tag names to include in the search. Defaults to None.
+            exclude_tag_names (str | list, optional): A comma-separated list of tag names to exclude from the search. Defaults to None.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Series]: The series, requested one page at a time.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for s in fred.iter_series_search('monetary services index'):
+            >>>     print(s.id)
+            'MSIM2'
+            'MSIM1P'
+            'OCM1P'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.Fred.get_series_search`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_search.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_series_search.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        url_endpoint = '/series/search'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'search_text': search_text
+        }
+        if search_type:
+            data['search_type'] = search_type
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = _liststring_converter(tag_names)
+            data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = _liststring_converter(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        return self.__fred_paginate(url_endpoint, data, 'seriess', lambda response: Series.to_object(response, client=self),
+                                    page_size, limit)
+
     def get_series_search_tags(self, series_search_text: str, realtime_start: Optional[Union[str, datetime]]=None,
                                realtime_end: Optional[Union[str, datetime]]=None, tag_names: Optional[Union[str, list[str]]]=None,
                                tag_group_id: Optional[str]=None,
@@ -2256,37 +3141,104 @@ class Fred:
         response = self.__fred_get_request(url_endpoint, data)
         return VintageDate.to_object(response)
 
-    ## Sources
-    def get_sources(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
-                    limit: Optional[int]=None, offset: Optional[int]=None,
-                    order_by: Optional[str]=None, sort_order: Optional[str]=None) -> List[Source]:
-        """Get FRED sources
+    def iter_series_vintagedates(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
+                                 realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                                 offset: Optional[int]=None, sort_order: Optional[str]=None, page_size: int=10000) -> Iterator[VintageDate]:
+        """Iterate over FRED series vintage dates
 
-        Retrieve sources of economic data from the FRED API.
+        Get the vintage dates for a given FRED series, fetching pages lazily as the iterator is consumed.
 
         Args:
+            series_id (str): The ID for the FRED series.
             realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
             realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
-            limit (int, optional): The maximum number of results to return. Default is 1000, maximum is 1000.
-            offset (int, optional): The offset for the results. Used for pagination.
-            order_by (str, optional): Order results by values. Options are 'source_id', 'name', 'realtime_start', 'realtime_end'.
-            sort_order (str, optional): Sort order of results. Options are 'asc' (ascending) or 'desc' (descending).
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            sort_order (str, optional): The order of the results. Possible values: 'asc' or 'desc'.
+            page_size (int, optional): The number of results requested per page, at most 10000. Default is 10000.
 
         Returns:
-            List[Source]: If multiple sources are returned.
+            Iterator[VintageDate]: The vintage dates, requested one page at a time. A period without vintage dates yields nothing.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, or if `series_id`, `limit` or `page_size` is invalid.
 
         Examples:
             >>> import fedfred as fd
             >>> fred = fd.Fred('your_api_key')
-            >>> sources = fred.get_sources()
-            >>> for source in sources:
-            >>>     print(source.name)
-            'Board of Governors of the Federal Reserve System'
-            'Federal Reserve Bank of Philadelphia'
-            'Federal Reserve Bank of St. Louis'...
+            >>> for vintage_date in fred.iter_series_vintagedates('GNPCA', realtime_start='2020-01-01'):
+            >>>     print(vintage_date.vintage_date)
+            '2020-03-26'
+            '2020-07-30'
+            '2020-09-30'...
+
+        Notes:
+            Only the page being consumed is held in memory. Unlike `get_series_vintagedates`, an empty period is not an error.
+
+        See Also:
+            - :class:`fedfred.VintageDate`: The VintageDate object representation.
+            - :meth:`fedfred.Fred.get_series_vintagedates`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_vintagedates.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_series_vintagedates.html
+        """
+
+        if not isinstance(series_id, str) or series_id == '':
+            raise ValueError("series_id must be a non-empty string")
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 10000:
+            raise ValueError("page_size must be an integer between 1 and 10000")
+        url_endpoint = '/series/vintagedates'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'series_id': series_id
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if sort_order:
+            data['sort_order'] = sort_order
+        return self.__fred_paginate(url_endpoint, data, 'vintage_dates', VintageDate.to_object, page_size, limit)
+
+    ## Sources
+    def get_sources(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                    limit: Optional[int]=None, offset: Optional[int]=None,
+                    order_by: Optional[str]=None, sort_order: Optional[str]=None) -> List[Source]:
+        """Get FRED sources
+
+        Retrieve sources of economic data from the FRED API.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to return. Default is 1000, maximum is 1000.
+            offset (int, optional): The offset for the results. Used for pagination.
+            order_by (str, optional): Order results by values. Options are 'source_id', 'name', 'realtime_start', 'realtime_end'.
+            sort_order (str, optional): Sort order of results. Options are 'asc' (ascending) or 'desc' (descending).
+
+        Returns:
+            List[Source]: If multiple sources are returned.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> sources = fred.get_sources()
+            >>> for source in sources:
+            >>>     print(source.name)
+            'Board of Governors of the Federal Reserve System'
+            'Federal Reserve Bank of Philadelphia'
+            'Federal Reserve Bank of St. Louis'...
 
         See Also:
             - :class:`fedfred.Source`: The Source object representation.
@@ -2318,6 +3270,72 @@ class Fred:
         sources = Source.to_object(response, client=self)
         return sources
 
+    def iter_sources(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                     limit: Optional[int]=None, offset: Optional[int]=None,
+                     order_by: Optional[str]=None, sort_order: Optional[str]=None, page_size: int=1000) -> Iterator[Source]:
+        """Iterate over FRED sources
+
+        Retrieve sources of economic data from the FRED API, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options are 'source_id', 'name', 'realtime_start', 'realtime_end'.
+            sort_order (str, optional): Sort order of results. Options are 'asc' (ascending) or 'desc' (descending).
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Source]: The sources, requested one page at a time.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for source in fred.iter_sources():
+            >>>     print(source.name)
+            'Board of Governors of the Federal Reserve System'
+            'Federal Reserve Bank of Philadelphia'
+            'Federal Reserve Bank of St. Louis'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Source`: The Source object representation.
+            - :meth:`fedfred.Fred.get_sources`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/sources.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_sources.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        url_endpoint = '/sources'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        return self.__fred_paginate(url_endpoint, data, 'sources', lambda response: Source.to_object(response, client=self),
+                                    page_size, limit)
+
     def get_source(self, source_id: int, realtime_start: Optional[Union[str, datetime]]=None,
                    realtime_end: Optional[Union[str, datetime]]=None) -> List[Source]:
         """Get a FRED source
@@ -2506,6 +3524,85 @@ class Fred:
         tags = Tag.to_object(response, client=self)
         return tags
 
+    def iter_tags(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str,datetime]]=None,
+                  tag_names: Optional[Union[str, list[str]]]=None, tag_group_id: Optional[str]=None,
+                  search_text: Optional[str]=None, limit: Optional[int]=None,
+                  offset: Optional[int]=None, order_by: Optional[str]=None,
+                  sort_order: Optional[str]=None, page_size: int=1000) -> Iterator[Tag]:
+        """Iterate over FRED tags
+
+        Retrieve FRED tags based on specified parameters, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            tag_names (str | list, optional): A semicolon-delimited list of tag names to filter results.
+            tag_group_id (str, optional): A tag group ID to filter results.
+            search_text (str, optional): The words to match against tag names and descriptions.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values such as 'series_count', 'popularity', etc.
+            sort_order (str, optional): Sort order of results. 'asc' for ascending, 'desc' for descending.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Tag]: The tags, requested one page at a time.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for tag in fred.iter_tags():
+            >>>     print(tag.name)
+            'nation'
+            'nsa'
+            'oecd'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Tag`: The Tag object representation.
+            - :meth:`fedfred.Fred.get_tags`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/tags.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_tags.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        url_endpoint = '/tags'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = _liststring_converter(tag_names)
+            data['tag_names'] = tag_names
+        if tag_group_id:
+            data['tag_group_id'] = tag_group_id
+        if search_text:
+            data['search_text'] = search_text
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        return self.__fred_paginate(url_endpoint, data, 'tags', lambda response: Tag.to_object(response, client=self),
+                                    page_size, limit)
+
     def get_related_tags(self, tag_names: Union[str, list[str]], realtime_start: Optional[Union[str, datetime]]=None,
                          realtime_end: Optional[Union[str, datetime]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None,
                          tag_group_id: Optional[str]=None, search_text: Optional[str]=None,
@@ -2655,6 +3752,82 @@ class Fred:
         seriess = Series.to_object(response, client=self)
         return seriess
 
+    def iter_tags_series(self, tag_names: Union[str, list[str]], exclude_tag_names: Optional[Union[str, list[str]]]=None,
+                         realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                         limit: Optional[int]=None, offset: Optional[int]=None,
+                         order_by: Optional[str]=None, sort_order: Optional[str]=None, page_size: int=1000) -> Iterator[Series]:
+        """Iterate over FRED tags series
+
+        Get the series matching tags, fetching pages lazily as the iterator is consumed.
+
+        Args:
+            tag_names (str | list): A semicolon delimited list of tag names to include in the search.
+            exclude_tag_names (str | list, optional): A semicolon delimited list of tag names to exclude in the search.
+            realtime_start (str, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options: 'series_id', 'title', 'units', 'frequency', 'seasonal_adjustment', 'realtime_start', 'realtime_end', 'last_updated', 'observation_start', 'observation_end', 'popularity', 'group_popularity'.
+            sort_order (str, optional): Sort results in ascending or descending order. Options: 'asc', 'desc'.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+
+        Returns:
+            Iterator[Series]: The series, requested one page at a time.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit` or `page_size` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> for s in fred.iter_tags_series('slovenia'):
+            >>>     print(s.id)
+            'CPGDFD02SIA657N'
+            'CPGDFD02SIA659N'
+            'CPGDFD02SIM657N'...
+
+        Notes:
+            Only the page being consumed is held in memory. Stopping early, for example with `itertools.islice`, skips the remaining pages.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.Fred.get_tags_series`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/tags_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.Fred.iter_tags_series.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        url_endpoint = '/tags/series'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if isinstance(tag_names, list):
+            tag_names = _liststring_converter(tag_names)
+        data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = _liststring_converter(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = _datetime_converter(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = _datetime_converter(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        return self.__fred_paginate(url_endpoint, data, 'seriess', lambda response: Series.to_object(response, client=self),
+                                    page_size, limit)
+
 class AsyncFred:
     """Asynchronous client for the Federal Reserve FRED/ALFRED API.
 
@@ -2664,12 +3837,17 @@ class AsyncFred:
     
     Attributes:
         cache_mode (bool): Whether caching is enabled for API responses.
-        cache (FIFOCache): The cache object for storing API responses.
+        cache (FIFOCache | MutableMapping): The cache object for storing API responses.
+        metrics (TransferMetrics): Compressed and decompressed response bytes per endpoint, shared with the parent Fred instance.
+        timeouts (TimeoutPolicy): Timeouts per endpoint family, shared with the parent Fred instance.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker, shared with the parent Fred instance.
+        hedging (HedgingPolicy, optional): The hedged request policy, if enabled.
         base_url (str): The base URL for the FRED API.
         AsyncGeoFred (AsyncGeoFred): Attached instance for asynchronous FRED Maps API endpoints.
     
     Args:
         parent (Fred): The parent Fred instance.
+        hedging (HedgingPolicy, optional): Opt-in hedged requests to cut tail latency. Defaults to None (disabled).
 
     Raises:
         ValueError: If the provided parent is not an instance of Fred.
@@ -2698,11 +3876,12 @@ class AsyncFred:
     """
 
     # Dunder Methods
-    def __init__(self, parent: 'Fred') -> None:
+    def __init__(self, parent: 'Fred', hedging: Optional[HedgingPolicy]=None) -> None:
         """Initialize the AsyncFred class with a reference to the parent Fred instance.
 
         Args:
             parent (Fred): The parent Fred instance.
+            hedging (HedgingPolicy, optional): Opt-in hedged requests to cut tail latency. Defaults to None (disabled).
 
         Raises:
             ValueError: If the provided parent is not an instance of Fred.
@@ -2731,8 +3910,13 @@ class AsyncFred:
 
         self._parent: Fred = parent
         self.cache_mode: bool = parent.cache_mode
-        self.cache: FIFOCache = parent.cache
+        self.cache: MutableMapping[Any, Any] = parent.cache
+        self.metrics: TransferMetrics = parent.metrics
+        self.timeouts: TimeoutPolicy = parent.timeouts
+        self.circuit_breaker: Optional[CircuitBreaker] = parent.circuit_breaker
+        self.hedging: Optional[HedgingPolicy] = hedging
         self.base_url: str = parent.base_url
+        self._limiter: Union[Fred, _AsyncLimiter] = parent
 
     def __repr__(self) -> str:
         """String representation of the AsyncFred class.
@@ -2848,7 +4032,7 @@ class AsyncFred:
             >>> # Cache is cleared when async_fred is deleted
         """
 
-        if hasattr(self, "cache"):
+        if hasattr(self, "cache") and self._parent.cache_backend is None:
             self.cache.clear()
 
     def __len__(self) -> int:
@@ -3012,12 +4196,13 @@ class AsyncFred:
 
         Notes:
             This method updates the semaphore limit based on the number of requests made in the last minute, allowing for dynamic rate limiting.
+            `request_times` is read under the parent's `_rate_lock`, so synchronous threads and coroutines share one budget.
 
         Warnings:
             This method should be used within an asynchronous context to ensure proper locking and timing.
         """
 
-        async with self._parent.lock:
+        async with self._limiter.lock, _hold_thread_lock(self._parent._rate_lock):
             now = time.time()
             while self._parent.request_times and self._parent.request_times[0] < now - 60:
                 self._parent.request_times.popleft()
@@ -3025,7 +4210,7 @@ class AsyncFred:
             requests_left = max(0, self._parent.max_requests_per_minute - requests_made)
             time_left = max(1, 60 - (now - (self._parent.request_times[0] if self._parent.request_times else now)))
             new_limit = max(1, min(self._parent.max_requests_per_minute // 10, requests_left // 2))
-            self._parent.semaphore = asyncio.Semaphore(new_limit)
+            self._limiter.semaphore = asyncio.Semaphore(new_limit)
             return requests_left, time_left
 
     async def __rate_limited(self) -> None:
@@ -3039,14 +4224,14 @@ class AsyncFred:
             This method should be used within an asynchronous context to ensure proper locking and timing.
         """
 
-        async with self._parent.semaphore:
+        async with self._limiter.semaphore:
             requests_left, time_left = await self.__update_semaphore()
             if requests_left > 0:
                 sleep_time = time_left / max(1, requests_left)
-                await asyncio.sleep(sleep_time)
+                await asyncio.sleep(_deadline_wait(sleep_time))
             else:
-                await asyncio.sleep(60)
-            async with self._parent.lock:
+                await asyncio.sleep(_deadline_wait(60))
+            async with self._limiter.lock, _hold_thread_lock(self._parent._rate_lock):
                 self._parent.request_times.append(time.time())
 
     async def __fred_get_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
@@ -3066,32 +4251,30 @@ class AsyncFred:
             This method handles rate limiting and caching for asynchronous GET requests to the FRED API.
 
         Warnings:
-            Caching is only applied if `cache_mode` is enabled in the parent Fred instance. Ensure that the `data` parameter is hashable for 
+            Caching is only applied if `cache_mode` is enabled in the parent Fred instance and the request is not made inside `_bypass_cache()`. Ensure that the `data` parameter is hashable for 
             caching to work correctly.
         """
 
-        @retry(wait=wait_fixed(1),
-            stop=stop_after_attempt(3),
-            retry=retry_if_exception_type(httpx.HTTPError),
-            reraise=True,)
-        async def __get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
-            """Perform a GET request without caching.
+        async def __send_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None,
+                                 dispatched: Optional[asyncio.Event]=None) -> Dict[str, Any]:
+            """Send a single rate-limited GET request.
 
             Args:
                 url_endpoint (str): The FRED API endpoint to query.
                 data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+                dispatched (asyncio.Event, optional): Set once the request has cleared the rate limiter. Defaults to None.
 
             Returns:
                 Dict[str, Any]: The JSON response from the FRED API.
 
             Raises:
-                httpx.HTTPError: If the HTTP request fails.
-
-            Notes:
-                This method handles rate limiting and caching for synchronous GET requests to the FRED API.
+                ValueError: If the HTTP request fails.
             """
 
+            _deadline_check(url_endpoint)
             await self.__rate_limited()
+            if dispatched is not None:
+                dispatched.set()
             params = {
                 **(data or {}),
                 'api_key': self._parent.api_key,
@@ -3107,48 +4290,273 @@ class AsyncFred:
                             **(data or {}),
                             'format': 'json'
                         }
-                        response = await client.get(self.base_url + url_endpoint, headers=headers, params=params, timeout=10)
+                        response = await client.get(self.base_url + url_endpoint, headers=_request_headers(headers), params=params, timeout=_request_timeout(self.timeouts, url_endpoint))
+                        _record_transfer(self.metrics, response)
                         response.raise_for_status()
-                        return response.json()
-                    response = await client.get(self.base_url + url_endpoint, params=params, timeout=10)
+                        return _json_response_decoder(response)
+                    response = await client.get(self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint))
+                    _record_transfer(self.metrics, response)
                     response.raise_for_status()
-                    return response.json()
+                    return _json_response_decoder(response)
                 except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
                     raise ValueError(f"HTTP Error occurred: {e}") from e
 
-        @async_cached(cache=self.cache)
-        async def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
-            """Perform a GET request with caching.
+        @retry(wait=wait_fixed(1),
+            stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
+            retry=retry_if_exception_type(httpx.HTTPError),
+            reraise=True,)
+        async def __get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            """Perform a GET request without caching.
 
             Args:
                 url_endpoint (str): The FRED API endpoint to query.
-                hashable_data (Optional[Tuple[Tuple[str, Optional[str | int]], ...]], optional): The hashable representation of the data. Defaults to None.
+                data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
 
             Returns:
                 Dict[str, Any]: The JSON response from the FRED API.
 
             Raises:
                 httpx.HTTPError: If the HTTP request fails.
+
+            Notes:
+                When a hedging policy is set, a duplicate request is sent if this one is still pending after the
+                policy's delay, and the first response wins.
             """
 
-            return await __get_request(url_endpoint, await _dict_type_converter_async(hashable_data))
+            if self.hedging is None:
+                return await __send_request(url_endpoint, data)
+            return await _hedged_request(self.hedging, url_endpoint,
+                                         lambda dispatched: __send_request(url_endpoint, data, dispatched))
 
-        if data:
-            await _fred_parameter_validator_async(data)
-        if self.cache_mode:
-            return await __cached_get_request(url_endpoint, await _hashable_type_converter_async(data))
-        else:
-            return await __get_request(url_endpoint, data)
+        async def __guarded_get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            """Perform a GET request through the circuit breaker, if one is configured.
 
-    # Public Methods
-    ## Categories
-    async def get_category(self, category_id: int) -> List[Category]:
-        """Get a FRED Category
+            Args:
+                url_endpoint (str): The API endpoint to query.
+                data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
 
-        Retrieve information about a specific category from the FRED API.
+            Returns:
+                Dict[str, Any]: The JSON response, or the last good response while the circuit is open and `serve_stale` is set.
 
-        Args:r
-            category_id (int): The ID of the category to retrieve.
+            Raises:
+                CircuitOpenError: If the circuit for this endpoint is open.
+            """
+
+            return await _breaker_call_async(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data)),
+                                             lambda: __get_request(url_endpoint, data))
+
+        @async_cached(cache=self.cache)
+        async def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
+            """Perform a GET request with caching.
+
+            Args:
+                url_endpoint (str): The FRED API endpoint to query.
+                hashable_data (Optional[Tuple[Tuple[str, Optional[str | int]], ...]], optional): The hashable representation of the data. Defaults to None.
+
+            Returns:
+                Dict[str, Any]: The JSON response from the FRED API.
+
+            Raises:
+                httpx.HTTPError: If the HTTP request fails.
+            """
+
+            return await __guarded_get_request(url_endpoint, await _dict_type_converter_async(hashable_data))
+
+        if data:
+            await _fred_parameter_validator_async(data)
+        use_cache = self.cache_mode and not _CACHE_BYPASS.get()
+        if use_cache and isinstance(self.cache, RedisCache):
+            key = hashkey(url_endpoint, await _hashable_type_converter_async(data))
+            cached_response = await self.cache.aget(key)
+            if cached_response is not None:
+                return cached_response
+            response = await __guarded_get_request(url_endpoint, data)
+            await self.cache.aset(key, response)
+            return response
+        elif use_cache:
+            return await __cached_get_request(url_endpoint, await _hashable_type_converter_async(data))
+        else:
+            return await __guarded_get_request(url_endpoint, data)
+
+    async def __fred_stream_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+        """Helper method to perform an asynchronous streaming GET request for FRED observations.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: A response-shaped dict whose 'observations' value maps each field to a column list.
+
+        Raises:
+            ValueError: If the HTTP request fails or the response is truncated.
+            CircuitOpenError: If the circuit for this endpoint is open.
+
+        Notes:
+            The response body is parsed incrementally as it is received, so the full payload is never buffered.
+            Streamed responses bypass the cache but go through the circuit breaker like any other request; stale
+            responses are kept apart from unstreamed ones because they hold columns rather than rows.
+        """
+
+        @retry(wait=wait_fixed(1),
+            stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
+            retry=retry_if_exception_type(httpx.HTTPError),
+            reraise=True,)
+        async def __stream_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            _deadline_check(url_endpoint)
+            await self.__rate_limited()
+            params = {
+                **(data or {}),
+                'api_key': self._parent.api_key,
+                'file_type': 'json'
+            }
+            parser = _ObservationStreamParser()
+            async with httpx.AsyncClient() as client:
+                try:
+                    async with client.stream("GET", self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint)) as response:
+                        response.raise_for_status()
+                        received = 0
+                        async for chunk in response.aiter_bytes():
+                            received += len(chunk)
+                            parser.feed(chunk)
+                        _record_transfer(self.metrics, response, received)
+                except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
+                    raise ValueError(f"HTTP Error occurred: {e}") from e
+            return parser.close()
+
+        if data:
+            await _fred_parameter_validator_async(data)
+        return await _breaker_call_async(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data), 'stream'),
+                                         lambda: __stream_request(url_endpoint, data))
+
+    async def __fred_paginate(self, url_endpoint: str, data: Dict[str, Optional[Union[str, int]]], result_key: str,
+                              to_object: Callable[[Dict[str, Any]], Awaitable[List[Any]]], page_size: int,
+                              limit: Optional[int]=None, prefetch: int=8) -> AsyncIterator[Any]:
+        """Helper method to page through a FRED endpoint that takes `limit` and `offset`, prefetching pages concurrently.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]]): The query parameters, without `limit`. An `offset` sets the first result.
+            result_key (str): The response key holding the results, such as 'seriess' or 'tags'.
+            to_object (Callable): Asynchronously parses a response into a list of objects.
+            page_size (int): The number of results requested per page.
+            limit (int, optional): The maximum number of results to yield. Defaults to None (every result).
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Defaults to 8.
+
+        Returns:
+            AsyncIterator: The parsed objects, in API order.
+
+        Notes:
+            The first page is fetched alone. Once its `count` is known, the offsets of the remaining pages are
+            computed and up to `prefetch` of them are kept in flight through the rate limiter, while pages are
+            still yielded in order. Without a `count`, the remaining pages are fetched one after another. Pages
+            bypass the response cache, so a full walk does not fill it.
+        """
+
+        async def fetch(page: Dict[str, Optional[Union[str, int]]]) -> Dict[str, Any]:
+            with _bypass_cache():
+                return await self.__fred_get_request(url_endpoint, page)
+
+        offset = int(data.get('offset') or 0)
+        page_limit = page_size if limit is None else min(page_size, limit)
+        response = await fetch({**data, 'limit': page_limit, 'offset': offset})
+        rows = response.get(result_key) or []
+        if not rows:
+            return
+        offset += len(rows)
+        count = response.get('count')
+        end = count if isinstance(count, int) else None
+        if limit is not None:
+            stop = int(data.get('offset') or 0) + limit
+            end = stop if end is None else min(end, stop)
+        if end is None:
+            for item in await to_object(response):
+                yield item
+            while len(rows) == page_limit:
+                response = await fetch({**data, 'limit': page_limit, 'offset': offset})
+                rows = response.get(result_key) or []
+                if not rows:
+                    return
+                offset += len(rows)
+                for item in await to_object(response):
+                    yield item
+            return
+
+        offsets = deque(range(offset, end, page_size))
+        pending: deque = deque()
+
+        def schedule() -> None:
+            while offsets and len(pending) < prefetch:
+                page_offset = offsets.popleft()
+                page = {**data, 'limit': min(page_size, end - page_offset), 'offset': page_offset}
+                pending.append(asyncio.ensure_future(fetch(page)))
+
+        try:
+            schedule()
+            for item in await to_object(response):
+                yield item
+            while pending:
+                response = await pending.popleft()
+                schedule()
+                if not response.get(result_key):
+                    return
+                for item in await to_object(response):
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def __fred_cursor_pages(self, url_endpoint: str, data: Dict[str, Optional[Union[str, int]]]) -> AsyncIterator[Dict[str, Any]]:
+        """Helper method to follow `next_cursor` through a FRED v2 endpoint, prefetching the next page.
+
+        Args:
+            url_endpoint (str): The FRED API endpoint to query.
+            data (Dict[str, Optional[str | int]]): The query parameters for the first page.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: The raw response of each page.
+
+        Notes:
+            While a page is being consumed, the request for the next cursor is already in flight. Closing the
+            iterator cancels the prefetched request. Pages bypass the response cache, so at most two are held at a time.
+        """
+
+        with _bypass_cache():
+            response = await self.__fred_get_request(url_endpoint, data)
+        prefetch: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if response.get('has_more'):
+                    data = {**data, 'next_cursor': response['next_cursor']}
+                    with _bypass_cache():
+                        prefetch = asyncio.ensure_future(self.__fred_get_request(url_endpoint, data))
+                yield response
+                if prefetch is None:
+                    return
+                response = await prefetch
+                prefetch = None
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+    # Public Methods
+    ## Categories
+    async def get_category(self, category_id: int) -> List[Category]:
+        """Get a FRED Category
+
+        Retrieve information about a specific category from the FRED API.
+
+        Args:r
+            category_id (int): The ID of the category to retrieve.
 
         Returns:
             List[Category]: If multiple categories are returned.
@@ -3378,6 +4786,103 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Series.to_object_async(response)
 
+    async def iter_category_series(self, category_id: int, realtime_start: Optional[Union[str, datetime]]=None,
+                                   realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                                   offset: Optional[int]=None, order_by: Optional[str]=None,
+                                   sort_order: Optional[str]=None, filter_variable: Optional[str]=None,
+                                   filter_value: Optional[str]=None, tag_names: Optional[Union[str, list[str]]]=None,
+                                   exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000,
+                                   prefetch: int=8) -> AsyncIterator[Series]:
+        """Iterate over a FRED Category's FRED Series
+
+        Get the series info for all series in a category from the FRED API, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            category_id (int): The ID for a category.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options are 'series_id', 'title', 'units', 'frequency', 'seasonal_adjustment', 'realtime_start', 'realtime_end', 'last_updated', 'observation_start', 'observation_end', 'popularity', 'group_popularity'.
+            sort_order (str, optional): Sort results in ascending or descending order. Options are 'asc' or 'desc'.
+            filter_variable (str, optional): The attribute to filter results by. Options are 'frequency', 'units', 'seasonal_adjustment'.
+            filter_value (str, optional): The value of the filter_variable to filter results by.
+            tag_names (str | list, optional): A semicolon-separated list of tag names to filter results by.
+            exclude_tag_names (str | list, optional): A semicolon-separated list of tag names to exclude results by.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Series]: The series, in API order.
+
+        Raises:
+            ValueError: If the request to the FRED API fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for s in fred.iter_category_series(125):
+            >>>         print(s.frequency)
+            >>> asyncio.run(main())
+            'Quarterly'
+            'Annual'
+            'Quarterly'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.AsyncFred.get_category_series`: Get a single page as a list.
+            
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/category_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_category_series.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/category/series'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'category_id': category_id
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = await _liststring_converter_async(tag_names)
+            data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = await _liststring_converter_async(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'seriess', Series.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     async def get_category_tags(self, category_id: int, realtime_start: Optional[Union[str, datetime]]=None,
                                 realtime_end: Optional[Union[str, datetime]]=None, tag_names: Optional[Union[str, list[str]]]=None,
                                 tag_group_id: Optional[int]=None, search_text: Optional[str]=None,
@@ -3543,6 +5048,126 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Tag.to_object_async(response)
 
+    async def crawl_categories(self, category_id: int=0, include_series: bool=True, max_concurrency: int=8,
+                               resume: Optional[CategoryIndex]=None, checkpoint_path: Optional[Union[str, os.PathLike]]=None,
+                               checkpoint_every: int=100) -> CategoryIndex:
+        """Crawl the FRED category tree into a local index
+
+        Walk the category tree breadth-first from `category_id`, fetching the children and series of up to
+        `max_concurrency` categories at once, and build a :class:`fedfred.CategoryIndex` that answers subtree
+        queries without further API calls.
+
+        Args:
+            category_id (int, optional): The category to start from. Default is 0, the root of the FRED category tree.
+            include_series (bool, optional): Also record the series in each category. Default is True.
+            max_concurrency (int, optional): The most categories expanded at once. Default is 8.
+            resume (CategoryIndex, optional): A partial index from an earlier crawl; only its pending categories are crawled. Default is None.
+            checkpoint_path (str | os.PathLike, optional): Save the partial index here every `checkpoint_every` categories, on interruption, and at the end. Default is None.
+            checkpoint_every (int, optional): The number of categories crawled between checkpoints. Default is 100.
+
+        Returns:
+            CategoryIndex: The index of the crawled subtree. Categories that failed are left in its `pending`.
+
+        Raises:
+            ValueError: If max_concurrency or checkpoint_every is not a positive integer, or if the start category does not exist.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     index = await fred.crawl_categories(32991, max_concurrency=16)
+            >>>     print(index.children(32991))
+            >>> asyncio.run(main())
+            [22, 46, 67, 94, 114, 3004, 32145, 33060]
+
+        Notes:
+            Every request goes through the rate limiter, cache and circuit breaker. Each category is fetched once
+            per crawl, and with caching enabled a repeated crawl is answered from the cache. A category whose
+            requests fail stays in `pending`, so passing the index back as `resume` retries it. If the crawl is
+            cancelled, the categories in flight are also left in `pending` of the last checkpoint.
+
+        See Also:
+            - :meth:`fedfred.AsyncFred.get_category_children`: Get the children of one category.
+            - :meth:`fedfred.AsyncFred.get_category_series`: Get the series in one category.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/category_children.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.crawl_categories.html
+        """
+
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        if not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be a positive integer")
+        records: Dict[int, Tuple[int, str]] = {}
+        series: Dict[int, List[str]] = {}
+        queue: deque = deque()
+        if resume is not None:
+            categories, series = resume.records()
+            records = {child_id: (parent_id, name) for child_id, parent_id, name in categories}
+            queue.extend(resume.pending)
+        else:
+            response = await self.__fred_get_request('/category', {'category_id': category_id})
+            root = next(iter(response.get('categories') or []), None)
+            if root is None:
+                raise ValueError(f"Category {category_id} was not found")
+            records[int(root['id'])] = (int(root.get('parent_id', root['id'])), root.get('name', ''))
+            queue.append(int(root['id']))
+        failed: List[int] = []
+        pending: Dict[asyncio.Future, int] = {}
+        completed = 0
+
+        async def series_ids(response: Dict[str, Any]) -> List[str]:
+            return [member['id'] for member in response.get('seriess') or []]
+
+        async def expand(parent_id: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+            response = await self.__fred_get_request('/category/children', {'category_id': parent_id})
+            members: List[str] = []
+            if include_series:
+                async with aclosing(self.__fred_paginate('/category/series', {'category_id': parent_id}, 'seriess',
+                                                         series_ids, 1000, None, 1)) as pages:
+                    members = [member async for member in pages]
+            return response.get('categories') or [], members
+
+        def snapshot() -> CategoryIndex:
+            return CategoryIndex(((child_id, parent_id, name) for child_id, (parent_id, name) in records.items()),
+                                 series, [*failed, *pending.values(), *queue])
+
+        try:
+            while queue or pending:
+                while queue and len(pending) < max_concurrency:
+                    parent_id = queue.popleft()
+                    pending[asyncio.ensure_future(expand(parent_id))] = parent_id
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    parent_id = pending.pop(task)
+                    if task.exception() is not None:
+                        failed.append(parent_id)
+                        continue
+                    children, members = task.result()
+                    if members:
+                        series[parent_id] = members
+                    for child in children:
+                        child_id = int(child['id'])
+                        if child_id not in records:
+                            records[child_id] = (int(child.get('parent_id', parent_id)), child.get('name', ''))
+                            queue.append(child_id)
+                    completed += 1
+                    if checkpoint_path is not None and completed % checkpoint_every == 0:
+                        await asyncio.to_thread(snapshot().save, checkpoint_path)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                if checkpoint_path is not None:
+                    snapshot().save(checkpoint_path)
+        index = snapshot()
+        if checkpoint_path is not None:
+            await asyncio.to_thread(index.save, checkpoint_path)
+        return index
+
     ## Releases
     async def get_releases(self, realtime_start: Optional[Union[str, datetime]]=None,
                            realtime_end: Optional[Union[str, datetime]]=None,
@@ -3608,6 +5233,82 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Release.to_object_async(response)
 
+    async def iter_releases(self, realtime_start: Optional[Union[str, datetime]]=None,
+                            realtime_end: Optional[Union[str, datetime]]=None,
+                            limit: Optional[int]=None, offset: Optional[int]=None, order_by: Optional[str]=None,
+                            sort_order: Optional[str]=None, page_size: int=1000,
+                            prefetch: int=8) -> AsyncIterator[Release]:
+        """Iterate over FRED releases
+
+        Get all economic data releases from the FRED API, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values such as 'release_id', 'name', 'press_release', 'realtime_start', 'realtime_end'. Default is None.
+            sort_order (str, optional): Sort results in 'asc' (ascending) or 'desc' (descending) order. Default is None.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Release]: The releases, in API order.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for release in fred.iter_releases():
+            >>>         print(release.name)
+            >>> asyncio.run(main())
+            'Advance Monthly Sales for Retail and Food Services'
+            'Consumer Price Index'
+            'Employment Cost Index'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Release`: The Release object representation.
+            - :meth:`fedfred.AsyncFred.get_releases`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/releases.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_releases.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/releases'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'releases', Release.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     async def get_releases_dates(self, realtime_start: Optional[Union[str, datetime]]=None,
                                  realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
                                  offset: Optional[int]=None, order_by: Optional[str]=None,
@@ -3871,6 +5572,94 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Series.to_object_async(response)
 
+    async def iter_release_series(self, release_id: int, realtime_start: Optional[Union[str, datetime]]=None,
+                                  realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                                  offset: Optional[int]=None, sort_order: Optional[str]=None,
+                                  filter_variable: Optional[str]=None, filter_value: Optional[str]=None,
+                                  exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000,
+                                  prefetch: int=8) -> AsyncIterator[Series]:
+        """Iterate over FRED release series
+
+        Get the series in a release, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            release_id (int): The ID for the release.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            sort_order (str, optional): Order results by values. Options are 'asc' or 'desc'.
+            filter_variable (str, optional): The attribute to filter results by.
+            filter_value (str, optional): The value of the filter variable.
+            exclude_tag_names (str | list, optional): A semicolon-separated list of tag names to exclude.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Series]: The series, in API order.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for s in fred.iter_release_series(51):
+            >>>         print(s.id)
+            >>> asyncio.run(main())
+            'BOMTVLM133S'
+            'BOMVGMM133S'
+            'BOMVJMM133S'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.AsyncFred.get_release_series`: Get a single page as a list.
+            
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_release_series.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/release/series'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'release_id': release_id
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = await _liststring_converter_async(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'seriess', Series.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     async def get_release_sources(self, release_id: int, realtime_start: Optional[Union[str, datetime]]=None,
                                   realtime_end: Optional[Union[str, datetime]]=None) -> List[Source]:
         """Get FRED release sources
@@ -4085,7 +5874,8 @@ class AsyncFred:
 
     async def get_release_tables(self, release_id: int, element_id: Optional[int]=None,
                                  include_observation_values: Optional[bool]=None,
-                                 observation_date: Optional[Union[str, datetime]]=None) -> List[Element]:
+                                 observation_date: Optional[Union[str, datetime]]=None,
+                                 dataframe_method: Optional[str]=None) -> Union[List[Element], pd.DataFrame, 'pl.DataFrame', 'pa.Table']:
         """Get FRED release tables
 
         Fetches release tables from the FRED API.
@@ -4095,12 +5885,14 @@ class AsyncFred:
             element_id (int, optional): The ID for the element. Defaults to None.
             include_observation_values (bool, optional): Whether to include observation values. Defaults to None.
             observation_date (str | datetime, optional): The observation date in YYYY-MM-DD string format. Defaults to None.
+            dataframe_method (str, optional): Return the table as one flat frame instead of Element trees. Options: 'pandas', 'polars', or 'arrow'. Defaults to None.
 
         Returns:
-            List[Element]: If multiple elements are returned.
+            List[Element]: The top-level elements, with their children nested, if dataframe_method is None.
+            pandas.DataFrame | polars.DataFrame | pyarrow.Table: One row per element with 'element_id', 'parent_id', 'level', 'series_id', 'type', 'name' and 'line' columns, parents before children, if dataframe_method is set.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, or if dataframe_method is invalid.
 
         Examples:
             >>> import fedfred as fd
@@ -4123,6 +5915,8 @@ class AsyncFred:
             - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.get_release_tables.html
         """
 
+        if dataframe_method not in (None, 'pandas', 'polars', 'arrow'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
         url_endpoint = '/release/tables'
         data: Dict[str, Optional[Union[str, int]]] = {
             'release_id': release_id
@@ -4136,9 +5930,12 @@ class AsyncFred:
                 observation_date = await _datetime_converter_async(observation_date)
             data['observation_date'] = observation_date
         response = await self.__fred_get_request(url_endpoint, data)
+        if dataframe_method is not None:
+            return await _element_dataframe_converter_async(_element_table_flattener(response), dataframe_method)
         return await Element.to_object_async(response)
 
-    async def get_release_observations(self, release_id: int, limit: Optional[int]=None) -> List[BulkRelease]:
+    async def get_release_observations(self, release_id: int, limit: Optional[int]=None, dataframe_method: Optional[str]=None,
+                                       layout: str='long') -> Union[List[BulkRelease], pd.DataFrame, 'pl.DataFrame', 'pa.Table']:
         """Get FRED release observations in bulk
 
         Fetches release observations in bulk from the FRED API.
@@ -4146,12 +5943,14 @@ class AsyncFred:
         Args:
             release_id (int): The ID for the release.
             limit (int, optional): The maximum number of results to return per request.
+            dataframe_method (str, optional): Return every observation in one frame instead of BulkRelease objects. Options: 'pandas', 'polars', or 'arrow'. Default is None.
+            layout (str, optional): With a dataframe_method, 'long' for series_id/date/value rows or 'wide' for one column per series indexed by date. Default is 'long'.
 
         Returns:
-            List[BulkRelease]: If multiple bulk release observations are returned.
+            List[BulkRelease] | pandas.DataFrame | polars.DataFrame | pyarrow.Table: BulkRelease objects, or a single frame when dataframe_method is set.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, if dataframe_method or layout is invalid, or if layout is 'wide' and a series repeats a date.
             
         Example:
             >>> import fedfred as fd
@@ -4171,11 +5970,17 @@ class AsyncFred:
             This method handles pagination to retrieve all observations for the specified release ID. 
             It continues to make requests until all data has been fetched, appending each batch of results to 
             a list which is then returned.
+            With a dataframe_method, each cursor page is appended straight to series_id/date/value columns and
+            the frame is built once at the end, without creating any BulkRelease or Series objects.
 
         See Also:
             - :class:`fedfred.BulkRelease`: Class representing bulk release observations.
         """
 
+        if dataframe_method is not None and dataframe_method not in ('pandas', 'polars', 'arrow'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
+        if layout not in ('long', 'wide'):
+            raise ValueError("layout must be a string, options are: 'long' or 'wide'")
         url_endpoint = '/v2/release/observations'
         return_list = []
         has_more = True
@@ -4184,6 +5989,12 @@ class AsyncFred:
         }
         if limit:
             data['limit'] = limit
+        if dataframe_method is not None:
+            columns: Dict[str, list] = {'series_id': [], 'date': [], 'value': []}
+            async with aclosing(self.__fred_cursor_pages(url_endpoint, data)) as pages:
+                async for response in pages:
+                    _panel_columns_collector(columns, response)
+            return await _panel_dataframe_converter_async(columns, dataframe_method, layout)
         while has_more:
             response = await self.__fred_get_request(url_endpoint, data)
             converted = await BulkRelease.to_object_async(response)
@@ -4194,6 +6005,56 @@ class AsyncFred:
                 has_more = False
         return return_list
 
+    async def iter_release_observations(self, release_id: int, limit: Optional[int]=None) -> AsyncIterator[BulkRelease]:
+        """Iterate over FRED release observations in bulk
+
+        Streams release observations from the FRED API one cursor page at a time.
+
+        Args:
+            release_id (int): The ID for the release.
+            limit (int, optional): The maximum number of results to return per request.
+
+        Returns:
+            AsyncIterator[BulkRelease]: One BulkRelease per page of the release.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for page in fred.iter_release_observations(18):
+            >>>         print(len(page.series))
+            >>> asyncio.run(main())
+            1000
+            1000
+            412
+
+        Notes:
+            While a page is being consumed, the request for the next cursor is already in flight, so at most
+            two pages are held in memory. Leaving the loop early cancels the prefetched request.
+
+        See Also:
+            - :meth:`fedfred.AsyncFred.get_release_observations`: Collect every page into a list.
+            - :class:`fedfred.BulkRelease`: Class representing bulk release observations.
+
+        References:
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_release_observations.html
+            - FRED API Documentation: https://fred.stlouisfed.org/docs/api/fred/release_observations.html
+        """
+
+        url_endpoint = '/v2/release/observations'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'release_id': release_id
+        }
+        if limit:
+            data['limit'] = limit
+        async with aclosing(self.__fred_cursor_pages(url_endpoint, data)) as pages:
+            async for response in pages:
+                yield await BulkRelease.to_object_async(response)
+
     ## Series
     async def get_series(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
                          realtime_end: Optional[Union[str, datetime]]=None) -> List[Series]:
@@ -4307,15 +6168,16 @@ class AsyncFred:
                                       units: Optional[str]=None, frequency: Optional[str]=None,
                                       aggregation_method: Optional[str]=None,
                                       output_type: Optional[int]=None,
-                                      vintage_dates: Optional[Union[str, datetime, list[Optional[Union[str, datetime]]]]]=None
-                                      ) -> Union[pd.DataFrame, 'pl.DataFrame', 'dd.DataFrame']:
+                                      vintage_dates: Optional[Union[str, datetime, list[Optional[Union[str, datetime]]]]]=None,
+                                      stream: bool=False, value_dtype: str='float64',
+                                      realtime_columns: str='string') -> Union[pd.DataFrame, 'pl.DataFrame', 'pl.LazyFrame', 'pa.Table', 'dd.DataFrame']:
         """Get FRED series observations
 
         Get observations for a FRED series as a pandas or polars DataFrame.
 
         Args:
             series_id (str): The ID for a series.
-            dataframe_method (str, optional): The method to use to convert the response to a DataFrame. Options: 'pandas', 'polars', or 'dask'. Default is 'pandas'.
+            dataframe_method (str, optional): The method to use to convert the response to a DataFrame. Options: 'pandas', 'polars', 'polars_lazy' (a Polars LazyFrame, so filters and joins across series are pushed down and run in parallel on collect), 'arrow' (a PyArrow Table that pandas, Polars and DuckDB can read without copying), or 'dask'. Default is 'pandas'.
             realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
             realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
             limit (int, optional): The maximum number of results to return. Default is 100000.
@@ -4327,10 +6189,13 @@ class AsyncFred:
             frequency (str, optional): An optional parameter to change the frequency of the observations. Options: 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew', 'bwem'.
             aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
             output_type (int, optional): An integer indicating the type of output. Options: 1 (observations by realtime period), 2 (observations by vintage date, all observations), 3 (observations by vintage date, new and revised observations only), 4 (observations by initial release only).
-            vintage_dates (str | list, optional): A comma-separated string of vintage dates. String format: YYYY-MM-DD.
+            vintage_dates (str | list, optional): A comma-separated string of vintage dates. String format: YYYY-MM-DD. Long lists are split into several requests, fetched concurrently, and merged.
+            stream (bool, optional): Parse the response incrementally as it is received, straight into columns. Lowers peak memory for long series and many vintage dates. Streamed responses are not cached. Default is False.
+            value_dtype (str, optional): The dtype of the value columns of a pandas frame. Options: 'float64', 'float32'. Default is 'float64'.
+            realtime_columns (str, optional): How a pandas frame returns 'realtime_start' and 'realtime_end'. Options: 'string', 'category', 'date' (with the open end 9999-12-31 as NaT), 'drop'. Default is 'string'.
 
         Returns:
-            pandas.DataFrame | polars.DataFrame | dask.DataFrame: Depending on the dataframe_method selected. Default is pandas.DataFrame.
+            pandas.DataFrame | polars.DataFrame | polars.LazyFrame | pyarrow.Table | dask.DataFrame: Depending on the dataframe_method selected. Default is pandas.DataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -4392,18 +6257,236 @@ class AsyncFred:
             data['aggregation_method'] = aggregation_method
         if output_type:
             data['output_type'] = output_type
+        chunks: List[str] = []
         if vintage_dates:
             vintage_dates = await _vintage_dates_type_converter_async(vintage_dates)
             data['vintage_dates'] = vintage_dates
-        response = await self.__fred_get_request(url_endpoint, data)
+            chunks = _vintage_dates_chunker(vintage_dates)
+        if len(chunks) > 1:
+            fetch = self.__fred_stream_request if stream else self.__fred_get_request
+            responses = await asyncio.gather(*(fetch(url_endpoint, {**data, 'vintage_dates': chunk}) for chunk in chunks))
+            response = await _vintage_chunks_merger_async(list(responses), chunks, output_type)
+        elif stream:
+            response = await self.__fred_stream_request(url_endpoint, data)
+        else:
+            response = await self.__fred_get_request(url_endpoint, data)
         if dataframe_method == 'pandas':
-            return await _pandas_dataframe_converter_async(response)
+            return await _pandas_dataframe_converter_async(response, value_dtype, realtime_columns)
         elif dataframe_method == 'polars':
             return await _polars_dataframe_converter_async(response)
+        elif dataframe_method == 'polars_lazy':
+            return await _polars_dataframe_converter_async(response, lazy=True)
+        elif dataframe_method == 'arrow':
+            return await _arrow_dataframe_converter_async(response)
         elif dataframe_method == 'dask':
             return await _dask_dataframe_converter_async(response)
         else:
-            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'dask'")
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', 'polars_lazy', 'arrow', or 'dask'")
+
+    async def get_series_observations_many(self, series_ids: List[str], dataframe_method: str='pandas', layout: str='long',
+                                               realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                                               observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+                                               units: Optional[str]=None, frequency: Optional[str]=None,
+                                               aggregation_method: Optional[str]=None) -> ObservationBatch:
+        """Get FRED series observations for many series
+
+        Fetch observations for many series concurrently, within the shared rate limit, and merge them into one frame.
+
+        Args:
+            series_ids (List[str]): The IDs of the series to fetch. Duplicates are fetched once.
+            dataframe_method (str, optional): The frame type to return. Options: 'pandas', 'polars', or 'arrow'. Default is 'pandas'.
+            layout (str, optional): 'long' for series_id/date/value rows, or 'wide' for one column per series indexed by date. Default is 'long'.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            observation_start (str | datetime, optional): The start of the observation period. String format: YYYY-MM-DD.
+            observation_end (str | datetime, optional): The end of the observation period. String format: YYYY-MM-DD.
+            units (str, optional): A key that indicates a data transformation, applied to every series. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            frequency (str, optional): Aggregate every series to this frequency. Options: 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew', 'bwem'.
+            aggregation_method (str, optional): The aggregation method used with frequency. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            ObservationBatch: The merged observations in `data`, and the error of each failed series in `errors`.
+
+        Raises:
+            ValueError: If series_ids is empty, if dataframe_method or layout is invalid, or if layout is 'wide' and a series repeats a date.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     batch = await fred.get_series_observations_many(['GDP', 'UNRATE', 'NOT_A_SERIES'])
+            >>>     print(batch.data.head(3))
+            >>>     print(list(batch.errors))
+            >>> asyncio.run(main())
+              series_id       date     value
+            0       GDP 1947-01-01   243.164
+            1       GDP 1947-04-01   245.968
+            2       GDP 1947-07-01   249.585
+            ['NOT_A_SERIES']
+
+        Notes:
+            Every series is requested at once; the rate limiter decides how many are in flight. A series that
+            fails is recorded in `errors` and left out of `data`; the rest of the batch still completes. Only
+            the date and value of each observation are kept, plus `realtime_start` and `realtime_end` in the
+            long layout when a real-time window is requested, and series appear in the order requested. A window
+            spanning several vintages can repeat a date, which the wide layout rejects.
+
+        See Also:
+            - :meth:`fedfred.AsyncFred.get_series_observations`: Fetch observations for a single series.
+            - :class:`fedfred.ObservationBatch`: The batch result.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_observations.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.get_series_observations_many.html
+        """
+
+        if isinstance(series_ids, str) or not series_ids or not all(isinstance(series_id, str) and series_id for series_id in series_ids):
+            raise ValueError("series_ids must be a non-empty list of series ID strings")
+        if dataframe_method not in ('pandas', 'polars', 'arrow'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas', 'polars', or 'arrow'")
+        if layout not in ('long', 'wide'):
+            raise ValueError("layout must be a string, options are: 'long' or 'wide'")
+        series_ids = list(dict.fromkeys(series_ids))
+        url_endpoint = '/series/observations'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if observation_start:
+            if isinstance(observation_start, datetime):
+                observation_start = await _datetime_converter_async(observation_start)
+            data['observation_start'] = observation_start
+        if observation_end:
+            if isinstance(observation_end, datetime):
+                observation_end = await _datetime_converter_async(observation_end)
+            data['observation_end'] = observation_end
+        if units:
+            data['units'] = units
+        if frequency:
+            data['frequency'] = frequency
+        if aggregation_method:
+            data['aggregation_method'] = aggregation_method
+
+        async def fetch(series_id: str) -> Union[Dict[str, Any], Exception]:
+            try:
+                return await self.__fred_get_request(url_endpoint, {'series_id': series_id, **data})
+            except Exception as e:
+                return e
+
+        responses = await asyncio.gather(*(fetch(series_id) for series_id in series_ids))
+        columns: Dict[str, list] = {'series_id': [], 'date': [], 'value': []}
+        if realtime_start or realtime_end:
+            columns.update(realtime_start=[], realtime_end=[])
+        errors: Dict[str, Exception] = {}
+        for series_id, response in zip(series_ids, responses):
+            if isinstance(response, Exception):
+                errors[series_id] = response
+                continue
+            _panel_columns_collector(columns, {'series': [{'series_id': series_id, 'observations': response.get('observations', [])}]})
+        frame = await _panel_dataframe_converter_async(columns, dataframe_method, layout)
+        return ObservationBatch(data=frame, errors=errors)
+
+    async def sync_series_observations(self, series_id: str,
+                                       stored: Optional[Union[pd.DataFrame, 'pl.DataFrame', str, datetime]]=None,
+                                       revision_window: Union[int, timedelta]=0, dataframe_method: str='pandas',
+                                       realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                                       units: Optional[str]=None, frequency: Optional[str]=None,
+                                       aggregation_method: Optional[str]=None) -> Union[pd.DataFrame, 'pl.DataFrame']:
+        """Sync stored FRED series observations with only the new data points
+
+        Fetch the observations of a series from its last stored date onwards, less a revision window, and
+        merge them into the stored observations.
+
+        Args:
+            series_id (str): The ID for a series.
+            stored (pandas.DataFrame | polars.DataFrame | str | datetime, optional): The observations stored by an earlier call, or a watermark: the last observation date already held. Default is None (fetch the full history).
+            revision_window (int | timedelta, optional): How far before the last stored date to re-request, in days or as a timedelta, so recent revisions are picked up. Default is 0.
+            dataframe_method (str, optional): The frame type returned when `stored` is not a frame. Options: 'pandas' or 'polars'. Default is 'pandas'.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            units (str, optional): A key that indicates a data transformation. Must match the stored data. Options: 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log'.
+            frequency (str, optional): An optional parameter to change the frequency of the observations. Must match the stored data.
+            aggregation_method (str, optional): A key that indicates the aggregation method used for frequency aggregation. Options: 'avg', 'sum', 'eop'.
+
+        Returns:
+            pandas.DataFrame | polars.DataFrame: The stored observations merged with the new ones if `stored` is a frame; otherwise only the observations from the watermark (less the revision window) onwards.
+
+        Raises:
+            ValueError: If stored, revision_window or dataframe_method is invalid, or if the API request fails.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     stored = await fred.sync_series_observations('UNRATE')
+            >>>     stored = await fred.sync_series_observations('UNRATE', stored=stored, revision_window=92)
+            >>>     print(stored.tail(1))
+            >>> asyncio.run(main())
+
+        Notes:
+            Only `observation_start >= last stored date - revision_window` is requested, so a nightly sync of a
+            long series transfers and decodes a handful of rows instead of its whole history. Stored rows on or
+            after that start are replaced by the fetched ones. If nothing new is returned, `stored` is returned
+            unchanged. The request bypasses the response cache, so a sync never sees a cached earlier response.
+
+        See Also:
+            - :meth:`fedfred.AsyncFred.get_series_observations`: Fetch observations with full control of the request.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_observations.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.sync_series_observations.html
+        """
+
+        if dataframe_method not in ('pandas', 'polars'):
+            raise ValueError("dataframe_method must be a string, options are: 'pandas' or 'polars'")
+        if isinstance(revision_window, int) and not isinstance(revision_window, bool):
+            revision_window = timedelta(days=revision_window)
+        if not isinstance(revision_window, timedelta) or revision_window < timedelta(0):
+            raise ValueError("revision_window must be a non-negative number of days or timedelta")
+        stored_frame = stored is not None and not isinstance(stored, (str, datetime))
+        if stored_frame:
+            dataframe_method = 'pandas' if isinstance(stored, pd.DataFrame) else 'polars'
+        start = _observations_sync_start(stored, revision_window)
+        url_endpoint = '/series/observations'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'series_id': series_id
+        }
+        if start:
+            data['observation_start'] = start
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if units:
+            data['units'] = units
+        if frequency:
+            data['frequency'] = frequency
+        if aggregation_method:
+            data['aggregation_method'] = aggregation_method
+        with _bypass_cache():
+            response = await self.__fred_get_request(url_endpoint, data)
+        if not response.get('observations'):
+            if stored_frame:
+                return stored
+            response = {**response, 'observations': _EMPTY_OBSERVATIONS}
+        if dataframe_method == 'pandas':
+            fresh = await _pandas_dataframe_converter_async(response)
+        else:
+            fresh = await _polars_dataframe_converter_async(response)
+        if not stored_frame or start is None:
+            return fresh
+        return _observations_sync_merger(stored, fresh, start)
 
     async def get_series_release(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
                                  realtime_end: Optional[Union[str, datetime]]=None) -> List[Release]:
@@ -4463,49 +6546,150 @@ class AsyncFred:
                                 tag_names: Optional[Union[str, list[str]]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None) -> List[Series]:
         """Get FRED series search
 
-        Searches for economic data series based on text queries.
+        Searches for economic data series based on text queries.
+
+        Args:
+            search_text (str): The text to search for in economic data series. if 'search_type'='series_id', it's possible to put an '*' in the middle of a string. 'm*sl' finds any series starting with 'm' and ending with 'sl'.
+            search_type (str, optional): The type of search to perform. Options include 'full_text' or 'series_id'. Defaults to None.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD. Defaults to None.
+            limit (int, optional): The maximum number of results to return. Defaults to None.
+            offset (int, optional): The offset for the results. Defaults to None.
+            order_by (str, optional): The attribute to order results by. Options include 'search_rank', 'series_id', 'title', etc. Defaults to None.
+            sort_order (str, optional): The order to sort results. Options include 'asc' or 'desc'. Defaults to None.
+            filter_variable (str, optional): The variable to filter results by. Defaults to None.
+            filter_value (str, optional): The value to filter results by. Defaults to None.
+            tag_names (str | list, optional): A comma-separated list of tag names to include in the search. Defaults to None.
+            exclude_tag_names (str | list, optional): A comma-separated list of tag names to exclude from the search. Defaults to None.
+
+        Returns:
+            List[Series]: If multiple series are returned.
+
+        Raises:
+            ValueError: If the API request fails or returns an error.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     series = await fred.get_series_search('monetary services index')
+            >>>     for s in series:
+            >>>         print(s.id)
+            >>> asyncio.run(main())
+            'MSIM2'
+            'MSIM1P'
+            'OCM1P'...
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_search.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.get_series_search.html
+        """
+
+        url_endpoint = '/series/search'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'search_text': search_text
+        }
+        if search_type:
+            data['search_type'] = search_type
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if limit:
+            data['limit'] = limit
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        if filter_variable:
+            data['filter_variable'] = filter_variable
+        if filter_value:
+            data['filter_value'] = filter_value
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = await _liststring_converter_async(tag_names)
+            data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = await _liststring_converter_async(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        response = await self.__fred_get_request(url_endpoint, data)
+        return await Series.to_object_async(response)
+
+    async def iter_series_search(self, search_text: str, search_type: Optional[str]=None,
+                                 realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                                 limit: Optional[int]=None, offset: Optional[int]=None,
+                                 order_by: Optional[str]=None, sort_order: Optional[str]=None,
+                                 filter_variable: Optional[str]=None, filter_value: Optional[str]=None,
+                                 tag_names: Optional[Union[str, list[str]]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None, page_size: int=1000,
+                                 prefetch: int=8) -> AsyncIterator[Series]:
+        """Iterate over FRED series search
+
+        Searches for economic data series based on text queries, prefetching the remaining pages concurrently once the first page reveals the total count.
 
         Args:
             search_text (str): The text to search for in economic data series. if 'search_type'='series_id', it's possible to put an '*' in the middle of a string. 'm*sl' finds any series starting with 'm' and ending with 'sl'.
             search_type (str, optional): The type of search to perform. Options include 'full_text' or 'series_id'. Defaults to None.
             realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD. Defaults to None.
             realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD. Defaults to None.
-            limit (int, optional): The maximum number of results to return. Defaults to None.
-            offset (int, optional): The offset for the results. Defaults to None.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
             order_by (str, optional): The attribute to order results by. Options include 'search_rank', 'series_id', 'title', etc. Defaults to None.
             sort_order (str, optional): The order to sort results. Options include 'asc' or 'desc'. Defaults to None.
             filter_variable (str, optional): The variable to filter results by. Defaults to None.
             filter_value (str, optional): The value to filter results by. Defaults to None.
             tag_names (str | list, optional): A comma-separated list of tag names to include in the search. Defaults to None.
             exclude_tag_names (str | list, optional): A comma-separated list of tag names to exclude from the search. Defaults to None.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
 
         Returns:
-            List[Series]: If multiple series are returned.
+            AsyncIterator[Series]: The series, in API order.
 
         Raises:
-            ValueError: If the API request fails or returns an error.
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
 
         Examples:
             >>> import fedfred as fd
             >>> import asyncio
             >>> async def main():
             >>>     fred = fd.Fred('your_api_key').AsyncFred
-            >>>     series = await fred.get_series_search('monetary services index')
-            >>>     for s in series:
+            >>>     async for s in fred.iter_series_search('monetary services index'):
             >>>         print(s.id)
             >>> asyncio.run(main())
             'MSIM2'
             'MSIM1P'
             'OCM1P'...
 
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
         See Also:
             - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.AsyncFred.get_series_search`: Get a single page as a list.
 
         References:
             - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_search.html
-            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.get_series_search.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_series_search.html
         """
 
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
         url_endpoint = '/series/search'
         data: Dict[str, Optional[Union[str, int]]] = {
             'search_text': search_text
@@ -4520,8 +6704,6 @@ class AsyncFred:
             if isinstance(realtime_end, datetime):
                 realtime_end = await _datetime_converter_async(realtime_end)
             data['realtime_end'] = realtime_end
-        if limit:
-            data['limit'] = limit
         if offset:
             data['offset'] = offset
         if order_by:
@@ -4540,8 +6722,9 @@ class AsyncFred:
             if isinstance(exclude_tag_names, list):
                 exclude_tag_names = await _liststring_converter_async(exclude_tag_names)
             data['exclude_tag_names'] = exclude_tag_names
-        response = await self.__fred_get_request(url_endpoint, data)
-        return await Series.to_object_async(response)
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'seriess', Series.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
 
     async def get_series_search_tags(self, series_search_text: str, realtime_start: Optional[Union[str, datetime]]=None,
                                      realtime_end: Optional[Union[str, datetime]]=None, tag_names: Optional[Union[str, list[str]]]=None,
@@ -4903,6 +7086,79 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await VintageDate.to_object_async(response)
 
+    async def iter_series_vintagedates(self, series_id: str, realtime_start: Optional[Union[str, datetime]]=None,
+                                       realtime_end: Optional[Union[str, datetime]]=None, limit: Optional[int]=None,
+                                       offset: Optional[int]=None, sort_order: Optional[str]=None, page_size: int=10000,
+                                       prefetch: int=8) -> AsyncIterator[VintageDate]:
+        """Iterate over FRED series vintage dates
+
+        Get the vintage dates for a given FRED series, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            series_id (str): The ID for the FRED series.
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            sort_order (str, optional): The order of the results. Possible values: 'asc' or 'desc'.
+            page_size (int, optional): The number of results requested per page, at most 10000. Default is 10000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[VintageDate]: The vintage dates, in API order. A period without vintage dates yields nothing.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `series_id`, `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for vintage_date in fred.iter_series_vintagedates('GNPCA', realtime_start='2020-01-01'):
+            >>>         print(vintage_date.vintage_date)
+            >>> asyncio.run(main())
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Unlike `get_series_vintagedates`, an empty period is not an error.
+
+        See Also:
+            - :class:`fedfred.VintageDate`: The VintageDate object representation.
+            - :meth:`fedfred.AsyncFred.get_series_vintagedates`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/series_vintagedates.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_series_vintagedates.html
+        """
+
+        if not isinstance(series_id, str) or series_id == '':
+            raise ValueError("series_id must be a non-empty string")
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 10000:
+            raise ValueError("page_size must be an integer between 1 and 10000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/series/vintagedates'
+        data: Dict[str, Optional[Union[str, int]]] = {
+            'series_id': series_id
+        }
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if sort_order:
+            data['sort_order'] = sort_order
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'vintage_dates', VintageDate.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     ## Sources
     async def get_sources(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
                           limit: Optional[int]=None, offset: Optional[int]=None,
@@ -4968,6 +7224,82 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Source.to_object_async(response)
 
+    async def iter_sources(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                           limit: Optional[int]=None, offset: Optional[int]=None,
+                           order_by: Optional[str]=None, sort_order: Optional[str]=None, page_size: int=1000,
+                           prefetch: int=8) -> AsyncIterator[Source]:
+        """Iterate over FRED sources
+
+        Retrieve sources of economic data from the FRED API, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            realtime_start (str, optional): The start of the real-time period. Format: YYYY-MM-DD.
+            realtime_end (str, optional): The end of the real-time period. Format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options are 'source_id', 'name', 'realtime_start', 'realtime_end'.
+            sort_order (str, optional): Sort order of results. Options are 'asc' (ascending) or 'desc' (descending).
+            file_type (str, optional): The format of the returned data. Default is 'json'. Options are 'json', 'xml'.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Source]: The sources, in API order.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for source in fred.iter_sources():
+            >>>         print(source.name)
+            >>> asyncio.run(main())
+            'Board of Governors of the Federal Reserve System'
+            'Federal Reserve Bank of Philadelphia'
+            'Federal Reserve Bank of St. Louis'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Source`: The Source object representation.
+            - :meth:`fedfred.AsyncFred.get_sources`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/sources.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_sources.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/sources'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'sources', Source.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     async def get_source(self, source_id: int, realtime_start: Optional[Union[str, datetime]]=None,
                          realtime_end: Optional[Union[str, datetime]]=None) -> List[Source]:
         """Get a FRED source
@@ -5162,6 +7494,94 @@ class AsyncFred:
         response = await self.__fred_get_request(url_endpoint, data)
         return await Tag.to_object_async(response)
 
+    async def iter_tags(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str,datetime]]=None,
+                        tag_names: Optional[Union[str, list[str]]]=None, tag_group_id: Optional[str]=None,
+                        search_text: Optional[str]=None, limit: Optional[int]=None,
+                        offset: Optional[int]=None, order_by: Optional[str]=None,
+                        sort_order: Optional[str]=None, page_size: int=1000,
+                        prefetch: int=8) -> AsyncIterator[Tag]:
+        """Iterate over FRED tags
+
+        Retrieve FRED tags based on specified parameters, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            realtime_start (str | datetime, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str | datetime, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            tag_names (str | list, optional): A semicolon-delimited list of tag names to filter results.
+            tag_group_id (str, optional): A tag group ID to filter results.
+            search_text (str, optional): The words to match against tag names and descriptions.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values such as 'series_count', 'popularity', etc.
+            sort_order (str, optional): Sort order of results. 'asc' for ascending, 'desc' for descending.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Tag]: The tags, in API order.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for tag in fred.iter_tags():
+            >>>         print(tag.name)
+            >>> asyncio.run(main())
+            'nation'
+            'nsa'
+            'oecd'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Tag`: The Tag object representation.
+            - :meth:`fedfred.AsyncFred.get_tags`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/tags.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_tags.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/tags'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = await _liststring_converter_async(tag_names)
+            data['tag_names'] = tag_names
+        if tag_group_id:
+            data['tag_group_id'] = tag_group_id
+        if search_text:
+            data['search_text'] = search_text
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'tags', Tag.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
     async def get_related_tags(self, realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
                                tag_names: Optional[Union[str, list[str]]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None,
                                tag_group_id: Optional[str]=None, search_text: Optional[str]=None,
@@ -5316,3 +7736,168 @@ class AsyncFred:
             data['sort_order'] = sort_order
         response = await self.__fred_get_request(url_endpoint, data)
         return await Series.to_object_async(response)
+
+    async def iter_tags_series(self, tag_names: Optional[Union[str, list[str]]]=None, exclude_tag_names: Optional[Union[str, list[str]]]=None,
+                               realtime_start: Optional[Union[str, datetime]]=None, realtime_end: Optional[Union[str, datetime]]=None,
+                               limit: Optional[int]=None, offset: Optional[int]=None,
+                               order_by: Optional[str]=None, sort_order: Optional[str]=None, page_size: int=1000,
+                               prefetch: int=8) -> AsyncIterator[Series]:
+        """Iterate over FRED tags series
+
+        Get the series matching tags, prefetching the remaining pages concurrently once the first page reveals the total count.
+
+        Args:
+            tag_names (str, optional): A semicolon delimited list of tag names to include in the search.
+            exclude_tag_names (str, optional): A semicolon delimited list of tag names to exclude in the search.
+            realtime_start (str, optional): The start of the real-time period. String format: YYYY-MM-DD.
+            realtime_end (str, optional): The end of the real-time period. String format: YYYY-MM-DD.
+            limit (int, optional): The maximum number of results to yield across all pages. Default is None (every result).
+            offset (int, optional): The offset of the first result. Default is 0.
+            order_by (str, optional): Order results by values. Options: 'series_id', 'title', 'units', 'frequency', 'seasonal_adjustment', 'realtime_start', 'realtime_end', 'last_updated', 'observation_start', 'observation_end', 'popularity', 'group_popularity'.
+            sort_order (str, optional): Sort results in ascending or descending order. Options: 'asc', 'desc'.
+            page_size (int, optional): The number of results requested per page, at most 1000. Default is 1000.
+            prefetch (int, optional): The maximum number of pages requested ahead of the consumer. Default is 8.
+
+        Returns:
+            AsyncIterator[Series]: The series, in API order.
+
+        Raises:
+            ValueError: If the API request fails or returns an error, or if `limit`, `page_size` or `prefetch` is invalid.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     async for s in fred.iter_tags_series('slovenia'):
+            >>>         print(s.id)
+            >>> asyncio.run(main())
+            'CPGDFD02SIA657N'
+            'CPGDFD02SIA659N'
+            'CPGDFD02SIM657N'...
+
+        Notes:
+            Pages are requested through the shared rate limiter and yielded in order. Breaking out of the loop
+            cancels the pages still in flight.
+
+        See Also:
+            - :class:`fedfred.Series`: The Series object representation.
+            - :meth:`fedfred.AsyncFred.get_tags_series`: Get a single page as a list.
+
+        References:
+            - Fred API Documentation: https://fred.stlouisfed.org/docs/api/fred/tags_series.html
+            - fedfred package documentation: https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.AsyncFred.iter_tags_series.html
+        """
+
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("limit must be a positive integer")
+        if not isinstance(page_size, int) or not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be an integer between 1 and 1000")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("prefetch must be a positive integer")
+        url_endpoint = '/tags/series'
+        data: Dict[str, Optional[Union[str, int]]] = {}
+        if tag_names:
+            if isinstance(tag_names, list):
+                tag_names = await _liststring_converter_async(tag_names)
+            data['tag_names'] = tag_names
+        if exclude_tag_names:
+            if isinstance(exclude_tag_names, list):
+                exclude_tag_names = await _liststring_converter_async(exclude_tag_names)
+            data['exclude_tag_names'] = exclude_tag_names
+        if realtime_start:
+            if isinstance(realtime_start, datetime):
+                realtime_start = await _datetime_converter_async(realtime_start)
+            data['realtime_start'] = realtime_start
+        if realtime_end:
+            if isinstance(realtime_end, datetime):
+                realtime_end = await _datetime_converter_async(realtime_end)
+            data['realtime_end'] = realtime_end
+        if offset:
+            data['offset'] = offset
+        if order_by:
+            data['order_by'] = order_by
+        if sort_order:
+            data['sort_order'] = sort_order
+        async with aclosing(self.__fred_paginate(url_endpoint, data, 'seriess', Series.to_object_async, page_size, limit, prefetch)) as pages:
+            async for item in pages:
+                yield item
+
+    async def as_completed(self, requests: Iterable[Tuple[str, Dict[str, Any]]],
+                           max_in_flight: int=32) -> AsyncIterator[Tuple[Tuple[str, Dict[str, Any]], Any]]:
+        """Run many FRED requests concurrently and yield each result as it completes
+
+        Each request spec names an AsyncFred `get_*` method and its keyword arguments, so one call can mix
+        endpoints and parameters freely. Results are yielded in completion order, letting downstream work
+        start on the first responses while slower ones are still in flight.
+
+        Args:
+            requests (Iterable[Tuple[str, Dict[str, Any]]]): Request specs as `(method_name, kwargs)` pairs, e.g. `('get_series', {'series_id': 'GDP'})`. May be a lazy iterable.
+            max_in_flight (int, optional): The most requests scheduled at once; further specs are pulled from `requests` as earlier ones finish. Default is 32.
+
+        Yields:
+            Tuple[Tuple[str, Dict[str, Any]], Any]: The request spec, and either its result or the exception it raised.
+
+        Raises:
+            ValueError: If max_in_flight is not a positive integer, or if a spec does not name an AsyncFred `get_*` method.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> import asyncio
+            >>> async def main():
+            >>>     fred = fd.Fred('your_api_key').AsyncFred
+            >>>     requests = [
+            >>>         ('get_series', {'series_id': 'GDP'}),
+            >>>         ('get_series_observations', {'series_id': 'UNRATE', 'observation_start': '2024-01-01'}),
+            >>>         ('get_release', {'release_id': 53}),
+            >>>     ]
+            >>>     async for (method, kwargs), result in fred.as_completed(requests):
+            >>>         if isinstance(result, Exception):
+            >>>             print(method, kwargs, 'failed:', result)
+            >>>         else:
+            >>>             print(method, kwargs, type(result).__name__)
+            >>> asyncio.run(main())
+            get_release {'release_id': 53} list
+            get_series {'series_id': 'GDP'} list
+            get_series_observations {'series_id': 'UNRATE', 'observation_start': '2024-01-01'} DataFrame
+
+        Notes:
+            Every request goes through the same rate limiter, cache and circuit breaker as a direct call, so
+            `max_in_flight` only bounds how many specs are held at once; the rate limiter still decides how
+            many hit the network. A request that fails is yielded with its exception and does not stop the
+            others. Requests still pending when iteration stops early are cancelled.
+
+        See Also:
+            - :meth:`fedfred.AsyncFred.get_series_observations_many`: Fetch observations for many series into one frame.
+        """
+
+        if not isinstance(max_in_flight, int) or max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+        specs = iter(requests)
+        pending: Dict[asyncio.Future, Tuple[int, Tuple[str, Dict[str, Any]]]] = {}
+        launched = 0
+
+        def launch(count: int) -> None:
+            nonlocal launched
+            for spec in islice(specs, count):
+                method_name, kwargs = spec
+                method = getattr(self, method_name, None) if isinstance(method_name, str) and method_name.startswith('get_') else None
+                if method is None:
+                    raise ValueError(f"Request spec must name an AsyncFred get_* method, got {method_name!r}")
+                pending[asyncio.ensure_future(method(**kwargs))] = (launched, spec)
+                launched += 1
+
+        try:
+            launch(max_in_flight)
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda task: pending[task][0]):
+                    _, spec = pending.pop(task)
+                    error = task.exception()
+                    yield spec, (error if error is not None else task.result())
+                launch(max_in_flight - len(pending))
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
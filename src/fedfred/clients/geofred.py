@@ -4,14 +4,21 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 import time
-from typing import TYPE_CHECKING, Optional, Dict, Union, List, Tuple, Any
+from typing import TYPE_CHECKING, Optional, Dict, Union, List, Tuple, Any, MutableMapping
 import httpx
 import geopandas as gpd
-from tenacity import retry, wait_fixed, stop_after_attempt, retry_if_exception_type
+from tenacity import retry, wait_fixed, stop_after_attempt, stop_any, retry_if_exception_type
 from cachetools import FIFOCache, cached
+from cachetools.keys import hashkey
 from asyncache import cached as async_cached
 from ..__about__ import __title__, __version__, __author__, __email__, __license__, __copyright__, __description__, __docs__, __repository__
 from .fred import Fred, AsyncFred
+from ..cache import RedisCache, _CACHE_BYPASS
+from ..transport import (
+    CircuitBreaker, TimeoutPolicy, TransferMetrics,
+    _breaker_call, _breaker_call_async, _deadline_check, _deadline_http_error, _deadline_retry_stop, _deadline_wait, _hold_thread_lock, _record_transfer,
+    _request_headers, _request_timeout
+)
 from .._core import (
     # Converters
     _dict_type_converter, _dict_type_converter_async,
@@ -20,16 +27,20 @@ from .._core import (
     _geopandas_geodataframe_converter, _geopandas_geodataframe_converter_async,
     _dask_geopandas_geodataframe_converter, _dask_geopandas_geodataframe_converter_async,
     _polars_geodataframe_converter, _polars_geodataframe_converter_async,
+    _arrow_regional_data_converter, _arrow_regional_data_converter_async,
     # Validators
     _geofred_parameter_validator, _geofred_parameter_validator_async,
     # Helpers
-    _region_type_extractor, _region_type_extractor_async
+    _region_type_extractor, _region_type_extractor_async,
+    # Decoders
+    _json_response_decoder
 )
 from ..models import SeriesGroup
 
 if TYPE_CHECKING:
     import dask_geopandas as dd_gpd # pragma: no cover
     import polars_st as st # pragma: no cover
+    import pyarrow as pa # pragma: no cover
 
 class GeoFred:
     """Client for interacting with the Federal Reserve Economic Data (FRED) Maps API.
@@ -40,7 +51,10 @@ class GeoFred:
 
     Attributes:
         cache_mode (bool): Whether to enable caching of API responses.
-        cache (FIFOCache): The cache used to store API responses.
+        cache (FIFOCache | MutableMapping): The cache used to store API responses, shared with the parent Fred instance.
+        metrics (TransferMetrics): Compressed and decompressed response bytes per endpoint, shared with the parent Fred instance.
+        timeouts (TimeoutPolicy): Timeouts per endpoint family, shared with the parent Fred instance.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker, shared with the parent Fred instance.
         base_url (str): The base URL for the FRED Maps API.
 
     Args:
@@ -104,7 +118,10 @@ class GeoFred:
 
         self._parent: Fred = parent
         self.cache_mode: bool = parent.cache_mode
-        self.cache: FIFOCache = parent.cache
+        self.cache: MutableMapping[Any, Any] = parent.cache
+        self.metrics: TransferMetrics = parent.metrics
+        self.timeouts: TimeoutPolicy = parent.timeouts
+        self.circuit_breaker: Optional[CircuitBreaker] = parent.circuit_breaker
         self.base_url: str = 'https://api.stlouisfed.org/geofred'
 
     def __repr__(self) -> str:
@@ -217,7 +234,7 @@ class GeoFred:
             >>> # Cache is cleared when fred_maps is deleted
         """
 
-        if hasattr(self, "cache"):
+        if hasattr(self, "cache") and self._parent.cache_backend is None:
             self.cache.clear()
 
     def __len__(self) -> int:
@@ -384,12 +401,13 @@ class GeoFred:
             This method uses time.sleep(), which blocks the current thread. Avoid using it in asynchronous contexts.
         """
 
-        now = time.time()
-        self._parent.request_times.append(now)
-        while self._parent.request_times and self._parent.request_times[0] < now - 60:
-            self._parent.request_times.popleft()
-        if len(self._parent.request_times) >= self._parent.max_requests_per_minute:
-            time.sleep(60 - (now - self._parent.request_times[0]))
+        with self._parent._rate_lock:
+            now = time.time()
+            self._parent.request_times.append(now)
+            while self._parent.request_times and self._parent.request_times[0] < now - 60:
+                self._parent.request_times.popleft()
+            if len(self._parent.request_times) >= self._parent.max_requests_per_minute:
+                time.sleep(_deadline_wait(60 - (now - self._parent.request_times[0])))
 
     def __fred_get_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
         """Helper method to perform a synchronous GET request to the FRED Maps API.
@@ -408,12 +426,12 @@ class GeoFred:
             This method handles rate limiting and caching for synchronous GET requests to the FRED Maps API.
 
         Warnings:
-            Caching is only applied if `cache_mode` is enabled. Ensure that the `data` parameter is hashable for 
+            Caching is only applied if `cache_mode` is enabled and the request is not made inside `_bypass_cache()`. Ensure that the `data` parameter is hashable for 
             caching to work correctly.
         """
 
         @retry(wait=wait_fixed(1),
-            stop=stop_after_attempt(3),
+            stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
             retry=retry_if_exception_type(httpx.HTTPError),
             reraise=True,)
         def __get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
@@ -433,6 +451,7 @@ class GeoFred:
                 This method handles rate limiting and caching for synchronous GET requests to the FRED Maps API.
             """
 
+            _deadline_check(url_endpoint)
             self.__rate_limited()
             params = {
                 **(data or {}),
@@ -440,13 +459,34 @@ class GeoFred:
             }
             with httpx.Client() as client:
                 try:
-                    response = client.get(self.base_url + url_endpoint, params=params, timeout=10)
+                    response = client.get(self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint))
+                    _record_transfer(self.metrics, response)
                     response.raise_for_status()
-                    return response.json()
+                    return _json_response_decoder(response)
                 except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
                     raise ValueError(f"HTTP Error Ocurred {e}") from e
 
-        @cached(cache=self.cache)
+        def __guarded_get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            """Perform a GET request through the circuit breaker, if one is configured.
+
+            Args:
+                url_endpoint (str): The API endpoint to query.
+                data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+
+            Returns:
+                Dict[str, Any]: The JSON response, or the last good response while the circuit is open and `serve_stale` is set.
+
+            Raises:
+                CircuitOpenError: If the circuit for this endpoint is open.
+            """
+
+            return _breaker_call(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data)),
+                                 lambda: __get_request(url_endpoint, data))
+
+        @cached(cache=self.cache, lock=self._parent._cache_lock)
         def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
             """Perform a GET request with caching.
 
@@ -461,14 +501,14 @@ class GeoFred:
                 httpx.HTTPError: If the HTTP request fails.
             """
 
-            return __get_request(url_endpoint, _dict_type_converter(hashable_data))
+            return __guarded_get_request(url_endpoint, _dict_type_converter(hashable_data))
 
         if data:
             _geofred_parameter_validator(data)
-        if self.cache_mode:
+        if self.cache_mode and not _CACHE_BYPASS.get():
             return __cached_get_request(url_endpoint, _hashable_type_converter(data))
         else:
-            return __get_request(url_endpoint, data)
+            return __guarded_get_request(url_endpoint, data)
 
     # Public Methods
     def get_shape_files(self, shape: str, geodataframe_method: str='geopandas') -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
@@ -574,19 +614,19 @@ class GeoFred:
         return SeriesGroup.to_object(response)
 
     def get_series_data(self, series_id: str, geodataframe_method: str='geopandas', date: Optional[Union[str, datetime]]=None,
-                        start_date: Optional[Union[str, datetime]]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
+                        start_date: Optional[Union[str, datetime]]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame', 'pa.Table']:
         """Get GeoFRED series data
 
         This request returns a cross section of regional data for a specified release date. If no date is specified, the most recent data available are returned.
 
         Args:
             series_id (string, required): The FRED series_id you want to request maps data for. Not all series that are in FRED have geographical data.
-            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas' 'polars', or 'dask'. Default is 'geopandas'.
+            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'polars', 'dask', or 'arrow' (a PyArrow Table of the regional values, without fetching a shapefile). Default is 'geopandas'.
             date (string | datetime, optional): The date you want to request series group data from. String format: YYYY-MM-DD
             start_date (string | datetime, optional): The start date you want to request series group data from. This allows you to pull a range of data. String format: YYYY-MM-DD
 
         Returns:
-            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
+            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame | pyarrow.Table: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -625,6 +665,8 @@ class GeoFred:
             data['start_date'] = start_date
         response = self.__fred_get_request(url_endpoint, data)
         meta_data = response.get('meta', {})
+        if geodataframe_method == 'arrow':
+            return _arrow_regional_data_converter(meta_data)
         region_type = _region_type_extractor(response)
         shapefile = self.get_shape_files(region_type)
         if isinstance(shapefile, gpd.GeoDataFrame):
@@ -635,14 +677,14 @@ class GeoFred:
             elif geodataframe_method == 'polars':
                 return _polars_geodataframe_converter(shapefile, meta_data)
             else:
-                raise ValueError("geodataframe_method must be 'geopandas', 'polars', or 'dask'")
+                raise ValueError("geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'")
         else:
             raise ValueError("shapefile type error")
 
     def get_regional_data(self, series_group: str, region_type: str, date: Union[str, datetime], season: str,
                           units: str, frequency: str, geodataframe_method: str='geopandas',
                           start_date: Optional[Union[str, datetime]]=None, transformation: Optional[str]=None,
-                          aggregation_method: Optional[str]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
+                          aggregation_method: Optional[str]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame', 'pa.Table']:
         """Get GeoFRED regional data
 
         Retrieve regional data for a specified series group and date from the FRED Maps API.
@@ -654,13 +696,13 @@ class GeoFred:
             season (str): The seasonality of the data. Options include 'seasonally_adjusted' or 'not_seasonally_adjusted'.
             units (str): The units of the data. Options are 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca' and 'log'.
             frequency (str): The frequency of the data. Options are 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew'and 'bwem'.
-            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'dask' or 'polars'. Default is 'geopandas'.
+            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'dask', 'polars', or 'arrow' (a PyArrow Table of the regional values, without fetching a shapefile). Default is 'geopandas'.
             start_date (str, optional): The start date for the range of data you want to request. Format: YYYY-MM-DD.
             transformation (str, optional): The data transformation to apply. Options are 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', and 'log'.
             aggregation_method (str, optional): The aggregation method to use. Options are 'avg', 'sum', and 'eop'.
 
         Returns:
-            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
+            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame | pyarrow.Table: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -708,6 +750,8 @@ class GeoFred:
             data['aggregation_method'] = aggregation_method
         response = self.__fred_get_request(url_endpoint, data)
         meta_data = response.get('meta', {})
+        if geodataframe_method == 'arrow':
+            return _arrow_regional_data_converter(meta_data)
         region_type = _region_type_extractor(response)
         shapefile = self.get_shape_files(region_type)
         if isinstance(shapefile, gpd.GeoDataFrame):
@@ -718,7 +762,7 @@ class GeoFred:
             elif geodataframe_method == 'polars':
                 return _polars_geodataframe_converter(shapefile, meta_data)
             else:
-                raise ValueError("geodataframe_method must be 'geopandas', 'polars', or 'dask'")
+                raise ValueError("geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'")
         else:
             raise ValueError("shapefile type error")
 
@@ -730,7 +774,10 @@ class AsyncGeoFred:
 
     Attributes:
         cache_mode (bool): Indicates whether caching is enabled.
-        cache (FIFOCache): The cache instance for storing API responses.
+        cache (FIFOCache | MutableMapping): The cache instance for storing API responses, shared with the grandparent Fred instance.
+        metrics (TransferMetrics): Compressed and decompressed response bytes per endpoint, shared with the grandparent Fred instance.
+        timeouts (TimeoutPolicy): Timeouts per endpoint family, shared with the grandparent Fred instance.
+        circuit_breaker (CircuitBreaker, optional): The circuit breaker, shared with the grandparent Fred instance.
         base_url (str): The base URL for the FRED Maps API.
 
     Args:
@@ -799,7 +846,10 @@ class AsyncGeoFred:
         self._parent: AsyncFred = parent
         self._grandparent: Fred = parent._parent
         self.cache_mode: bool = parent._parent.cache_mode
-        self.cache: FIFOCache = parent._parent.cache
+        self.cache: MutableMapping[Any, Any] = parent._parent.cache
+        self.metrics: TransferMetrics = parent._parent.metrics
+        self.timeouts: TimeoutPolicy = parent._parent.timeouts
+        self.circuit_breaker: Optional[CircuitBreaker] = parent._parent.circuit_breaker
         self.base_url: str = 'https://api.stlouisfed.org/geofred'
 
     def __repr__(self) -> str:
@@ -913,7 +963,7 @@ class AsyncGeoFred:
             >>> del maps_api
         """
 
-        if hasattr(self, "cache"):
+        if hasattr(self, "cache") and self._grandparent.cache_backend is None:
             self.cache.clear()
 
     def __len__(self) -> int:
@@ -1076,7 +1126,7 @@ class AsyncGeoFred:
             This method should be called within an asynchronous context to ensure proper locking and timing.
         """
 
-        async with self._grandparent.lock:
+        async with self._parent._limiter.lock, _hold_thread_lock(self._grandparent._rate_lock):
             now = time.time()
             while self._grandparent.request_times and self._grandparent.request_times[0] < now - 60:
                 self._grandparent.request_times.popleft()
@@ -1084,7 +1134,7 @@ class AsyncGeoFred:
             requests_left = max(0, self._grandparent.max_requests_per_minute - requests_made)
             time_left = max(1, 60 - (now - (self._grandparent.request_times[0] if self._grandparent.request_times else now)))
             new_limit = max(1, min(self._grandparent.max_requests_per_minute // 10, requests_left // 2))
-            self._grandparent.semaphore = asyncio.Semaphore(new_limit)
+            self._parent._limiter.semaphore = asyncio.Semaphore(new_limit)
             return requests_left, time_left
 
     async def __rate_limited(self) -> None:
@@ -1098,14 +1148,14 @@ class AsyncGeoFred:
             This method should be used within an asynchronous context to ensure proper locking and timing.
         """
 
-        async with self._grandparent.semaphore:
+        async with self._parent._limiter.semaphore:
             requests_left, time_left = await self.__update_semaphore()
             if requests_left > 0:
                 sleep_time = time_left / max(1, requests_left)
-                await asyncio.sleep(sleep_time)
+                await asyncio.sleep(_deadline_wait(sleep_time))
             else:
-                await asyncio.sleep(60)
-            async with self._grandparent.lock:
+                await asyncio.sleep(_deadline_wait(60))
+            async with self._parent._limiter.lock, _hold_thread_lock(self._grandparent._rate_lock):
                 self._grandparent.request_times.append(time.time())
 
     async def __fred_get_request(self, url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
@@ -1125,12 +1175,12 @@ class AsyncGeoFred:
             This method handles rate limiting and caching for asynchronous GET requests to the FRED Maps API.
 
         Warnings:
-            Caching is only applied if `cache_mode` is enabled in the parent Fred instance. Ensure that the `data` parameter is hashable for 
+            Caching is only applied if `cache_mode` is enabled in the parent Fred instance and the request is not made inside `_bypass_cache()`. Ensure that the `data` parameter is hashable for 
             caching to work correctly.
         """
 
         @retry(wait=wait_fixed(1),
-               stop=stop_after_attempt(3),
+               stop=stop_any(stop_after_attempt(3), _deadline_retry_stop),
                retry=retry_if_exception_type(httpx.HTTPError),
                reraise=True,)
         async def __get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
@@ -1150,6 +1200,7 @@ class AsyncGeoFred:
                 This method handles rate limiting and caching for synchronous GET requests to the FRED Maps API.
             """
 
+            _deadline_check(url_endpoint)
             await self.__rate_limited()
             params = {
                 **(data or {}),
@@ -1157,12 +1208,33 @@ class AsyncGeoFred:
             }
             async with httpx.AsyncClient() as client:
                 try:
-                    response = await client.get(self.base_url + url_endpoint, params=params, timeout=10)
+                    response = await client.get(self.base_url + url_endpoint, params=params, headers=_request_headers(), timeout=_request_timeout(self.timeouts, url_endpoint))
+                    _record_transfer(self.metrics, response)
                     response.raise_for_status()
-                    return response.json()
+                    return _json_response_decoder(response)
                 except httpx.HTTPError as e:
+                    deadline_error = _deadline_http_error(url_endpoint, e)
+                    if deadline_error is not None:
+                        raise deadline_error from e
                     raise ValueError(f"HTTP Error occurred: {e}") from e
 
+        async def __guarded_get_request(url_endpoint: str, data: Optional[Dict[str, Optional[Union[str, int]]]]=None) -> Dict[str, Any]:
+            """Perform a GET request through the circuit breaker, if one is configured.
+
+            Args:
+                url_endpoint (str): The API endpoint to query.
+                data (Dict[str, Optional[str | int]], optional): The query parameters for the request. Defaults to None.
+
+            Returns:
+                Dict[str, Any]: The JSON response, or the last good response while the circuit is open and `serve_stale` is set.
+
+            Raises:
+                CircuitOpenError: If the circuit for this endpoint is open.
+            """
+
+            return await _breaker_call_async(self.circuit_breaker, self.base_url + url_endpoint, hashkey(url_endpoint, _hashable_type_converter(data)),
+                                             lambda: __get_request(url_endpoint, data))
+
         @async_cached(cache=self.cache)
         async def __cached_get_request(url_endpoint: str, hashable_data: Optional[Tuple[Tuple[str, Optional[Union[str, int]]], ...]]=None) -> Dict[str, Any]:
             """Perform a GET request with caching.
@@ -1178,14 +1250,23 @@ class AsyncGeoFred:
                 httpx.HTTPError: If the HTTP request fails.
             """
 
-            return await __get_request(url_endpoint, await _dict_type_converter_async(hashable_data))
+            return await __guarded_get_request(url_endpoint, await _dict_type_converter_async(hashable_data))
 
         if data:
             await _geofred_parameter_validator_async(data)
-        if self.cache_mode:
+        use_cache = self.cache_mode and not _CACHE_BYPASS.get()
+        if use_cache and isinstance(self.cache, RedisCache):
+            key = hashkey(url_endpoint, await _hashable_type_converter_async(data))
+            cached_response = await self.cache.aget(key)
+            if cached_response is not None:
+                return cached_response
+            response = await __guarded_get_request(url_endpoint, data)
+            await self.cache.aset(key, response)
+            return response
+        elif use_cache:
             return await __cached_get_request(url_endpoint, await _hashable_type_converter_async(data))
         else:
-            return await __get_request(url_endpoint, data)
+            return await __guarded_get_request(url_endpoint, data)
 
     # Public Methods
     async def get_shape_files(self, shape: str, geodataframe_method: str='geopandas') -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
@@ -1299,7 +1380,7 @@ class AsyncGeoFred:
         return await SeriesGroup.to_object_async(response)
 
     async def get_series_data(self, series_id: str, geodataframe_method: str='geopandas', date: Optional[Union[str, datetime]]=None,
-                              start_date: Optional[Union[str, datetime]]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
+                              start_date: Optional[Union[str, datetime]]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame', 'pa.Table']:
         """Get GeoFRED series data
 
         This request returns a cross section of regional data for a specified release date. If no
@@ -1307,12 +1388,12 @@ class AsyncGeoFred:
 
         Args:
             series_id (string, required): The FRED series_id you want to request maps data for. Not all series that are in FRED have geographical data.
-            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas' 'polars', or 'dask'. Default is 'geopandas'.
+            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'polars', 'dask', or 'arrow' (a PyArrow Table of the regional values, without fetching a shapefile). Default is 'geopandas'.
             date (string | datetime, optional): The date you want to request series group data from. String format: YYYY-MM-DD
             start_date (string | datetime, optional): The start date you want to request series group data from. This allows you to pull a range of data. String format: YYYY-MM-DD
 
         Returns:
-            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
+            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame | pyarrow.Table: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -1354,6 +1435,8 @@ class AsyncGeoFred:
             data['start_date'] = start_date
         response = await self.__fred_get_request(url_endpoint, data)
         meta_data = response.get('meta', {})
+        if geodataframe_method == 'arrow':
+            return await _arrow_regional_data_converter_async(meta_data)
         region_type = await _region_type_extractor_async(response)
         shapefile = await self.get_shape_files(region_type)
         if isinstance(shapefile, gpd.GeoDataFrame):
@@ -1364,13 +1447,13 @@ class AsyncGeoFred:
             elif geodataframe_method == 'polars':
                 return await _polars_geodataframe_converter_async(shapefile, meta_data)
             else:
-                raise ValueError("geodataframe_method must be 'geopandas', 'polars', or 'dask'")
+                raise ValueError("geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'")
         else:
             raise ValueError("shapefile type error")
 
     async def get_regional_data(self, series_group: str, region_type: str, date: Union[str, datetime], season: str,
                                 units: str, frequency: str, geodataframe_method: str='geopandas', start_date: Optional[Union[str, datetime]]=None,
-                                transformation: Optional[str]=None, aggregation_method: Optional[str]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame']:
+                                transformation: Optional[str]=None, aggregation_method: Optional[str]=None) -> Union[gpd.GeoDataFrame, 'dd_gpd.GeoDataFrame', 'st.GeoDataFrame', 'pa.Table']:
         """Get GeoFRED regional data
 
         Retrieve regional data for a specified series group and date from the FRED Maps API.
@@ -1382,13 +1465,13 @@ class AsyncGeoFred:
             season (str): The seasonality of the data. Options include 'seasonally_adjusted' or 'not_seasonally_adjusted'.
             units (str): The units of the data. Options are 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca' and 'log'.
             frequency (str): The frequency of the data. Options are 'd', 'w', 'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu', 'wesa', 'bwew'and 'bwem'.
-            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'dask' or 'polars'. Default is 'geopandas'.
+            geodataframe_method (str, optional): The method to use for creating the GeoDataFrame. Options are 'geopandas', 'dask', 'polars', or 'arrow' (a PyArrow Table of the regional values, without fetching a shapefile). Default is 'geopandas'.
             start_date (str, optional): The start date for the range of data you want to request. Format: YYYY-MM-DD.
             transformation (str, optional): The data transformation to apply. Options are 'lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', and 'log'.
             aggregation_method (str, optional): The aggregation method to use. Options are 'avg', 'sum', and 'eop'.
 
         Returns:
-            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
+            geopandas.GeoDataFrame | dask_geopandas.GeoDataFrame | polars_st.GeoDataFrame | pyarrow.Table: Depending on the geodataframe_method selected. Default is geopandas.GeoDataFrame.
 
         Raises:
             ValueError: If the API request fails or returns an error.
@@ -1439,6 +1522,8 @@ class AsyncGeoFred:
             data['aggregation_method'] = aggregation_method
         response = await self.__fred_get_request(url_endpoint, data)
         meta_data = response.get('meta', {})
+        if geodataframe_method == 'arrow':
+            return await _arrow_regional_data_converter_async(meta_data)
         region_type = await _region_type_extractor_async(response)
         shapefile = await self.get_shape_files(region_type)
         if isinstance(shapefile, gpd.GeoDataFrame):
@@ -1449,6 +1534,6 @@ class AsyncGeoFred:
             elif geodataframe_method == 'polars':
                 return await _polars_geodataframe_converter_async(shapefile, meta_data)
             else:
-                raise ValueError("geodataframe_method must be 'geopandas', 'polars', or 'dask'")
+                raise ValueError("geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'")
         else:
             raise ValueError("shapefile type error")
@@ -24,4 +24,5 @@
 from .validation import ValueValidationError, TypeValidationError, ParameterValidationError, ValidationError
 from .conversion import ConversionError, ParameterConversionError, TypeConversionError, DateConversionError, DataFrameConversionError, GeoDataFrameConversionError
 from .dependencies import OptionalDependencyError
-from .base import FedfredError
+from .transport import TransportError, DeadlineExceededError, CircuitOpenError
+from .base import FedfredError
\ No newline at end of file
@@ -46,4 +46,4 @@ class OptionalDependencyError(FedfredError):
         if self.install_hint:
             base_message += f" Install it with `{self.install_hint}`."
 
-        super().__init__(base_message)
\ No newline at end of file
+        Exception.__init__(self, base_message)
\ No newline at end of file
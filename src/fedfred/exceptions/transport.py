@@ -0,0 +1,74 @@
+# filepath: /src/fedfred/exceptions/transport.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.exceptions.transport"""
+
+from dataclasses import dataclass
+from typing import Optional
+from .base import FedfredError
+
+
+@dataclass(frozen=True, slots=True)
+class TransportError(FedfredError):
+    """
+    Base exception for request-layer failures raised before or instead of an HTTP response.
+    """
+
+    endpoint: str = ""
+
+@dataclass(frozen=True, slots=True)
+class DeadlineExceededError(TransportError):
+    """Raised when a `fedfred.deadline(...)` budget runs out.
+
+    The deadline spans rate-limit waits, retries and pagination, so this may be raised before a request
+    is sent, while waiting for rate-limit capacity, or when a request times out against the budget.
+
+    Args:
+        deadline (float, optional): The deadline budget in seconds.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> with fd.deadline(2.0):
+        ...     fred.get_series_observations('GNPCA')
+    """
+
+    deadline: Optional[float] = None
+
+@dataclass(frozen=True, slots=True)
+class CircuitOpenError(TransportError):
+    """Raised instead of sending a request while the circuit breaker for its host or endpoint is open.
+
+    Args:
+        circuit (str): The host or host and path the open circuit guards.
+        retry_after (float): Seconds until the circuit lets a half-open probe request through.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> from fedfred.exceptions import CircuitOpenError
+        >>> fred = fd.Fred('your_api_key', circuit_breaker=fd.CircuitBreaker())
+        >>> try:
+        ...     fred.get_series('GNPCA')
+        ... except CircuitOpenError as e:
+        ...     print(f"FRED unavailable, retry in {e.retry_after:.0f}s")
+    """
+
+    circuit: str = ""
+    retry_after: float = 0.0
@@ -34,6 +34,7 @@ Imports:
     VintageDate: A class representing a vintage date in the Fred database.
     SeriesGroup: A class representing a series group in the Fred database.
     BulkRelease: A class representing a bulk release in the Fred database.
+    ObservationBatch: A class representing the result of a batch observations request.
 """
 
 from .fred import (
@@ -46,7 +47,8 @@ from .fred import (
     Element,
     VintageDate,
     SeriesGroup,
-    BulkRelease
+    BulkRelease,
+    ObservationBatch
 )
 
 __all__ = [
@@ -60,4 +62,5 @@ __all__ = [
     "BulkRelease",
     "VintageDate",
     "SeriesGroup",
+    "ObservationBatch",
 ]
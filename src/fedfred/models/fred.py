@@ -33,6 +33,7 @@ Classes:
     VintageDate: Represents a FRED Vintage Date.
     Element: Represents a FRED Element.
     SeriesGroup: Represents a FRED Series Observation.
+    ObservationBatch: Represents the result of a batch observations request.
 
 Examples:
     >>> import fedfred as fd
@@ -47,12 +48,12 @@ References:
     - Federal Reserve Bank of St. Louis, FRED API documentation. https://fred.stlouisfed.org/docs/api/fred/
 """
 
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Any, Optional, List, Dict, TYPE_CHECKING
 from dataclasses import dataclass, field
 import asyncio
 import pandas as pd
 from ..__about__ import __title__, __version__, __author__, __email__, __license__, __copyright__, __description__, __docs__, __repository__
-from .._core import _pandas_dataframe_converter, _pandas_dataframe_converter_async
+from .._core import _pandas_dataframe_converter, _pandas_dataframe_converter_async, _element_table_flattener
 
 if TYPE_CHECKING:
     from ..clients.fred import Fred # pragma: no cover
@@ -1396,36 +1397,37 @@ class Element:
         
         Notes:
             This method assumes that the input response dictionary contains an 'elements' key with a dictionary of element data.
+            The table is first flattened into columns with an explicit stack, then each Element is built once in
+            reverse preorder, so children exist before their parent and no recursion is needed at any depth.
 
         References:
             - fedfred package documentation. https://nikhilxsunder.github.io/fedfred/api/_autosummary/fedfred.objects.Element.to_object.html
         """
 
-        if "elements" not in response:
-            raise ValueError("Invalid API response: Missing 'elements' field")
-        elements: List[Element] = []
-        def process_element(element_data: Dict) -> "Element":
-            children_list: List[Element] = []
-            for child_data in element_data.get("children", []):
-                child_element = process_element(child_data)
-                children_list.append(child_element)
-            return cls(
-                element_id=element_data["element_id"],
-                release_id=element_data["release_id"],
-                series_id=element_data["series_id"],
-                parent_id=element_data["parent_id"],
-                line=element_data["line"],
-                type=element_data["type"],
-                name=element_data["name"],
-                level=element_data["level"],
-                children=children_list or None,
+        columns = _element_table_flattener(response)
+        parent_positions = columns['parent_position']
+        if not parent_positions:
+            raise ValueError("No elements found in the response")
+        child_positions: Dict[int, List[int]] = {}
+        for position, parent_position in enumerate(parent_positions):
+            if parent_position >= 0:
+                child_positions.setdefault(parent_position, []).append(position)
+        elements: List[Element] = [None] * len(parent_positions) # type: ignore[list-item]
+        for position in range(len(parent_positions) - 1, -1, -1):
+            children = child_positions.get(position)
+            elements[position] = cls(
+                element_id=columns["element_id"][position],
+                release_id=columns["release_id"][position],
+                series_id=columns["series_id"][position],
+                parent_id=columns["parent_id"][position],
+                line=columns["line"][position],
+                type=columns["type"][position],
+                name=columns["name"][position],
+                level=columns["level"][position],
+                children=[elements[child] for child in children] if children else None,
                 client=client,
             )
-        for element_data in response["elements"].values():
-            elements.append(process_element(element_data))
-        if not elements:
-            raise ValueError("No elements found in the response")
-        return elements
+        return [element for element, parent_position in zip(elements, parent_positions) if parent_position < 0]
 
     @classmethod
     async def to_object_async(cls, response: Dict) -> List["Element"]:
@@ -1731,3 +1733,49 @@ class BulkRelease:
         if not bulk_release:
             raise ValueError("No bulk releases found in the response")
         return bulk_release
+
+@dataclass(slots=True)
+class ObservationBatch:
+    """A class used to represent the result of a batch observations request.
+
+    Holds the observations of every series that was fetched successfully in one frame, along with the
+    error raised for each series that failed.
+
+    Attributes:
+        data (pandas.DataFrame | polars.DataFrame | pyarrow.Table): The merged observations, in long or wide layout.
+        errors (Dict[str, Exception]): The error raised for each series that could not be fetched, keyed by series ID.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key')
+        >>> batch = fred.get_series_observations_many(['GDP', 'UNRATE', 'NOT_A_SERIES'])
+        >>> batch.data.head()
+        >>> batch.errors
+        {'NOT_A_SERIES': ValueError('HTTP Error occurred: ...')}
+
+    See Also:
+        - :meth:`fedfred.Fred.get_series_observations_many`: Fetch observations for many series at once.
+    """
+
+    data: Any
+    """The merged observations of every series fetched successfully."""
+
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    """The error raised for each series that failed, keyed by series ID."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every series in the batch was fetched."""
+
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """Raise the first per-series error, if any series failed.
+
+        Raises:
+            ValueError: If any series failed, naming the failed series and chained from the first error.
+        """
+
+        if self.errors:
+            series_id, error = next(iter(self.errors.items()))
+            raise ValueError(f"{len(self.errors)} series failed ({', '.join(self.errors)}); first error for {series_id}: {error}") from error
@@ -27,6 +27,7 @@ The configuration system supports:
     - Setting a global API key via `set_api_key(...)`.
     - Retrieving the current API key via `get_api_key()`.
     - Resolving an API key from an explicit argument, the global setting, or the environment variable via `resolve_api_key(...)`.
+    - Choosing the JSON decoder used for API responses via `set_json_decoder(...)`.
 
 Examples:
     >>> import fedfred as fd
@@ -49,7 +50,7 @@ References:
 """
 
 from __future__ import annotations
-from typing import Optional, Literal, Dict
+from typing import Optional, Literal, Dict, get_args
 import os
 from .__about__ import __title__, __version__, __author__, __email__, __license__, __copyright__, __description__, __docs__, __repository__
 
@@ -68,6 +69,12 @@ _GLOBAL_KEYS: Dict[Service, Optional[str]] = {
 }
 """Global storage for API keys for each service."""
 
+JsonDecoder = Literal["auto", "orjson", "msgspec", "json"]
+"""Type alias for supported JSON decoders in fedfred package."""
+
+_JSON_DECODER: JsonDecoder = "auto"
+"""Global JSON decoder selection used for API responses."""
+
 def set_api_key(api_key: str, service: Service = "fred") -> None:
     """Set the global API key for the fedfred package.
 
@@ -154,3 +161,36 @@ def _resolve_api_key(api_key: Optional[str] = None, *, service: Service = "fred"
         f"Provide api_key=..., call set_api_key(..., service={service!r}), "
         f"or set the environment variable {env_name}."
     )
+
+def set_json_decoder(decoder: JsonDecoder = "auto") -> None:
+    """Set the JSON decoder used for API responses.
+
+    Args:
+        decoder (JsonDecoder): The decoder to use. "auto" picks the fastest installed library, in the order
+            orjson, msgspec, then the standard library json module. Defaults to "auto".
+
+    Raises:
+        ValueError: If an unknown decoder is specified.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fd.set_json_decoder("orjson")
+
+    Notes:
+        Requesting "orjson" or "msgspec" explicitly raises an OptionalDependencyError on the next request
+        if that library is not installed.
+    """
+
+    global _JSON_DECODER
+    if decoder not in get_args(JsonDecoder):
+        raise ValueError(f"Unknown JSON decoder: {decoder!r}. Expected one of {get_args(JsonDecoder)}.")
+    _JSON_DECODER = decoder
+
+def get_json_decoder() -> JsonDecoder:
+    """Get the currently configured JSON decoder.
+
+    Returns:
+        JsonDecoder: The configured decoder selection.
+    """
+
+    return _JSON_DECODER
@@ -0,0 +1,304 @@
+# filepath: /src/fedfred/store.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.store
+
+This module defines a local, append-only store of ALFRED real-time histories.
+
+Histories are kept as Parquet files partitioned by series and vintage date, in a Hive layout that
+pyarrow, polars and DuckDB can scan directly::
+
+    root/
+        series_id=GDP/
+            vintage_date=2020-04-29/part-0.parquet
+            vintage_date=2020-05-28/part-0.parquet
+
+Each vintage partition holds the observations that were new or revised on that vintage date. New vintages
+are written as new partitions and existing partitions are never rewritten, so keeping a store current
+costs one vintage-dates request per series and an observations request only when something changed.
+
+Classes:
+    VintageStore: A local Parquet store of ALFRED histories, partitioned by series and vintage date.
+
+Examples:
+    >>> import fedfred as fd
+    >>> alfred = fd.Alfred('your_api_key')
+    >>> store = fd.VintageStore('~/fred-vintages')
+    >>> alfred.sync_vintage_store(store, ['GDP', 'UNRATE'])
+    {'GDP': 312, 'UNRATE': 871}
+    >>> store.load('GDP', vintage_end='2020-06-30').as_of('2020-06-30').tail(1)
+
+Notes:
+    The store requires the optional `pyarrow` package (`pip install fedfred[arrow]`).
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    Apache Arrow, Tabular datasets. https://arrow.apache.org/docs/python/dataset.html
+"""
+
+from __future__ import annotations
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from .exceptions import OptionalDependencyError
+from .vintages import VintageMatrix, _OPEN_END, _day
+
+if TYPE_CHECKING:
+    import polars as pl # pragma: no cover
+
+class VintageStore:
+    """A local Parquet store of ALFRED histories, partitioned by series and vintage date.
+
+    Attributes:
+        root (str): The directory holding the store.
+
+    Args:
+        root (str | os.PathLike): The directory holding the store. It is created if it does not exist.
+
+    Raises:
+        OptionalDependencyError: If pyarrow is not installed.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> store = fd.VintageStore('vintages')
+        >>> store.append('GDP', fd.Alfred('your_api_key').get_series_history('GDP'))
+        312
+        >>> store.vintages('GDP')[-1]
+        numpy.datetime64('2026-09-25')
+        >>> matrix = store.load('GDP', observation_start='2000-01-01')
+
+    Notes:
+        A vintage partition stores 'date' (date32) and 'value' (float64) columns. Real-time periods are
+        rebuilt on load: a value is in effect from its vintage date until the day before the next vintage
+        that revises the same observation. Withdrawn observations are not recorded, so they keep their
+        last value.
+
+    See Also:
+        - :meth:`fedfred.Alfred.sync_vintage_store`: Keep the store current from the API.
+        - :class:`fedfred.VintageMatrix`: The structure returned by `load`.
+    """
+
+    __slots__ = ('root',)
+
+    def __init__(self, root: Union[str, os.PathLike]) -> None:
+        """Initialize the VintageStore.
+
+        Args:
+            root (str | os.PathLike): The directory holding the store.
+
+        Raises:
+            OptionalDependencyError: If pyarrow is not installed.
+        """
+
+        _pyarrow()
+        self.root: str = os.path.abspath(os.path.expanduser(os.fspath(root)))
+        os.makedirs(self.root, exist_ok=True)
+
+    def __repr__(self) -> str:
+        """String representation of the VintageStore class.
+
+        Returns:
+            str: A string representation of the VintageStore instance.
+        """
+
+        return f"VintageStore(root='{self.root}')"
+
+    def __contains__(self, series_id: object) -> bool:
+        """Check if a series has any vintage in the store.
+
+        Args:
+            series_id (object): The series ID.
+
+        Returns:
+            bool: True if the series is stored, False otherwise.
+        """
+
+        return isinstance(series_id, str) and len(self.vintages(series_id)) > 0
+
+    # Queries
+    def series_ids(self) -> List[str]:
+        """Get the IDs of the stored series.
+
+        Returns:
+            List[str]: The stored series IDs, sorted.
+        """
+
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root) if name.startswith('series_id='))
+
+    def vintages(self, series_id: str) -> np.ndarray:
+        """Get the stored vintage dates of a series.
+
+        Args:
+            series_id (str): The series ID.
+
+        Returns:
+            numpy.ndarray: The vintage dates, sorted, as `datetime64[D]`. Empty if the series is not stored.
+
+        Notes:
+            Only partitions whose data file is complete are listed, so an interrupted append is invisible.
+        """
+
+        directory = self.__series_directory(series_id)
+        if not os.path.isdir(directory):
+            return np.array([], dtype='datetime64[D]')
+        names = [name.split('=', 1)[1] for name in os.listdir(directory)
+                 if name.startswith('vintage_date=') and os.path.exists(os.path.join(directory, name, 'part-0.parquet'))]
+        return np.sort(np.array(names, dtype='datetime64[D]'))
+
+    def load(self, series_id: str, vintage_end: Optional[Union[str, datetime]]=None,
+             observation_start: Optional[Union[str, datetime]]=None,
+             observation_end: Optional[Union[str, datetime]]=None) -> VintageMatrix:
+        """Load the real-time history of a series.
+
+        Args:
+            series_id (str): The series ID.
+            vintage_end (str | datetime, optional): Ignore vintages after this date, giving the history as known then. Defaults to None (every vintage).
+            observation_start (str | datetime, optional): The first observation date to load. Defaults to None (unbounded).
+            observation_end (str | datetime, optional): The last observation date to load. Defaults to None (unbounded).
+
+        Returns:
+            VintageMatrix: The stored real-time periods. Empty if the series is not stored.
+
+        Notes:
+            Only the partitions up to `vintage_end` are opened, and the observation window is pushed down to
+            the Parquet row groups, so point-in-time loads read a fraction of a long history.
+        """
+
+        pa, ds = _pyarrow()
+        vintages = self.vintages(series_id)
+        if vintage_end is not None:
+            vintages = vintages[vintages <= _day(vintage_end)]
+        if not len(vintages):
+            return VintageMatrix([], [], [], [])
+        directory = self.__series_directory(series_id)
+        files = [os.path.join(directory, f'vintage_date={vintage}', 'part-0.parquet') for vintage in vintages]
+        partitioning = ds.partitioning(pa.schema([('vintage_date', pa.date32())]), flavor='hive')
+        dataset = ds.dataset(files, format='parquet', partitioning=partitioning, partition_base_dir=directory)
+        condition = None
+        if observation_start is not None:
+            condition = ds.field('date') >= pa.scalar(_day(observation_start).astype(object), pa.date32())
+        if observation_end is not None:
+            upper = ds.field('date') <= pa.scalar(_day(observation_end).astype(object), pa.date32())
+            condition = upper if condition is None else condition & upper
+        table = dataset.to_table(columns=['date', 'vintage_date', 'value'], filter=condition)
+        dates = table.column('date').to_numpy().astype('datetime64[D]')
+        starts = table.column('vintage_date').to_numpy().astype('datetime64[D]')
+        values = table.column('value').to_numpy(zero_copy_only=False).astype(np.float64)
+        order = np.lexsort((starts, dates))
+        dates, starts, values = dates[order], starts[order], values[order]
+        ends = np.full(len(dates), _OPEN_END)
+        same_date = dates[1:] == dates[:-1]
+        ends[:-1][same_date] = starts[1:][same_date] - np.timedelta64(1, 'D')
+        return VintageMatrix(dates, starts, ends, values)
+
+    # Updates
+    def append(self, series_id: str, history: Union[VintageMatrix, pd.DataFrame, 'pl.DataFrame']) -> int:
+        """Append the vintages of a history that are newer than the stored ones.
+
+        Args:
+            series_id (str): The series ID.
+            history (VintageMatrix | pandas.DataFrame | polars.DataFrame): Real-time periods of the series, as a matrix or as a frame accepted by :meth:`fedfred.VintageMatrix.from_frame`. It may start at any real-time date after the stored history.
+
+        Returns:
+            int: The number of vintage partitions written.
+
+        Raises:
+            ValueError: If series_id is empty or contains a path separator.
+
+        Notes:
+            Only periods starting after the latest stored vintage are written, one partition per vintage
+            date, in ascending order and each by atomic rename, so existing partitions are never modified
+            and an interrupted append resumes cleanly. Periods that only repeat the stored value are
+            dropped, which lets `history` be an API response whose real-time start was clipped to the
+            request.
+        """
+
+        pa, _ = _pyarrow()
+        import pyarrow.parquet as pq
+        matrix = history if isinstance(history, VintageMatrix) else VintageMatrix.from_frame(history)
+        stored = self.vintages(series_id)
+        dates = np.repeat(matrix.dates, np.diff(matrix.offsets))
+        starts, values = matrix.realtime_starts, matrix.values
+        if len(stored):
+            new = starts > stored[-1]
+            dates, starts, values = dates[new], starts[new], values[new]
+            if len(starts):
+                first = starts == starts.min()
+                previous = self.load(series_id).latest_release()
+                before = previous.reindex(pd.DatetimeIndex(dates[first])).to_numpy()
+                repeated = (before == values[first]) | (np.isnan(before) & np.isnan(values[first]))
+                keep = np.ones(len(starts), dtype=bool)
+                keep[np.flatnonzero(first)[repeated]] = False
+                dates, starts, values = dates[keep], starts[keep], values[keep]
+        directory = self.__series_directory(series_id)
+        vintages = np.unique(starts)
+        order = np.argsort(starts, kind='stable')
+        bounds = np.append(np.searchsorted(starts[order], vintages), len(starts))
+        for position, vintage in enumerate(vintages):
+            rows = order[bounds[position]:bounds[position + 1]]
+            table = pa.table({'date': pa.array(dates[rows], pa.date32()), 'value': pa.array(values[rows], pa.float64())})
+            partition = os.path.join(directory, f'vintage_date={vintage}')
+            os.makedirs(partition, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=partition, suffix='.tmp')
+            os.close(handle)
+            try:
+                pq.write_table(table, temporary)
+                os.replace(temporary, os.path.join(partition, 'part-0.parquet'))
+            finally:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+        return len(vintages)
+
+    def remove(self, series_id: str) -> None:
+        """Remove a series and all of its vintages from the store.
+
+        Args:
+            series_id (str): The series ID.
+        """
+
+        shutil.rmtree(self.__series_directory(series_id), ignore_errors=True)
+
+    # Internals
+    def __series_directory(self, series_id: str) -> str:
+        """Get the partition directory of a series, rejecting IDs that would escape the store."""
+
+        if not series_id or os.sep in series_id or (os.altsep and os.altsep in series_id) or series_id in ('.', '..'):
+            raise ValueError(f"Invalid series_id for the vintage store: {series_id!r}")
+        return os.path.join(self.root, f'series_id={series_id}')
+
+def _pyarrow() -> Tuple[Any, Any]:
+    """Import pyarrow and pyarrow.dataset, raising OptionalDependencyError if pyarrow is missing."""
+
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise OptionalDependencyError(
+            message=f"{e}: PyArrow is not installed. Install it with `pip install pyarrow` to use the vintage store.",
+            package="pyarrow",
+            feature="VintageStore",
+            install_hint="pip install pyarrow",
+        ) from e
+    return pa, ds
@@ -0,0 +1,880 @@
+# filepath: /src/fedfred/transport.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.transport
+
+This module defines the transport-level settings and instrumentation shared by the fedfred clients.
+
+Classes:
+    EndpointTransfer: Wire-size counters for a single endpoint.
+    TransferMetrics: Thread-safe per-endpoint accounting of compressed and decompressed response bytes.
+    Timeout: Connect, read, write and pool timeouts for one endpoint family.
+    TimeoutPolicy: Timeouts per endpoint family, with a default for everything else.
+    HedgingPolicy: Opt-in hedged requests for `AsyncFred`, delayed by a latency percentile per endpoint.
+    CircuitBreaker: Per-host or per-endpoint circuit breaker that fails fast during outages.
+
+Functions:
+    deadline: Context manager bounding the total time spent in fedfred calls, including rate-limit waits, retries and pagination.
+
+Examples:
+    >>> import fedfred as fd
+    >>> fred = fd.Fred('your_api_key')
+    >>> fred.get_series_observations('GNPCA')
+    >>> fred.metrics.snapshot()['/fred/series/observations']
+    EndpointTransfer(requests=1, compressed_bytes=2315, decompressed_bytes=11842, encodings={'gzip': 1})
+
+    >>> policy = fd.TimeoutPolicy(endpoints={'/series': fd.Timeout(connect=1.0, read=2.0)})
+    >>> fred = fd.Fred('your_api_key', timeouts=policy)
+    >>> with fd.deadline(5.0):
+    ...     fred.get_series('GNPCA')
+
+Notes:
+    Every request advertises the content codings httpx can decode in this environment: gzip and deflate
+    always, brotli when the `brotli` or `brotlicffi` package is installed, and zstd when `zstandard` is
+    installed (`pip install fedfred[compression]`).
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    RFC 9110, Section 12.5.3 Accept-Encoding. https://www.rfc-editor.org/rfc/rfc9110#name-accept-encoding
+"""
+
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Hashable, Iterator, Literal, Mapping, Optional, TypeVar
+import httpx
+from cachetools import LRUCache
+from .exceptions import CircuitOpenError, DeadlineExceededError
+
+@dataclass(slots=True)
+class EndpointTransfer:
+    """Wire-size counters for a single endpoint.
+
+    Attributes:
+        requests (int): Number of responses recorded.
+        compressed_bytes (int): Bytes received on the wire, before content decoding.
+        decompressed_bytes (int): Bytes of response body after content decoding.
+        encodings (Dict[str, int]): Number of responses per content coding, 'identity' when uncompressed.
+    """
+
+    requests: int = 0
+    compressed_bytes: int = 0
+    decompressed_bytes: int = 0
+    encodings: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        """Decompressed over compressed bytes, or None before any bytes were received."""
+
+        if not self.compressed_bytes:
+            return None
+        return self.decompressed_bytes / self.compressed_bytes
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes kept off the wire by content coding."""
+
+        return self.decompressed_bytes - self.compressed_bytes
+
+class TransferMetrics:
+    """Thread-safe per-endpoint accounting of compressed and decompressed response bytes.
+
+    A `Fred` instance owns one TransferMetrics, shared with its `AsyncFred`, `GeoFred` and `AsyncGeoFred`
+    children. `Fraser` keeps its own. Endpoints are keyed by URL path, e.g. '/fred/series/observations'.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key')
+        >>> fred.get_series('GNPCA')
+        >>> fred.metrics.total().compressed_bytes
+        512
+        >>> fred.metrics.reset()
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty transfer metrics."""
+
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointTransfer] = {}
+
+    def __repr__(self) -> str:
+        """String representation of the TransferMetrics class.
+
+        Returns:
+            str: A string representation of the TransferMetrics instance.
+        """
+
+        total = self.total()
+        return f"TransferMetrics(endpoints={len(self._endpoints)}, compressed_bytes={total.compressed_bytes}, decompressed_bytes={total.decompressed_bytes})"
+
+    def record(self, endpoint: str, compressed_bytes: int, decompressed_bytes: int, encoding: str='identity') -> None:
+        """Record one response.
+
+        Args:
+            endpoint (str): The endpoint path.
+            compressed_bytes (int): Bytes received on the wire.
+            decompressed_bytes (int): Bytes of decoded response body.
+            encoding (str, optional): The response content coding. Defaults to 'identity'.
+        """
+
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointTransfer()
+            stats.requests += 1
+            stats.compressed_bytes += compressed_bytes
+            stats.decompressed_bytes += decompressed_bytes
+            stats.encodings[encoding] = stats.encodings.get(encoding, 0) + 1
+
+    def snapshot(self) -> Dict[str, EndpointTransfer]:
+        """Get a copy of the counters for every endpoint.
+
+        Returns:
+            Dict[str, EndpointTransfer]: Counters keyed by endpoint path.
+        """
+
+        with self._lock:
+            return {endpoint: replace(stats, encodings=dict(stats.encodings)) for endpoint, stats in self._endpoints.items()}
+
+    def total(self) -> EndpointTransfer:
+        """Get the counters summed over every endpoint.
+
+        Returns:
+            EndpointTransfer: The summed counters.
+        """
+
+        total = EndpointTransfer()
+        for stats in self.snapshot().values():
+            total.requests += stats.requests
+            total.compressed_bytes += stats.compressed_bytes
+            total.decompressed_bytes += stats.decompressed_bytes
+            for encoding, count in stats.encodings.items():
+                total.encodings[encoding] = total.encodings.get(encoding, 0) + count
+        return total
+
+    def reset(self) -> None:
+        """Clear every counter."""
+
+        with self._lock:
+            self._endpoints.clear()
+
+@dataclass(frozen=True, slots=True)
+class Timeout:
+    """Connect, read, write and pool timeouts for one endpoint family.
+
+    Attributes:
+        connect (float, optional): Seconds to establish a connection. None disables the limit.
+        read (float, optional): Seconds to wait between bytes of the response. None disables the limit.
+        write (float, optional): Seconds to wait while sending the request. None disables the limit.
+        pool (float, optional): Seconds to wait for a free connection from the pool. None disables the limit.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fd.Timeout(connect=2.0, read=60.0)
+        Timeout(connect=2.0, read=60.0, write=10.0, pool=5.0)
+    """
+
+    connect: Optional[float] = 5.0
+    read: Optional[float] = 10.0
+    write: Optional[float] = 10.0
+    pool: Optional[float] = 5.0
+
+    def __post_init__(self) -> None:
+        for name in ('connect', 'read', 'write', 'pool'):
+            value = getattr(self, name)
+            if value is not None and (not isinstance(value, (int, float)) or value <= 0):
+                raise ValueError(f"{name} timeout must be a positive number of seconds or None")
+
+_DEFAULT_ENDPOINT_TIMEOUTS: Mapping[str, Timeout] = {
+    '/series/observations': Timeout(read=30.0),
+    '/v2/release/observations': Timeout(read=60.0),
+    '/shapes/file': Timeout(read=60.0),
+}
+"""Endpoint families whose payloads routinely outgrow the default read timeout."""
+
+@dataclass(slots=True)
+class TimeoutPolicy:
+    """Timeouts per endpoint family, with a default for everything else.
+
+    An endpoint resolves to the most specific family configured for it: '/series/observations' first,
+    then its parent family '/series', then the default.
+
+    Attributes:
+        default (Timeout): Timeouts for endpoints without a family entry.
+        endpoints (Dict[str, Timeout]): Timeouts keyed by endpoint family, e.g. '/shapes/file' or '/v2/release/observations'.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> policy = fd.TimeoutPolicy(endpoints={'/series': fd.Timeout(connect=1.0, read=2.0)})
+        >>> policy.for_endpoint('/series/search')
+        Timeout(connect=1.0, read=2.0, write=10.0, pool=5.0)
+        >>> policy.for_endpoint('/shapes/file')
+        Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
+
+    Notes:
+        Families given in `endpoints` are merged over the built-in families, which give
+        '/series/observations' a 30 second read timeout and '/v2/release/observations' and
+        '/shapes/file' 60 seconds.
+    """
+
+    default: Timeout = field(default_factory=Timeout)
+    endpoints: Dict[str, Timeout] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.endpoints = {**_DEFAULT_ENDPOINT_TIMEOUTS, **self.endpoints}
+
+    def for_endpoint(self, url_endpoint: str) -> Timeout:
+        """Resolve the timeouts for an endpoint.
+
+        Args:
+            url_endpoint (str): The endpoint path relative to the service base URL.
+
+        Returns:
+            Timeout: The timeouts of the most specific matching family.
+        """
+
+        family = url_endpoint.rstrip('/')
+        while family:
+            timeout = self.endpoints.get(family)
+            if timeout is not None:
+                return timeout
+            family = family.rsplit('/', 1)[0]
+        return self.default
+
+@dataclass(slots=True)
+class HedgingPolicy:
+    """Opt-in hedged requests for `AsyncFred`, delayed by a latency percentile per endpoint.
+
+    When a GET is still pending after the endpoint's `percentile` latency, a duplicate is sent. The
+    first successful response wins and the other request is cancelled. Every hedge goes through the
+    client's rate limiter, so it is charged to the same request budget as the original.
+
+    Attributes:
+        percentile (float): Latency percentile, per endpoint, after which a hedge is sent. Defaults to 95.
+        initial_delay (float): Hedge delay in seconds until `min_samples` latencies have been observed. Defaults to 1.0.
+        min_delay (float): Lower bound on the hedge delay in seconds. Defaults to 0.05.
+        max_delay (float): Upper bound on the hedge delay in seconds. Defaults to 5.0.
+        max_hedges (int): Maximum duplicates sent per request. Defaults to 1.
+        min_samples (int): Latencies observed before the percentile is trusted. Defaults to 20.
+        window (int): Number of recent latencies kept per endpoint. Defaults to 256.
+        hedges_sent (int): Number of hedges sent so far.
+        hedges_won (int): Number of hedges whose response arrived first.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key')
+        >>> async_fred = fd.AsyncFred(fred, hedging=fd.HedgingPolicy(percentile=95))
+        >>> series = await async_fred.get_series('GNPCA')
+        >>> async_fred.hedging.hedges_sent, async_fred.hedging.hedges_won
+        (0, 0)
+
+    Notes:
+        Only plain GET requests are hedged; streamed observation requests are not.
+    """
+
+    percentile: float = 95.0
+    initial_delay: float = 1.0
+    min_delay: float = 0.05
+    max_delay: float = 5.0
+    max_hedges: int = 1
+    min_samples: int = 20
+    window: int = 256
+    hedges_sent: int = 0
+    hedges_won: int = 0
+    _latencies: Dict[str, Deque[float]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.max_hedges < 1:
+            raise ValueError("max_hedges must be at least 1")
+        if not 0 <= self.min_delay <= self.max_delay:
+            raise ValueError("min_delay must be non-negative and no greater than max_delay")
+
+    def delay(self, endpoint: str) -> float:
+        """Get the hedge delay for an endpoint.
+
+        Args:
+            endpoint (str): The endpoint path.
+
+        Returns:
+            float: Seconds to wait before sending a hedge.
+        """
+
+        samples = self._latencies.get(endpoint)
+        if samples is None or len(samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            ordered = sorted(samples)
+            delay = ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a completed request.
+
+        Args:
+            endpoint (str): The endpoint path.
+            latency (float): The request latency in seconds.
+        """
+
+        samples = self._latencies.get(endpoint)
+        if samples is None:
+            samples = self._latencies[endpoint] = deque(maxlen=self.window)
+        samples.append(latency)
+
+@dataclass(slots=True)
+class _Circuit:
+    """Mutable state of one circuit."""
+
+    state: str = 'closed'
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Per-host or per-endpoint circuit breaker that fails fast during outages.
+
+    After `failure_threshold` consecutive failures a circuit opens and requests raise
+    :class:`fedfred.exceptions.CircuitOpenError` immediately, without waiting through timeouts and
+    retries. After `recovery_timeout` seconds the circuit is half-open: up to `half_open_max_calls`
+    probe requests are let through, and the circuit closes on the first success or reopens on a failure.
+
+    Only outage symptoms count as failures: connection errors, timeouts, HTTP 429 and HTTP 5xx. Other
+    HTTP errors, such as 400 for a bad series ID, show the service is up and reset the count.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open a circuit. Defaults to 5.
+        recovery_timeout (float): Seconds a circuit stays open before a half-open probe. Defaults to 30.
+        half_open_max_calls (int): Concurrent probe requests allowed while half-open. Defaults to 1.
+        scope (str): 'endpoint' for one circuit per host and path, or 'host' for one circuit per host. Defaults to 'endpoint'.
+        serve_stale (bool): While open, return the last successful response for the same request, if one is kept. Defaults to False.
+        stale_size (int): Number of last successful responses kept for `serve_stale`. Defaults to 256.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> breaker = fd.CircuitBreaker(failure_threshold=3, recovery_timeout=10, serve_stale=True)
+        >>> fred = fd.Fred('your_api_key', circuit_breaker=breaker)
+        >>> breaker.state('api.stlouisfed.org/fred/series')
+        'closed'
+
+    Notes:
+        A `Fred` instance shares its breaker with its `AsyncFred`, `GeoFred` and `AsyncGeoFred` children.
+        Responses already in the client cache are served without consulting the breaker.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    scope: Literal['endpoint', 'host'] = 'endpoint'
+    serve_stale: bool = False
+    stale_size: int = 256
+    _circuits: Dict[str, _Circuit] = field(default_factory=dict, init=False, repr=False)
+    _stale: Optional[LRUCache] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if self.recovery_timeout <= 0:
+            raise ValueError("recovery_timeout must be a positive number of seconds")
+        if self.half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        if self.scope not in ('endpoint', 'host'):
+            raise ValueError("scope must be 'endpoint' or 'host'")
+        if self.serve_stale:
+            self._stale = LRUCache(maxsize=self.stale_size)
+
+    def state(self, circuit: str) -> str:
+        """Get the state of a circuit.
+
+        Args:
+            circuit (str): The circuit name: a host, or a host and path when scoped per endpoint.
+
+        Returns:
+            str: 'closed', 'open' or 'half_open'.
+        """
+
+        with self._lock:
+            entry = self._circuits.get(circuit)
+            if entry is None:
+                return 'closed'
+            if entry.state == 'open' and time.monotonic() - entry.opened_at >= self.recovery_timeout:
+                return 'half_open'
+            return entry.state
+
+    def reset(self) -> None:
+        """Close every circuit and drop the kept responses."""
+
+        with self._lock:
+            self._circuits.clear()
+            if self._stale is not None:
+                self._stale.clear()
+
+    def _circuit(self, url: str) -> str:
+        """Get the circuit name guarding a request URL."""
+
+        parsed = httpx.URL(url)
+        return parsed.host if self.scope == 'host' else f"{parsed.host}{parsed.path}"
+
+    def _acquire(self, circuit: str) -> None:
+        """Admit a request through a circuit, or raise CircuitOpenError."""
+
+        with self._lock:
+            entry = self._circuits.setdefault(circuit, _Circuit())
+            if entry.state == 'closed':
+                return
+            elapsed = time.monotonic() - entry.opened_at
+            if entry.state == 'open' and elapsed >= self.recovery_timeout:
+                entry.state, entry.probes = 'half_open', 0
+            if entry.state == 'half_open' and entry.probes < self.half_open_max_calls:
+                entry.probes += 1
+                return
+            retry_after = max(0.0, self.recovery_timeout - elapsed)
+        raise CircuitOpenError(
+            message=f"Circuit for {circuit} is open; failing fast for another {retry_after:.1f}s",
+            endpoint=circuit,
+            circuit=circuit,
+            retry_after=retry_after,
+        )
+
+    def _record_success(self, circuit: str) -> None:
+        """Close a circuit after a request that reached a healthy service."""
+
+        with self._lock:
+            self._circuits[circuit] = _Circuit()
+
+    def _release(self, circuit: str) -> None:
+        """Return a half-open probe slot for a request that ended without a verdict, such as a cancellation."""
+
+        with self._lock:
+            entry = self._circuits.get(circuit)
+            if entry is not None and entry.state == 'half_open' and entry.probes > 0:
+                entry.probes -= 1
+
+    def _record_failure(self, circuit: str) -> None:
+        """Count an outage symptom, opening the circuit at the threshold or on a failed probe."""
+
+        with self._lock:
+            entry = self._circuits.setdefault(circuit, _Circuit())
+            entry.failures += 1
+            if entry.state == 'open':
+                # A request admitted before the circuit opened; the recovery clock keeps running.
+                return
+            if entry.state == 'half_open' or entry.failures >= self.failure_threshold:
+                entry.state, entry.opened_at, entry.probes = 'open', time.monotonic(), 0
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar('fedfred_deadline', default=None)
+"""Monotonic time at which the innermost active `deadline(...)` expires."""
+
+_DEADLINE_BUDGET: ContextVar[Optional[float]] = ContextVar('fedfred_deadline_budget', default=None)
+"""Budget in seconds of the innermost active `deadline(...)`, for error messages."""
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound the total time spent in fedfred calls made inside the block.
+
+    The budget covers everything a call does: waiting for rate-limit capacity, every retry, every page
+    of a paginated call, and the connect/read/write/pool phases of each request, whose timeouts are
+    capped to the time left.
+
+    Args:
+        seconds (float): The budget in seconds.
+
+    Raises:
+        ValueError: If seconds is not a positive number.
+        DeadlineExceededError: Raised inside the block when the budget runs out.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> fred = fd.Fred('your_api_key')
+        >>> with fd.deadline(3.0):
+        ...     series = fred.get_series('GNPCA')
+        ...     observations = fred.get_series_observations('GNPCA')
+
+        Asynchronous calls and tasks started inside the block share the same budget:
+
+        >>> async def main():
+        ...     with fd.deadline(3.0):
+        ...         await fred.AsyncFred.get_series('GNPCA')
+
+    Notes:
+        Nested deadlines can only tighten the budget. The deadline is stored in a context variable, so
+        it follows the calling thread and any asyncio tasks created inside the block.
+    """
+
+    if not isinstance(seconds, (int, float)) or seconds <= 0:
+        raise ValueError("deadline seconds must be a positive number")
+    expires = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None and current < expires:
+        expires, seconds = current, _DEADLINE_BUDGET.get() or seconds
+    token = _DEADLINE.set(expires)
+    budget_token = _DEADLINE_BUDGET.set(seconds)
+    try:
+        yield
+    finally:
+        _DEADLINE_BUDGET.reset(budget_token)
+        _DEADLINE.reset(token)
+
+# Private Helpers
+def _deadline_remaining() -> Optional[float]:
+    """Get the seconds left before the active deadline, or None when no deadline is active."""
+
+    expires = _DEADLINE.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+def _deadline_exceeded(endpoint: str="", original_exception: Optional[BaseException]=None) -> DeadlineExceededError:
+    """Build the error raised when the active deadline runs out."""
+
+    budget = _DEADLINE_BUDGET.get()
+    return DeadlineExceededError(
+        message=f"Deadline of {budget}s exceeded" + (f" while requesting {endpoint}" if endpoint else ""),
+        endpoint=endpoint,
+        deadline=budget,
+        original_exception=original_exception,
+    )
+
+def _deadline_check(endpoint: str="") -> None:
+    """Raise if the active deadline has already expired.
+
+    Raises:
+        DeadlineExceededError: If the deadline has expired.
+    """
+
+    remaining = _deadline_remaining()
+    if remaining is not None and remaining <= 0:
+        raise _deadline_exceeded(endpoint)
+
+def _deadline_wait(seconds: float, endpoint: str="") -> float:
+    """Validate a planned wait, such as a rate-limit sleep, against the active deadline.
+
+    Args:
+        seconds (float): The planned wait.
+        endpoint (str, optional): The endpoint being waited for.
+
+    Returns:
+        float: The wait, unchanged.
+
+    Raises:
+        DeadlineExceededError: If the wait would end after the deadline, so callers fail fast instead of sleeping.
+    """
+
+    remaining = _deadline_remaining()
+    if remaining is not None and seconds >= remaining:
+        raise _deadline_exceeded(endpoint)
+    return seconds
+
+def _deadline_retry_stop(retry_state: Any) -> bool:
+    """Tenacity stop condition ending retries once the active deadline has expired."""
+
+    remaining = _deadline_remaining()
+    return remaining is not None and remaining <= 0
+
+def _deadline_http_error(endpoint: str, error: httpx.HTTPError) -> Optional[DeadlineExceededError]:
+    """Translate a request timeout caused by the deadline cap into a DeadlineExceededError.
+
+    Returns:
+        DeadlineExceededError, optional: The translated error, or None when the deadline was not the cause.
+    """
+
+    remaining = _deadline_remaining()
+    if isinstance(error, httpx.TimeoutException) and remaining is not None and remaining <= 0.01:
+        return _deadline_exceeded(endpoint, error)
+    return None
+
+def _request_timeout(policy: TimeoutPolicy, url_endpoint: str) -> httpx.Timeout:
+    """Build the httpx timeout for a request, capped by the active deadline.
+
+    Args:
+        policy (TimeoutPolicy): The client's timeout policy.
+        url_endpoint (str): The endpoint path relative to the service base URL.
+
+    Returns:
+        httpx.Timeout: The timeout to pass to httpx.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already expired.
+    """
+
+    timeout = policy.for_endpoint(url_endpoint)
+    _deadline_check(url_endpoint)
+    remaining = _deadline_remaining()
+    if remaining is None:
+        return httpx.Timeout(connect=timeout.connect, read=timeout.read, write=timeout.write, pool=timeout.pool)
+
+    def cap(value: Optional[float]) -> float:
+        return remaining if value is None else min(value, remaining)
+
+    return httpx.Timeout(connect=cap(timeout.connect), read=cap(timeout.read), write=cap(timeout.write), pool=cap(timeout.pool))
+
+def _supported_encodings() -> str:
+    """Build the Accept-Encoding header value from the content codings httpx can decode here.
+
+    Returns:
+        str: The header value, most compact coding first.
+    """
+
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+        available = set(SUPPORTED_DECODERS)
+    except ImportError: # pragma: no cover
+        available = {"gzip", "deflate"}
+    return ", ".join(encoding for encoding in ("zstd", "br", "gzip", "deflate") if encoding in available)
+
+_ACCEPT_ENCODING: str = _supported_encodings()
+"""Accept-Encoding header value sent with every request."""
+
+def _request_headers(headers: Optional[Dict[str, str]]=None) -> Dict[str, str]:
+    """Merge the compression negotiation header into a request's headers.
+
+    Args:
+        headers (Dict[str, str], optional): Endpoint-specific headers, such as Authorization.
+
+    Returns:
+        Dict[str, str]: The headers to send.
+    """
+
+    return {'Accept-Encoding': _ACCEPT_ENCODING, **(headers or {})}
+
+def _record_transfer(metrics: TransferMetrics, response: httpx.Response, decompressed_bytes: Optional[int]=None) -> None:
+    """Record the wire and decoded sizes of a completed response.
+
+    Args:
+        metrics (TransferMetrics): The metrics to update.
+        response (httpx.Response): The response, fully read or streamed to the end.
+        decompressed_bytes (int, optional): Decoded body size for streamed responses, whose content is not retained.
+    """
+
+    if decompressed_bytes is None:
+        decompressed_bytes = len(response.content)
+    metrics.record(
+        response.request.url.path,
+        response.num_bytes_downloaded,
+        decompressed_bytes,
+        response.headers.get('Content-Encoding', 'identity'),
+    )
+
+_T = TypeVar('_T')
+
+class _DispatchEvent(asyncio.Event):
+    """Event that remembers when it was first set, so each attempt's latency is measured from its own dispatch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.at: Optional[float] = None
+
+    def set(self) -> None:
+        if self.at is None:
+            self.at = time.monotonic()
+        super().set()
+
+async def _hedged_request(policy: HedgingPolicy, endpoint: str, send: Callable[[asyncio.Event], Awaitable[_T]]) -> _T:
+    """Run a request with hedging.
+
+    Args:
+        policy (HedgingPolicy): The hedging policy.
+        endpoint (str): The endpoint path, used for latency tracking.
+        send (Callable[[asyncio.Event], Awaitable]): Sends one attempt, rate limited, and sets the event
+            once the request has cleared the rate limiter and is on the wire.
+
+    Returns:
+        The result of the first attempt to succeed.
+
+    Raises:
+        Exception: The error of the original attempt, if every attempt fails.
+
+    Notes:
+        Hedges are spaced one hedge delay apart, so `max_hedges` duplicates are never sent at once. The
+        recorded latency is that of the winning attempt, measured from its own dispatch.
+    """
+
+    def launch() -> asyncio.Future:
+        event = _DispatchEvent()
+        task = asyncio.ensure_future(send(event))
+        dispatches[task] = event
+        return task
+
+    dispatches: Dict[asyncio.Future, _DispatchEvent] = {}
+    primary = launch()
+    dispatched = dispatches[primary]
+    dispatch_wait = asyncio.ensure_future(dispatched.wait())
+    await asyncio.wait({primary, dispatch_wait}, return_when=asyncio.FIRST_COMPLETED)
+    dispatch_wait.cancel()
+    next_hedge = (dispatched.at or time.monotonic()) + policy.delay(endpoint)
+    pending = {primary}
+    errors: Dict[asyncio.Future, BaseException] = {}
+    hedges_left = policy.max_hedges
+    try:
+        while pending:
+            timeout = max(0.0, next_hedge - time.monotonic()) if hedges_left else None
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    started = dispatches[task].at
+                    if started is not None:
+                        policy.record(endpoint, time.monotonic() - started)
+                    if task is not primary:
+                        policy.hedges_won += 1
+                    return task.result()
+                errors[task] = task.exception()
+            if not done and hedges_left:
+                hedges_left -= 1
+                policy.hedges_sent += 1
+                pending.add(launch())
+                next_hedge = time.monotonic() + policy.delay(endpoint)
+    finally:
+        for task in pending:
+            task.cancel()
+    raise errors.get(primary) or next(iter(errors.values()))
+
+_MISSING = object()
+
+def _breaker_failure(error: BaseException) -> bool:
+    """Check whether a request error is an outage symptom that should count against a circuit."""
+
+    cause = error if isinstance(error, httpx.HTTPError) else error.__cause__
+    if isinstance(cause, httpx.HTTPStatusError):
+        return cause.response.status_code == 429 or cause.response.status_code >= 500
+    return isinstance(cause, httpx.TransportError)
+
+def _breaker_enter(breaker: CircuitBreaker, circuit: str, stale_key: Optional[Hashable]) -> Any:
+    """Admit a request, returning a kept response instead when the circuit is open and one exists."""
+
+    try:
+        breaker._acquire(circuit)
+    except CircuitOpenError:
+        if breaker._stale is not None and stale_key is not None:
+            with breaker._lock:
+                stale = breaker._stale.get(stale_key, _MISSING)
+            if stale is not _MISSING:
+                return stale
+        raise
+    return _MISSING
+
+def _breaker_exit(breaker: CircuitBreaker, circuit: str, stale_key: Optional[Hashable], result: Any=_MISSING, error: Optional[BaseException]=None) -> None:
+    """Record the outcome of an admitted request."""
+
+    if error is not None:
+        if not isinstance(error, Exception) or isinstance(error, DeadlineExceededError):
+            breaker._release(circuit)
+        elif _breaker_failure(error):
+            breaker._record_failure(circuit)
+        else:
+            breaker._record_success(circuit)
+        return
+    breaker._record_success(circuit)
+    if breaker._stale is not None and stale_key is not None:
+        with breaker._lock:
+            breaker._stale[stale_key] = result
+
+def _breaker_call(breaker: Optional[CircuitBreaker], url: str, stale_key: Optional[Hashable], send: Callable[[], _T]) -> _T:
+    """Run a synchronous request through a circuit breaker.
+
+    Args:
+        breaker (CircuitBreaker, optional): The breaker, or None to call `send` directly.
+        url (str): The request URL, used to pick the circuit.
+        stale_key (Hashable, optional): Identifies the request for stale responses, or None for requests that must never be replayed, such as POSTs.
+        send (Callable): Sends the request.
+
+    Returns:
+        The response, or a kept stale response while the circuit is open.
+
+    Raises:
+        CircuitOpenError: If the circuit is open and no stale response is kept.
+    """
+
+    if breaker is None:
+        return send()
+    circuit = breaker._circuit(url)
+    stale = _breaker_enter(breaker, circuit, stale_key)
+    if stale is not _MISSING:
+        return stale
+    try:
+        result = send()
+    except BaseException as e:
+        _breaker_exit(breaker, circuit, stale_key, error=e)
+        raise
+    _breaker_exit(breaker, circuit, stale_key, result)
+    return result
+
+async def _breaker_call_async(breaker: Optional[CircuitBreaker], url: str, stale_key: Optional[Hashable], send: Callable[[], Awaitable[_T]]) -> _T:
+    """Run an asynchronous request through a circuit breaker.
+
+    Args:
+        breaker (CircuitBreaker, optional): The breaker, or None to await `send` directly.
+        url (str): The request URL, used to pick the circuit.
+        stale_key (Hashable, optional): Identifies the request for stale responses, or None for requests that must never be replayed, such as POSTs.
+        send (Callable): Sends the request.
+
+    Returns:
+        The response, or a kept stale response while the circuit is open.
+
+    Raises:
+        CircuitOpenError: If the circuit is open and no stale response is kept.
+    """
+
+    if breaker is None:
+        return await send()
+    circuit = breaker._circuit(url)
+    stale = _breaker_enter(breaker, circuit, stale_key)
+    if stale is not _MISSING:
+        return stale
+    try:
+        result = await send()
+    except BaseException as e:
+        _breaker_exit(breaker, circuit, stale_key, error=e)
+        raise
+    _breaker_exit(breaker, circuit, stale_key, result)
+    return result
+
+@dataclass(slots=True)
+class _AsyncLimiter:
+    """asyncio primitives of an async rate limiter, kept apart from the parent client's."""
+
+    lock: asyncio.Lock
+    semaphore: asyncio.Semaphore
+
+@asynccontextmanager
+async def _hold_thread_lock(lock: threading.Lock, poll: float=0.005) -> AsyncIterator[None]:
+    """Hold a threading lock from a coroutine, yielding to the event loop while another thread has it.
+
+    Args:
+        lock (threading.Lock): The lock shared with synchronous threads.
+        poll (float, optional): Seconds between attempts to take the lock. Defaults to 0.005.
+
+    Notes:
+        The lock is only tried without blocking, so a cancelled waiter never leaves it taken.
+    """
+
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(poll)
+    try:
+        yield
+    finally:
+        lock.release()
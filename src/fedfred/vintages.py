@@ -0,0 +1,692 @@
+# filepath: /src/fedfred/vintages.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""fedfred.vintages
+
+This module defines a compact, interval-encoded vintage matrix for ALFRED real-time histories.
+
+A series' revision triangle (observation date by vintage date) is mostly repeated values: an observation
+keeps its value from one vintage to the next until it is revised. The matrix therefore stores one row per
+real-time period rather than one cell per vintage, in flat arrays sorted by observation date and real-time
+start, which makes as-of lookups a binary search and observation windows a slice.
+
+Classes:
+    VintageMatrix: The real-time history of one series, encoded as real-time periods.
+    AsOfEngine: Point-in-time queries over the vintage matrices of many series.
+
+Examples:
+    >>> import fedfred as fd
+    >>> alfred = fd.Alfred('your_api_key')
+    >>> matrix = alfred.get_vintage_matrix('GDP')
+    >>> matrix.as_of('2020-06-30').tail(2)
+    date
+    2019-10-01    21694.458
+    2020-01-01    21539.724
+    Name: value, dtype: float64
+
+References:
+    fedfred package documentation. https://nikhilxsunder.github.io/fedfred/
+    Federal Reserve Bank of St. Louis, ALFRED real-time periods. https://alfred.stlouisfed.org/help#real_time_periods
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import polars as pl # pragma: no cover
+
+_OPEN_END = np.datetime64('9999-12-31', 'D')
+"""The real-time end of a value that is still current."""
+
+class VintageMatrix:
+    """The real-time history of one series, encoded as real-time periods.
+
+    Each observation date owns a contiguous run of real-time periods, sorted by start, in the flat
+    `realtime_starts`, `realtime_ends` and `values` arrays; `offsets` marks where each run begins. A value
+    as of a date is found by binary search, a whole vintage by one vectorized search over all observation
+    dates, and an observation window is a slice of the arrays without copying.
+
+    Attributes:
+        dates (numpy.ndarray): The observation dates, sorted and unique, as `datetime64[D]`.
+        offsets (numpy.ndarray): Offsets into the period arrays of each observation date's periods; length is one more than the number of dates.
+        realtime_starts (numpy.ndarray): The first day each value was in effect, as `datetime64[D]`.
+        realtime_ends (numpy.ndarray): The last day each value was in effect, as `datetime64[D]`; 9999-12-31 for values that are still current.
+        values (numpy.ndarray): The value of each real-time period, as float64. Missing values ('.') are NaN.
+        vintages (numpy.ndarray): The vintage dates of the matrix: every distinct real-time start, sorted.
+
+    Args:
+        dates (array-like): The observation date of each real-time period.
+        realtime_starts (array-like): The real-time start of each period.
+        realtime_ends (array-like): The real-time end of each period. '9999-12-31' or NaT marks a value that is still current.
+        values (array-like): The value of each period.
+
+    Raises:
+        ValueError: If the arrays differ in length, or if two periods of the same observation date overlap.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> matrix = fd.VintageMatrix(['2020-01-01', '2020-01-01', '2020-04-01'],
+        >>>                           ['2020-04-29', '2020-05-28', '2020-07-30'],
+        >>>                           ['2020-05-27', '9999-12-31', '9999-12-31'],
+        >>>                           [100.0, 101.0, 90.0])
+        >>> matrix.value('2020-01-01', as_of='2020-05-01')
+        100.0
+        >>> matrix.shape
+        (2, 3)
+
+    Notes:
+        Dates are handled at day resolution. Periods are sorted on construction, so input order does not
+        matter.
+
+    See Also:
+        - :meth:`fedfred.Alfred.get_vintage_matrix`: Build the matrix of a series from ALFRED.
+        - :meth:`VintageMatrix.from_frame`: Build the matrix from a real-time observations frame.
+    """
+
+    __slots__ = ('dates', 'offsets', 'realtime_starts', 'realtime_ends', 'values', 'vintages',
+                 '_keys', '_origin', '_span')
+
+    def __init__(self, dates: Any, realtime_starts: Any, realtime_ends: Any, values: Any) -> None:
+        """Initialize the VintageMatrix from real-time periods.
+
+        Args:
+            dates (array-like): The observation date of each real-time period.
+            realtime_starts (array-like): The real-time start of each period.
+            realtime_ends (array-like): The real-time end of each period.
+            values (array-like): The value of each period.
+
+        Raises:
+            ValueError: If the arrays differ in length, or if two periods of the same observation date overlap.
+        """
+
+        dates = _day_array(dates)
+        starts = _day_array(realtime_starts)
+        ends = _day_array(realtime_ends, open_end=True)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(dates) == len(starts) == len(ends) == len(values):
+            raise ValueError("dates, realtime_starts, realtime_ends and values must have the same length")
+        order = np.lexsort((starts, dates))
+        dates, starts, ends, values = dates[order], starts[order], ends[order], values[order]
+        same_date = dates[1:] == dates[:-1]
+        if np.any(same_date & (ends[:-1] >= starts[1:])):
+            position = int(np.argmax(same_date & (ends[:-1] >= starts[1:])))
+            raise ValueError(f"Overlapping real-time periods for observation date {dates[position]}")
+        unique_dates, first = np.unique(dates, return_index=True)
+        self._set(unique_dates, np.append(first, len(dates)).astype(np.int64), starts, ends, values)
+
+    def __repr__(self) -> str:
+        """String representation of the VintageMatrix class.
+
+        Returns:
+            str: A string representation of the VintageMatrix instance.
+        """
+
+        return f"VintageMatrix(dates={len(self.dates)}, vintages={len(self.vintages)}, periods={len(self.values)})"
+
+    def __len__(self) -> int:
+        """Get the number of observation dates in the matrix.
+
+        Returns:
+            int: The number of observation dates.
+        """
+
+        return len(self.dates)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The (observation dates, vintages) shape of the dense revision triangle."""
+
+        return len(self.dates), len(self.vintages)
+
+    @property
+    def nbytes(self) -> int:
+        """The memory held by the matrix arrays, in bytes."""
+
+        return sum(array.nbytes for array in (self.dates, self.offsets, self.realtime_starts, self.realtime_ends,
+                                              self.values, self.vintages, self._keys))
+
+    # Constructors
+    @classmethod
+    def from_frame(cls, frame: Union[pd.DataFrame, 'pl.DataFrame']) -> VintageMatrix:
+        """Build the matrix from a real-time observations frame.
+
+        Args:
+            frame (pandas.DataFrame | polars.DataFrame): Observations with 'realtime_start', 'realtime_end' and 'value' columns, and the observation date as a 'date' column or as the index, such as the output of :meth:`fedfred.Alfred.get_series_history` or of :meth:`fedfred.Fred.get_series_observations` with `output_type=1`.
+
+        Returns:
+            VintageMatrix: The matrix of the frame's real-time periods.
+
+        Raises:
+            ValueError: If two periods of the same observation date overlap.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> fred = fd.Fred('your_api_key')
+            >>> frame = fred.get_series_observations('GDP', realtime_start='1776-07-04', realtime_end='9999-12-31', output_type=1)
+            >>> matrix = fd.VintageMatrix.from_frame(frame)
+        """
+
+        if not isinstance(frame, pd.DataFrame):
+            frame = frame.to_pandas()
+        dates = frame['date'] if 'date' in frame.columns else frame.index
+        values = pd.to_numeric(frame['value'], errors='coerce')
+        return cls(dates, frame['realtime_start'], frame['realtime_end'], values)
+
+    # Queries
+    def value(self, observation_date: Union[str, datetime], as_of: Union[str, datetime]) -> float:
+        """Get the value of one observation as it was known on a date.
+
+        Args:
+            observation_date (str | datetime): The observation date.
+            as_of (str | datetime): The real-time date.
+
+        Returns:
+            float: The value in effect on `as_of`, or NaN if the observation was not published then.
+        """
+
+        date = _day(observation_date)
+        row = int(np.searchsorted(self.dates, date))
+        if row == len(self.dates) or self.dates[row] != date:
+            return float('nan')
+        day = _day(as_of)
+        start, end = self.offsets[row], self.offsets[row + 1]
+        position = start + int(np.searchsorted(self.realtime_starts[start:end], day, side='right')) - 1
+        if position < start or self.realtime_ends[position] < day:
+            return float('nan')
+        return float(self.values[position])
+
+    def as_of(self, as_of: Union[str, datetime]) -> pd.Series:
+        """Get the series as it was known on a date.
+
+        Args:
+            as_of (str | datetime): The real-time date.
+
+        Returns:
+            pandas.Series: The values in effect on `as_of`, indexed by observation date. Observations not published on that date are omitted.
+        """
+
+        rows, positions = self._lookup(_day(as_of))
+        return pd.Series(self.values[positions], index=pd.DatetimeIndex(self.dates[rows], name='date'), name='value')
+
+    def values_at(self, observation_dates: Any, as_of: Any) -> np.ndarray:
+        """Get many observations as they were known on many dates.
+
+        Args:
+            observation_dates (array-like): The observation dates.
+            as_of (array-like | str | datetime): The real-time date of each observation date, or one date for all of them.
+
+        Returns:
+            numpy.ndarray: The value in effect for each pair, or NaN where the observation was not published.
+        """
+
+        dates = _day_array(observation_dates)
+        if not len(self.values):
+            return np.full(len(dates), np.nan)
+        days = np.broadcast_to(_day_array(np.atleast_1d(as_of)), dates.shape)
+        rows = np.searchsorted(self.dates, dates)
+        known = rows < len(self.dates)
+        known[known] &= self.dates[rows[known]] == dates[known]
+        positions = np.full(len(dates), -1, dtype=np.int64)
+        positions[known] = self._positions(rows[known], days[known])
+        return np.where(positions >= 0, self.values[positions], np.nan)
+
+    def first_release(self) -> pd.Series:
+        """Get the first published value of each observation.
+
+        Returns:
+            pandas.Series: The first release of each observation, indexed by observation date.
+        """
+
+        return pd.Series(self.values[self.offsets[:-1]], index=pd.DatetimeIndex(self.dates, name='date'), name='value')
+
+    def latest_release(self) -> pd.Series:
+        """Get the most recently published value of each observation.
+
+        Returns:
+            pandas.Series: The latest release of each observation, indexed by observation date.
+        """
+
+        return pd.Series(self.values[self.offsets[1:] - 1], index=pd.DatetimeIndex(self.dates, name='date'), name='value')
+
+    # Revisions
+    def revisions(self) -> pd.DataFrame:
+        """Get revision statistics for every observation.
+
+        Returns:
+            pandas.DataFrame: Indexed by observation date, with columns:
+                'first_release' and 'latest_release' (the first and latest published values),
+                'revision' (latest minus first release),
+                'releases' (the number of real-time periods),
+                'revision_count' (the number of times the value changed),
+                'mean_absolute_revision' (the mean size of those changes, NaN if there were none).
+
+        Examples:
+            >>> import fedfred as fd
+            >>> alfred = fd.Alfred('your_api_key')
+            >>> stats = alfred.get_vintage_matrix('GDP').revisions()
+            >>> stats['revision'].abs().mean()  # mean absolute first-to-latest revision
+            >>> stats['revision_count'].describe()
+
+        Notes:
+            Computed in one pass over consecutive periods of the flat arrays, without a loop over
+            observations or vintages. A change to or from a missing value counts as a revision of unknown
+            size: it is counted in 'revision_count' but left out of 'mean_absolute_revision'.
+        """
+
+        count = len(self.dates)
+        releases = np.diff(self.offsets)
+        first = self.values[self.offsets[:-1]]
+        latest = self.values[self.offsets[1:] - 1]
+        period_rows = np.repeat(np.arange(count), releases)
+        rows = period_rows[1:]
+        same_row = rows == period_rows[:-1]
+        before, after = self.values[:-1], self.values[1:]
+        changed = same_row & ~((before == after) | (np.isnan(before) & np.isnan(after)))
+        sized = changed & ~np.isnan(before) & ~np.isnan(after)
+        revision_count = np.bincount(rows[changed], minlength=count)
+        sized_count = np.bincount(rows[sized], minlength=count)
+        total = np.bincount(rows[sized], weights=np.abs(after - before)[sized], minlength=count)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_absolute = np.where(sized_count > 0, total / sized_count, np.nan)
+        return pd.DataFrame({
+            'first_release': first,
+            'latest_release': latest,
+            'revision': latest - first,
+            'releases': releases,
+            'revision_count': revision_count,
+            'mean_absolute_revision': mean_absolute,
+        }, index=pd.DatetimeIndex(self.dates, name='date'))
+
+    def revision_at(self, horizon: Union[int, timedelta, pd.Timedelta]) -> pd.Series:
+        """Get the revision of every observation at a horizon after its first release.
+
+        Args:
+            horizon (int | timedelta): Either a number of releases after the first, or a time after the first release.
+
+        Returns:
+            pandas.Series: The value at the horizon minus the first release, indexed by observation date.
+
+        Raises:
+            ValueError: If horizon is a negative number of releases or a negative time.
+
+        Examples:
+            >>> import fedfred as fd
+            >>> from datetime import timedelta
+            >>> matrix = fd.Alfred('your_api_key').get_vintage_matrix('GDP')
+            >>> matrix.revision_at(2)                    # third release minus first
+            >>> matrix.revision_at(timedelta(days=365))  # one year after the first release
+
+        Notes:
+            With a number of releases, observations released fewer times use their latest release. With a
+            time, observations whose horizon falls after the latest vintage of the matrix are NaN, as are
+            observations withdrawn at the horizon.
+        """
+
+        first_positions = self.offsets[:-1]
+        first = self.values[first_positions]
+        if isinstance(horizon, (int, np.integer)) and not isinstance(horizon, bool):
+            if horizon < 0:
+                raise ValueError(f"horizon must be a non-negative number of releases, got {horizon}")
+            at = self.values[np.minimum(first_positions + horizon, self.offsets[1:] - 1)]
+        else:
+            days = pd.Timedelta(horizon).days
+            if days < 0:
+                raise ValueError(f"horizon must be a non-negative time, got {horizon}")
+            targets = self.realtime_starts[first_positions] + np.timedelta64(days, 'D')
+            rows = np.arange(len(self.dates), dtype=np.int64)
+            positions = self._positions(rows, targets)
+            reached = positions >= 0
+            if len(self.vintages):
+                reached &= targets <= self.vintages[-1]
+            at = np.where(reached, self.values[np.maximum(positions, 0)], np.nan)
+        return pd.Series(at - first, index=pd.DatetimeIndex(self.dates, name='date'), name='revision')
+
+    def slice(self, observation_start: Optional[Union[str, datetime]]=None, observation_end: Optional[Union[str, datetime]]=None,
+              vintage_start: Optional[Union[str, datetime]]=None, vintage_end: Optional[Union[str, datetime]]=None) -> VintageMatrix:
+        """Restrict the matrix to an observation window and a vintage window.
+
+        Args:
+            observation_start (str | datetime, optional): The first observation date to keep. Defaults to None (unbounded).
+            observation_end (str | datetime, optional): The last observation date to keep. Defaults to None (unbounded).
+            vintage_start (str | datetime, optional): The first real-time date to keep. Defaults to None (unbounded).
+            vintage_end (str | datetime, optional): The last real-time date to keep. Defaults to None (unbounded).
+
+        Returns:
+            VintageMatrix: The restricted matrix. Without a vintage window it shares the arrays of this matrix.
+
+        Notes:
+            An observation window is a slice of the sorted arrays. A vintage window keeps the periods that
+            overlap it, clipped to the window, so a value current at `vintage_end` ends there in the result;
+            observations with no period inside the window are dropped.
+        """
+
+        lo = 0 if observation_start is None else int(np.searchsorted(self.dates, _day(observation_start), side='left'))
+        hi = len(self.dates) if observation_end is None else int(np.searchsorted(self.dates, _day(observation_end), side='right'))
+        hi = max(lo, hi)
+        first, last = self.offsets[lo], self.offsets[hi]
+        dates = self.dates[lo:hi]
+        offsets = self.offsets[lo:hi + 1] - first
+        starts = self.realtime_starts[first:last]
+        ends = self.realtime_ends[first:last]
+        values = self.values[first:last]
+        if vintage_start is not None or vintage_end is not None:
+            window_start = _day(vintage_start) if vintage_start is not None else np.datetime64('0001-01-01', 'D')
+            window_end = _day(vintage_end) if vintage_end is not None else _OPEN_END
+            keep = (ends >= window_start) & (starts <= window_end)
+            rows = np.repeat(np.arange(len(dates)), np.diff(offsets))[keep]
+            counts = np.bincount(rows, minlength=len(dates))
+            offsets = np.concatenate(([0], np.cumsum(counts[counts > 0]))).astype(np.int64)
+            dates = dates[counts > 0]
+            starts = np.maximum(starts[keep], window_start)
+            ends = np.minimum(ends[keep], window_end)
+            values = values[keep]
+        matrix = VintageMatrix.__new__(VintageMatrix)
+        matrix._set(dates, offsets, starts, ends, values)
+        return matrix
+
+    # Conversion
+    def to_frame(self) -> pd.DataFrame:
+        """Get the real-time periods as a long frame.
+
+        Returns:
+            pandas.DataFrame: Indexed by 'date', with 'realtime_start', 'realtime_end' and 'value' columns, in the layout of :meth:`fedfred.Alfred.get_series_history`. A 'realtime_end' of NaT marks a value that is still current.
+        """
+
+        dates = np.repeat(self.dates, np.diff(self.offsets))
+        ends = np.where(self.realtime_ends == _OPEN_END, np.datetime64('NaT', 'D'), self.realtime_ends)
+        return pd.DataFrame({
+            'realtime_start': pd.DatetimeIndex(self.realtime_starts),
+            'realtime_end': pd.DatetimeIndex(ends),
+            'value': self.values,
+        }, index=pd.DatetimeIndex(dates, name='date'))
+
+    def to_dense(self) -> pd.DataFrame:
+        """Get the dense revision triangle.
+
+        Returns:
+            pandas.DataFrame: One row per observation date and one column per vintage date, holding the value in effect at each vintage and NaN where the observation was not published.
+
+        Notes:
+            The dense triangle holds `len(dates) * len(vintages)` cells; prefer the interval queries for long
+            daily series.
+        """
+
+        dense = np.full(self.shape, np.nan)
+        first = np.searchsorted(self.vintages, self.realtime_starts, side='left')
+        stop = np.searchsorted(self.vintages, self.realtime_ends, side='right')
+        lengths = np.maximum(stop - first, 0)
+        period = np.repeat(np.arange(len(self.values)), lengths)
+        within = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        rows = np.repeat(np.arange(len(self.dates)), np.diff(self.offsets))
+        dense[rows[period], first[period] + within] = self.values[period]
+        return pd.DataFrame(dense, index=pd.DatetimeIndex(self.dates, name='date'),
+                            columns=pd.DatetimeIndex(self.vintages, name='vintage_date'))
+
+    # Internals
+    def _set(self, dates: np.ndarray, offsets: np.ndarray, starts: np.ndarray, ends: np.ndarray, values: np.ndarray) -> None:
+        """Store sorted period arrays and build the as-of search keys."""
+
+        self.dates = dates
+        self.offsets = offsets
+        self.realtime_starts = starts
+        self.realtime_ends = ends
+        self.values = values
+        self.vintages = np.unique(starts)
+        days = starts.astype(np.int64)
+        self._origin = int(days.min()) if len(days) else 0
+        self._span = int(days.max()) - self._origin + 1 if len(days) else 1
+        rows = np.repeat(np.arange(len(dates), dtype=np.int64), np.diff(offsets))
+        self._keys = rows * self._span + (days - self._origin)
+
+    def _lookup(self, day: np.datetime64) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the period in effect on a day for every observation date.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The rows that have a value in effect, and the position of that value.
+        """
+
+        rows = np.arange(len(self.dates), dtype=np.int64)
+        positions = self._positions(rows, np.full(len(rows), day))
+        found = positions >= 0
+        return rows[found], positions[found]
+
+    def _positions(self, rows: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Find the period of each row in effect on the paired day.
+
+        Args:
+            rows (numpy.ndarray): Row positions into `dates`.
+            days (numpy.ndarray): The `datetime64[D]` real-time day of each row.
+
+        Returns:
+            numpy.ndarray: The position of the period in effect for each pair, or -1 where none is.
+        """
+
+        offsets = np.clip(days.astype(np.int64) - self._origin, -1, self._span - 1)
+        positions = np.searchsorted(self._keys, rows * self._span + offsets, side='right') - 1
+        found = positions >= self.offsets[rows]
+        found[found] &= self.realtime_ends[positions[found]] >= days[found]
+        return np.where(found, positions, -1)
+
+class AsOfEngine:
+    """Point-in-time queries over the vintage matrices of many series.
+
+    The engine holds one :class:`VintageMatrix` per series and answers "what was known on date D" for many
+    dates and series at once from memory. Each lookup is a vectorized binary search over all query dates of
+    a series, so a backtest over thousands of dates costs one search per series rather than one API call
+    per date.
+
+    Args:
+        matrices (Mapping[str, VintageMatrix | pandas.DataFrame], optional): The real-time history of each series, as a matrix or as a frame accepted by :meth:`VintageMatrix.from_frame`. Defaults to None.
+
+    Examples:
+        >>> import fedfred as fd
+        >>> alfred = fd.Alfred('your_api_key')
+        >>> engine = alfred.get_as_of_engine(['GDP', 'UNRATE', 'CPIAUCSL'])
+        >>> engine.latest(pd.date_range('2020-01-01', '2020-12-31', freq='B')).head(2)
+                          GDP  UNRATE  CPIAUCSL
+        as_of
+        2020-01-01  21542.540     3.5   257.971
+        2020-01-02  21542.540     3.5   257.971
+
+    Notes:
+        `latest` treats the most recent observation date ever published by D as the latest known
+        observation. If that observation was withdrawn again by D, its value is NaN rather than falling back
+        to an older observation.
+
+    See Also:
+        - :meth:`fedfred.Alfred.get_as_of_engine`: Build the engine for many series from ALFRED.
+    """
+
+    __slots__ = ('_matrices', '_first_known')
+
+    def __init__(self, matrices: Optional[Mapping[str, Union[VintageMatrix, pd.DataFrame]]]=None) -> None:
+        """Initialize the AsOfEngine from the real-time history of each series.
+
+        Args:
+            matrices (Mapping[str, VintageMatrix | pandas.DataFrame], optional): The real-time history of each series. Defaults to None.
+        """
+
+        self._matrices: Dict[str, VintageMatrix] = {}
+        self._first_known: Dict[str, np.ndarray] = {}
+        for series_id, history in (matrices or {}).items():
+            self.add(series_id, history)
+
+    def __repr__(self) -> str:
+        """String representation of the AsOfEngine class.
+
+        Returns:
+            str: A string representation of the AsOfEngine instance.
+        """
+
+        return f"AsOfEngine(series={len(self)})"
+
+    def __len__(self) -> int:
+        """Get the number of series in the engine.
+
+        Returns:
+            int: The number of series.
+        """
+
+        return len(self._matrices)
+
+    def __contains__(self, series_id: object) -> bool:
+        """Check if a series is in the engine.
+
+        Args:
+            series_id (object): The series ID.
+
+        Returns:
+            bool: True if the series is loaded, False otherwise.
+        """
+
+        return series_id in self._matrices
+
+    def __getitem__(self, series_id: str) -> VintageMatrix:
+        """Get the vintage matrix of a series.
+
+        Args:
+            series_id (str): The series ID.
+
+        Returns:
+            VintageMatrix: The series' vintage matrix.
+
+        Raises:
+            KeyError: If the series is not in the engine.
+        """
+
+        return self._matrices[series_id]
+
+    @property
+    def series_ids(self) -> List[str]:
+        """The IDs of the series in the engine, in insertion order."""
+
+        return list(self._matrices)
+
+    def add(self, series_id: str, history: Union[VintageMatrix, pd.DataFrame]) -> None:
+        """Add or replace the real-time history of a series.
+
+        Args:
+            series_id (str): The series ID.
+            history (VintageMatrix | pandas.DataFrame): The series' vintage matrix, or a real-time observations frame accepted by :meth:`VintageMatrix.from_frame`.
+        """
+
+        matrix = history if isinstance(history, VintageMatrix) else VintageMatrix.from_frame(history)
+        first = matrix.realtime_starts[matrix.offsets[:-1]]
+        self._matrices[series_id] = matrix
+        self._first_known[series_id] = np.minimum.accumulate(first[::-1])[::-1]
+
+    # Queries
+    def latest(self, as_of: Any, series_ids: Optional[Iterable[str]]=None) -> pd.DataFrame:
+        """Get the latest known value of each series on each date.
+
+        Args:
+            as_of (array-like | str | datetime): The real-time dates to query.
+            series_ids (Iterable[str], optional): The series to query. Defaults to None (every series).
+
+        Returns:
+            pandas.DataFrame: Indexed by 'as_of' date with one column per series, holding the value of the most recent observation published by that date, or NaN if none was.
+        """
+
+        days, selected = self.__query(as_of, series_ids)
+        columns = {}
+        for series_id in selected:
+            rows, positions = self.__latest_positions(series_id, days)
+            columns[series_id] = np.where(positions >= 0, self._matrices[series_id].values[positions], np.nan)
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(days, name='as_of'), columns=selected)
+
+    def latest_dates(self, as_of: Any, series_ids: Optional[Iterable[str]]=None) -> pd.DataFrame:
+        """Get the observation date of the latest known value of each series on each date.
+
+        Args:
+            as_of (array-like | str | datetime): The real-time dates to query.
+            series_ids (Iterable[str], optional): The series to query. Defaults to None (every series).
+
+        Returns:
+            pandas.DataFrame: Indexed by 'as_of' date with one column per series, holding the observation date behind :meth:`latest`, or NaT if none was published.
+        """
+
+        days, selected = self.__query(as_of, series_ids)
+        columns = {}
+        for series_id in selected:
+            rows, _ = self.__latest_positions(series_id, days)
+            observed = np.full(len(days), np.datetime64('NaT', 'D'))
+            observed[rows >= 0] = self._matrices[series_id].dates[rows[rows >= 0]]
+            columns[series_id] = observed
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(days, name='as_of'), columns=selected)
+
+    def panel(self, as_of: Union[str, datetime], series_ids: Optional[Iterable[str]]=None) -> pd.DataFrame:
+        """Get every series as it was known on one date.
+
+        Args:
+            as_of (str | datetime): The real-time date.
+            series_ids (Iterable[str], optional): The series to include. Defaults to None (every series).
+
+        Returns:
+            pandas.DataFrame: Indexed by observation date with one column per series, holding the values in effect on `as_of` and NaN where an observation was not published.
+        """
+
+        _, selected = self.__query(as_of, series_ids)
+        columns = {series_id: self._matrices[series_id].as_of(as_of) for series_id in selected}
+        if not columns:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='date'))
+        return pd.concat(columns, axis=1, sort=True).rename_axis('date')
+
+    # Internals
+    def __query(self, as_of: Any, series_ids: Optional[Iterable[str]]) -> Tuple[np.ndarray, List[str]]:
+        """Normalise query dates and series, raising KeyError for series that are not loaded."""
+
+        selected = self.series_ids if series_ids is None else list(series_ids)
+        missing = [series_id for series_id in selected if series_id not in self._matrices]
+        if missing:
+            raise KeyError(f"Series not loaded in the engine: {', '.join(missing)}")
+        return _day_array(np.atleast_1d(as_of)), selected
+
+    def __latest_positions(self, series_id: str, days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the latest published row of a series on each day and the period of it in effect then."""
+
+        matrix = self._matrices[series_id]
+        rows = np.searchsorted(self._first_known[series_id], days, side='right') - 1
+        positions = np.full(len(days), -1, dtype=np.int64)
+        published = rows >= 0
+        positions[published] = matrix._positions(rows[published], days[published])
+        return rows, positions
+
+def _day(value: Union[str, datetime, np.datetime64]) -> np.datetime64:
+    """Convert a date to `datetime64[D]`."""
+
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
+
+def _day_array(values: Any, open_end: bool=False) -> np.ndarray:
+    """Convert dates to a `datetime64[D]` array, mapping '9999-12-31' and NaT to the open end when asked."""
+
+    array = np.asarray(values)
+    if array.dtype.kind != 'M':
+        strings = pd.Series(array, dtype=object)
+        if open_end:
+            strings = strings.mask(strings.astype(str) == str(_OPEN_END))
+        array = pd.to_datetime(strings).to_numpy()
+    days = array.astype('datetime64[D]')
+    if open_end:
+        days = np.where(np.isnat(days), _OPEN_END, days)
+    return days
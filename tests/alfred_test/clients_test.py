@@ -0,0 +1,220 @@
+# filepath: /test/alfred_test/clients_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the alfred clients module.
+"""
+
+from unittest.mock import patch
+import httpx
+import pandas as pd
+import pytest
+from fedfred import Alfred, Fred, VintageStore
+
+HISTORY = [
+    {"realtime_start": "2020-04-29", "realtime_end": "2020-05-27", "date": "2020-01-01", "value": "100.0"},
+    {"realtime_start": "2020-05-28", "realtime_end": "2020-06-24", "date": "2020-01-01", "value": "101.0"},
+    {"realtime_start": "2020-06-25", "realtime_end": "9999-12-31", "date": "2020-01-01", "value": "102.0"},
+    {"realtime_start": "2020-07-30", "realtime_end": "2020-08-26", "date": "2020-04-01", "value": "90.0"},
+    {"realtime_start": "2020-08-27", "realtime_end": "9999-12-31", "date": "2020-04-01", "value": "."},
+]
+
+def fake_history(calls, rows=HISTORY):
+    def fake_get(url_endpoint, data):
+        calls.append(dict(data))
+        offset = data.get("offset", 0)
+        return {"observations": rows[offset:offset + data["limit"]]}
+    return fake_get
+
+@pytest.fixture
+def alfred():
+    return Alfred(api_key="test_key")
+
+class TestAlfred:
+    def test_history_is_typed_and_fetched_once(self, alfred):
+        calls = []
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history(calls)):
+            history = alfred.get_series_history("GDP")
+            first = alfred.get_series_observations_first_release("GDP")
+            latest = alfred.get_series_observations_latest_release("GDP")
+            as_of = alfred.get_series_observations_as_of_date("GDP", "2020-06-01")
+        assert len(calls) == 1
+        assert calls[0]["output_type"] == 1
+        assert calls[0]["realtime_start"] == "1776-07-04"
+        assert calls[0]["realtime_end"] == "9999-12-31"
+        assert isinstance(history.index, pd.DatetimeIndex)
+        assert history["realtime_start"].dtype.kind == "M"
+        assert history["value"].dtype == "float64"
+        assert history["realtime_end"].isna().sum() == 2
+        assert first["value"].tolist() == [100.0, 90.0]
+        assert latest["value"].tolist()[0] == 102.0
+        assert pd.isna(latest["value"].tolist()[1])
+        assert as_of["value"].tolist() == [101.0]
+
+    def test_as_of_boundaries_and_current_values(self, alfred):
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history([])):
+            assert alfred.get_series_observations_as_of_date("GDP", "2020-04-28").empty
+            assert alfred.get_series_observations_as_of_date("GDP", "2020-05-27")["value"].tolist() == [100.0]
+            today = alfred.get_series_observations_as_of_date("GDP", "2030-01-01")
+        assert today["value"].tolist()[0] == 102.0
+        assert len(today) == 2
+
+    def test_options_are_separate_histories(self, alfred):
+        calls = []
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history(calls)):
+            alfred.get_series_observations_first_release("GDP")
+            alfred.get_series_observations_first_release("GDP", units="pch")
+            alfred.get_series_observations_first_release("GDP")
+            alfred.clear_history("GDP")
+            alfred.get_series_observations_first_release("GDP")
+        assert len(calls) == 3
+        assert calls[1]["units"] == "pch"
+
+    def test_history_pages_through_offsets(self, alfred):
+        calls = []
+        with patch("fedfred.clients.alfred._OBSERVATIONS_PER_REQUEST", 2), \
+             patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history(calls)):
+            history = alfred.get_series_history("GDP")
+        assert [call.get("offset") for call in calls] == [None, 2, 4]
+        assert len(history) == 5
+        assert history.index.is_monotonic_increasing
+
+    def test_views_do_not_share_the_history(self, alfred):
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history([])):
+            latest = alfred.get_series_observations_latest_release("GDP")
+            latest["value"] = 0.0
+            assert alfred.get_series_history("GDP")["value"].max() == 102.0
+
+    def test_polars_view(self, alfred):
+        pl = pytest.importorskip("polars")
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history([])):
+            first = alfred.get_series_observations_first_release("GDP", dataframe_method="polars")
+        assert isinstance(first, pl.DataFrame)
+        assert first.schema["date"] == pl.Date
+        assert first["value"].to_list() == [100.0, 90.0]
+
+    def test_invalid_arguments(self, alfred):
+        with pytest.raises(ValueError):
+            alfred.get_series_observations_first_release("GDP", dataframe_method="dask")
+        with pytest.raises(ValueError):
+            alfred.get_series_observations_as_of_date("GDP", "not a date")
+
+    def test_repr(self, alfred):
+        assert repr(alfred) == "Alfred(api_key='test_key', cache_mode=True, cache_size=256)"
+
+    def test_vintage_matrix_from_history(self, alfred):
+        calls = []
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history(calls)):
+            matrix = alfred.get_vintage_matrix("GDP")
+            as_of = alfred.get_series_observations_as_of_date("GDP", "2020-08-01")
+        assert len(calls) == 1
+        assert matrix.shape == (2, 5)
+        assert matrix.as_of("2020-08-01").tolist() == as_of["value"].tolist()
+
+    def test_as_of_engine_reuses_histories(self, alfred):
+        calls = []
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history(calls)):
+            alfred.get_series_history("GDP")
+            engine = alfred.get_as_of_engine(["GDP", "GDPC1", "GNP", "GDP"])
+            again = alfred.get_as_of_engine(["GNP"])
+        assert sorted(call.get("series_id") for call in calls) == ["GDP", "GDPC1", "GNP"]
+        assert engine.series_ids == ["GDP", "GDPC1", "GNP"]
+        assert engine.latest("2020-08-01")["GDP"].tolist() == [90.0]
+        assert again["GNP"].shape == engine["GNP"].shape
+
+    def test_as_of_engine_workers_share_the_rate_limiter(self, alfred, monkeypatch):
+        def handler(request):
+            return httpx.Response(200, json={"observations": HISTORY})
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        fred = alfred._Alfred__fred
+        fred.max_requests_per_minute = 40
+        held = []
+        series_ids = [f"S{index}" for index in range(48)]
+        with patch("fedfred.clients.fred.time.sleep", side_effect=lambda seconds: held.append(fred._rate_lock.locked())):
+            engine = alfred.get_as_of_engine(series_ids)
+        assert engine.series_ids == series_ids
+        assert len(fred.request_times) == 48
+        assert len(held) == 9 and all(held)
+
+    def test_series_revisions(self, alfred):
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_history([])):
+            stats = alfred.get_series_revisions("GDP")
+        assert stats["revision"].iloc[0] == 2.0
+        assert stats["revision_count"].tolist() == [2, 1]
+
+    def test_sync_vintage_store_appends_only_new_vintages(self, alfred, tmp_path):
+        pytest.importorskip("pyarrow")
+        store = VintageStore(tmp_path)
+        calls = []
+        published = HISTORY[:3]
+        def fake_get(url_endpoint, data):
+            calls.append((url_endpoint, data.get("realtime_start")))
+            rows = [row for row in published if row["realtime_end"] >= data["realtime_start"]]
+            if url_endpoint.endswith("vintagedates"):
+                return {"vintage_dates": sorted({row["realtime_start"] for row in rows if row["realtime_start"] >= data["realtime_start"]})}
+            return {"observations": [dict(row, realtime_start=max(row["realtime_start"], data["realtime_start"])) for row in rows]}
+        with patch.object(Fred, "_Fred__fred_get_request", side_effect=fake_get):
+            assert alfred.sync_vintage_store(store, "GDP") == {"GDP": 3}
+            assert alfred.sync_vintage_store(store, ["GDP"]) == {"GDP": 0}
+            published = HISTORY[:2] + [dict(HISTORY[2], realtime_end="2020-07-29"), HISTORY[3],
+                                      dict(HISTORY[2], realtime_start="2020-07-30")]
+            assert alfred.sync_vintage_store(store, ["GDP"]) == {"GDP": 1}
+        assert [endpoint.rsplit("/", 1)[-1] for endpoint, _ in calls] == ["observations", "vintagedates", "vintagedates", "observations"]
+        assert calls[-1][1] == "2020-06-26"
+        assert store.load("GDP").as_of("2020-08-01").tolist() == [102.0, 90.0]
+
+    def test_sync_vintage_store_bypasses_the_response_cache(self, alfred, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        store = VintageStore(tmp_path)
+        published = HISTORY[:3]
+        sent = []
+
+        def handler(request):
+            params = request.url.params
+            sent.append(request.url.path.rsplit("/", 1)[-1])
+            rows = [row for row in published if row["realtime_end"] >= params["realtime_start"]]
+            if request.url.path.endswith("vintagedates"):
+                dates = sorted({row["realtime_start"] for row in rows if row["realtime_start"] >= params["realtime_start"]})
+                return httpx.Response(200, json={"count": len(dates), "vintage_dates": dates[:int(params["limit"])]})
+            return httpx.Response(200, json={"observations": [
+                dict(row, realtime_start=max(row["realtime_start"], params["realtime_start"])) for row in rows]})
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        assert alfred.sync_vintage_store(store, "GDP") == {"GDP": 3}
+        assert alfred.sync_vintage_store(store, "GDP") == {"GDP": 0}
+        published = HISTORY[:2] + [dict(HISTORY[2], realtime_end="2020-07-29"), HISTORY[3],
+                                  dict(HISTORY[2], realtime_start="2020-07-30")]
+        assert alfred.sync_vintage_store(store, "GDP") == {"GDP": 1}
+        assert sent == ["observations", "vintagedates", "vintagedates", "observations"]
+        assert alfred.keys == []
@@ -0,0 +1,340 @@
+# filepath: /test/batch_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the batch and fan-out requests of the clients module.
+"""
+
+import asyncio
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import patch
+import httpx
+import pytest
+from fedfred import Fred, AsyncFred, ObservationBatch
+from fedfred._core import _vintage_dates_chunker, _vintage_chunks_merger
+
+OBSERVATIONS = {
+    "GDP": [{"date": "2020-01-01", "value": "1.5"}, {"date": "2020-04-01", "value": "."}],
+    "UNRATE": [{"date": "2020-01-01", "value": "3.5"}, {"date": "2020-02-01", "value": "4.4"}],
+}
+
+def fake_requests(calls):
+    async def fake_get(url_endpoint, data):
+        calls.append((url_endpoint, data))
+        await asyncio.sleep(0)
+        if data["series_id"] not in OBSERVATIONS:
+            raise ValueError(f"Bad Request: series {data['series_id']} does not exist")
+        return {"observations": OBSERVATIONS[data["series_id"]]}
+    return fake_get
+
+class TestAsyncFredObservationsMany:
+    @pytest.mark.asyncio
+    async def test_long_frame_with_failures(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls = []
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_requests(calls)):
+            batch = await fred.get_series_observations_many(["UNRATE", "MISSING", "GDP", "UNRATE"], units="pch",
+                                                            observation_start="2020-01-01")
+        assert isinstance(batch, ObservationBatch)
+        assert sorted(data["series_id"] for _, data in calls) == ["GDP", "MISSING", "UNRATE"]
+        assert all(url == "/series/observations" and data["units"] == "pch" for url, data in calls)
+        assert list(batch.errors) == ["MISSING"]
+        assert not batch.succeeded
+        with pytest.raises(ValueError, match="MISSING"):
+            batch.raise_for_errors()
+        frame = batch.data
+        assert list(frame["series_id"]) == ["UNRATE", "UNRATE", "GDP", "GDP"]
+        assert frame["value"].isna().sum() == 1
+        assert frame["date"].dt.date.iloc[0] == date(2020, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_wide_polars_frame(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_requests([])):
+            batch = await fred.get_series_observations_many(["GDP", "UNRATE"], dataframe_method="polars", layout="wide")
+        assert batch.succeeded
+        assert batch.data.columns == ["date", "GDP", "UNRATE"]
+        assert batch.data.height == 3
+
+    @pytest.mark.asyncio
+    async def test_realtime_window_keeps_periods(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        vintages = [
+            {"realtime_start": "2020-01-01", "realtime_end": "2020-03-31", "date": "2020-01-01", "value": "1.5"},
+            {"realtime_start": "2020-04-01", "realtime_end": "9999-12-31", "date": "2020-01-01", "value": "1.7"},
+        ]
+
+        async def fake_get(url_endpoint, data):
+            return {"observations": vintages}
+
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            batch = await fred.get_series_observations_many(["GDP"], realtime_start="2020-01-01", realtime_end="2020-12-31")
+            assert list(batch.data.columns) == ["series_id", "realtime_start", "realtime_end", "date", "value"]
+            assert list(batch.data["realtime_start"]) == ["2020-01-01", "2020-04-01"]
+            assert list(batch.data["value"]) == [1.5, 1.7]
+            methods = ["pandas"] + [name for name in ("polars", "arrow")
+                                    if importlib.util.find_spec("pyarrow" if name == "arrow" else name)]
+            for method in methods:
+                with pytest.raises(ValueError, match="more than once"):
+                    await fred.get_series_observations_many(["GDP"], dataframe_method=method, layout="wide",
+                                                            realtime_start="2020-01-01")
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        with pytest.raises(ValueError, match="series_ids"):
+            await fred.get_series_observations_many([])
+        with pytest.raises(ValueError, match="series_ids"):
+            await fred.get_series_observations_many("GDP")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="dataframe_method"):
+            await fred.get_series_observations_many(["GDP"], dataframe_method="dask")
+        with pytest.raises(ValueError, match="layout"):
+            await fred.get_series_observations_many(["GDP"], layout="tall")
+
+class TestFredObservationsMany:
+    def test_runs_batch_on_fresh_event_loop(self):
+        fred = Fred(api_key="test_key")
+        with patch.object(AsyncFred, "_AsyncFred__fred_get_request", side_effect=fake_requests([])):
+            first = fred.get_series_observations_many(["GDP", "UNRATE"], dataframe_method="arrow")
+            second = fred.get_series_observations_many(["MISSING"])
+        assert first.data.column_names == ["series_id", "date", "value"]
+        assert first.data.num_rows == 4
+        assert list(second.errors) == ["MISSING"]
+        assert len(second.data) == 0
+
+    @pytest.mark.asyncio
+    async def test_refuses_running_loop(self):
+        with pytest.raises(RuntimeError, match="AsyncFred"):
+            Fred(api_key="test_key").get_series_observations_many(["GDP"])
+
+class TestAsyncFredAsCompleted:
+    @staticmethod
+    def fake_category_requests(delays, calls):
+        async def fake_get(url_endpoint, data):
+            calls.append(data["category_id"])
+            await asyncio.sleep(delays[data["category_id"]])
+            if data["category_id"] < 0:
+                raise ValueError("Bad Request: invalid category")
+            return {"categories": [{"id": data["category_id"], "name": f"C{data['category_id']}", "parent_id": 0}]}
+        return fake_get
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order_with_errors(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        delays = {1: 0.03, 2: 0.0, -1: 0.01}
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=self.fake_category_requests(delays, [])):
+            results = [item async for item in fred.as_completed(
+                [("get_category", {"category_id": 1}), ("get_category", {"category_id": 2}),
+                 ("get_category", {"category_id": -1})])]
+        assert [spec[1]["category_id"] for spec, _ in results] == [2, -1, 1]
+        assert results[0][1][0].name == "C2"
+        assert isinstance(results[1][1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_bounded_window_over_lazy_specs_and_early_exit(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls = []
+        delays = {i: 0.0 for i in range(100)}
+        specs = (("get_category", {"category_id": i}) for i in range(100))
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=self.fake_category_requests(delays, calls)):
+            async for spec, result in fred.as_completed(specs, max_in_flight=4):
+                if spec[1]["category_id"] == 1:
+                    break
+            await asyncio.sleep(0)
+        assert len(calls) <= 6
+        assert next(specs)[1]["category_id"] < 10
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        with pytest.raises(ValueError, match="max_in_flight"):
+            await fred.as_completed([], max_in_flight=0).__anext__()
+        for name in ("iter_tags", "as_completed", "missing"):
+            with pytest.raises(ValueError, match="get_\\* method"):
+                await fred.as_completed([(name, {})]).__anext__()
+
+def vintage_dates(count):
+    return [f"{2000 + index // 12:04d}-{index % 12 + 1:02d}-01" for index in range(count)]
+
+class TestVintageDateChunks:
+    def test_chunker_sorts_dedupes_and_splits(self):
+        assert _vintage_dates_chunker("2020-03-01, 2020-01-01,2020-02-01,2020-01-01", size=2) == [
+            "2020-01-01,2020-02-01", "2020-03-01"]
+        assert len(_vintage_dates_chunker(",".join(vintage_dates(1200)))) == 3
+
+    def test_merger_joins_periods_across_chunk_boundaries(self):
+        chunks = ["2020-01-01,2020-02-01", "2020-03-01,2020-04-01"]
+        responses = [
+            {"count": 2, "offset": 0, "observations": [
+                {"realtime_start": "2020-01-01", "realtime_end": "2020-01-01", "date": "2019-10-01", "value": "1.0"},
+                {"realtime_start": "2020-02-01", "realtime_end": "2020-02-01", "date": "2019-10-01", "value": "1.1"},
+            ]},
+            {"observations": {
+                "realtime_start": ["2020-03-01", "2020-04-01"],
+                "realtime_end": ["2020-03-01", "2020-04-01"],
+                "date": ["2019-10-01", "2019-10-01"],
+                "value": ["1.1", "1.2"],
+            }},
+        ]
+        merged = _vintage_chunks_merger(responses, chunks)
+        assert merged["count"] == 3 and "offset" not in merged
+        assert merged["observations"]["realtime_end"] == ["2020-01-01", "2020-03-01", "2020-04-01"]
+        assert merged["observations"]["value"] == ["1.0", "1.1", "1.2"]
+
+    def test_merger_sorts_rows_by_date_then_realtime_start(self):
+        chunks = ["2020-01-01", "2020-02-01"]
+        responses = [
+            {"observations": [
+                {"realtime_start": "2020-01-01", "realtime_end": "2020-01-01", "date": "2019-10-01", "value": "1.0"},
+                {"realtime_start": "2020-01-01", "realtime_end": "2020-01-01", "date": "2019-11-01", "value": "2.0"},
+            ]},
+            {"observations": [
+                {"realtime_start": "2020-02-01", "realtime_end": "2020-02-01", "date": "2019-10-01", "value": "1.5"},
+                {"realtime_start": "2020-02-01", "realtime_end": "2020-02-01", "date": "2019-11-01", "value": "2.0"},
+                {"realtime_start": "2020-02-01", "realtime_end": "2020-02-01", "date": "2019-12-01", "value": "3.0"},
+            ]},
+        ]
+        merged = _vintage_chunks_merger(responses, chunks)["observations"]
+        assert merged["date"] == ["2019-10-01", "2019-10-01", "2019-11-01", "2019-12-01"]
+        assert merged["realtime_start"] == ["2020-01-01", "2020-02-01", "2020-01-01", "2020-02-01"]
+        assert merged["value"] == ["1.0", "1.5", "2.0", "3.0"]
+        assert merged["realtime_end"][2] == "2020-02-01"
+
+    def test_merger_joins_vintage_columns_on_date(self):
+        responses = [
+            {"observations": [{"date": "2019-10-01", "GDP_20200101": "1.0"}]},
+            {"observations": [{"date": "2019-07-01", "GDP_20200301": "0.9"}, {"date": "2019-10-01", "GDP_20200301": "1.1"}]},
+        ]
+        merged = _vintage_chunks_merger(responses, ["2020-01-01", "2020-03-01"], output_type=2)["observations"]
+        assert merged == {"date": ["2019-07-01", "2019-10-01"], "GDP_20200101": [None, "1.0"], "GDP_20200301": ["0.9", "1.1"]}
+
+    @staticmethod
+    def fake_vintage_requests(calls):
+        def rows(data):
+            return [{"realtime_start": vintage, "realtime_end": vintage, "date": "1999-01-01", "value": "1.0"}
+                    for vintage in data["vintage_dates"].split(",")]
+
+        def fake_get(url_endpoint, data):
+            calls.append(data["vintage_dates"].count(",") + 1)
+            return {"observations": rows(data)}
+
+        async def fake_get_async(url_endpoint, data):
+            await asyncio.sleep(0)
+            return fake_get(url_endpoint, data)
+        return fake_get, fake_get_async
+
+    def test_sync_get_series_observations_splits_long_vintage_lists(self):
+        fred = Fred(api_key="test_key")
+        calls = []
+        fake_get, _ = self.fake_vintage_requests(calls)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            df = fred.get_series_observations("GNPCA", vintage_dates=vintage_dates(1200))
+        assert sorted(calls) == [200, 500, 500]
+        # the unchanged value at each of the two chunk boundaries is joined into one real-time period
+        assert len(df) == 1198
+        assert df["realtime_start"].is_monotonic_increasing
+        joined = df[df["realtime_start"] == "2041-08-01"]
+        assert joined["realtime_end"].tolist() == ["2041-09-01"]
+
+    @pytest.mark.asyncio
+    async def test_async_get_series_observations_splits_long_vintage_lists(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls = []
+        _, fake_get_async = self.fake_vintage_requests(calls)
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_get_async):
+            df = await fred.get_series_observations("GNPCA", vintage_dates=",".join(vintage_dates(600)))
+            single = await fred.get_series_observations("GNPCA", vintage_dates=vintage_dates(3))
+        assert calls == [500, 100, 3]
+        assert len(df) == 599 and len(single) == 3
+
+class TestThreadSafeRequests:
+    def test_rate_limiter_serializes_worker_threads(self):
+        fred = Fred(api_key="test_key")
+        fred.max_requests_per_minute = 5
+        held = []
+        with patch("fedfred.clients.fred.time.sleep", side_effect=lambda seconds: held.append(fred._rate_lock.locked())):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: fred._Fred__rate_limited(), range(20)))
+        assert len(fred.request_times) == 20
+        assert len(held) == 16 and all(held)
+
+    def test_vintage_chunks_share_the_locked_cache(self, monkeypatch):
+        sent = []
+        guard = threading.Lock()
+
+        def handler(request):
+            with guard:
+                sent.append(request.url.params["vintage_dates"])
+            first = request.url.params["vintage_dates"].split(",")[0]
+            return httpx.Response(200, json={"observations": [
+                {"realtime_start": first, "realtime_end": first, "date": "2020-01-01", "value": str(len(sent))}]})
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        fred = Fred(api_key="test_key")
+        fred.max_requests_per_minute = 6000
+        first = fred.get_series_observations("GNPCA", vintage_dates=vintage_dates(1200))
+        second = fred.get_series_observations("GNPCA", vintage_dates=vintage_dates(1200))
+        assert len(sent) == 3 and len(fred.cache) == 3
+        assert first.equals(second)
+
+    def test_sync_wrappers_run_from_threads_on_private_loop_primitives(self, monkeypatch):
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"observations": OBSERVATIONS[request.url.params["series_id"]]})
+
+        original = httpx.AsyncClient.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "__init__", init)
+        fred = Fred(api_key="test_key", cache_mode=False)
+        fred.max_requests_per_minute = 6000
+        lock, semaphore = fred.lock, fred.semaphore
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            batches = list(executor.map(lambda _: fred.get_series_observations_many(["GDP", "UNRATE"]), range(4)))
+        assert all(batch.succeeded and len(batch.data) == 4 for batch in batches)
+        assert fred.lock is lock and fred.semaphore is semaphore
+        assert len(fred.request_times) == 8
+
+    @pytest.mark.asyncio
+    async def test_async_limiter_waits_for_sync_threads(self):
+        fred = Fred(api_key="test_key")
+        fred.max_requests_per_minute = 6000
+        fred._rate_lock.acquire()
+        try:
+            task = asyncio.ensure_future(AsyncFred(fred)._AsyncFred__rate_limited())
+            await asyncio.sleep(0.05)
+            assert not task.done() and len(fred.request_times) == 0
+        finally:
+            fred._rate_lock.release()
+        await task
+        assert len(fred.request_times) == 1
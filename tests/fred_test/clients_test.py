@@ -2058,7 +2058,7 @@ class TestFredAPI:
 
         # Test invalid dataframe_method
         with patch.object(api, "_FredAPI__fred_get_request", return_value=fake_response):
-            with pytest.raises(ValueError, match="dataframe_method must be a string, options are: 'pandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="dataframe_method must be a string, options are: 'pandas', 'polars', 'polars_lazy', 'arrow', or 'dask'"):
                 api.get_series_observations("GNPCA", dataframe_method="invalid")
 
     def test_get_series_release(self):
@@ -3902,7 +3902,7 @@ class TestFredMapsAPI:
 
             # invalid geodataframe_method
             mock_get.reset_mock(); mock_extract.reset_mock(); mock_shape.reset_mock()
-            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'"):
                 maps_api.get_series_data("MAPCPI", geodataframe_method="invalid")
 
             # shapefile not a GeoDataFrame
@@ -4262,7 +4262,7 @@ class TestFredMapsAPI:
 
             # invalid geodataframe_method
             mock_get.reset_mock(); mock_extract.reset_mock(); mock_shape.reset_mock()
-            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'"):
                 maps_api.get_regional_data(
                     series_group="882",
                     region_type="state",
@@ -6435,7 +6435,7 @@ class TestAsyncFredAPI:
 
         # Test invalid dataframe_method
         with patch.object(async_api, "_AsyncFredAPI__fred_get_request", AsyncMock(return_value=fake_response)):
-            with pytest.raises(ValueError, match="dataframe_method must be a string, options are: 'pandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="dataframe_method must be a string, options are: 'pandas', 'polars', 'polars_lazy', 'arrow', or 'dask'"):
                 await async_api.get_series_observations("GNPCA", dataframe_method="invalid")
 
     @pytest.mark.asyncio
@@ -8379,7 +8379,7 @@ class TestAsyncFredMapsAPI:
                 assert result == "pl_gdf"
 
             # invalid geodataframe_method
-            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'"):
                 await maps_api.get_series_data("SMU56000000500000001", geodataframe_method="invalid")
 
         # shapefile not a GeoDataFrame
@@ -8718,7 +8718,7 @@ class TestAsyncFredMapsAPI:
                 assert result == "pl_gdf"
 
             # invalid geodataframe_method
-            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', or 'dask'"):
+            with pytest.raises(ValueError, match="geodataframe_method must be 'geopandas', 'polars', 'dask', or 'arrow'"):
                 await maps_api.get_regional_data(
                     series_group="882",
                     region_type="state",
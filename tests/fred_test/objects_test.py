@@ -27,6 +27,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 import pandas as pd
 from fedfred.models.fred import Category, Series, Tag, Release, ReleaseDate, Source, Element, VintageDate, SeriesGroup, BulkRelease
+from fedfred._core import _element_table_flattener, _element_dataframe_converter
 from fedfred.__about__ import __title__, __version__, __author__, __email__, __license__, __copyright__, __description__, __docs__, __repository__
 
 class TestCategory:
@@ -1771,6 +1772,55 @@ class TestElement:
         assert series == [mock_series]
         assert series[0].title == "Real Gross Domestic Product"
 
+    def test_element_to_object_deep_table(self):
+        depth = 5000
+        def element(element_id, parent_id):
+            return {"element_id": element_id, "release_id": 1, "series_id": f"S{element_id}", "parent_id": parent_id,
+                    "line": str(element_id), "type": "series", "name": f"Element {element_id}", "level": str(element_id - 1),
+                    "children": []}
+        root = element(1, 0)
+        node = root
+        for element_id in range(2, depth + 1):
+            child = element(element_id, element_id - 1)
+            node["children"].append(child)
+            node = child
+        root["children"].append(element(depth + 1, 1))
+        elements = Element.to_object({"elements": {"1": root, "2": element(depth + 2, 0)}})
+        assert [top.element_id for top in elements] == [1, depth + 2]
+        assert [child.element_id for child in elements[0].children] == [2, depth + 1]
+        node, seen = elements[0], 1
+        while node.children:
+            node = node.children[0]
+            seen += 1
+        assert seen == depth and node.element_id == depth
+
+    def test_element_table_flat_frame(self):
+        response = {
+            "elements": {
+                "1": {"element_id": 1, "release_id": 1, "series_id": "S1", "parent_id": 0, "line": "1",
+                      "type": "series", "name": "Element 1", "level": "0",
+                      "children": [{"element_id": 2, "release_id": 1, "series_id": "S2", "parent_id": 1, "line": "2",
+                                    "type": "series", "name": "Element 2", "level": "1", "children": []}]},
+                "3": {"element_id": 3, "release_id": 1, "series_id": "S3", "parent_id": 0, "line": "3",
+                      "type": "series", "name": "Element 3", "level": "0", "children": []},
+            }
+        }
+        columns = _element_table_flattener(response)
+        assert columns["parent_position"] == [-1, 0, -1]
+        df = _element_dataframe_converter(columns)
+        assert list(df.columns) == ["element_id", "parent_id", "level", "series_id", "type", "name", "line"]
+        assert df["element_id"].tolist() == [1, 2, 3]
+        assert df["parent_id"].tolist() == [0, 1, 0]
+        assert df["level"].tolist() == [0, 1, 0]
+        pl = pytest.importorskip("polars")
+        assert _element_dataframe_converter(columns, "polars")["level"].dtype == pl.Int16
+        pytest.importorskip("pyarrow")
+        assert _element_dataframe_converter(columns, "arrow").column("series_id").to_pylist() == ["S1", "S2", "S3"]
+        with pytest.raises(ValueError, match="dataframe_method"):
+            _element_dataframe_converter(columns, "dask")
+        with pytest.raises(ValueError, match="Missing 'elements'"):
+            _element_table_flattener({})
+
 class TestVintageDate:
     def test_vintage_date_to_object(self):
         response = {
@@ -0,0 +1,451 @@
+# filepath: /test/pagination_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the paginated iterators of the clients module.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import time
+from itertools import islice
+from unittest.mock import patch
+import httpx
+import pytest
+from fedfred import Fred, AsyncFred
+from fedfred.cache import _CACHE_BYPASS
+from fedfred._core import _panel_dataframe_converter
+
+def tags_page(total, limit, offset):
+    names = [f"tag{i}" for i in range(offset, min(offset + limit, total))]
+    return {
+        "count": total,
+        "offset": offset,
+        "limit": limit,
+        "tags": [{"name": name, "group_id": "gen", "notes": None, "created": "2012-02-27 10:18:19-06",
+                  "popularity": 1, "series_count": 1} for name in names],
+    }
+
+def vintage_dates_page(total, limit, offset):
+    dates = [f"{2000 + index // 12:04d}-{index % 12 + 1:02d}-01" for index in range(offset, min(offset + limit, total))]
+    return {"count": total, "offset": offset, "limit": limit, "vintage_dates": dates}
+
+def series_page(total, limit, offset):
+    ids = [f"S{i}" for i in range(offset, min(offset + limit, total))]
+    return {
+        "count": total,
+        "offset": offset,
+        "limit": limit,
+        "seriess": [{"id": series_id, "title": series_id, "frequency": "Monthly", "frequency_short": "M",
+                     "units": "Index", "units_short": "Index", "seasonal_adjustment": "Not Seasonally Adjusted",
+                     "seasonal_adjustment_short": "NSA", "last_updated": "2024-01-01"} for series_id in ids],
+    }
+
+def mock_tags_transport(monkeypatch, client_class, total):
+    def handler(request):
+        return httpx.Response(200, json=tags_page(total, int(request.url.params["limit"]), int(request.url.params["offset"])))
+
+    original = client_class.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(client_class, "__init__", init)
+
+class TestFredPagination:
+    @staticmethod
+    def paged(page, total):
+        calls = []
+
+        def fake_get(url_endpoint, data):
+            calls.append((url_endpoint, dict(data)))
+            return page(total, data["limit"], data["offset"])
+
+        return calls, fake_get
+
+    def test_iter_tags_walks_every_page(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(tags_page, 5)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            names = [tag.name for tag in fred.iter_tags(search_text="gdp", page_size=2)]
+        assert names == [f"tag{i}" for i in range(5)]
+        assert [data["offset"] for _, data in calls] == [0, 2, 4]
+        assert all(url == "/tags" and data["search_text"] == "gdp" for url, data in calls)
+
+    def test_pages_are_fetched_lazily(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(series_page, 10_000)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            iterator = fred.iter_category_series(125, page_size=100)
+            assert calls == []
+            first = list(islice(iterator, 150))
+        assert [s.id for s in first[:2]] == ["S0", "S1"]
+        assert len(calls) == 2
+
+    def test_limit_and_offset(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(series_page, 100)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            ids = [s.id for s in fred.iter_release_series(51, offset=10, limit=25, page_size=10)]
+        assert ids == [f"S{i}" for i in range(10, 35)]
+        assert [(data["offset"], data["limit"]) for _, data in calls] == [(10, 10), (20, 10), (30, 5)]
+
+    def test_exact_multiple_stops_at_count(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(series_page, 4)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            assert len(list(fred.iter_series_search("gdp", page_size=2))) == 4
+        assert len(calls) == 2
+
+    def test_empty_result(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(series_page, 0)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            assert list(fred.iter_tags_series("slovenia")) == []
+        assert len(calls) == 1
+
+    def test_iter_series_vintagedates_pages_and_empty_period(self):
+        fred = Fred(api_key="test_key")
+        calls, fake_get = self.paged(vintage_dates_page, 25)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get):
+            dates = [vintage.vintage_date for vintage in fred.iter_series_vintagedates("GNPCA", page_size=10)]
+        assert len(dates) == 25 and dates[-1] == "2002-01-01"
+        assert len(calls) == 3
+        _, fake_empty = self.paged(vintage_dates_page, 0)
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_empty):
+            assert next(fred.iter_series_vintagedates("GNPCA", realtime_start="2030-01-01"), None) is None
+
+    def test_pages_bypass_the_response_cache(self, monkeypatch):
+        mock_tags_transport(monkeypatch, httpx.Client, 5)
+        fred = Fred(api_key="test_key")
+        bypassed = [_CACHE_BYPASS.get() for _ in fred.iter_tags(page_size=2)]
+        assert bypassed == [False] * 5
+        assert fred.keys == []
+
+    def test_invalid_arguments_fail_eagerly(self):
+        fred = Fred(api_key="test_key")
+        with pytest.raises(ValueError, match="page_size"):
+            fred.iter_releases(page_size=1001)
+        with pytest.raises(ValueError, match="limit"):
+            fred.iter_sources(limit=0)
+        with pytest.raises(ValueError, match="category_id"):
+            fred.iter_category_series(-1)
+
+class TestAsyncFredPagination:
+    @staticmethod
+    def paged(page, total, delays=None, include_count=True):
+        calls = []
+        state = {"in_flight": 0, "max_in_flight": 0}
+
+        async def fake_get(url_endpoint, data):
+            calls.append((url_endpoint, dict(data)))
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            try:
+                await asyncio.sleep((delays or {}).get(data["offset"], 0.0))
+                response = page(total, data["limit"], data["offset"])
+            finally:
+                state["in_flight"] -= 1
+            if not include_count:
+                del response["count"]
+            return response
+
+        return calls, state, fake_get
+
+    @pytest.mark.asyncio
+    async def test_prefetches_pages_and_yields_in_order(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        delays = {10: 0.05, 20: 0.01, 30: 0.0}
+        calls, state, fake_get = self.paged(series_page, 35, delays)
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            ids = [s.id async for s in async_fred.iter_tags_series("gdp", page_size=10)]
+        assert ids == [f"S{i}" for i in range(35)]
+        assert [(data["offset"], data["limit"]) for _, data in calls] == [(0, 10), (10, 10), (20, 10), (30, 5)]
+        assert state["max_in_flight"] == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_window_and_limit(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        calls, state, fake_get = self.paged(tags_page, 10_000)
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            names = [tag.name async for tag in async_fred.iter_tags(page_size=100, limit=950, prefetch=2)]
+        assert len(names) == 950 and names[-1] == "tag949"
+        assert calls[-1][1] == {"limit": 50, "offset": 900}
+        assert state["max_in_flight"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_pending_pages(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        calls, state, fake_get = self.paged(series_page, 100, {offset: 1.0 for offset in range(10, 100, 10)})
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            iterator = async_fred.iter_category_series(125, page_size=10, prefetch=4)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0)
+            await iterator.aclose()
+        assert first.id == "S0"
+        assert len(calls) == 5
+        assert state["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_without_count_pages_serially(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        calls, state, fake_get = self.paged(series_page, 25, include_count=False)
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            ids = [s.id async for s in async_fred.iter_release_series(51, page_size=10)]
+        assert len(ids) == 25
+        assert [data["offset"] for _, data in calls] == [0, 10, 20]
+        assert state["max_in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_iter_series_vintagedates(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls, _, fake_get = self.paged(vintage_dates_page, 25)
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            dates = [vintage.vintage_date async for vintage in fred.iter_series_vintagedates("GNPCA", page_size=10)]
+        assert len(dates) == 25 and len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_pages_bypass_the_response_cache(self, monkeypatch):
+        mock_tags_transport(monkeypatch, httpx.AsyncClient, 5)
+        fred = Fred(api_key="test_key")
+        bypassed = [_CACHE_BYPASS.get() async for _ in AsyncFred(fred).iter_tags(page_size=2)]
+        assert bypassed == [False] * 5
+        assert fred.keys == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        with pytest.raises(ValueError, match="prefetch"):
+            await async_fred.iter_sources(prefetch=0).__anext__()
+        with pytest.raises(ValueError, match="page_size"):
+            await async_fred.iter_releases(page_size=0).__anext__()
+
+def cursor_page(cursor, pages):
+    index = 0 if cursor is None else int(cursor)
+    has_more = index + 1 < pages
+    return {"page": index, "has_more": has_more, "next_cursor": str(index + 1) if has_more else None}
+
+class TestReleaseObservationsCursor:
+    def test_sync_prefetches_next_cursor(self):
+        fred = Fred(api_key="test_key")
+        calls = []
+        second_started = threading.Event()
+
+        def fake_get(url_endpoint, data):
+            calls.append(dict(data))
+            if data.get("next_cursor") == "1":
+                second_started.set()
+            return cursor_page(data.get("next_cursor"), 3)
+
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object", side_effect=lambda response, client=None: response["page"]):
+            iterator = fred.iter_release_observations(18, limit=500)
+            assert next(iterator) == 0
+            assert second_started.wait(1.0)
+            assert list(iterator) == [1, 2]
+        assert [call.get("next_cursor") for call in calls] == [None, "1", "2"]
+        assert all(call["release_id"] == 18 and call["limit"] == 500 for call in calls)
+
+    def test_sync_pages_bypass_the_response_cache(self):
+        fred = Fred(api_key="test_key")
+        bypassed = []
+
+        def fake_get(url_endpoint, data):
+            bypassed.append(_CACHE_BYPASS.get())
+            return cursor_page(data.get("next_cursor"), 3)
+
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object", side_effect=lambda response, client=None: response["page"]):
+            assert list(fred.iter_release_observations(18)) == [0, 1, 2]
+        assert bypassed == [True, True, True]
+        assert not _CACHE_BYPASS.get()
+
+    def test_sync_early_exit(self):
+        fred = Fred(api_key="test_key")
+        calls = []
+
+        def fake_get(url_endpoint, data):
+            calls.append(data.get("next_cursor"))
+            return cursor_page(data.get("next_cursor"), 100)
+
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object", side_effect=lambda response, client=None: response["page"]):
+            assert list(islice(fred.iter_release_observations(18), 2)) == [0, 1]
+            time.sleep(0.05)
+        assert len(calls) <= 3
+
+    @pytest.mark.asyncio
+    async def test_async_overlaps_fetch_and_consumption(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+
+        async def fake_get(url_endpoint, data):
+            await asyncio.sleep(0.05)
+            return cursor_page(data.get("next_cursor"), 4)
+
+        async def to_object(response):
+            return response["page"]
+
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object_async", side_effect=to_object):
+            start = time.monotonic()
+            pages = []
+            async for page in async_fred.iter_release_observations(18):
+                pages.append(page)
+                await asyncio.sleep(0.05)
+            elapsed = time.monotonic() - start
+        assert pages == [0, 1, 2, 3]
+        assert elapsed < 0.38
+
+    @pytest.mark.asyncio
+    async def test_async_pages_bypass_the_response_cache(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        bypassed = []
+
+        async def fake_get(url_endpoint, data):
+            bypassed.append(_CACHE_BYPASS.get())
+            return cursor_page(data.get("next_cursor"), 3)
+
+        async def to_object(response):
+            return response["page"]
+
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object_async", side_effect=to_object):
+            pages = [page async for page in async_fred.iter_release_observations(18)]
+        assert pages == [0, 1, 2]
+        assert bypassed == [True, True, True]
+        assert not _CACHE_BYPASS.get()
+
+    @pytest.mark.asyncio
+    async def test_async_early_exit_cancels_prefetch(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+        cancelled = []
+
+        async def fake_get(url_endpoint, data):
+            try:
+                await asyncio.sleep(0 if data.get("next_cursor") is None else 1.0)
+            except asyncio.CancelledError:
+                cancelled.append(data.get("next_cursor"))
+                raise
+            return cursor_page(data.get("next_cursor"), 5)
+
+        async def to_object(response):
+            return response["page"]
+
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get), \
+             patch("fedfred.clients.fred.BulkRelease.to_object_async", side_effect=to_object):
+            iterator = async_fred.iter_release_observations(18)
+            assert await iterator.__anext__() == 0
+            await asyncio.sleep(0)
+            await iterator.aclose()
+        assert cancelled == ["1"]
+
+def bulk_page(cursor):
+    pages = [
+        [("GDP", [("2020-01-01", "1.5"), ("2020-04-01", "2.5")]), ("UNRATE", [("2020-01-01", "3.5")])],
+        [("UNRATE", [("2020-04-01", ".")]), ("CPI", [("2020-04-01", "250.1")])],
+    ]
+    index = 0 if cursor is None else int(cursor)
+    has_more = index + 1 < len(pages)
+    return {
+        "release": {"id": 53, "name": "Gross Domestic Product"},
+        "has_more": has_more,
+        "next_cursor": str(index + 1) if has_more else None,
+        "series": [{"series_id": series_id, "title": series_id,
+                    "observations": [{"date": date, "value": value} for date, value in observations]}
+                   for series_id, observations in pages[index]],
+    }
+
+class TestReleaseObservationsFrame:
+    @staticmethod
+    def fred():
+        fred = Fred(api_key="test_key")
+        return fred, patch.object(fred, "_Fred__fred_get_request", side_effect=lambda url, data: bulk_page(data.get("next_cursor")))
+
+    def test_pandas_long_without_model_objects(self):
+        fred, patched = self.fred()
+        with patched, patch("fedfred.clients.fred.BulkRelease.to_object") as to_object:
+            df = fred.get_release_observations(53, dataframe_method="pandas")
+        to_object.assert_not_called()
+        assert list(df.columns) == ["series_id", "date", "value"]
+        assert list(df["series_id"]) == ["GDP", "GDP", "UNRATE", "UNRATE", "CPI"]
+        assert str(df["date"].dtype).startswith("datetime64")
+        assert df["value"].isna().sum() == 1
+
+    def test_pandas_wide(self):
+        fred, patched = self.fred()
+        with patched:
+            df = fred.get_release_observations(53, dataframe_method="pandas", layout="wide")
+        assert sorted(df.columns) == ["CPI", "GDP", "UNRATE"]
+        assert df.shape == (2, 3)
+        assert df.loc["2020-04-01", "CPI"] == pytest.approx(250.1)
+
+    def test_polars(self):
+        pl = pytest.importorskip("polars")
+        fred, patched = self.fred()
+        with patched:
+            long = fred.get_release_observations(53, dataframe_method="polars")
+            wide = fred.get_release_observations(53, dataframe_method="polars", layout="wide")
+        assert long.schema["date"] == pl.Date and long.schema["value"] == pl.Float64
+        assert long["value"].null_count() == 1
+        assert wide.columns == ["date", "GDP", "UNRATE", "CPI"]
+        assert wide.height == 2
+
+    def test_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        fred, patched = self.fred()
+        with patched:
+            long = fred.get_release_observations(53, dataframe_method="arrow")
+            wide = fred.get_release_observations(53, dataframe_method="arrow", layout="wide")
+        assert long.num_rows == 5 and long.schema.field("date").type == pa.date32()
+        assert long.column("value").null_count == 1
+        assert wide.column_names == ["date", "GDP", "UNRATE", "CPI"]
+        assert wide.column("UNRATE").to_pylist() == [3.5, None]
+        assert wide.column("CPI").to_pylist() == [None, 250.1]
+
+    def test_wide_rejects_repeated_dates_in_every_backend(self):
+        columns = {"series_id": ["GDP", "GDP", "CPI"], "date": ["2020-01-01", "2020-01-01", "2020-01-01"],
+                   "value": ["1.0", "2.0", "3.0"]}
+        methods = ["pandas"] + [method for method, module in (("polars", "polars"), ("arrow", "pyarrow"))
+                                if importlib.util.find_spec(module)]
+        for method in methods:
+            with pytest.raises(ValueError, match="GDP has 2020-01-01 more than once"):
+                _panel_dataframe_converter(columns, method, "wide")
+            assert len(_panel_dataframe_converter(columns, method, "long")) == 3
+
+    def test_invalid_options(self):
+        fred = Fred(api_key="test_key")
+        with pytest.raises(ValueError, match="dataframe_method"):
+            fred.get_release_observations(53, dataframe_method="dask")
+        with pytest.raises(ValueError, match="layout"):
+            fred.get_release_observations(53, dataframe_method="pandas", layout="panel")
+
+    @pytest.mark.asyncio
+    async def test_async_pandas_wide(self):
+        async_fred = AsyncFred(Fred(api_key="test_key"))
+
+        async def fake_get(url_endpoint, data):
+            return bulk_page(data.get("next_cursor"))
+
+        with patch.object(async_fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            df = await async_fred.get_release_observations(53, dataframe_method="pandas", layout="wide")
+        assert df.shape == (2, 3)
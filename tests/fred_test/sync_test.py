@@ -0,0 +1,146 @@
+# filepath: /test/sync_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the incremental observation sync of the clients module.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import httpx
+import pandas as pd
+import pytest
+from fedfred import Fred, AsyncFred
+
+HISTORY = {f"2024-{month:02d}-01": str(month) for month in range(1, 13)}
+
+def observations_since(observation_start, history):
+    return [{"realtime_start": "2025-01-01", "realtime_end": "2025-01-01", "date": date, "value": value}
+            for date, value in history.items() if observation_start is None or date >= observation_start]
+
+def fake_observations(calls, history):
+    def fake_get(url_endpoint, data):
+        calls.append(data.get("observation_start"))
+        return {"observations": observations_since(data.get("observation_start"), history)}
+    return fake_get
+
+def mock_transport(monkeypatch, client_class, sent):
+    def handler(request):
+        sent.append(request.url.params["observation_start"])
+        return httpx.Response(200, json={"observations": observations_since(request.url.params["observation_start"], HISTORY)})
+
+    original = client_class.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(client_class, "__init__", init)
+
+class TestFredSyncObservations:
+    def test_full_then_incremental_with_revision_window(self):
+        fred = Fred(api_key="test_key")
+        calls = []
+        history = dict(list(HISTORY.items())[:10])
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_observations(calls, history)):
+            stored = fred.sync_series_observations("UNRATE")
+            history.update({"2024-10-01": "10.5", "2024-11-01": "11", "2024-12-01": "12"})
+            stored = fred.sync_series_observations("UNRATE", stored=stored, revision_window=timedelta(days=30))
+        assert calls == [None, "2024-09-01"]
+        assert len(stored) == 12
+        assert stored.index.is_monotonic_increasing
+        assert stored.loc["2024-10-01", "value"] == 10.5
+        assert stored.loc["2024-01-01", "value"] == 1.0
+
+    def test_no_new_data_returns_stored(self):
+        fred = Fred(api_key="test_key")
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_observations([], HISTORY)):
+            stored = fred.sync_series_observations("UNRATE")
+        with patch.object(fred, "_Fred__fred_get_request", return_value={"observations": []}):
+            assert fred.sync_series_observations("UNRATE", stored=stored) is stored
+            empty = fred.sync_series_observations("UNRATE", stored="2030-01-01")
+        assert empty.empty and "value" in empty.columns
+
+    def test_watermark_returns_only_new_rows(self):
+        fred = Fred(api_key="test_key")
+        calls = []
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_observations(calls, HISTORY)):
+            new_rows = fred.sync_series_observations("UNRATE", stored=datetime(2024, 11, 1), revision_window=0)
+        assert calls == ["2024-11-01"]
+        assert new_rows["value"].tolist() == [11.0, 12.0]
+
+    def test_polars_stored_frame(self):
+        pl = pytest.importorskip("polars")
+        fred = Fred(api_key="test_key")
+        stored = pl.DataFrame({"realtime_start": ["2025-01-01"] * 2, "realtime_end": ["2025-01-01"] * 2,
+                               "date": ["2024-11-01", "2024-12-01"], "value": [0.0, 0.0]})
+        calls = []
+        with patch.object(fred, "_Fred__fred_get_request", side_effect=fake_observations(calls, HISTORY)):
+            merged = fred.sync_series_observations("UNRATE", stored=stored)
+        assert calls == ["2024-12-01"]
+        assert merged["value"].to_list() == [0.0, 12.0]
+
+    def test_repeated_sync_bypasses_the_response_cache(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.Client, sent)
+        fred = Fred(api_key="test_key")
+        for _ in range(2):
+            new_rows = fred.sync_series_observations("UNRATE", stored="2024-12-01", revision_window=0)
+        assert sent == ["2024-12-01", "2024-12-01"]
+        assert new_rows["value"].tolist() == [12.0]
+        assert fred.keys == []
+
+    def test_validation(self):
+        fred = Fred(api_key="test_key")
+        with pytest.raises(ValueError, match="revision_window"):
+            fred.sync_series_observations("UNRATE", stored="2024-01-01", revision_window=-1)
+        with pytest.raises(ValueError, match="dataframe_method"):
+            fred.sync_series_observations("UNRATE", dataframe_method="dask")
+        with pytest.raises(ValueError, match="stored"):
+            fred.sync_series_observations("UNRATE", stored=[1, 2])  # type: ignore[arg-type]
+
+class TestAsyncFredSyncObservations:
+    @pytest.mark.asyncio
+    async def test_incremental_merge(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls = []
+        sync_fake = fake_observations(calls, HISTORY)
+
+        async def fake_get(url_endpoint, data):
+            return sync_fake(url_endpoint, data)
+
+        stored = pd.DataFrame({"realtime_start": ["2025-01-01"], "realtime_end": ["2025-01-01"], "value": [1.0]},
+                              index=pd.DatetimeIndex(["2024-01-01"], name="date"))
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_get):
+            merged = await fred.sync_series_observations("UNRATE", stored=stored, revision_window=0)
+        assert calls == ["2024-01-01"]
+        assert len(merged) == 12
+
+    @pytest.mark.asyncio
+    async def test_repeated_sync_bypasses_the_response_cache(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.AsyncClient, sent)
+        fred = Fred(api_key="test_key")
+        async_fred = AsyncFred(fred)
+        for _ in range(2):
+            await async_fred.sync_series_observations("UNRATE", stored="2024-12-01", revision_window=0)
+        assert sent == ["2024-12-01", "2024-12-01"]
+        assert fred.keys == []
@@ -0,0 +1,250 @@
+# filepath: /test/cache_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the cache module.
+"""
+
+import fnmatch
+import httpx
+import pytest
+from cachetools.keys import hashkey
+from fedfred import Fred, AsyncFred, GeoFred, Fraser
+from fedfred.cache import RedisCache, _bypass_cache
+from fedfred.clients.geofred import AsyncGeoFred
+
+class InProcessRedis:
+    """In-process stand-in for a Redis server, recording the TTL of every write."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if key in self.store:
+                del self.store[key]
+                self.ttls.pop(key, None)
+                removed += 1
+        return removed
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def scan_iter(self, match="*"):
+        return [key.encode() for key in list(self.store) if fnmatch.fnmatch(key, match)]
+
+class AsyncInProcessRedis:
+    """Asynchronous view over an InProcessRedis server."""
+
+    def __init__(self, server):
+        self.server = server
+
+    async def get(self, key):
+        return self.server.get(key)
+
+    async def set(self, key, value, ex=None):
+        return self.server.set(key, value, ex=ex)
+
+class UnreachableRedis:
+    """Stand-in for a Redis server that has gone away."""
+
+    def get(self, key):
+        raise ConnectionError("Connection refused")
+
+    def set(self, key, value, ex=None):
+        raise ConnectionError("Connection refused")
+
+class AsyncUnreachableRedis:
+    """Asynchronous stand-in for a Redis server that has gone away."""
+
+    async def get(self, key):
+        raise ConnectionError("Connection refused")
+
+    async def set(self, key, value, ex=None):
+        raise ConnectionError("Connection refused")
+
+def mock_transport(monkeypatch, client_class, sent):
+    def handler(request):
+        sent.append(request.url.path)
+        return httpx.Response(200, json={"seriess": [{"id": "GNPCA"}]})
+
+    original = client_class.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(client_class, "__init__", init)
+
+class TestRedisCache:
+    def test_init_validation(self):
+        with pytest.raises(ValueError, match="Either client or url must be provided"):
+            RedisCache()
+        with pytest.raises(ValueError, match="ttl must be a positive integer"):
+            RedisCache(client=InProcessRedis(), ttl=0)
+        with pytest.raises(ValueError, match="ttl must be a positive integer"):
+            RedisCache(client=InProcessRedis(), ttl=True)
+
+    def test_mapping_round_trip_with_ttl(self):
+        server = InProcessRedis()
+        cache = RedisCache(client=server, ttl=60, namespace="test")
+        key = hashkey("/series", (("series_id", "GNPCA"),))
+
+        assert key not in cache
+        cache[key] = {"seriess": [{"id": "GNPCA"}]}
+        assert key in cache
+        assert cache[key] == {"seriess": [{"id": "GNPCA"}]}
+        assert len(cache) == 1
+        assert all(k.startswith("test:") for k in cache.keys())
+        assert list(server.ttls.values()) == [60]
+
+        del cache[key]
+        with pytest.raises(KeyError):
+            cache[key]
+        with pytest.raises(KeyError):
+            del cache[key]
+
+    def test_clear_only_touches_namespace(self):
+        server = InProcessRedis()
+        server.set("other:key", b"1")
+        cache = RedisCache(client=server, namespace="fedfred")
+        cache[("a",)] = 1
+        cache[("b",)] = 2
+        cache.clear()
+        assert len(cache) == 0
+        assert server.get("other:key") == b"1"
+
+    def test_shared_between_instances(self):
+        server = InProcessRedis()
+        writer = RedisCache(client=server)
+        reader = RedisCache(client=server)
+        writer[("k",)] = [1, 2, 3]
+        assert reader[("k",)] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_async_get_set(self):
+        server = InProcessRedis()
+        cache = RedisCache(client=server, async_client=AsyncInProcessRedis(server), ttl=30)
+        assert await cache.aget(("missing",)) is None
+        await cache.aset(("k",), {"v": 1})
+        assert await cache.aget(("k",)) == {"v": 1}
+        assert cache[("k",)] == {"v": 1}
+        assert list(server.ttls.values()) == [30]
+
+    def test_server_errors_are_misses(self):
+        cache = RedisCache(client=UnreachableRedis())
+        with pytest.raises(KeyError):
+            cache[("k",)]
+        cache[("k",)] = {"v": 1}
+        assert cache.errors == 2
+
+    @pytest.mark.asyncio
+    async def test_async_server_errors_are_misses(self):
+        cache = RedisCache(client=UnreachableRedis(), async_client=AsyncUnreachableRedis())
+        assert await cache.aget(("k",)) is None
+        await cache.aset(("k",), {"v": 1})
+        assert cache.errors == 2
+
+    @pytest.mark.asyncio
+    async def test_async_falls_back_to_thread(self):
+        cache = RedisCache(client=InProcessRedis())
+        await cache.aset(("k",), "v")
+        assert await cache.aget(("k",)) == "v"
+
+class TestClientCacheBackend:
+    def test_fred_uses_backend(self):
+        cache = RedisCache(client=InProcessRedis())
+        fred = Fred(api_key="test_key", cache_backend=cache)
+        assert fred.cache is cache
+        assert GeoFred(fred).cache is cache
+        assert AsyncFred(fred).cache is cache
+
+    def test_del_keeps_shared_backend(self):
+        cache = RedisCache(client=InProcessRedis())
+        cache[("k",)] = 1
+        fred = Fred(api_key="test_key", cache_backend=cache)
+        fred.__del__()
+        assert cache[("k",)] == 1
+
+    def test_fred_stores_and_serves_responses(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.Client, sent)
+        server = InProcessRedis()
+        fred = Fred(api_key="test_key", cache_backend=RedisCache(client=server))
+        for _ in range(2):
+            assert fred._Fred__fred_get_request("/series", {"series_id": "GNPCA"}) == {"seriess": [{"id": "GNPCA"}]}
+        assert sent == ["/fred/series"]
+        assert len(server.store) == 1
+
+    def test_fred_survives_a_cache_outage(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.Client, sent)
+        cache = RedisCache(client=UnreachableRedis())
+        fred = Fred(api_key="test_key", cache_backend=cache)
+        for _ in range(2):
+            assert fred._Fred__fred_get_request("/series", {"series_id": "GNPCA"}) == {"seriess": [{"id": "GNPCA"}]}
+        assert len(sent) == 2
+        assert cache.errors >= 4
+
+    @pytest.mark.asyncio
+    async def test_async_fred_stores_and_serves_responses(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.AsyncClient, sent)
+        server = InProcessRedis()
+        fred = Fred(api_key="test_key", cache_backend=RedisCache(client=server, async_client=AsyncInProcessRedis(server)))
+        async_fred = AsyncFred(fred)
+        for _ in range(2):
+            assert await async_fred._AsyncFred__fred_get_request("/series", {"series_id": "GNPCA"}) == {"seriess": [{"id": "GNPCA"}]}
+        assert sent == ["/fred/series"]
+        assert len(server.store) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_geofred_honours_cache_bypass(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.AsyncClient, sent)
+        server = InProcessRedis()
+        fred = Fred(api_key="test_key", cache_backend=RedisCache(client=server, async_client=AsyncInProcessRedis(server)))
+        geofred = AsyncGeoFred(AsyncFred(fred))
+        with _bypass_cache():
+            for _ in range(2):
+                await geofred._AsyncGeoFred__fred_get_request("/regional/data", {"series_group": "882"})
+        assert len(sent) == 2
+        assert server.store == {}
+
+    def test_fraser_stores_and_serves_responses(self, monkeypatch):
+        sent = []
+        mock_transport(monkeypatch, httpx.Client, sent)
+        server = InProcessRedis()
+        fraser = Fraser(api_key="test_key", cache_backend=RedisCache(client=server))
+        for _ in range(2):
+            assert fraser._Fraser__fraser_get_request("/title/1") == {"seriess": [{"id": "GNPCA"}]}
+        assert len(sent) == 1
+        assert len(server.store) == 1
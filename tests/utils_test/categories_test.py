@@ -0,0 +1,143 @@
+# filepath: /test/categories_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the categories module.
+"""
+
+import asyncio
+from unittest.mock import patch
+import pytest
+from fedfred import Fred, AsyncFred, CategoryIndex
+
+TREE = {
+    0: (0, "Categories"),
+    1: (0, "Money"),
+    2: (0, "Population"),
+    10: (1, "Interest Rates"),
+    11: (1, "Exchange Rates"),
+    20: (2, "Employment"),
+    100: (10, "Treasury"),
+}
+SERIES = {10: ["FEDFUNDS"], 11: ["DEXUSEU", "DEXJPUS"], 20: ["UNRATE"], 100: ["DGS10", "FEDFUNDS"]}
+
+def build_index(pending=()):
+    return CategoryIndex(((category_id, parent_id, name) for category_id, (parent_id, name) in TREE.items()), SERIES, pending)
+
+def fake_tree_requests(calls, failing=()):
+    async def fake_get(url_endpoint, data):
+        category_id = data["category_id"]
+        calls.append((url_endpoint, category_id))
+        await asyncio.sleep(0)
+        if category_id in failing:
+            raise ValueError("Internal Server Error")
+        if url_endpoint == "/category":
+            return {"categories": [{"id": category_id, "name": TREE[category_id][1], "parent_id": TREE[category_id][0]}]}
+        if url_endpoint == "/category/children":
+            return {"categories": [{"id": child, "name": name, "parent_id": parent}
+                                   for child, (parent, name) in TREE.items() if parent == category_id and child != category_id]}
+        members = SERIES.get(category_id, [])
+        return {"count": len(members), "offset": 0, "limit": 1000,
+                "seriess": [{"id": series_id} for series_id in members]}
+    return fake_get
+
+class TestCategoryIndex:
+    def test_tree_queries(self):
+        index = build_index()
+        assert len(index) == 7 and 100 in index and 5 not in index
+        assert index.children(0) == [1, 2]
+        assert index.children(1) == [10, 11]
+        assert index.parent(100) == 10
+        assert index.parent(0) is None
+        assert index.path(100) == [0, 1, 10, 100]
+        assert index.name(20) == "Employment"
+        assert index.subtree(1).tolist() == [1, 10, 100, 11]
+        assert index.subtree(100).tolist() == [100]
+        with pytest.raises(KeyError):
+            index.children(5)
+
+    def test_series_membership(self):
+        index = build_index()
+        assert index.series(1) == []
+        assert index.series(1, recursive=True) == ["FEDFUNDS", "DGS10", "DEXUSEU", "DEXJPUS"]
+        assert index.series(0, recursive=True) == ["FEDFUNDS", "DGS10", "DEXUSEU", "DEXJPUS", "UNRATE"]
+        assert sorted(index.categories_of("FEDFUNDS")) == [10, 100]
+        assert index.categories_of("MISSING") == []
+
+    def test_save_load_round_trip(self, tmp_path):
+        index = build_index(pending=[20])
+        path = tmp_path / "categories.json"
+        index.save(path)
+        loaded = CategoryIndex.load(path)
+        assert loaded.category_ids.tolist() == index.category_ids.tolist()
+        assert loaded.series(0, recursive=True) == index.series(0, recursive=True)
+        assert loaded.pending == (20,)
+        assert not loaded.complete
+
+    def test_invalid_records(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            CategoryIndex([(1, 0, "a"), (1, 0, "b")])
+        with pytest.raises(ValueError, match="cycle"):
+            CategoryIndex([(1, 2, "a"), (2, 1, "b")])
+
+class TestCategoryCrawler:
+    @pytest.mark.asyncio
+    async def test_crawls_whole_tree(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        calls = []
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_tree_requests(calls)):
+            index = await fred.crawl_categories(max_concurrency=3)
+        assert index.complete
+        assert index.category_ids.tolist() == build_index().category_ids.tolist()
+        assert index.series(0, recursive=True) == build_index().series(0, recursive=True)
+        children_calls = [category_id for url, category_id in calls if url == "/category/children"]
+        assert sorted(children_calls) == sorted(TREE)
+        assert children_calls[:3] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failures_resume_from_checkpoint(self, tmp_path):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        path = tmp_path / "categories.json"
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_tree_requests([], failing={10})):
+            partial = await fred.crawl_categories(include_series=False, checkpoint_path=path, checkpoint_every=2)
+        assert partial.pending == (10,)
+        assert 100 not in partial
+        calls = []
+        with patch.object(fred, "_AsyncFred__fred_get_request", side_effect=fake_tree_requests(calls)):
+            index = await fred.crawl_categories(resume=CategoryIndex.load(path), include_series=False)
+        assert index.complete
+        assert index.subtree(1).tolist() == [1, 10, 100, 11]
+        assert sorted(category_id for _, category_id in calls) == [10, 100]
+
+    def test_sync_crawl(self):
+        fred = Fred(api_key="test_key")
+        with patch.object(AsyncFred, "_AsyncFred__fred_get_request", side_effect=fake_tree_requests([])):
+            index = fred.crawl_categories(1)
+        assert index.subtree(1).tolist() == [1, 10, 100, 11]
+        assert index.parent(1) is None
+
+    @pytest.mark.asyncio
+    async def test_validation(self):
+        fred = AsyncFred(Fred(api_key="test_key"))
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await fred.crawl_categories(max_concurrency=0)
+        with pytest.raises(ValueError, match="checkpoint_every"):
+            await fred.crawl_categories(checkpoint_every=0)
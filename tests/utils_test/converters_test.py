@@ -0,0 +1,224 @@
+# filepath: /test/converters_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the converters module.
+"""
+
+import datetime
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+import pytest
+from fedfred import Fred, GeoFred
+from fedfred._core._converters import (_pandas_dataframe_converter, _pandas_dataframe_converter_async,
+                                      _polars_dataframe_converter, _polars_dataframe_converter_async,
+                                      _arrow_dataframe_converter, _arrow_dataframe_converter_async,
+                                      _arrow_regional_data_converter, _arrow_regional_data_converter_async)
+from fedfred.exceptions import DataFrameConversionError, GeoDataFrameConversionError
+
+ROWS = 100000
+
+def observations(rows=ROWS):
+    dates = np.arange(np.datetime64("1800-01-01"), np.datetime64("1800-01-01") + rows).astype(str)
+    values = np.round(np.linspace(0, 1000, rows), 3).astype(str).astype(object)
+    values[::50] = "."
+    return [{"realtime_start": "2024-01-01", "realtime_end": "9999-12-31" if row % 2 else "2024-06-30",
+             "date": date, "value": value} for row, (date, value) in enumerate(zip(dates, values))]
+
+def reference(data):
+    df = pd.DataFrame(data["observations"])
+    df["date"] = pd.to_datetime(df["date"])
+    df.set_index("date", inplace=True)
+    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    return df
+
+class TestPandasDataFrameConverter:
+    def test_matches_row_frame_on_long_series(self):
+        data = {"observations": observations()}
+        pd.testing.assert_frame_equal(_pandas_dataframe_converter(data), reference(data))
+
+    def test_missing_marker_and_float32(self):
+        data = {"observations": observations(100)}
+        df = _pandas_dataframe_converter(data, value_dtype="float32")
+        assert df["value"].dtype == np.float32
+        assert df["value"].isna().sum() == 2
+        assert df["value"].iloc[1] == pytest.approx(10.101, rel=1e-6)
+
+    def test_realtime_column_options(self):
+        data = {"observations": observations(10)}
+        category = _pandas_dataframe_converter(data, realtime_columns="category")
+        assert isinstance(category["realtime_end"].dtype, pd.CategoricalDtype)
+        dates = _pandas_dataframe_converter(data, realtime_columns="date")
+        assert dates["realtime_start"].dtype.kind == "M"
+        assert dates["realtime_end"].isna().tolist() == [False, True] * 5
+        assert dates["realtime_end"].iloc[0] == pd.Timestamp("2024-06-30")
+        dropped = _pandas_dataframe_converter(data, realtime_columns="drop")
+        assert list(dropped.columns) == ["value"]
+
+    def test_streamed_columns_and_vintage_columns(self):
+        columns = {"date": ["2020-01-01", "2020-02-01"], "GDP_20200301": ["1.5", "."], "GDP_20200401": ["1.6", "2.0"]}
+        df = _pandas_dataframe_converter({"observations": columns})
+        assert list(df.columns) == ["GDP_20200301", "GDP_20200401"]
+        assert df["GDP_20200401"].tolist() == [1.6, 2.0]
+        assert np.isnan(df["GDP_20200301"].iloc[1])
+
+    def test_irregular_rows_and_values(self):
+        data = {"observations": [{"date": "2020-01-01", "value": "1"}, {"date": "2020-02-01", "value": "NA", "extra": "x"}]}
+        df = _pandas_dataframe_converter(data)
+        assert df["value"].iloc[0] == 1.0 and np.isnan(df["value"].iloc[1])
+        assert np.isnan(df["extra"].to_numpy()).all()
+
+    def test_empty_and_invalid(self):
+        empty = _pandas_dataframe_converter({"observations": []})
+        assert empty.empty and list(empty.columns) == ["value"] and empty.index.name == "date"
+        with pytest.raises(DataFrameConversionError):
+            _pandas_dataframe_converter({})
+        with pytest.raises(DataFrameConversionError):
+            _pandas_dataframe_converter({"observations": [{"value": "1"}]})
+        with pytest.raises(ValueError):
+            _pandas_dataframe_converter({"observations": []}, value_dtype="int64")
+        with pytest.raises(ValueError):
+            _pandas_dataframe_converter({"observations": []}, realtime_columns="keep")
+
+    @pytest.mark.asyncio
+    async def test_async_passes_options(self):
+        df = await _pandas_dataframe_converter_async({"observations": observations(10)}, "float32", "drop")
+        assert list(df.columns) == ["value"] and df["value"].dtype == np.float32
+
+class TestPolarsDataFrameConverter:
+    def test_typed_columns_and_missing_marker(self):
+        pl = pytest.importorskip("polars")
+        df = _polars_dataframe_converter({"observations": observations(1000)})
+        assert df.schema == pl.Schema({"realtime_start": pl.Date, "realtime_end": pl.Date, "date": pl.Date, "value": pl.Float64})
+        assert df["value"].null_count() == 20
+        assert df["date"][1] == datetime.date(1800, 1, 2)
+        assert df["realtime_end"][1] == datetime.date(9999, 12, 31)
+        expected = reference({"observations": observations(1000)})["value"].to_numpy()
+        np.testing.assert_array_equal(df["value"].fill_null(float("nan")).to_numpy(), expected)
+
+    def test_lazy_frame(self):
+        pl = pytest.importorskip("polars")
+        lazy = _polars_dataframe_converter({"observations": observations(100)}, lazy=True)
+        assert isinstance(lazy, pl.LazyFrame)
+        filtered = lazy.filter(pl.col("date") >= datetime.date(1800, 3, 1)).select("date", "value").collect()
+        assert filtered.height == 100 - 59
+        assert _polars_dataframe_converter({"observations": []}, lazy=True).collect().schema["date"] == pl.Date
+
+    def test_streamed_columns_and_errors(self):
+        pl = pytest.importorskip("polars")
+        df = _polars_dataframe_converter({"observations": {"date": ["2020-01-01"], "GDP_20200301": ["."]}})
+        assert df.schema["GDP_20200301"] == pl.Float64 and df["GDP_20200301"].null_count() == 1
+        with pytest.raises(DataFrameConversionError):
+            _polars_dataframe_converter({"observations": [{"value": "1"}]})
+
+    @pytest.mark.asyncio
+    async def test_async_lazy(self):
+        pl = pytest.importorskip("polars")
+        lazy = await _polars_dataframe_converter_async({"observations": observations(10)}, lazy=True)
+        assert isinstance(lazy, pl.LazyFrame)
+
+REGIONAL = {
+    "title": "Per Capita Personal Income by State (Dollars)",
+    "region": "state",
+    "units": "Dollars",
+    "frequency": "Annual",
+    "data": {
+        "2012-01-01": [{"region": "Alabama", "code": "01", "value": "35068", "series_id": "ALPCPI"},
+                       {"region": "Alaska", "code": "02", "value": ".", "series_id": "AKPCPI"}],
+        "2013-01-01": [{"region": "Alabama", "code": "01", "value": "36132", "series_id": "ALPCPI"}],
+    },
+}
+
+class TestArrowDataFrameConverter:
+    def test_typed_columns_and_missing_marker(self):
+        pa = pytest.importorskip("pyarrow")
+        data = {"observations": observations(1000)}
+        table = _arrow_dataframe_converter(data)
+        assert table.column_names == ["realtime_start", "realtime_end", "date", "value"]
+        assert all(table.schema.field(name).type == pa.date32() for name in ("realtime_start", "realtime_end", "date"))
+        assert table.schema.field("value").type == pa.float64()
+        assert table["value"].null_count == 20
+        expected = reference(data)["value"].to_numpy()
+        np.testing.assert_array_equal(table["value"].to_numpy(), expected)
+
+    def test_zero_copy_handoff(self):
+        pytest.importorskip("pyarrow")
+        pl = pytest.importorskip("polars")
+        table = _arrow_dataframe_converter({"observations": observations(100)})
+        df = pl.from_arrow(table)
+        assert df.schema["date"] == pl.Date and df.height == 100
+        frame = table.to_pandas(types_mapper=pd.ArrowDtype)
+        assert isinstance(frame["value"].dtype, pd.ArrowDtype)
+
+    def test_streamed_columns_empty_and_errors(self):
+        pa = pytest.importorskip("pyarrow")
+        table = _arrow_dataframe_converter({"observations": {"date": ["2020-01-01"], "GDP_20200301": ["."]}})
+        assert table.schema.field("GDP_20200301").type == pa.float64() and table["GDP_20200301"].null_count == 1
+        empty = _arrow_dataframe_converter({"observations": []})
+        assert empty.num_rows == 0 and empty.schema.field("date").type == pa.date32()
+        with pytest.raises(DataFrameConversionError):
+            _arrow_dataframe_converter({})
+        with pytest.raises(DataFrameConversionError):
+            _arrow_dataframe_converter({"observations": [{"value": "1"}]})
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        pytest.importorskip("pyarrow")
+        table = await _arrow_dataframe_converter_async({"observations": observations(10)})
+        assert table.num_rows == 10
+
+class TestArrowRegionalDataConverter:
+    def test_long_table_with_metadata(self):
+        pa = pytest.importorskip("pyarrow")
+        table = _arrow_regional_data_converter(REGIONAL)
+        assert table.column_names == ["date", "region", "code", "value", "series_id"]
+        assert table.schema.field("date").type == pa.date32()
+        assert pa.types.is_dictionary(table.schema.field("series_id").type)
+        assert table["value"].to_pylist() == [35068.0, None, 36132.0]
+        assert table["date"].to_pylist()[-1] == datetime.date(2013, 1, 1)
+        assert table.schema.metadata[b"units"] == b"Dollars"
+        assert b"data" not in table.schema.metadata
+
+    @pytest.mark.asyncio
+    async def test_async_and_errors(self):
+        pytest.importorskip("pyarrow")
+        table = await _arrow_regional_data_converter_async(REGIONAL)
+        assert table.num_rows == 3
+        with pytest.raises(GeoDataFrameConversionError):
+            _arrow_regional_data_converter({"title": "empty"})
+
+class TestArrowClientOutput:
+    def test_series_observations(self):
+        pa = pytest.importorskip("pyarrow")
+        fred = Fred(api_key="test_key")
+        with patch.object(Fred, "_Fred__fred_get_request", return_value={"observations": observations(10)}):
+            table = fred.get_series_observations("GNPCA", dataframe_method="arrow")
+        assert isinstance(table, pa.Table) and table.num_rows == 10
+
+    def test_regional_data_skips_shapefile(self):
+        pa = pytest.importorskip("pyarrow")
+        geofred = GeoFred(Fred(api_key="test_key"))
+        with patch.object(GeoFred, "_GeoFred__fred_get_request", return_value={"meta": REGIONAL}), \
+             patch.object(GeoFred, "get_shape_files") as shape_files:
+            table = geofred.get_series_data("ALPCPI", geodataframe_method="arrow")
+        assert isinstance(table, pa.Table) and table.num_rows == 3
+        shape_files.assert_not_called()
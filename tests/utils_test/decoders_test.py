@@ -0,0 +1,119 @@
+# filepath: /test/decoders_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the decoders module.
+"""
+
+import builtins
+import httpx
+import pytest
+from fedfred import settings
+from fedfred._core import _decoders
+from fedfred._core._decoders import _json_decoder_resolver, _json_response_decoder, _ObservationStreamParser
+from fedfred.exceptions import OptionalDependencyError
+
+PAYLOAD = b'{"observations":[{"date":"2020-01-01","value":"1.5"},{"date":"2020-02-01","value":"."}]}'
+
+@pytest.fixture(autouse=True)
+def reset_decoder():
+    yield
+    settings.set_json_decoder("auto")
+    _json_decoder_resolver.cache_clear()
+
+class TestJsonDecoders:
+    @pytest.mark.parametrize("decoder", ["auto", "orjson", "msgspec", "json"])
+    def test_decodes_response_content(self, decoder):
+        if decoder in ("orjson", "msgspec"):
+            pytest.importorskip(decoder)
+        settings.set_json_decoder(decoder)
+        response = httpx.Response(200, content=PAYLOAD)
+        assert _json_response_decoder(response) == {
+            "observations": [
+                {"date": "2020-01-01", "value": "1.5"},
+                {"date": "2020-02-01", "value": "."},
+            ]
+        }
+
+    @pytest.mark.parametrize("decoder", ["orjson", "msgspec", "json"])
+    def test_invalid_json_raises_value_error(self, decoder):
+        pytest.importorskip(decoder)
+        with pytest.raises(ValueError):
+            _json_decoder_resolver(decoder)(b'{"observations": [')
+
+    def test_unknown_decoder(self):
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            settings.set_json_decoder("simdjson")  # type: ignore[arg-type]
+
+    def test_auto_falls_back_when_fast_decoders_missing(self, monkeypatch):
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name in ("orjson", "msgspec"):
+                raise ImportError(f"No module named {name!r}")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        _json_decoder_resolver.cache_clear()
+        assert _json_decoder_resolver("auto") is _decoders.json.loads
+        with pytest.raises(OptionalDependencyError):
+            _json_decoder_resolver("orjson")
+
+class TestObservationStreamParser:
+    def test_parses_across_arbitrary_chunk_boundaries(self):
+        body = (
+            b'{"realtime_start":"2025-02-13","count":3,"observations":['
+            b'{"realtime_start":"2025-02-13","realtime_end":"2025-02-13","date":"1929-01-01","value":"1202.659"},'
+            b'{"realtime_start":"2025-02-13","realtime_end":"2025-02-13","date":"1930-01-01","value":"."},\n'
+            b'{"realtime_start":"2025-02-13","realtime_end":"2025-02-13","date":"1931-01-01","value":"1029.038"}'
+            b']}'
+        )
+        for size in (1, 7, 64, len(body)):
+            parser = _ObservationStreamParser()
+            for i in range(0, len(body), size):
+                parser.feed(body[i:i + size])
+            columns = parser.close()['observations']
+            assert columns['date'] == ["1929-01-01", "1930-01-01", "1931-01-01"]
+            assert columns['value'] == ["1202.659", ".", "1029.038"]
+            assert len(columns['realtime_end']) == 3
+
+    def test_multibyte_characters_split_across_chunks(self):
+        body = '{"observations":[{"date":"2020-01-01","value":"1","note":"€"}]}'.encode()
+        split = body.index("€".encode()) + 1
+        parser = _ObservationStreamParser()
+        parser.feed(body[:split])
+        parser.feed(body[split:])
+        assert parser.close()['observations']['note'] == ["€"]
+
+    def test_missing_fields_are_padded(self):
+        parser = _ObservationStreamParser()
+        parser.feed(b'{"observations":[{"date":"2020-01-01"},{"date":"2020-02-01","value":"2"}]}')
+        assert parser.close()['observations'] == {'date': ["2020-01-01", "2020-02-01"], 'value': [None, "2"]}
+
+    def test_empty_and_truncated(self):
+        parser = _ObservationStreamParser()
+        parser.feed(b'{"observations":[]}')
+        assert parser.close() == {'observations': {}}
+
+        parser = _ObservationStreamParser()
+        parser.feed(b'{"observations":[{"date":"2020-01-01","val')
+        with pytest.raises(ValueError, match="truncated"):
+            parser.close()
@@ -0,0 +1,97 @@
+# filepath: /test/store_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the store module.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from fedfred import VintageMatrix, VintageStore
+
+pytest.importorskip("pyarrow")
+
+HISTORY = pd.DataFrame({
+    "date": ["2020-01-01", "2020-01-01", "2020-01-01", "2020-04-01", "2020-04-01", "2020-07-01"],
+    "realtime_start": ["2020-04-29", "2020-05-28", "2020-06-25", "2020-07-30", "2020-08-27", "2020-10-29"],
+    "realtime_end": ["2020-05-27", "2020-06-24", "9999-12-31", "2020-08-26", "9999-12-31", "9999-12-31"],
+    "value": ["100.0", "101.0", "102.0", "90.0", ".", "95.0"],
+})
+
+@pytest.fixture
+def store(tmp_path):
+    return VintageStore(tmp_path / "vintages")
+
+def partitions(store, series_id):
+    directory = os.path.join(store.root, f"series_id={series_id}")
+    return {name: os.path.getmtime(os.path.join(directory, name, "part-0.parquet")) for name in os.listdir(directory)}
+
+class TestVintageStore:
+    def test_append_and_load_round_trip(self, store):
+        assert store.append("GDP", HISTORY) == 6
+        assert store.series_ids() == ["GDP"] and "GDP" in store and "GNP" not in store
+        assert store.vintages("GDP")[0] == np.datetime64("2020-04-29")
+        loaded = store.load("GDP")
+        original = VintageMatrix.from_frame(HISTORY)
+        np.testing.assert_array_equal(loaded.realtime_starts, original.realtime_starts)
+        np.testing.assert_array_equal(loaded.realtime_ends, original.realtime_ends)
+        np.testing.assert_array_equal(loaded.values, original.values)
+
+    def test_load_prunes_vintages_and_observations(self, store):
+        store.append("GDP", HISTORY)
+        as_known = store.load("GDP", vintage_end="2020-06-01")
+        assert as_known.vintages.tolist() == [np.datetime64("2020-04-29"), np.datetime64("2020-05-28")]
+        assert as_known.latest_release().tolist() == [101.0]
+        window = store.load("GDP", observation_start="2020-02-01", observation_end="2020-06-30")
+        assert len(window) == 1 and window.first_release().tolist() == [90.0]
+        assert len(store.load("GNP")) == 0
+
+    def test_append_is_append_only(self, store):
+        store.append("GDP", HISTORY.iloc[:4])
+        before = partitions(store, "GDP")
+        clipped = pd.DataFrame({
+            "date": ["2020-01-01", "2020-04-01", "2020-04-01", "2020-07-01"],
+            "realtime_start": ["2020-08-01", "2020-08-01", "2020-08-27", "2020-10-29"],
+            "realtime_end": ["9999-12-31", "2020-08-26", "9999-12-31", "9999-12-31"],
+            "value": ["102.0", "90.0", ".", "95.0"],
+        })
+        assert store.append("GDP", clipped) == 2
+        after = partitions(store, "GDP")
+        assert {name: after[name] for name in before} == before
+        assert "vintage_date=2020-08-01" not in after
+        loaded = store.load("GDP")
+        assert loaded.values.tolist()[:3] == [100.0, 101.0, 102.0]
+        assert loaded.value("2020-04-01", as_of="2020-09-01") != loaded.value("2020-04-01", as_of="2020-09-01")
+        assert store.append("GDP", clipped) == 0
+
+    def test_interrupted_partition_is_ignored(self, store):
+        store.append("GDP", HISTORY)
+        os.makedirs(os.path.join(store.root, "series_id=GDP", "vintage_date=2021-01-01"))
+        assert store.vintages("GDP")[-1] == np.datetime64("2020-10-29")
+
+    def test_remove_and_invalid_ids(self, store):
+        store.append("GDP", HISTORY)
+        store.remove("GDP")
+        assert store.series_ids() == []
+        with pytest.raises(ValueError):
+            store.vintages("../GDP")
@@ -0,0 +1,447 @@
+# filepath: /test/transport_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the transport module.
+"""
+
+import asyncio
+import gzip
+import json
+import time
+import httpx
+import pytest
+from fedfred import Fred, AsyncFred, GeoFred, Fraser, TransferMetrics, Timeout, TimeoutPolicy, HedgingPolicy, CircuitBreaker, deadline
+from fedfred.exceptions import CircuitOpenError, DeadlineExceededError
+from fedfred.transport import _ACCEPT_ENCODING, _breaker_call, _breaker_enter, _breaker_exit, _deadline_remaining, _hedged_request, _record_transfer, _request_headers, _request_timeout
+
+BODY = json.dumps({"seriess": [{"id": "GNPCA", "title": "Real Gross National Product " * 20}]}).encode()
+
+class TestTransferMetrics:
+    def test_record_snapshot_total_reset(self):
+        metrics = TransferMetrics()
+        metrics.record("/fred/series", 100, 400, "gzip")
+        metrics.record("/fred/series", 50, 50)
+        metrics.record("/geofred/shapes/file", 1000, 5000, "br")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["/fred/series"].requests == 2
+        assert snapshot["/fred/series"].compressed_bytes == 150
+        assert snapshot["/fred/series"].decompressed_bytes == 450
+        assert snapshot["/fred/series"].encodings == {"gzip": 1, "identity": 1}
+        assert snapshot["/fred/series"].compression_ratio == pytest.approx(3.0)
+
+        total = metrics.total()
+        assert total.requests == 3
+        assert total.bytes_saved == 4300
+
+        snapshot["/fred/series"].requests = 99
+        assert metrics.snapshot()["/fred/series"].requests == 2
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+        assert metrics.total().compression_ratio is None
+
+    def test_request_headers(self):
+        assert "gzip" in _ACCEPT_ENCODING
+        assert _request_headers() == {"Accept-Encoding": _ACCEPT_ENCODING}
+        assert _request_headers({"Authorization": "Bearer k"})["Authorization"] == "Bearer k"
+
+    def test_record_transfer_counts_wire_bytes(self):
+        compressed = gzip.compress(BODY)
+
+        def handler(request):
+            assert "gzip" in request.headers["Accept-Encoding"]
+            return httpx.Response(200, stream=httpx.ByteStream(compressed), headers={"Content-Encoding": "gzip"})
+
+        metrics = TransferMetrics()
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            response = client.get("https://api.stlouisfed.org/fred/series", headers=_request_headers())
+            _record_transfer(metrics, response)
+
+        stats = metrics.snapshot()["/fred/series"]
+        assert stats.compressed_bytes == len(compressed)
+        assert stats.decompressed_bytes == len(BODY)
+        assert stats.encodings == {"gzip": 1}
+
+class TestClientMetrics:
+    def test_metrics_shared_with_children(self):
+        fred = Fred(api_key="test_key")
+        assert isinstance(fred.metrics, TransferMetrics)
+        assert GeoFred(fred).metrics is fred.metrics
+        assert AsyncFred(fred).metrics is fred.metrics
+
+class TestTimeoutPolicy:
+    def test_family_resolution(self):
+        policy = TimeoutPolicy(endpoints={"/series": Timeout(connect=1.0, read=2.0)})
+        assert policy.for_endpoint("/series") == Timeout(connect=1.0, read=2.0)
+        assert policy.for_endpoint("/series/search/tags") == Timeout(connect=1.0, read=2.0)
+        assert policy.for_endpoint("/series/observations").read == 30.0
+        assert policy.for_endpoint("/shapes/file").read == 60.0
+        assert policy.for_endpoint("/v2/release/observations").read == 60.0
+        assert policy.for_endpoint("/category") == Timeout()
+
+    def test_invalid_timeout(self):
+        with pytest.raises(ValueError, match="read timeout"):
+            Timeout(read=0)
+
+    def test_request_timeout_without_deadline(self):
+        timeout = _request_timeout(TimeoutPolicy(), "/category")
+        assert timeout.connect == 5.0 and timeout.read == 10.0
+
+class TestDeadline:
+    def test_caps_request_timeout_and_nests(self):
+        with deadline(30.0):
+            with deadline(1.0):
+                timeout = _request_timeout(TimeoutPolicy(), "/shapes/file")
+                assert timeout.read <= 1.0
+            assert 1.0 < _deadline_remaining() <= 30.0
+        assert _deadline_remaining() is None
+
+    def test_outer_deadline_wins_when_tighter(self):
+        with deadline(0.5):
+            with deadline(10.0):
+                assert _deadline_remaining() <= 0.5
+
+    def test_invalid_deadline(self):
+        with pytest.raises(ValueError):
+            with deadline(0):
+                pass
+
+    def test_rate_limit_wait_fails_fast(self):
+        fred = Fred(api_key="test_key", cache_mode=False)
+        fred.max_requests_per_minute = 1
+        fred.request_times.append(time.time())
+        start = time.monotonic()
+        with deadline(0.5):
+            with pytest.raises(DeadlineExceededError) as excinfo:
+                fred.get_series("GNPCA")
+        assert time.monotonic() - start < 0.5
+        assert excinfo.value.deadline == 0.5
+
+    def test_expired_deadline_blocks_requests(self):
+        with deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                _request_timeout(TimeoutPolicy(), "/series")
+
+    def test_expired_deadline_takes_no_rate_slot(self):
+        fred = Fred(api_key="test_key", cache_mode=False)
+        with deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                fred.get_series("GNPCA")
+            with pytest.raises(DeadlineExceededError):
+                fred.get_series_observations("GNPCA", stream=True)
+        assert len(fred.request_times) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_expired_deadline_takes_no_rate_slot(self):
+        fred = Fred(api_key="test_key", cache_mode=False)
+        with deadline(0.01):
+            await asyncio.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                await AsyncFred(fred).get_series("GNPCA")
+        assert len(fred.request_times) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_rate_limit_wait_fails_fast(self):
+        fred = Fred(api_key="test_key", cache_mode=False)
+        with deadline(0.01):
+            with pytest.raises(DeadlineExceededError):
+                await AsyncFred(fred).get_series("GNPCA")
+
+class TestHedgingPolicy:
+    def test_delay_uses_percentile_after_min_samples(self):
+        policy = HedgingPolicy(percentile=90, initial_delay=1.0, min_samples=10, min_delay=0.0)
+        assert policy.delay("/series") == 1.0
+        for latency in range(1, 11):
+            policy.record("/series", latency / 10)
+        assert policy.delay("/series") == pytest.approx(1.0)
+        assert policy.delay("/category") == 1.0
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_hedges=0)
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self):
+        policy = HedgingPolicy(initial_delay=0.05, min_delay=0.0)
+        calls = []
+        cancelled = []
+
+        async def send(dispatched):
+            attempt = len(calls)
+            calls.append(attempt)
+            dispatched.set()
+            try:
+                await asyncio.sleep(1.0 if attempt == 0 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+            return attempt
+
+        start = time.monotonic()
+        assert await _hedged_request(policy, "/series", send) == 1
+        assert time.monotonic() - start < 0.5
+        await asyncio.sleep(0)
+        assert cancelled == [0]
+        assert policy.hedges_sent == 1 and policy.hedges_won == 1
+
+    @pytest.mark.asyncio
+    async def test_hedges_are_spaced_and_timed_from_their_own_dispatch(self):
+        policy = HedgingPolicy(initial_delay=0.1, min_delay=0.0, max_hedges=2)
+        start = time.monotonic()
+        dispatched_at = []
+
+        async def send(dispatched):
+            attempt = len(dispatched_at)
+            dispatched_at.append(time.monotonic() - start)
+            dispatched.set()
+            await asyncio.sleep(1.0 if attempt < 2 else 0.01)
+            return attempt
+
+        assert await _hedged_request(policy, "/series", send) == 2
+        assert policy.hedges_sent == 2
+        assert dispatched_at[1] == pytest.approx(0.1, abs=0.05)
+        assert dispatched_at[2] == pytest.approx(0.2, abs=0.05)
+        assert list(policy._latencies["/series"])[0] < 0.05
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_sends_no_hedge(self):
+        policy = HedgingPolicy(initial_delay=0.5)
+
+        async def send(dispatched):
+            dispatched.set()
+            return "ok"
+
+        assert await _hedged_request(policy, "/series", send) == "ok"
+        assert policy.hedges_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back_to_hedge(self):
+        policy = HedgingPolicy(initial_delay=0.01, min_delay=0.0)
+        attempts = []
+
+        async def send(dispatched):
+            attempts.append(None)
+            dispatched.set()
+            if len(attempts) == 1:
+                await asyncio.sleep(0.05)
+                raise ValueError("primary failed")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        assert await _hedged_request(policy, "/series", send) == "hedge"
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self):
+        async def send(dispatched):
+            dispatched.set()
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await _hedged_request(HedgingPolicy(), "/series", send)
+
+    @pytest.mark.asyncio
+    async def test_async_fred_hedges_through_rate_limiter(self, monkeypatch):
+        responses = iter([1.0, 0.0])
+
+        async def handler(request):
+            await asyncio.sleep(next(responses))
+            return httpx.Response(200, json={"seriess": [{"id": "GNPCA"}]})
+
+        original = httpx.AsyncClient.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "__init__", init)
+        fred = Fred(api_key="test_key", cache_mode=False)
+        fred.max_requests_per_minute = 6000
+        async_fred = AsyncFred(fred, hedging=HedgingPolicy(initial_delay=0.05, min_delay=0.0))
+        sent_before = len(fred.request_times)
+        response = await async_fred._AsyncFred__fred_get_request("/series", {"series_id": "GNPCA"})
+        assert response == {"seriess": [{"id": "GNPCA"}]}
+        assert async_fred.hedging.hedges_won == 1
+        assert len(fred.request_times) - sent_before == 2
+
+class TestCircuitBreaker:
+    URL = "https://api.stlouisfed.org/fred/series"
+
+    @staticmethod
+    def failing():
+        request = httpx.Request("GET", TestCircuitBreaker.URL)
+        error = httpx.HTTPStatusError("503", request=request, response=httpx.Response(503, request=request))
+        raise ValueError("HTTP Error occurred") from error
+
+    def test_opens_after_threshold_and_recovers(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        circuit = "api.stlouisfed.org/fred/series"
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                _breaker_call(breaker, self.URL, ("k",), self.failing)
+        assert breaker.state(circuit) == "open"
+        with pytest.raises(CircuitOpenError) as excinfo:
+            _breaker_call(breaker, self.URL, ("k",), lambda: "ok")
+        assert excinfo.value.circuit == circuit and excinfo.value.retry_after > 0
+
+        time.sleep(0.06)
+        assert breaker.state(circuit) == "half_open"
+        assert _breaker_call(breaker, self.URL, ("k",), lambda: "ok") == "ok"
+        assert breaker.state(circuit) == "closed"
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.02)
+        with pytest.raises(ValueError):
+            _breaker_call(breaker, self.URL, ("k",), self.failing)
+        time.sleep(0.03)
+        with pytest.raises(ValueError):
+            _breaker_call(breaker, self.URL, ("k",), self.failing)
+        with pytest.raises(CircuitOpenError):
+            _breaker_call(breaker, self.URL, ("k",), lambda: "ok")
+
+    def test_late_failures_do_not_extend_an_open_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        circuit = "api.stlouisfed.org/fred/series"
+        for _ in range(2):
+            _breaker_enter(breaker, circuit, ("k",))
+        try:
+            self.failing()
+        except ValueError as e:
+            error = e
+        _breaker_exit(breaker, circuit, ("k",), error=error)
+        time.sleep(0.03)
+        _breaker_exit(breaker, circuit, ("k",), error=error)
+        time.sleep(0.03)
+        assert breaker.state(circuit) == "half_open"
+
+    def test_client_errors_do_not_count(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        def bad_request():
+            request = httpx.Request("GET", self.URL)
+            error = httpx.HTTPStatusError("400", request=request, response=httpx.Response(400, request=request))
+            raise ValueError("HTTP Error occurred") from error
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                _breaker_call(breaker, self.URL, ("k",), bad_request)
+        assert breaker.state("api.stlouisfed.org/fred/series") == "closed"
+
+    def test_serves_stale_while_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, serve_stale=True)
+        assert _breaker_call(breaker, self.URL, ("k",), lambda: {"v": 1}) == {"v": 1}
+        with pytest.raises(ValueError):
+            _breaker_call(breaker, self.URL, ("k",), self.failing)
+        assert _breaker_call(breaker, self.URL, ("k",), lambda: {"v": 2}) == {"v": 1}
+        with pytest.raises(CircuitOpenError):
+            _breaker_call(breaker, self.URL, ("other",), lambda: {"v": 2})
+
+    def test_host_scope_and_reset(self):
+        breaker = CircuitBreaker(failure_threshold=1, scope="host")
+        with pytest.raises(ValueError):
+            _breaker_call(breaker, self.URL, ("k",), self.failing)
+        with pytest.raises(CircuitOpenError):
+            _breaker_call(breaker, "https://api.stlouisfed.org/fred/category", ("k",), lambda: "ok")
+        breaker.reset()
+        assert breaker.state("api.stlouisfed.org") == "closed"
+
+    def test_invalid_breaker(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(scope="path")  # type: ignore[arg-type]
+
+    def test_fred_fails_fast_during_outage(self, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503)
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        fred = Fred(api_key="test_key", cache_mode=False, circuit_breaker=breaker)
+        assert GeoFred(fred).circuit_breaker is breaker
+        assert AsyncFred(fred).circuit_breaker is breaker
+        with pytest.raises(ValueError):
+            fred.get_series("GNPCA")
+        sent = len(calls)
+        with pytest.raises(CircuitOpenError):
+            fred.get_series("GNPCA")
+        assert len(calls) == sent
+
+    @pytest.mark.asyncio
+    async def test_streamed_requests_fail_fast_during_outage(self, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503)
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        fred = Fred(api_key="test_key", cache_mode=False, circuit_breaker=breaker)
+        with pytest.raises(ValueError):
+            fred.get_series_observations("GNPCA", stream=True)
+        sent = len(calls)
+        with pytest.raises(CircuitOpenError):
+            fred.get_series_observations("GNPCA", stream=True)
+        with pytest.raises(CircuitOpenError):
+            await AsyncFred(fred).get_series_observations("GNPCA", stream=True)
+        assert len(calls) == sent
+
+    def test_fraser_post_fails_fast_during_outage(self, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(503)
+
+        original = httpx.Client.__init__
+
+        def init(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original(self, *args, **kwargs)
+
+        monkeypatch.setattr(httpx.Client, "__init__", init)
+        fraser = Fraser(api_key="test_key", circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_timeout=60))
+        with pytest.raises(ValueError):
+            fraser.post_key_request("user@example.com", "research")
+        with pytest.raises(CircuitOpenError):
+            fraser.post_key_request("user@example.com", "research")
+        assert calls == ["POST"]
@@ -0,0 +1,215 @@
+# filepath: /test/vintages_test.py
+#
+# Copyright (c) 2026 Nikhil Sunder
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Comprehensive unit tests for the vintages module.
+"""
+
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+import pytest
+from fedfred import VintageMatrix, AsOfEngine
+
+PERIODS = pd.DataFrame({
+    "date": ["2020-04-01", "2020-01-01", "2020-01-01", "2020-01-01", "2020-04-01", "2020-07-01"],
+    "realtime_start": ["2020-07-30", "2020-04-29", "2020-06-25", "2020-05-28", "2020-08-27", "2020-10-29"],
+    "realtime_end": ["2020-08-26", "2020-05-27", "9999-12-31", "2020-06-24", "2020-12-31", "9999-12-31"],
+    "value": ["90.0", "100.0", "102.0", "101.0", ".", "95.0"],
+})
+
+def naive_as_of(frame, day):
+    frame = frame.assign(realtime_end=frame["realtime_end"].replace("9999-12-31", "2262-01-01"))
+    known = frame[(pd.to_datetime(frame["realtime_start"]) <= day) & (pd.to_datetime(frame["realtime_end"]) >= day)]
+    return pd.to_numeric(known.set_index(pd.DatetimeIndex(known["date"]))["value"], errors="coerce").astype("float64").sort_index()
+
+@pytest.fixture
+def matrix():
+    return VintageMatrix.from_frame(PERIODS)
+
+class TestVintageMatrix:
+    def test_build_sorts_and_encodes(self, matrix):
+        assert len(matrix) == 3
+        assert matrix.shape == (3, 6)
+        assert matrix.offsets.tolist() == [0, 3, 5, 6]
+        assert matrix.values[:3].tolist() == [100.0, 101.0, 102.0]
+        assert np.isnan(matrix.values[4])
+        assert matrix.realtime_ends[2] == np.datetime64("9999-12-31")
+        assert matrix.nbytes > 0
+
+    def test_value_lookups(self, matrix):
+        assert matrix.value("2020-01-01", as_of="2020-04-28") != matrix.value("2020-01-01", as_of="2020-04-28")
+        assert matrix.value("2020-01-01", as_of="2020-04-29") == 100.0
+        assert matrix.value("2020-01-01", as_of="2020-06-24") == 101.0
+        assert matrix.value("2020-01-01", as_of="2030-01-01") == 102.0
+        assert np.isnan(matrix.value("2020-04-01", as_of="2021-01-01"))
+        assert np.isnan(matrix.value("2019-01-01", as_of="2021-01-01"))
+
+    @pytest.mark.parametrize("day", ["2020-01-01", "2020-05-27", "2020-05-28", "2020-08-01", "2020-09-01",
+                                     "2020-11-01", "2021-01-01"])
+    def test_as_of_matches_naive_mask(self, matrix, day):
+        expected = naive_as_of(PERIODS, pd.Timestamp(day))
+        result = matrix.as_of(day)
+        pd.testing.assert_series_equal(result, expected, check_names=False, check_freq=False, check_index_type=False)
+
+    def test_first_and_latest_release(self, matrix):
+        assert matrix.first_release().tolist() == [100.0, 90.0, 95.0]
+        latest = matrix.latest_release()
+        assert latest.iloc[0] == 102.0 and np.isnan(latest.iloc[1])
+
+    def test_observation_slice_shares_arrays(self, matrix):
+        sliced = matrix.slice(observation_start="2020-02-01")
+        assert len(sliced) == 2
+        assert sliced.offsets.tolist() == [0, 2, 3]
+        assert np.shares_memory(sliced.values, matrix.values)
+        assert sliced.value("2020-04-01", as_of="2020-08-01") == 90.0
+        assert len(matrix.slice(observation_start="2021-01-01")) == 0
+
+    def test_vintage_slice_clips_periods(self, matrix):
+        sliced = matrix.slice(vintage_start="2020-06-01", vintage_end="2020-08-01")
+        assert sliced.dates.tolist() == [np.datetime64("2020-01-01"), np.datetime64("2020-04-01")]
+        assert sliced.realtime_starts[0] == np.datetime64("2020-06-01")
+        assert sliced.realtime_ends.max() == np.datetime64("2020-08-01")
+        assert sliced.as_of("2020-08-01").tolist() == [102.0, 90.0]
+
+    def test_dense_triangle(self, matrix):
+        dense = matrix.to_dense()
+        assert dense.shape == matrix.shape
+        for vintage in dense.columns:
+            expected = matrix.as_of(vintage).reindex(dense.index)
+            np.testing.assert_array_equal(dense[vintage].to_numpy(), expected.to_numpy())
+
+    def test_to_frame_round_trip(self, matrix):
+        frame = matrix.to_frame()
+        assert frame["realtime_end"].isna().sum() == 2
+        rebuilt = VintageMatrix.from_frame(frame)
+        np.testing.assert_array_equal(rebuilt.realtime_ends, matrix.realtime_ends)
+        np.testing.assert_array_equal(rebuilt.values, matrix.values)
+
+    def test_invalid_periods(self):
+        with pytest.raises(ValueError):
+            VintageMatrix(["2020-01-01", "2020-01-01"], ["2020-01-01", "2020-02-01"], ["2020-03-01", "9999-12-31"], [1, 2])
+        with pytest.raises(ValueError):
+            VintageMatrix(["2020-01-01"], ["2020-01-01", "2020-02-01"], ["2020-03-01"], [1])
+
+    def test_large_history_as_of(self):
+        rng = np.random.default_rng(0)
+        dates = np.repeat(np.arange(np.datetime64("2000-01-01"), np.datetime64("2000-01-01") + 2000), 20)
+        starts = dates + np.tile(np.arange(20) * 7, 2000)
+        ends = np.where(np.tile(np.arange(20), 2000) == 19, np.datetime64("9999-12-31"), starts + 6)
+        values = rng.normal(size=len(dates))
+        matrix = VintageMatrix(dates, starts, ends, values)
+        result = matrix.as_of("2001-01-01")
+        frame = pd.DataFrame({"date": dates, "realtime_start": starts, "realtime_end": ends.astype(str), "value": values})
+        pd.testing.assert_series_equal(result, naive_as_of(frame, pd.Timestamp("2001-01-01")),
+                                       check_names=False, check_freq=False, check_index_type=False)
+
+    def test_values_at_pairs(self, matrix):
+        values = matrix.values_at(["2020-01-01", "2020-01-01", "2020-04-01", "2019-01-01"],
+                                  ["2020-05-01", "2020-07-01", "2020-07-01", "2020-07-01"])
+        assert values[:2].tolist() == [100.0, 102.0]
+        assert np.isnan(values[2:]).all()
+        assert matrix.values_at(["2020-01-01", "2020-07-01"], "2021-01-01").tolist() == [102.0, 95.0]
+
+    def test_revisions(self, matrix):
+        stats = matrix.revisions()
+        assert stats["first_release"].tolist() == [100.0, 90.0, 95.0]
+        assert stats["revision"].iloc[0] == 2.0
+        assert np.isnan(stats["revision"].iloc[1])
+        assert stats["releases"].tolist() == [3, 2, 1]
+        assert stats["revision_count"].tolist() == [2, 1, 0]
+        assert stats["mean_absolute_revision"].iloc[0] == 1.0
+        assert np.isnan(stats["mean_absolute_revision"].iloc[1:]).all()
+
+    def test_revisions_match_loop(self):
+        rng = np.random.default_rng(1)
+        releases = rng.integers(1, 8, size=300)
+        dates = np.repeat(np.arange(np.datetime64("2000-01-01"), np.datetime64("2000-01-01") + 300), releases)
+        starts = dates + np.concatenate([np.arange(count) * 10 for count in releases])
+        ends = np.where(np.concatenate([np.arange(count) == count - 1 for count in releases]),
+                        np.datetime64("9999-12-31"), starts + 9)
+        values = np.round(rng.normal(size=len(dates)), 1)
+        values[rng.random(len(values)) < 0.2] = 1.0
+        stats = VintageMatrix(dates, starts, ends, values).revisions()
+        offsets = np.concatenate(([0], np.cumsum(releases)))
+        for row in range(300):
+            run = values[offsets[row]:offsets[row + 1]]
+            changes = np.diff(run)[np.diff(run) != 0]
+            assert stats["revision_count"].iloc[row] == len(changes)
+            assert stats["revision"].iloc[row] == pytest.approx(run[-1] - run[0])
+            if len(changes):
+                assert stats["mean_absolute_revision"].iloc[row] == pytest.approx(np.abs(changes).mean())
+
+    def test_revision_at(self, matrix):
+        assert matrix.revision_at(0).fillna(-1).tolist() == [0.0, 0.0, 0.0]
+        at_one = matrix.revision_at(1)
+        assert at_one.iloc[0] == 1.0 and np.isnan(at_one.iloc[1]) and at_one.iloc[2] == 0.0
+        assert matrix.revision_at(5).iloc[0] == 2.0
+        by_time = matrix.revision_at(timedelta(days=30))
+        assert by_time.iloc[0] == 1.0 and np.isnan(by_time.iloc[1]) and np.isnan(by_time.iloc[2])
+        with pytest.raises(ValueError):
+            matrix.revision_at(-1)
+
+class TestAsOfEngine:
+    @pytest.fixture
+    def engine(self, matrix):
+        other = pd.DataFrame({"date": ["2020-01-01", "2020-02-01", "2020-02-01"],
+                              "realtime_start": ["2020-02-07", "2020-03-06", "2020-04-03"],
+                              "realtime_end": ["9999-12-31", "2020-04-02", "9999-12-31"],
+                              "value": ["3.5", "3.6", "3.5"]})
+        return AsOfEngine({"GDP": matrix, "UNRATE": other})
+
+    def test_latest_matches_naive_scan(self, engine):
+        days = pd.date_range("2020-01-01", "2021-02-01", freq="D")
+        latest = engine.latest(days)
+        dates = engine.latest_dates(days)
+        assert list(latest.columns) == ["GDP", "UNRATE"]
+        for series_id in engine.series_ids:
+            matrix = engine[series_id]
+            for day in days[::7]:
+                known = matrix.as_of(day)
+                published = matrix.to_frame()
+                published = published[published["realtime_start"] <= day]
+                if published.empty:
+                    assert np.isnan(latest.loc[day, series_id]) and pd.isna(dates.loc[day, series_id])
+                    continue
+                observed = published.index.max()
+                assert dates.loc[day, series_id] == observed
+                expected = known.get(observed, np.nan)
+                assert latest.loc[day, series_id] == expected or (np.isnan(expected) and np.isnan(latest.loc[day, series_id]))
+
+    def test_latest_selected_series_and_unknown(self, engine):
+        latest = engine.latest("2020-03-10", series_ids=["UNRATE"])
+        assert latest.to_dict("list") == {"UNRATE": [3.6]}
+        with pytest.raises(KeyError):
+            engine.latest("2020-03-10", series_ids=["CPIAUCSL"])
+
+    def test_panel(self, engine):
+        panel = engine.panel("2020-08-01")
+        assert list(panel.columns) == ["GDP", "UNRATE"]
+        assert panel.loc["2020-01-01"].tolist() == [102.0, 3.5]
+        assert panel.loc["2020-04-01", "GDP"] == 90.0
+        assert np.isnan(panel.loc["2020-02-01", "GDP"])
+        assert AsOfEngine().panel("2020-01-01").empty
+
+    def test_container_protocol(self, engine):
+        assert len(engine) == 2 and "GDP" in engine and "CPI" not in engine
+        assert repr(engine) == "AsOfEngine(series=2)"